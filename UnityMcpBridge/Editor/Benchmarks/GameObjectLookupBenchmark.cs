@@ -0,0 +1,133 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Text;
+using UnityEditor;
+using UnityEngine;
+using UnityMcpBridge.Editor.Helpers;
+using Debug = UnityEngine.Debug;
+
+namespace UnityMcpBridge.Editor.Benchmarks
+{
+    /// <summary>
+    /// Measures GameObject lookup latency against scene size, for the scans ManageGameObject uses by
+    /// default and for GameObjectIndex. Objects are created under a temporary root in the active scene
+    /// and destroyed afterwards; results are written to the console.
+    /// </summary>
+    public static class GameObjectLookupBenchmark
+    {
+        private static readonly int[] SceneSizes = { 1000, 10000, 50000 };
+        private const int Branching = 8;
+        private const int FindRepeats = 200;
+        private const int ScanRepeats = 10;
+        private const string RootName = "__UnityMcpLookupBenchmark";
+
+        [MenuItem("Window/Unity MCP/Benchmarks/GameObject Lookup")]
+        public static void Run()
+        {
+            var report = new StringBuilder();
+            report.AppendLine("GameObject lookup latency (microseconds per lookup; index rebuild and one-object update in ms)");
+            report.AppendLine("objects\tmethod\tscan\tindex");
+            try
+            {
+                foreach (int size in SceneSizes)
+                {
+                    EditorUtility.DisplayProgressBar("Unity MCP", $"Benchmarking lookups with {size} GameObjects", 0f);
+                    RunSize(size, report);
+                }
+            }
+            finally
+            {
+                EditorUtility.ClearProgressBar();
+                GameObjectIndex.MarkDirty();
+            }
+            Debug.Log(report.ToString());
+        }
+
+        private static void RunSize(int size, StringBuilder report)
+        {
+            var root = new GameObject(RootName);
+            try
+            {
+                GameObject last = Populate(root, size);
+                string name = last.name;
+                string path = GetPath(last.transform);
+                int layer = LayerMask.NameToLayer("Water");
+
+                GameObjectIndex.MarkDirty();
+                var stopwatch = Stopwatch.StartNew();
+                GameObjectIndex.FindAll();
+                report.AppendLine($"{size}\trebuild\t-\t{stopwatch.Elapsed.TotalMilliseconds:F1}");
+
+                stopwatch.Restart();
+                for (int i = 0; i < FindRepeats; i++)
+                    GameObjectIndex.Reindex(last);
+                report.AppendLine($"{size}\tupdate\t-\t{stopwatch.Elapsed.TotalMilliseconds / FindRepeats:F3}");
+
+                Row(report, size, "by_name", FindRepeats,
+                    () => GameObject.Find(name), () => GameObjectIndex.Find(name));
+                Row(report, size, "by_path", FindRepeats,
+                    () => GameObject.Find(path), () => GameObjectIndex.Find(path));
+                Row(report, size, "by_tag", ScanRepeats,
+                    () => GameObject.FindGameObjectsWithTag("Respawn"), () => GameObjectIndex.FindWithTag("Respawn"));
+                Row(report, size, "by_layer", ScanRepeats,
+                    () => GameObject.FindObjectsOfType<GameObject>().Where(go => go.layer == layer).ToList(),
+                    () => GameObjectIndex.FindInLayer(layer));
+                Row(report, size, "by_component", ScanRepeats,
+                    () => GameObject.FindObjectsOfType<GameObject>().Where(go => go.GetComponent(typeof(BoxCollider)) != null).ToList(),
+                    () => GameObjectIndex.FindWithComponent(typeof(BoxCollider)));
+            }
+            finally
+            {
+                UnityEngine.Object.DestroyImmediate(root);
+            }
+        }
+
+        /// <summary>
+        /// Builds a tree of size objects below root and returns the last (deepest) one.
+        /// Every 100th object is tagged, every 50th is on the Water layer and every 20th has a BoxCollider.
+        /// </summary>
+        private static GameObject Populate(GameObject root, int size)
+        {
+            var parents = new Queue<Transform>();
+            parents.Enqueue(root.transform);
+            GameObject go = root;
+            for (int i = 0; i < size; i++)
+            {
+                Transform parent = parents.Peek();
+                go = new GameObject($"Node_{i}");
+                go.transform.SetParent(parent, false);
+                if (i % 100 == 0) go.tag = "Respawn";
+                if (i % 50 == 0) go.layer = LayerMask.NameToLayer("Water");
+                if (i % 20 == 0) go.AddComponent<BoxCollider>();
+                parents.Enqueue(go.transform);
+                if (parent.childCount == Branching) parents.Dequeue();
+            }
+            return go;
+        }
+
+        private static void Row(StringBuilder report, int size, string method, int repeats, Func<object> scan, Func<object> index)
+        {
+            report.AppendLine($"{size}\t{method}\t{Measure(scan, repeats):F1}\t{Measure(index, repeats):F1}");
+        }
+
+        private static double Measure(Func<object> lookup, int repeats)
+        {
+            lookup(); // warm up
+            var stopwatch = Stopwatch.StartNew();
+            for (int i = 0; i < repeats; i++)
+                lookup();
+            return stopwatch.Elapsed.TotalMilliseconds * 1000.0 / repeats;
+        }
+
+        private static string GetPath(Transform t)
+        {
+            var names = new List<string>();
+            for (; t != null; t = t.parent)
+                names.Add(t.name);
+            names.Reverse();
+            return string.Join("/", names);
+        }
+    }
+}
@@ -0,0 +1,36 @@
+using System.Collections.Generic;
+using System.Linq;
+using Newtonsoft.Json;
+using UnityEditor;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// Pushes the paths of imported, deleted and moved assets to the clients that asked for asset
+    /// change notifications during the handshake, so that they can drop cached asset searches.
+    /// Large imports are reported as a change to everything.
+    /// </summary>
+    public class AssetChangeNotifier : AssetPostprocessor
+    {
+        private const int MaxPaths = 1000;
+
+        private static void OnPostprocessAllAssets(
+            string[] importedAssets, string[] deletedAssets, string[] movedAssets, string[] movedFromAssetPaths)
+        {
+            if (!UnityMcpBridge.HasEventListeners)
+            {
+                return;
+            }
+            List<string> paths = importedAssets.Concat(deletedAssets).Concat(movedAssets).Concat(movedFromAssetPaths)
+                .Distinct().ToList();
+            if (paths.Count == 0)
+            {
+                return;
+            }
+            object message = paths.Count > MaxPaths
+                ? new { @event = "assetsChanged", all = true }
+                : (object)new { @event = "assetsChanged", paths };
+            UnityMcpBridge.BroadcastEvent(JsonConvert.SerializeObject(message));
+        }
+    }
+}
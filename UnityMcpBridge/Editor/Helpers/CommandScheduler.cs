@@ -0,0 +1,141 @@
+using System.Collections.Generic;
+using System.Threading.Tasks;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// Commands received by the listener threads, waiting for the main thread.
+    /// The lock is only held to add or take one command, so socket threads keep reading while commands run.
+    /// Reads (queries, job polls, pings) are taken before writes, which may be heavy; a write that has waited
+    /// longer than MaxWriteDelaySeconds goes first, so that a steady stream of reads cannot starve it.
+    /// The bridge runs commands until TickBudgetSeconds of the editor tick are spent, and replies tell the
+    /// client how many commands were still queued and how long theirs waited.
+    /// </summary>
+    public static class CommandScheduler
+    {
+        /// <summary>
+        /// Main thread time the commands may take per editor tick; at least one command runs per tick
+        /// </summary>
+        public const double TickBudgetSeconds = 0.02;
+
+        /// <summary>
+        /// Time after which a write is taken before the reads queued with it
+        /// </summary>
+        public const double MaxWriteDelaySeconds = 0.25;
+
+        // Command types, and actions of any command type, that only read the editor's state
+        private static readonly HashSet<string> ReadTypes = new() { "ping", "job_status" };
+        private static readonly HashSet<string> ReadActions = new()
+        {
+            "get", "get_state", "get_active", "get_active_scene", "get_hierarchy", "find", "find_many", "search", "read",
+        };
+
+        public sealed class QueuedCommand
+        {
+            public string Text;
+            public TaskCompletionSource<string> Completion;
+            public bool IsRead;
+            public long EnqueuedAt; // Stopwatch timestamp
+            public int QueueDepth; // Commands still queued when this one was taken
+            public double WaitMs; // Time from enqueueing to being taken
+        }
+
+        private static readonly object queueLock = new();
+        private static readonly Queue<QueuedCommand> reads = new();
+        private static readonly Queue<QueuedCommand> writes = new();
+
+        /// <summary>
+        /// Number of commands waiting; read by any thread.
+        /// </summary>
+        public static int Count
+        {
+            get
+            {
+                lock (queueLock)
+                {
+                    return reads.Count + writes.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Queues a command received from a client; called from the listener threads.
+        /// </summary>
+        public static void Enqueue(string commandText, TaskCompletionSource<string> completion)
+        {
+            // Classified here, off the main thread
+            var command = new QueuedCommand
+            {
+                Text = commandText,
+                Completion = completion,
+                IsRead = IsRead(commandText),
+                EnqueuedAt = System.Diagnostics.Stopwatch.GetTimestamp(),
+            };
+            lock (queueLock)
+            {
+                (command.IsRead ? reads : writes).Enqueue(command);
+            }
+        }
+
+        /// <summary>
+        /// Takes the next command to run, or returns false when none is waiting.
+        /// </summary>
+        public static bool TryDequeue(out QueuedCommand command)
+        {
+            long now = System.Diagnostics.Stopwatch.GetTimestamp();
+            lock (queueLock)
+            {
+                bool overdueWrite = writes.Count > 0 && Seconds(now - writes.Peek().EnqueuedAt) > MaxWriteDelaySeconds;
+                if (reads.Count > 0 && !overdueWrite)
+                {
+                    command = reads.Dequeue();
+                }
+                else if (writes.Count > 0)
+                {
+                    command = writes.Dequeue();
+                }
+                else
+                {
+                    command = null;
+                    return false;
+                }
+                command.QueueDepth = reads.Count + writes.Count;
+            }
+            command.WaitMs = Seconds(now - command.EnqueuedAt) * 1000.0;
+            return true;
+        }
+
+        /// <summary>
+        /// Whether a command only reads the editor's state, judged from its type and action without parsing it.
+        /// </summary>
+        public static bool IsRead(string commandText)
+        {
+            if (commandText == null)
+            {
+                return false;
+            }
+            string trimmed = commandText.Trim();
+            if (trimmed == "ping")
+            {
+                return true;
+            }
+            // Both come before any nested value: "type" is the first key (after "id"), and "action" the first parameter
+            string type = JsonHelper.GetStringValue(trimmed, "type");
+            if (type == null || type == "batch")
+            {
+                return false;
+            }
+            if (ReadTypes.Contains(type))
+            {
+                return true;
+            }
+            string action = JsonHelper.GetStringValue(trimmed, "action");
+            return action != null && ReadActions.Contains(action.ToLowerInvariant());
+        }
+
+        private static double Seconds(long elapsedTicks)
+        {
+            return (double)elapsedTicks / System.Diagnostics.Stopwatch.Frequency;
+        }
+    }
+}
@@ -0,0 +1,46 @@
+using System.Threading;
+using UnityEditor;
+using UnityEditor.Compilation;
+using UnityEditor.SceneManagement;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// A number that changes whenever the editor's state may have changed: the hierarchy, the project's
+    /// assets, the open scenes, play and pause mode, compilation, or an undo. Every reply carries it as
+    /// "stateVersion", so clients can tell whether the query results they memoized still hold, including
+    /// after edits made by hand. It is kept in SessionState, and a domain reload counts as a change.
+    /// </summary>
+    [InitializeOnLoad]
+    public static class EditorStateVersion
+    {
+        private const string SessionKey = "UnityMcpBridge.StateVersion";
+
+        private static int current;
+
+        static EditorStateVersion()
+        {
+            current = SessionState.GetInt(SessionKey, 0) + 1;
+            SessionState.SetInt(SessionKey, current);
+            EditorApplication.hierarchyChanged += Bump;
+            EditorApplication.projectChanged += Bump;
+            EditorApplication.playModeStateChanged += _ => Bump();
+            EditorApplication.pauseStateChanged += _ => Bump();
+            EditorSceneManager.activeSceneChangedInEditMode += (previous, next) => Bump();
+            CompilationPipeline.compilationStarted += _ => Bump();
+            CompilationPipeline.compilationFinished += _ => Bump();
+            Undo.undoRedoPerformed += Bump;
+        }
+
+        /// <summary>
+        /// The current version; read by the listener threads when they write replies.
+        /// </summary>
+        public static int Current => Volatile.Read(ref current);
+
+        private static void Bump()
+        {
+            Volatile.Write(ref current, current + 1);
+            SessionState.SetInt(SessionKey, current);
+        }
+    }
+}
@@ -0,0 +1,404 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using UnityEditor;
+using UnityEditor.SceneManagement;
+using UnityEngine;
+using UnityEngine.SceneManagement;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// Optional lookup index of the GameObjects in all loaded scenes, by name, path, tag, layer and component type.
+    /// Repeated lookups cost a dictionary access instead of a scene scan. Results match GameObject.Find and
+    /// FindObjectsOfType: only active objects are returned.
+    /// Edits update just the affected objects' entries, from ObjectChangeEvents and from the bridge's own
+    /// writes; the index is rebuilt on the first lookup after a scene is opened or closed, or after play mode
+    /// changes objects, since runtime changes publish no change events.
+    /// </summary>
+    [InitializeOnLoad]
+    public static class GameObjectIndex
+    {
+        private const string EnabledPrefKey = "UnityMcpBridge.UseLookupIndex";
+        private const string MenuPath = "Window/Unity MCP/Use GameObject Lookup Index";
+
+        private static readonly Dictionary<string, List<GameObject>> byName = new Dictionary<string, List<GameObject>>();
+        private static readonly Dictionary<string, List<GameObject>> byPath = new Dictionary<string, List<GameObject>>();
+        private static readonly Dictionary<string, List<GameObject>> byTag = new Dictionary<string, List<GameObject>>();
+        private static readonly Dictionary<int, List<GameObject>> byLayer = new Dictionary<int, List<GameObject>>();
+        private static readonly Dictionary<Type, List<GameObject>> byComponent = new Dictionary<Type, List<GameObject>>();
+        // Every indexed object by instance ID, with the keys it is listed under, so it can be removed again
+        private static readonly Dictionary<int, Entry> entries = new Dictionary<int, Entry>();
+        private static readonly Dictionary<int, List<int>> children = new Dictionary<int, List<int>>();
+        private static bool dirty = true;
+
+        private sealed class Entry
+        {
+            public GameObject go;
+            public int parentId; // 0 for scene roots
+            public string name;
+            public string path;
+            public string tag;
+            public int layer;
+            public List<Type> componentTypes;
+        }
+
+        public static int RebuildCount { get; private set; }
+        public static double LastRebuildMilliseconds { get; private set; }
+        public static int UpdateCount { get; private set; }
+        public static int Count => entries.Count;
+
+        static GameObjectIndex()
+        {
+            EditorSceneManager.sceneOpened += (scene, mode) => MarkDirty();
+            EditorSceneManager.sceneClosed += scene => MarkDirty();
+            EditorSceneManager.newSceneCreated += (scene, setup, mode) => MarkDirty();
+            SceneManager.sceneLoaded += (scene, mode) => MarkDirty();
+            SceneManager.sceneUnloaded += scene => MarkDirty();
+            EditorApplication.playModeStateChanged += state => MarkDirty();
+            EditorApplication.hierarchyChanged += () =>
+            {
+                if (EditorApplication.isPlaying)
+                    MarkDirty();
+            };
+#if UNITY_2020_2_OR_NEWER
+            ObjectChangeEvents.changesPublished += OnChangesPublished;
+#else
+            EditorApplication.hierarchyChanged += MarkDirty;
+            Undo.undoRedoPerformed += MarkDirty;
+#endif
+        }
+
+        public static bool Enabled
+        {
+            get => EditorPrefs.GetBool(EnabledPrefKey, false);
+            set
+            {
+                EditorPrefs.SetBool(EnabledPrefKey, value);
+                MarkDirty();
+            }
+        }
+
+        [MenuItem(MenuPath)]
+        private static void ToggleEnabled()
+        {
+            Enabled = !Enabled;
+        }
+
+        [MenuItem(MenuPath, true)]
+        private static bool ToggleEnabledValidate()
+        {
+            Menu.SetChecked(MenuPath, Enabled);
+            return true;
+        }
+
+        /// <summary>
+        /// Forces a rebuild before the next lookup. Commands whose changes cannot be pinned to
+        /// particular objects, such as scene loads and menu items, call this.
+        /// </summary>
+        public static void MarkDirty()
+        {
+            dirty = true;
+        }
+
+        /// <summary>
+        /// Re-reads an object and everything under it after its name, tag, layer, components or parent changed,
+        /// or adds it if it was just created. Change events are only published on a later editor update,
+        /// too late for the next command in a batch, so commands that edit objects call this themselves.
+        /// </summary>
+        public static void Reindex(GameObject go)
+        {
+            if (dirty || go == null)
+                return;
+            RemoveTree(go.GetInstanceID());
+            // Prefab assets and prefab stage objects are not in a loaded scene
+            if (!go.scene.IsValid() || !go.scene.isLoaded || EditorSceneManager.IsPreviewScene(go.scene))
+                return;
+            Transform parent = go.transform.parent;
+            int parentId = parent != null ? parent.gameObject.GetInstanceID() : 0;
+            Entry parentEntry = null;
+            if (parent != null && !entries.TryGetValue(parentId, out parentEntry))
+            {
+                dirty = true;
+                return;
+            }
+            AddTree(go.transform, parentEntry?.path, parentId);
+            UpdateCount++;
+        }
+
+        /// <summary>
+        /// Drops a destroyed object and everything under it.
+        /// </summary>
+        public static void Remove(int instanceId)
+        {
+            if (dirty)
+                return;
+            RemoveTree(instanceId);
+            UpdateCount++;
+        }
+
+#if UNITY_2020_2_OR_NEWER
+        private static void OnChangesPublished(ref ObjectChangeEventStream stream)
+        {
+            for (int i = 0; i < stream.length && !dirty; i++)
+            {
+                switch (stream.GetEventType(i))
+                {
+                    case ObjectChangeKind.ChangeScene:
+                        MarkDirty();
+                        break;
+                    case ObjectChangeKind.CreateGameObjectHierarchy:
+                        stream.GetCreateGameObjectHierarchyEvent(i, out var created);
+                        Reindex(created.instanceId);
+                        break;
+                    case ObjectChangeKind.DestroyGameObjectHierarchy:
+                        stream.GetDestroyGameObjectHierarchyEvent(i, out var destroyed);
+                        Remove(destroyed.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectParent:
+                        stream.GetChangeGameObjectParentEvent(i, out var reparented);
+                        Reindex(reparented.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectStructure:
+                        stream.GetChangeGameObjectStructureEvent(i, out var structure);
+                        Reindex(structure.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectStructureHierarchy:
+                        stream.GetChangeGameObjectStructureHierarchyEvent(i, out var structureHierarchy);
+                        Reindex(structureHierarchy.instanceId);
+                        break;
+                    case ObjectChangeKind.ChangeGameObjectOrComponentProperties:
+                        // Renames, tags and layers, but mostly edits no entry depends on, such as a moved Transform
+                        stream.GetChangeGameObjectOrComponentPropertiesEvent(i, out var properties);
+                        GameObject edited = ToGameObject(properties.instanceId);
+                        if (edited == null || !IsCurrent(edited))
+                            Reindex(properties.instanceId);
+                        break;
+                    case ObjectChangeKind.UpdatePrefabInstances:
+                        stream.GetUpdatePrefabInstancesEvent(i, out var prefabs);
+                        foreach (int instanceId in prefabs.instanceIds)
+                            Reindex(instanceId);
+                        break;
+                }
+            }
+        }
+
+        private static void Reindex(int instanceId)
+        {
+            GameObject go = ToGameObject(instanceId);
+            if (go != null)
+                Reindex(go);
+            else
+                Remove(instanceId);
+        }
+
+        /// <summary>
+        /// The object with this ID, or the object a component with this ID is on.
+        /// </summary>
+        private static GameObject ToGameObject(int instanceId)
+        {
+            UnityEngine.Object obj = EditorUtility.InstanceIDToObject(instanceId);
+            if (obj is Component component)
+                return component != null ? component.gameObject : null;
+            return obj as GameObject;
+        }
+
+        private static bool IsCurrent(GameObject go)
+        {
+            return entries.TryGetValue(go.GetInstanceID(), out var entry)
+                && entry.name == go.name && entry.tag == go.tag && entry.layer == go.layer;
+        }
+#endif
+
+        /// <summary>
+        /// Same result as GameObject.Find: an active object by name, or by path when the name contains '/'.
+        /// </summary>
+        public static GameObject Find(string nameOrPath)
+        {
+            EnsureBuilt();
+            GameObject found;
+            if (!nameOrPath.Contains("/"))
+            {
+                found = Lookup(byName, nameOrPath).FirstOrDefault(go => IsActive(go) && go.name == nameOrPath);
+            }
+            else
+            {
+                string path = nameOrPath.TrimStart('/');
+                string[] parts = path.Split('/');
+                found = Lookup(byPath, path).FirstOrDefault(go => IsActive(go) && go.name == parts[parts.Length - 1]);
+                if (found == null && !nameOrPath.StartsWith("/"))
+                {
+                    // Relative paths match at any depth
+                    found = Lookup(byName, parts[parts.Length - 1])
+                        .FirstOrDefault(go => IsActive(go) && MatchesAncestors(go.transform, parts));
+                }
+            }
+            // Objects created since the last hierarchy event are still found, just without the index
+            return found != null ? found : GameObject.Find(nameOrPath);
+        }
+
+        public static List<GameObject> FindWithTag(string tag)
+        {
+            EnsureBuilt();
+            return Lookup(byTag, tag).Where(go => IsActive(go) && go.CompareTag(tag)).ToList();
+        }
+
+        public static List<GameObject> FindInLayer(int layer)
+        {
+            EnsureBuilt();
+            return Lookup(byLayer, layer).Where(go => IsActive(go) && go.layer == layer).ToList();
+        }
+
+        /// <summary>
+        /// Active objects with a component of this type or a subclass, like GetComponent(type).
+        /// </summary>
+        public static List<GameObject> FindWithComponent(Type type)
+        {
+            EnsureBuilt();
+            return Lookup(byComponent, type).Where(go => IsActive(go) && go.GetComponent(type) != null).ToList();
+        }
+
+        public static List<GameObject> FindAll()
+        {
+            EnsureBuilt();
+            return entries.Values.Select(entry => entry.go).Where(IsActive).ToList();
+        }
+
+        private static void EnsureBuilt()
+        {
+            if (!dirty)
+                return;
+            var stopwatch = Stopwatch.StartNew();
+            byName.Clear();
+            byPath.Clear();
+            byTag.Clear();
+            byLayer.Clear();
+            byComponent.Clear();
+            entries.Clear();
+            children.Clear();
+            for (int i = 0; i < SceneManager.sceneCount; i++)
+            {
+                Scene scene = SceneManager.GetSceneAt(i);
+                if (!scene.isLoaded)
+                    continue;
+                foreach (GameObject root in scene.GetRootGameObjects())
+                    AddTree(root.transform, null, 0);
+            }
+            dirty = false;
+            RebuildCount++;
+            LastRebuildMilliseconds = stopwatch.Elapsed.TotalMilliseconds;
+        }
+
+        private static void AddTree(Transform t, string parentPath, int parentId)
+        {
+            GameObject go = t.gameObject;
+            var entry = new Entry
+            {
+                go = go,
+                parentId = parentId,
+                name = go.name,
+                path = parentPath == null ? go.name : parentPath + "/" + go.name,
+                tag = go.tag,
+                layer = go.layer,
+                componentTypes = new List<Type>(),
+            };
+            foreach (Component component in go.GetComponents<Component>())
+            {
+                if (component == null)
+                    continue;
+                for (Type type = component.GetType(); type != null && type != typeof(UnityEngine.Object); type = type.BaseType)
+                {
+                    // Two components of the same type would list the object twice
+                    if (!entry.componentTypes.Contains(type))
+                        entry.componentTypes.Add(type);
+                }
+            }
+
+            int instanceId = go.GetInstanceID();
+            entries[instanceId] = entry;
+            Add(children, parentId, instanceId);
+            Add(byName, entry.name, go);
+            Add(byPath, entry.path, go);
+            Add(byTag, entry.tag, go);
+            Add(byLayer, entry.layer, go);
+            foreach (Type type in entry.componentTypes)
+                Add(byComponent, type, go);
+            for (int i = 0; i < t.childCount; i++)
+                AddTree(t.GetChild(i), entry.path, instanceId);
+        }
+
+        private static void RemoveTree(int instanceId)
+        {
+            if (!entries.TryGetValue(instanceId, out var top))
+                return;
+            if (children.TryGetValue(top.parentId, out var siblings))
+                siblings.Remove(instanceId);
+            var pending = new Stack<int>();
+            pending.Push(instanceId);
+            while (pending.Count > 0)
+            {
+                int id = pending.Pop();
+                if (!entries.TryGetValue(id, out var entry))
+                    continue;
+                entries.Remove(id);
+                RemoveFrom(byName, entry.name, entry.go);
+                RemoveFrom(byPath, entry.path, entry.go);
+                RemoveFrom(byTag, entry.tag, entry.go);
+                RemoveFrom(byLayer, entry.layer, entry.go);
+                foreach (Type type in entry.componentTypes)
+                    RemoveFrom(byComponent, type, entry.go);
+                if (children.TryGetValue(id, out var ids))
+                {
+                    children.Remove(id);
+                    foreach (int child in ids)
+                        pending.Push(child);
+                }
+            }
+        }
+
+        private static void Add<TKey, TValue>(Dictionary<TKey, List<TValue>> map, TKey key, TValue value)
+        {
+            if (!map.TryGetValue(key, out var list))
+            {
+                list = new List<TValue>();
+                map[key] = list;
+            }
+            list.Add(value);
+        }
+
+        private static void RemoveFrom<TKey>(Dictionary<TKey, List<GameObject>> map, TKey key, GameObject go)
+        {
+            if (key == null || !map.TryGetValue(key, out var list))
+                return;
+            // Destroyed objects all compare equal to null, so match by reference
+            int index = list.FindIndex(item => ReferenceEquals(item, go));
+            if (index >= 0)
+                list.RemoveAt(index);
+            if (list.Count == 0)
+                map.Remove(key);
+        }
+
+        private static IEnumerable<GameObject> Lookup<TKey>(Dictionary<TKey, List<GameObject>> map, TKey key)
+        {
+            return key != null && map.TryGetValue(key, out var list) ? list : Enumerable.Empty<GameObject>();
+        }
+
+        // Changes the index has not been told about yet can leave stale entries, so every hit is checked
+        private static bool IsActive(GameObject go)
+        {
+            return go != null && go.activeInHierarchy;
+        }
+
+        private static bool MatchesAncestors(Transform t, string[] parts)
+        {
+            for (int i = parts.Length - 1; i >= 0; i--)
+            {
+                if (t == null || t.name != parts[i])
+                    return false;
+                t = t.parent;
+            }
+            return true;
+        }
+    }
+}
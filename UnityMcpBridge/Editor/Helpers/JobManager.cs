@@ -0,0 +1,505 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using UnityEditor;
+using UnityEditor.Compilation;
+using UnityEngine;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// Long-running editor operations (script compilation, scene loads, asset imports, play mode changes).
+    /// The command that starts one replies at once with a job ID; the job then advances on editor ticks,
+    /// so other commands keep being answered, and clients follow it with the job_status command.
+    /// Jobs are kept in SessionState: those that only watch the editor (compilation, play mode) resume
+    /// after a domain reload, the others are reported as interrupted.
+    /// Script changes can also be staged: a compile job then collects them without importing them, and
+    /// imports them all at once when committed, so that they cost a single compilation and domain reload.
+    /// </summary>
+    [InitializeOnLoad]
+    public static class JobManager
+    {
+        public const string Running = "running";
+        public const string Succeeded = "succeeded";
+        public const string Failed = "failed";
+
+        public const string CompileKind = "compile";
+        public const string PlayKind = "play";
+        public const string StopKind = "stop";
+
+        private const string SessionKey = "UnityMcpBridge.Jobs";
+        private const int MaxFinishedJobs = 100;
+        // Seconds to wait for a compilation to start, or for the domain reload after it
+        private const double CompileGraceSeconds = 2.0;
+        // Seconds a play mode change may take to be scheduled before it counts as refused
+        private const double PlayModeGraceSeconds = 1.0;
+
+        /// <summary>
+        /// Main thread time the jobs may share per editor tick before yielding to commands
+        /// </summary>
+        public const double TickBudgetSeconds = 0.05;
+
+        public sealed class Job
+        {
+            public string jobId;
+            public string kind;
+            public string status = Running;
+            public float? progress; // 0 to 1, or null if it cannot be measured
+            public string message;
+            public JToken result;
+            public string error;
+            public double startedAt;
+            public double? finishedAt;
+            public JObject state = new(); // Kind-specific state that must survive a domain reload
+
+            [JsonIgnore]
+            public Func<Job, bool> Step; // Advances the job; returns true once it has finished
+        }
+
+        private static readonly List<Job> jobs = new();
+        private static bool dirty;
+        private static readonly System.Diagnostics.Stopwatch tickWatch = new();
+        private static int rotation; // Job that goes first on the next tick
+
+        // Steps of the jobs that can resume after a domain reload, by kind
+        private static readonly Dictionary<string, Func<Job, bool>> ResumableSteps = new()
+        {
+            { CompileKind, WatchCompilation },
+            { PlayKind, WatchEnterPlayMode },
+            { StopKind, WatchExitPlayMode },
+        };
+
+        static JobManager()
+        {
+            Restore();
+            CompilationPipeline.compilationStarted += _ => SetCompilePhase("compiling");
+            CompilationPipeline.assemblyCompilationFinished += RecordCompilerMessages;
+            CompilationPipeline.compilationFinished += _ => SetCompilePhase("compiled");
+            AssemblyReloadEvents.beforeAssemblyReload += () => SetCompilePhase("reloading");
+        }
+
+        private static double Now => EditorApplication.timeSinceStartup;
+
+        /// <summary>
+        /// Starts a job; its step first runs on the next editor tick, before any later command.
+        /// Kinds that only watch the editor (compile, play, stop) pass no step.
+        /// </summary>
+        public static Job Start(string kind, Func<Job, bool> step, string message = null)
+        {
+            if (step == null && !ResumableSteps.TryGetValue(kind, out step))
+            {
+                throw new ArgumentException($"Job kind '{kind}' needs a step.", nameof(step));
+            }
+            var job = new Job
+            {
+                jobId = Guid.NewGuid().ToString("N"),
+                kind = kind,
+                message = message,
+                startedAt = Now,
+                Step = step,
+            };
+            jobs.Add(job);
+            Save();
+            return job;
+        }
+
+        /// <summary>
+        /// Returns the compile job still waiting for compilation to start, or starts one, for a script
+        /// change that has been imported. Changes made in a row share the compilation they trigger,
+        /// and staged changes are committed with them, since they would be compiled anyway.
+        /// </summary>
+        public static Job StartCompilation(string path = null)
+        {
+            Job staged = StagedCompilation();
+            if (staged != null)
+            {
+                CommitStaged(staged);
+            }
+            Job pending = jobs.FirstOrDefault(job => job.kind == CompileKind && job.status == Running
+                && job.state.Value<string>("phase") == "waiting");
+            if (pending == null)
+            {
+                pending = Start(CompileKind, null, "Waiting for script compilation to start.");
+                pending.state["phase"] = "waiting";
+            }
+            // The grace period restarts with the latest write
+            pending.state["phaseAt"] = Now;
+            AddFile(pending, path);
+            Save();
+            return pending;
+        }
+
+        /// <summary>
+        /// Stages a script change ("write" or "delete") that has not been imported, and returns the compile
+        /// job collecting the staged changes. They are imported together by CommitStaged, by a change that
+        /// is imported right away, or once `debounceSeconds` pass without another staged change (0: never).
+        /// </summary>
+        public static Job StageScriptChange(string path, string change, double debounceSeconds)
+        {
+            Job staged = StagedCompilation();
+            if (staged == null)
+            {
+                staged = Start(CompileKind, null);
+                staged.state["phase"] = "staged";
+                staged.state["staged"] = new JObject();
+            }
+            var changes = (JObject)staged.state["staged"];
+            changes[path] = change;
+            AddFile(staged, path);
+            staged.state["phaseAt"] = Now;
+            staged.state["debounce"] = debounceSeconds;
+            staged.message = $"{changes.Count} script change(s) staged, waiting for a commit.";
+            Save();
+            return staged;
+        }
+
+        /// <summary>
+        /// The compile job collecting staged script changes, if there are any.
+        /// </summary>
+        public static Job StagedCompilation()
+        {
+            return jobs.FirstOrDefault(job => job.kind == CompileKind && job.status == Running
+                && job.state.Value<string>("phase") == "staged");
+        }
+
+        /// <summary>
+        /// Imports the staged script changes in one batch; the job then follows the compilation they trigger.
+        /// </summary>
+        public static void CommitStaged(Job job)
+        {
+            var changes = (JObject)job.state["staged"];
+            var notDeleted = new JArray();
+            AssetDatabase.StartAssetEditing();
+            try
+            {
+                foreach (JProperty change in changes.Properties())
+                {
+                    if ((string)change.Value != "delete")
+                    {
+                        AssetDatabase.ImportAsset(change.Name);
+                    }
+                    else if (!AssetDatabase.MoveAssetToTrash(change.Name))
+                    {
+                        Debug.LogWarning($"[JobManager] Could not move staged script '{change.Name}' to the trash.");
+                        notDeleted.Add(change.Name);
+                    }
+                }
+            }
+            finally
+            {
+                AssetDatabase.StopAssetEditing();
+            }
+            AssetDatabase.Refresh();
+            job.state.Remove("staged");
+            if (notDeleted.Count > 0)
+            {
+                job.state["notDeleted"] = notDeleted;
+            }
+            job.state["phase"] = "waiting";
+            job.state["phaseAt"] = Now;
+            job.message = $"{changes.Count} script change(s) committed, waiting for script compilation to start.";
+            Save();
+        }
+
+        public static Job Get(string jobId)
+        {
+            return jobs.FirstOrDefault(job => job.jobId == jobId);
+        }
+
+        public static IReadOnlyList<Job> All => jobs;
+
+        /// <summary>
+        /// True while the jobs have main thread time left in this tick. Steps that work in slices
+        /// stop when it turns false and go on at the next tick.
+        /// </summary>
+        public static bool TickBudgetLeft => tickWatch.Elapsed.TotalSeconds < TickBudgetSeconds;
+
+        public static void Complete(Job job, string message, JToken result = null)
+        {
+            Finish(job, Succeeded, message, result, null);
+        }
+
+        public static void Fail(Job job, string error, JToken result = null)
+        {
+            Finish(job, Failed, null, result, error);
+        }
+
+        private static void Finish(Job job, string status, string message, JToken result, string error)
+        {
+            job.status = status;
+            job.message = message ?? job.message;
+            job.result = result ?? job.result;
+            job.error = error;
+            job.finishedAt = Now;
+            if (status == Succeeded)
+            {
+                job.progress = 1f;
+            }
+            dirty = true;
+        }
+
+        /// <summary>
+        /// The reply of a command that started a job.
+        /// </summary>
+        public static object Started(Job job, string message, object data = null)
+        {
+            var result = data != null ? JObject.FromObject(data) : new JObject();
+            result["jobId"] = job.jobId;
+            result["jobStatus"] = job.status;
+            return Response.Success(message, result);
+        }
+
+        /// <summary>
+        /// A job as reported by job_status.
+        /// </summary>
+        public static object Describe(Job job)
+        {
+            return new
+            {
+                jobId = job.jobId,
+                kind = job.kind,
+                status = job.status,
+                progress = job.progress,
+                message = job.message,
+                error = job.error,
+                result = job.result,
+                elapsed = Math.Round((job.finishedAt ?? Now) - job.startedAt, 3),
+            };
+        }
+
+        /// <summary>
+        /// Advances the running jobs. Called by the bridge on every editor tick before it processes commands.
+        /// </summary>
+        public static void Update()
+        {
+            List<Job> running = jobs.Where(job => job.status == Running && job.Step != null).ToList();
+            tickWatch.Restart();
+            // Each tick a different job goes first, so that one slicing job cannot starve the others
+            rotation = running.Count > 0 ? (rotation + 1) % running.Count : 0;
+            foreach (Job job in running.Skip(rotation).Concat(running.Take(rotation)))
+            {
+                try
+                {
+                    if (job.Step(job) && job.status == Running)
+                    {
+                        Complete(job, job.message);
+                    }
+                }
+                catch (Exception e)
+                {
+                    Fail(job, e.Message);
+                }
+            }
+            if (dirty)
+            {
+                Save();
+            }
+        }
+
+        private static void Save()
+        {
+            // Finished jobs are kept for job_status until there are too many
+            int excess = jobs.Count(job => job.status != Running) - MaxFinishedJobs;
+            if (excess > 0)
+            {
+                jobs.RemoveAll(job => job.status != Running && excess-- > 0);
+            }
+            SessionState.SetString(SessionKey, JsonConvert.SerializeObject(jobs));
+            dirty = false;
+        }
+
+        private static void Restore()
+        {
+            string json = SessionState.GetString(SessionKey, null);
+            if (string.IsNullOrEmpty(json))
+            {
+                return;
+            }
+            try
+            {
+                jobs.AddRange(JsonConvert.DeserializeObject<List<Job>>(json) ?? new List<Job>());
+            }
+            catch (Exception e)
+            {
+                Debug.LogWarning($"[JobManager] Could not restore jobs: {e.Message}");
+                return;
+            }
+            foreach (Job job in jobs.Where(job => job.status == Running))
+            {
+                if (ResumableSteps.TryGetValue(job.kind, out Func<Job, bool> step))
+                {
+                    job.Step = step;
+                }
+                else
+                {
+                    Fail(job, "Interrupted by a domain reload.");
+                }
+            }
+            Save();
+        }
+
+        // --- Script compilation ---
+
+        // Compile jobs following a compilation; staged ones have not triggered theirs yet
+        private static IEnumerable<Job> WatchingCompilation()
+        {
+            return jobs.Where(job => job.kind == CompileKind && job.status == Running
+                && job.state.Value<string>("phase") != "staged");
+        }
+
+        private static void AddFile(Job job, string path)
+        {
+            if (string.IsNullOrEmpty(path))
+            {
+                return;
+            }
+            if (!(job.state["files"] is JArray files))
+            {
+                job.state["files"] = files = new JArray();
+            }
+            if (!files.Values<string>().Contains(path))
+            {
+                files.Add(path);
+            }
+        }
+
+        /// <summary>
+        /// The result of a compile job: the compiler errors, and for each script the job's changes
+        /// touched, the errors reported in that file.
+        /// </summary>
+        private static JObject CompileResult(Job job)
+        {
+            var errors = job.state["errors"] as JArray ?? new JArray();
+            var files = new JObject();
+            foreach (string path in job.state["files"]?.Values<string>() ?? Enumerable.Empty<string>())
+            {
+                files[path] = new JArray(errors.Where(error => ((string)error["file"] ?? "").Replace('\\', '/')
+                    .EndsWith(path, StringComparison.OrdinalIgnoreCase)));
+            }
+            var result = new JObject { ["errors"] = errors, ["files"] = files };
+            if (job.state["notDeleted"] is JArray notDeleted)
+            {
+                result["notDeleted"] = notDeleted;
+            }
+            return result;
+        }
+
+        private static void SetCompilePhase(string phase)
+        {
+            foreach (Job job in WatchingCompilation())
+            {
+                job.state["phase"] = phase;
+                job.state["phaseAt"] = Now;
+            }
+            // Saved right away: a domain reload may follow before the next tick
+            Save();
+        }
+
+        private static void RecordCompilerMessages(string assembly, CompilerMessage[] messages)
+        {
+            var errors = messages.Where(m => m.type == CompilerMessageType.Error).ToList();
+            if (errors.Count == 0)
+            {
+                return;
+            }
+            foreach (Job job in WatchingCompilation())
+            {
+                if (!(job.state["errors"] is JArray list))
+                {
+                    job.state["errors"] = list = new JArray();
+                }
+                foreach (CompilerMessage error in errors)
+                {
+                    list.Add(JObject.FromObject(new { message = error.message, file = error.file, line = error.line }));
+                }
+            }
+            Save();
+        }
+
+        private static bool WatchCompilation(Job job)
+        {
+            string phase = job.state.Value<string>("phase") ?? "waiting";
+            double phaseAt = job.state.Value<double?>("phaseAt") ?? job.startedAt;
+            switch (phase)
+            {
+                case "staged":
+                    double debounce = job.state.Value<double?>("debounce") ?? 0;
+                    if (debounce > 0 && Now - phaseAt >= debounce)
+                    {
+                        CommitStaged(job);
+                    }
+                    return false;
+                case "waiting":
+                    if (EditorApplication.isCompiling)
+                    {
+                        SetCompilePhase("compiling");
+                        return false;
+                    }
+                    if (Now - phaseAt < CompileGraceSeconds)
+                    {
+                        return false;
+                    }
+                    Complete(job, "No script compilation was needed.", CompileResult(job));
+                    return true;
+                case "compiling":
+                    job.message = "Compiling scripts.";
+                    if (EditorApplication.isCompiling)
+                    {
+                        return false;
+                    }
+                    SetCompilePhase("compiled");
+                    return false;
+                case "compiled":
+                    if (job.state["errors"] is JArray errors && errors.Count > 0)
+                    {
+                        Fail(job, $"Script compilation failed with {errors.Count} error(s).", CompileResult(job));
+                        return true;
+                    }
+                    if (EditorUtility.scriptCompilationFailed)
+                    {
+                        Fail(job, "Script compilation failed; see the console.", CompileResult(job));
+                        return true;
+                    }
+                    job.message = "Waiting for the domain reload.";
+                    if (Now - phaseAt < CompileGraceSeconds)
+                    {
+                        return false;
+                    }
+                    Complete(job, "Scripts compiled.", CompileResult(job));
+                    return true;
+                default: // "reloading": this step runs in the reloaded domain
+                    Complete(job, "Scripts compiled and reloaded.", CompileResult(job));
+                    return true;
+            }
+        }
+
+        // --- Play mode ---
+
+        private static bool WatchEnterPlayMode(Job job)
+        {
+            if (EditorApplication.isPlaying)
+            {
+                Complete(job, "Editor entered play mode.");
+                return true;
+            }
+            if (!EditorApplication.isPlayingOrWillChangePlaymode && Now - job.startedAt > PlayModeGraceSeconds)
+            {
+                Fail(job, "The editor did not enter play mode; check the console for compile errors.");
+                return true;
+            }
+            return false;
+        }
+
+        private static bool WatchExitPlayMode(Job job)
+        {
+            if (EditorApplication.isPlaying || EditorApplication.isPlayingOrWillChangePlaymode)
+            {
+                return false;
+            }
+            Complete(job, "Editor exited play mode.");
+            return true;
+        }
+    }
+}
@@ -0,0 +1,206 @@
+using System;
+using System.IO;
+using System.Text;
+using System.Threading.Tasks;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// Reassembles the unframed (legacy) messages of one client from the pieces its socket reads return.
+    /// A message that starts with a JSON object ends with the brace that closes it, and a "ping {options}"
+    /// handshake with the brace that closes its options; any other text, such as a bare ping, is taken as it
+    /// was read (once it is at least as long as "ping"). Braces inside JSON strings are skipped, and the bytes
+    /// are only decoded once a message is complete, so characters split across reads survive.
+    /// </summary>
+    public sealed class MessageAssembler
+    {
+        private const string HandshakePrefix = "ping ";
+        private const int PingLength = 4; // A bare "ping"
+        private const int ReadSize = 8192;
+
+        private readonly int maxSize;
+        private byte[] buffer = new byte[ReadSize];
+        private int start; // First byte of the message being assembled
+        private int end; // End of the bytes read so far
+        // Scan state of the JSON message being assembled; scanFrom is -1 until its first brace is found
+        private int scanFrom = -1;
+        private int depth;
+        private bool inString;
+        private bool escaped;
+
+        public MessageAssembler(int maxSize)
+        {
+            this.maxSize = maxSize;
+        }
+
+        /// <summary>
+        /// Reads from the stream until the next message is complete. Returns null if the client disconnected.
+        /// </summary>
+        public async Task<string> ReadMessageAsync(Stream stream)
+        {
+            while (true)
+            {
+                string message = TakeMessage();
+                if (message != null)
+                {
+                    return message;
+                }
+                Reserve(ReadSize);
+                int bytesRead = await stream.ReadAsync(buffer, end, buffer.Length - end);
+                if (bytesRead == 0)
+                {
+                    return null;
+                }
+                end += bytesRead;
+            }
+        }
+
+        /// <summary>
+        /// Makes room for a read of at least `minimum` bytes, growing the buffer for long messages.
+        /// </summary>
+        private void Reserve(int minimum)
+        {
+            if (buffer.Length - end >= minimum)
+            {
+                return;
+            }
+            int pending = end - start;
+            if (pending + minimum > maxSize)
+            {
+                throw new InvalidDataException($"Message exceeds {maxSize} bytes");
+            }
+            byte[] target = pending + minimum <= buffer.Length
+                ? buffer
+                : new byte[Math.Min(maxSize, Math.Max(buffer.Length * 2, pending + minimum))];
+            Array.Copy(buffer, start, target, 0, pending);
+            buffer = target;
+            if (scanFrom >= 0)
+            {
+                scanFrom -= start;
+            }
+            start = 0;
+            end = pending;
+        }
+
+        /// <summary>
+        /// Returns the next complete message, or null if more bytes are needed.
+        /// </summary>
+        private string TakeMessage()
+        {
+            if (scanFrom < 0)
+            {
+                while (start < end && IsWhiteSpace(buffer[start]))
+                {
+                    start++;
+                }
+                if (start == end)
+                {
+                    start = end = 0;
+                    return null;
+                }
+                int brace = start;
+                if (StartsWith(HandshakePrefix))
+                {
+                    brace += HandshakePrefix.Length;
+                    while (brace < end && IsWhiteSpace(buffer[brace]))
+                    {
+                        brace++;
+                    }
+                    if (brace == end)
+                    {
+                        return null; // The handshake options follow
+                    }
+                }
+                else if (end - start < PingLength && IsPrefixOf(HandshakePrefix))
+                {
+                    return null; // The start of a ping
+                }
+                if (buffer[brace] != (byte)'{')
+                {
+                    // Not JSON: taken as it was read
+                    return Take(end);
+                }
+                scanFrom = brace;
+            }
+
+            for (int i = scanFrom; i < end; i++)
+            {
+                byte b = buffer[i];
+                if (inString)
+                {
+                    if (escaped)
+                    {
+                        escaped = false;
+                    }
+                    else if (b == (byte)'\\')
+                    {
+                        escaped = true;
+                    }
+                    else if (b == (byte)'"')
+                    {
+                        inString = false;
+                    }
+                }
+                else if (b == (byte)'"')
+                {
+                    inString = true;
+                }
+                else if (b == (byte)'{' || b == (byte)'[')
+                {
+                    depth++;
+                }
+                else if ((b == (byte)'}' || b == (byte)']') && --depth == 0)
+                {
+                    scanFrom = -1;
+                    return Take(i + 1);
+                }
+            }
+            scanFrom = end;
+            return null;
+        }
+
+        private string Take(int messageEnd)
+        {
+            string message = Encoding.UTF8.GetString(buffer, start, messageEnd - start);
+            start = messageEnd;
+            if (start == end)
+            {
+                start = end = 0;
+            }
+            return message;
+        }
+
+        private bool IsPrefixOf(string text)
+        {
+            for (int i = start; i < end; i++)
+            {
+                if (buffer[i] != (byte)text[i - start])
+                {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        private bool StartsWith(string prefix)
+        {
+            if (end - start < prefix.Length)
+            {
+                return false;
+            }
+            for (int i = 0; i < prefix.Length; i++)
+            {
+                if (buffer[start + i] != (byte)prefix[i])
+                {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        private static bool IsWhiteSpace(byte b)
+        {
+            return b == (byte)' ' || b == (byte)'\t' || b == (byte)'\r' || b == (byte)'\n';
+        }
+    }
+}
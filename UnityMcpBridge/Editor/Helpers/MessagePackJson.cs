@@ -0,0 +1,410 @@
+using System;
+using System.Globalization;
+using System.IO;
+using System.Numerics;
+using System.Text;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// Converts messages between JSON text and MessagePack, for clients that negotiate the MessagePack
+    /// encoding. The bridge converts at the frame boundary, so commands and responses stay JSON inside
+    /// the editor. Only the types JSON can express are written; binary values are read back as base64
+    /// strings and extension types as null.
+    /// </summary>
+    public static class MessagePackJson
+    {
+        private static readonly UTF8Encoding Utf8 = new UTF8Encoding(false);
+
+        /// <summary>
+        /// True if the message starts with a MessagePack map, the shape of every command.
+        /// </summary>
+        public static bool StartsWithMap(byte[] data)
+        {
+            return data.Length > 0 && ((data[0] & 0xf0) == 0x80 || data[0] == 0xde || data[0] == 0xdf);
+        }
+
+        /// <summary>
+        /// Encodes a JSON document as MessagePack.
+        /// </summary>
+        public static byte[] FromJson(string json)
+        {
+            JToken token;
+            using (var reader = new JsonTextReader(new StringReader(json)))
+            {
+                // Keep date-like strings as strings
+                reader.DateParseHandling = DateParseHandling.None;
+                token = JToken.ReadFrom(reader);
+            }
+            var output = new MemoryStream(json.Length / 2 + 16);
+            Write(output, token);
+            return output.ToArray();
+        }
+
+        /// <summary>
+        /// Decodes one MessagePack message to compact JSON text.
+        /// </summary>
+        public static string ToJson(byte[] data)
+        {
+            var text = new StringWriter(new StringBuilder(data.Length * 2), CultureInfo.InvariantCulture);
+            using (var writer = new JsonTextWriter(text))
+            {
+                int position = 0;
+                Read(data, ref position, writer);
+                if (position != data.Length)
+                {
+                    throw new InvalidDataException($"Unexpected data after the MessagePack message at offset {position}");
+                }
+            }
+            return text.ToString();
+        }
+
+        private static void Write(MemoryStream output, JToken token)
+        {
+            switch (token.Type)
+            {
+                case JTokenType.Object:
+                    var obj = (JObject)token;
+                    WriteHeader(output, obj.Count, 0x80, 0xde, 0xdf);
+                    foreach (JProperty property in obj.Properties())
+                    {
+                        WriteString(output, property.Name);
+                        Write(output, property.Value);
+                    }
+                    break;
+                case JTokenType.Array:
+                    var array = (JArray)token;
+                    WriteHeader(output, array.Count, 0x90, 0xdc, 0xdd);
+                    foreach (JToken item in array)
+                    {
+                        Write(output, item);
+                    }
+                    break;
+                case JTokenType.Integer:
+                    object value = ((JValue)token).Value;
+                    if (value is BigInteger big)
+                    {
+                        if (big >= 0 && big <= ulong.MaxValue)
+                        {
+                            output.WriteByte(0xcf);
+                            WriteBigEndian(output, (ulong)big, 8);
+                        }
+                        else
+                        {
+                            WriteDouble(output, (double)big);
+                        }
+                    }
+                    else
+                    {
+                        WriteInteger(output, token.Value<long>());
+                    }
+                    break;
+                case JTokenType.Float:
+                    WriteDouble(output, token.Value<double>());
+                    break;
+                case JTokenType.Boolean:
+                    output.WriteByte(token.Value<bool>() ? (byte)0xc3 : (byte)0xc2);
+                    break;
+                case JTokenType.Null:
+                case JTokenType.Undefined:
+                    output.WriteByte(0xc0);
+                    break;
+                case JTokenType.String:
+                    WriteString(output, (string)token);
+                    break;
+                default:
+                    WriteString(output, token.ToString());
+                    break;
+            }
+        }
+
+        private static void WriteHeader(MemoryStream output, int count, byte fix, byte marker16, byte marker32)
+        {
+            if (count < 16)
+            {
+                output.WriteByte((byte)(fix | count));
+            }
+            else if (count <= ushort.MaxValue)
+            {
+                output.WriteByte(marker16);
+                WriteBigEndian(output, (ulong)count, 2);
+            }
+            else
+            {
+                output.WriteByte(marker32);
+                WriteBigEndian(output, (ulong)count, 4);
+            }
+        }
+
+        private static void WriteString(MemoryStream output, string value)
+        {
+            byte[] bytes = Utf8.GetBytes(value);
+            if (bytes.Length < 32)
+            {
+                output.WriteByte((byte)(0xa0 | bytes.Length));
+            }
+            else if (bytes.Length <= byte.MaxValue)
+            {
+                output.WriteByte(0xd9);
+                output.WriteByte((byte)bytes.Length);
+            }
+            else if (bytes.Length <= ushort.MaxValue)
+            {
+                output.WriteByte(0xda);
+                WriteBigEndian(output, (ulong)bytes.Length, 2);
+            }
+            else
+            {
+                output.WriteByte(0xdb);
+                WriteBigEndian(output, (ulong)bytes.Length, 4);
+            }
+            output.Write(bytes, 0, bytes.Length);
+        }
+
+        private static void WriteInteger(MemoryStream output, long value)
+        {
+            if (value >= 0)
+            {
+                if (value <= 0x7f)
+                {
+                    output.WriteByte((byte)value);
+                }
+                else if (value <= byte.MaxValue)
+                {
+                    output.WriteByte(0xcc);
+                    output.WriteByte((byte)value);
+                }
+                else if (value <= ushort.MaxValue)
+                {
+                    output.WriteByte(0xcd);
+                    WriteBigEndian(output, (ulong)value, 2);
+                }
+                else if (value <= uint.MaxValue)
+                {
+                    output.WriteByte(0xce);
+                    WriteBigEndian(output, (ulong)value, 4);
+                }
+                else
+                {
+                    output.WriteByte(0xcf);
+                    WriteBigEndian(output, (ulong)value, 8);
+                }
+            }
+            else if (value >= -32)
+            {
+                output.WriteByte((byte)(sbyte)value);
+            }
+            else if (value >= sbyte.MinValue)
+            {
+                output.WriteByte(0xd0);
+                output.WriteByte((byte)(sbyte)value);
+            }
+            else if (value >= short.MinValue)
+            {
+                output.WriteByte(0xd1);
+                WriteBigEndian(output, (ulong)value, 2);
+            }
+            else if (value >= int.MinValue)
+            {
+                output.WriteByte(0xd2);
+                WriteBigEndian(output, (ulong)value, 4);
+            }
+            else
+            {
+                output.WriteByte(0xd3);
+                WriteBigEndian(output, (ulong)value, 8);
+            }
+        }
+
+        private static void WriteDouble(MemoryStream output, double value)
+        {
+            output.WriteByte(0xcb);
+            WriteBigEndian(output, (ulong)BitConverter.DoubleToInt64Bits(value), 8);
+        }
+
+        private static void WriteBigEndian(MemoryStream output, ulong value, int size)
+        {
+            for (int shift = (size - 1) * 8; shift >= 0; shift -= 8)
+            {
+                output.WriteByte((byte)(value >> shift));
+            }
+        }
+
+        private static void Read(byte[] data, ref int position, JsonWriter writer)
+        {
+            byte marker = ReadByte(data, ref position);
+            if (marker <= 0x7f)
+            {
+                writer.WriteValue((long)marker);
+            }
+            else if (marker <= 0x8f)
+            {
+                ReadMap(data, ref position, writer, marker & 0x0f);
+            }
+            else if (marker <= 0x9f)
+            {
+                ReadArray(data, ref position, writer, marker & 0x0f);
+            }
+            else if (marker <= 0xbf)
+            {
+                writer.WriteValue(ReadString(data, ref position, marker & 0x1f));
+            }
+            else if (marker >= 0xe0)
+            {
+                writer.WriteValue((long)(sbyte)marker);
+            }
+            else
+            {
+                switch (marker)
+                {
+                    case 0xc0: writer.WriteNull(); break;
+                    case 0xc2: writer.WriteValue(false); break;
+                    case 0xc3: writer.WriteValue(true); break;
+                    case 0xc4: writer.WriteValue(ReadBytes(data, ref position, (int)ReadBigEndian(data, ref position, 1))); break;
+                    case 0xc5: writer.WriteValue(ReadBytes(data, ref position, (int)ReadBigEndian(data, ref position, 2))); break;
+                    case 0xc6: writer.WriteValue(ReadBytes(data, ref position, ReadLength(data, ref position))); break;
+                    case 0xc7: SkipExtension(data, ref position, (int)ReadBigEndian(data, ref position, 1), writer); break;
+                    case 0xc8: SkipExtension(data, ref position, (int)ReadBigEndian(data, ref position, 2), writer); break;
+                    case 0xc9: SkipExtension(data, ref position, ReadLength(data, ref position), writer); break;
+                    case 0xca: writer.WriteValue((double)ReadSingle(data, ref position)); break;
+                    case 0xcb: writer.WriteValue(BitConverter.Int64BitsToDouble((long)ReadBigEndian(data, ref position, 8))); break;
+                    case 0xcc: writer.WriteValue((long)ReadBigEndian(data, ref position, 1)); break;
+                    case 0xcd: writer.WriteValue((long)ReadBigEndian(data, ref position, 2)); break;
+                    case 0xce: writer.WriteValue((long)ReadBigEndian(data, ref position, 4)); break;
+                    case 0xcf: writer.WriteValue(ReadBigEndian(data, ref position, 8)); break;
+                    case 0xd0: writer.WriteValue((long)(sbyte)ReadBigEndian(data, ref position, 1)); break;
+                    case 0xd1: writer.WriteValue((long)(short)ReadBigEndian(data, ref position, 2)); break;
+                    case 0xd2: writer.WriteValue((long)(int)ReadBigEndian(data, ref position, 4)); break;
+                    case 0xd3: writer.WriteValue((long)ReadBigEndian(data, ref position, 8)); break;
+                    case 0xd4: SkipExtension(data, ref position, 1, writer); break;
+                    case 0xd5: SkipExtension(data, ref position, 2, writer); break;
+                    case 0xd6: SkipExtension(data, ref position, 4, writer); break;
+                    case 0xd7: SkipExtension(data, ref position, 8, writer); break;
+                    case 0xd8: SkipExtension(data, ref position, 16, writer); break;
+                    case 0xd9: writer.WriteValue(ReadString(data, ref position, (int)ReadBigEndian(data, ref position, 1))); break;
+                    case 0xda: writer.WriteValue(ReadString(data, ref position, (int)ReadBigEndian(data, ref position, 2))); break;
+                    case 0xdb: writer.WriteValue(ReadString(data, ref position, ReadLength(data, ref position))); break;
+                    case 0xdc: ReadArray(data, ref position, writer, (int)ReadBigEndian(data, ref position, 2)); break;
+                    case 0xdd: ReadArray(data, ref position, writer, ReadLength(data, ref position)); break;
+                    case 0xde: ReadMap(data, ref position, writer, (int)ReadBigEndian(data, ref position, 2)); break;
+                    case 0xdf: ReadMap(data, ref position, writer, ReadLength(data, ref position)); break;
+                    default: throw new InvalidDataException($"Invalid MessagePack marker 0x{marker:x2}");
+                }
+            }
+        }
+
+        private static void ReadMap(byte[] data, ref int position, JsonWriter writer, int count)
+        {
+            writer.WriteStartObject();
+            for (int i = 0; i < count; i++)
+            {
+                writer.WritePropertyName(ReadKey(data, ref position));
+                Read(data, ref position, writer);
+            }
+            writer.WriteEndObject();
+        }
+
+        private static void ReadArray(byte[] data, ref int position, JsonWriter writer, int count)
+        {
+            writer.WriteStartArray();
+            for (int i = 0; i < count; i++)
+            {
+                Read(data, ref position, writer);
+            }
+            writer.WriteEndArray();
+        }
+
+        /// <summary>
+        /// Reads a map key; JSON only has string keys, so other scalars are written as text.
+        /// </summary>
+        private static string ReadKey(byte[] data, ref int position)
+        {
+            EnsureAvailable(data, position, 1);
+            byte marker = data[position];
+            if ((marker & 0xe0) == 0xa0)
+            {
+                position++;
+                return ReadString(data, ref position, marker & 0x1f);
+            }
+            if (marker >= 0xd9 && marker <= 0xdb)
+            {
+                position++;
+                int length = marker == 0xdb ? ReadLength(data, ref position) : (int)ReadBigEndian(data, ref position, marker - 0xd8);
+                return ReadString(data, ref position, length);
+            }
+            var text = new StringWriter(CultureInfo.InvariantCulture);
+            using (var writer = new JsonTextWriter(text))
+            {
+                Read(data, ref position, writer);
+            }
+            return text.ToString();
+        }
+
+        private static string ReadString(byte[] data, ref int position, int length)
+        {
+            EnsureAvailable(data, position, length);
+            string value = Utf8.GetString(data, position, length);
+            position += length;
+            return value;
+        }
+
+        private static byte[] ReadBytes(byte[] data, ref int position, int length)
+        {
+            EnsureAvailable(data, position, length);
+            byte[] value = new byte[length];
+            Buffer.BlockCopy(data, position, value, 0, length);
+            position += length;
+            return value;
+        }
+
+        private static void SkipExtension(byte[] data, ref int position, int length, JsonWriter writer)
+        {
+            EnsureAvailable(data, position, length + 1);
+            position += length + 1; // Type byte and payload
+            writer.WriteNull();
+        }
+
+        private static float ReadSingle(byte[] data, ref int position)
+        {
+            byte[] bytes = BitConverter.GetBytes((uint)ReadBigEndian(data, ref position, 4));
+            return BitConverter.ToSingle(bytes, 0);
+        }
+
+        private static int ReadLength(byte[] data, ref int position)
+        {
+            ulong length = ReadBigEndian(data, ref position, 4);
+            if (length > int.MaxValue)
+            {
+                throw new InvalidDataException($"MessagePack length {length} is too large");
+            }
+            return (int)length;
+        }
+
+        private static ulong ReadBigEndian(byte[] data, ref int position, int size)
+        {
+            EnsureAvailable(data, position, size);
+            ulong value = 0;
+            for (int i = 0; i < size; i++)
+            {
+                value = (value << 8) | data[position++];
+            }
+            return value;
+        }
+
+        private static byte ReadByte(byte[] data, ref int position)
+        {
+            EnsureAvailable(data, position, 1);
+            return data[position++];
+        }
+
+        private static void EnsureAvailable(byte[] data, int position, int count)
+        {
+            if (count < 0 || position + count > data.Length)
+            {
+                throw new InvalidDataException("MessagePack message ended unexpectedly");
+            }
+        }
+    }
+}
@@ -0,0 +1,134 @@
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.IO;
+using System.Text;
+using System.Text.RegularExpressions;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// Applies unified diffs, as produced by Python's difflib for manage_script updates.
+    /// Lines are split after each '\n' and keep their line endings, so a "\r" stays part of its line;
+    /// a "\ No newline at end of file" marker removes the newline of the line before it.
+    /// </summary>
+    public static class UnifiedDiff
+    {
+        private static readonly Regex HunkHeader = new(@"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@");
+
+        private sealed class Hunk
+        {
+            public int OldStart; // 0-based index of the first line the hunk replaces
+            public readonly List<(char Kind, string Text)> Lines = new();
+        }
+
+        /// <summary>
+        /// Returns the text with the patch applied. Throws InvalidDataException if the patch is malformed
+        /// or its context and removed lines do not match the text.
+        /// </summary>
+        public static string Apply(string original, string patch)
+        {
+            List<string> lines = SplitLines(original);
+            var result = new StringBuilder(original.Length + patch.Length);
+            int cursor = 0;
+            foreach (Hunk hunk in Parse(patch))
+            {
+                if (hunk.OldStart < cursor || hunk.OldStart > lines.Count)
+                {
+                    throw new InvalidDataException($"Hunk at line {hunk.OldStart + 1} is out of order or past the end of the file.");
+                }
+                while (cursor < hunk.OldStart)
+                {
+                    result.Append(lines[cursor++]);
+                }
+                foreach ((char kind, string text) in hunk.Lines)
+                {
+                    if (kind == '+')
+                    {
+                        result.Append(text);
+                        continue;
+                    }
+                    if (cursor >= lines.Count || lines[cursor] != text)
+                    {
+                        throw new InvalidDataException($"Patch does not match the file at line {cursor + 1}.");
+                    }
+                    if (kind == ' ')
+                    {
+                        result.Append(text);
+                    }
+                    cursor++;
+                }
+            }
+            while (cursor < lines.Count)
+            {
+                result.Append(lines[cursor++]);
+            }
+            return result.ToString();
+        }
+
+        private static List<Hunk> Parse(string patch)
+        {
+            var hunks = new List<Hunk>();
+            Hunk hunk = null;
+            foreach (string line in SplitLines(patch))
+            {
+                if (hunk == null && (line.StartsWith("--- ") || line.StartsWith("+++ ")))
+                {
+                    continue; // File headers
+                }
+                Match header = HunkHeader.Match(line);
+                if (header.Success)
+                {
+                    int oldStart = int.Parse(header.Groups[1].Value, CultureInfo.InvariantCulture);
+                    int oldCount = header.Groups[2].Success ? int.Parse(header.Groups[2].Value, CultureInfo.InvariantCulture) : 1;
+                    // An empty range names the line after which the new lines go
+                    hunk = new Hunk { OldStart = oldCount == 0 ? oldStart : oldStart - 1 };
+                    hunks.Add(hunk);
+                    continue;
+                }
+                if (hunk == null)
+                {
+                    throw new InvalidDataException("Patch text found before the first hunk header.");
+                }
+                char kind = line[0];
+                if (kind == '\\')
+                {
+                    // "\ No newline at end of file"
+                    int last = hunk.Lines.Count - 1;
+                    if (last < 0 || !hunk.Lines[last].Text.EndsWith("\n"))
+                    {
+                        throw new InvalidDataException("Misplaced end-of-file marker in patch.");
+                    }
+                    (char lastKind, string lastText) = hunk.Lines[last];
+                    hunk.Lines[last] = (lastKind, lastText.Substring(0, lastText.Length - 1));
+                }
+                else if (kind == ' ' || kind == '-' || kind == '+')
+                {
+                    hunk.Lines.Add((kind, line.Substring(1)));
+                }
+                else
+                {
+                    throw new InvalidDataException($"Unexpected patch line: '{line.TrimEnd()}'.");
+                }
+            }
+            return hunks;
+        }
+
+        /// <summary>
+        /// Splits text after each '\n', keeping the line endings; the last line may have none.
+        /// </summary>
+        private static List<string> SplitLines(string text)
+        {
+            var lines = new List<string>();
+            int start = 0;
+            while (start < text.Length)
+            {
+                int newline = text.IndexOf('\n', start);
+                int end = newline < 0 ? text.Length : newline + 1;
+                lines.Add(text.Substring(start, end - start));
+                start = end;
+            }
+            return lines;
+        }
+    }
+}
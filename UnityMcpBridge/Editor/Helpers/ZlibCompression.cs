@@ -0,0 +1,96 @@
+using System;
+using System.IO;
+using System.IO.Compression;
+
+namespace UnityMcpBridge.Editor.Helpers
+{
+    /// <summary>
+    /// zlib (RFC 1950) compression of message bodies, for clients that negotiate compression.
+    /// DeflateStream provides the deflate data; the zlib header and Adler-32 trailer are added here.
+    /// </summary>
+    public static class ZlibCompression
+    {
+        public const string Name = "zlib";
+
+        private const uint AdlerModulus = 65521;
+        private const int AdlerBlock = 5552; // Bytes that can be summed before the sums must be reduced
+
+        /// <summary>
+        /// Compresses data with the fastest deflate level.
+        /// </summary>
+        public static byte[] Compress(byte[] data)
+        {
+            var output = new MemoryStream(data.Length / 4 + 16);
+            // Header: deflate with a 32K window, fastest level
+            output.WriteByte(0x78);
+            output.WriteByte(0x01);
+            using (var deflate = new DeflateStream(output, CompressionLevel.Fastest, true))
+            {
+                deflate.Write(data, 0, data.Length);
+            }
+            uint checksum = Adler32(data, data.Length);
+            output.WriteByte((byte)(checksum >> 24));
+            output.WriteByte((byte)(checksum >> 16));
+            output.WriteByte((byte)(checksum >> 8));
+            output.WriteByte((byte)checksum);
+            return output.ToArray();
+        }
+
+        /// <summary>
+        /// Decompresses a zlib stream, failing if the output would exceed maxSize bytes.
+        /// </summary>
+        public static byte[] Decompress(byte[] data, int maxSize)
+        {
+            if (data.Length < 6 || (data[0] & 0x0f) != 8 || ((data[0] << 8) | data[1]) % 31 != 0)
+            {
+                throw new InvalidDataException("Invalid zlib header");
+            }
+            if ((data[1] & 0x20) != 0)
+            {
+                throw new InvalidDataException("zlib preset dictionaries are not supported");
+            }
+            var output = new MemoryStream((int)Math.Min(data.Length * 4L, maxSize));
+            using (var input = new MemoryStream(data, 2, data.Length - 6))
+            using (var deflate = new DeflateStream(input, CompressionMode.Decompress))
+            {
+                byte[] buffer = new byte[81920];
+                int read;
+                while ((read = deflate.Read(buffer, 0, buffer.Length)) > 0)
+                {
+                    if (output.Length + read > maxSize)
+                    {
+                        throw new InvalidDataException($"Decompressed message exceeds {maxSize} bytes");
+                    }
+                    output.Write(buffer, 0, read);
+                }
+            }
+            byte[] result = output.GetBuffer();
+            int length = (int)output.Length;
+            int end = data.Length - 4;
+            uint expected = ((uint)data[end] << 24) | ((uint)data[end + 1] << 16) | ((uint)data[end + 2] << 8) | data[end + 3];
+            if (Adler32(result, length) != expected)
+            {
+                throw new InvalidDataException("zlib checksum mismatch");
+            }
+            return result.Length == length ? result : output.ToArray();
+        }
+
+        private static uint Adler32(byte[] data, int length)
+        {
+            uint a = 1, b = 0;
+            int offset = 0;
+            while (offset < length)
+            {
+                int end = Math.Min(offset + AdlerBlock, length);
+                for (; offset < end; offset++)
+                {
+                    a += data[offset];
+                    b += a;
+                }
+                a %= AdlerModulus;
+                b %= AdlerModulus;
+            }
+            return (b << 16) | a;
+        }
+    }
+}
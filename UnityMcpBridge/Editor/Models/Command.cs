@@ -93,6 +93,12 @@ namespace UnityMcpBridge.Editor.Models
         public string contents;
         public string scriptType;
         public string namespaceName;
+        public bool? deferCompile; // create/update/delete: stage the change until commit (or the debounce) instead of importing it
+        public double? debounceSeconds; // Commit staged changes after this many seconds without another one (0: only on commit)
+        public string ifNoneMatch; // read: the content hash the client has; an unchanged script is not sent again
+        public string patch; // update: a unified diff against the script whose content hash is baseHash, instead of contents
+        public string baseHash;
+        public string hash; // update: the content hash the updated script must have
     }
 
     [Serializable]
@@ -102,6 +108,13 @@ namespace UnityMcpBridge.Editor.Models
         public string name;
         public string path;
         public int? buildIndex;
+        public bool? asJob; // load: reply with a job ID instead of waiting for the scene
+        // get_hierarchy options
+        public int? pageSize;
+        public string cursor;
+        public int? maxDepth;
+        public string root;
+        public List<string> fields;
     }
 
     [Serializable]
@@ -134,6 +147,7 @@ namespace UnityMcpBridge.Editor.Models
         public string action;
         public string target;
         public string searchMethod;
+        public System.Collections.Generic.List<string> targets;
         public string name;
         public string tag;
         public string layer;
@@ -148,6 +162,9 @@ namespace UnityMcpBridge.Editor.Models
         public bool? setActive;
         public bool? saveAsPrefab;
         public string prefabPath;
+        public System.Collections.Generic.List<string> fields; // set_transforms: what values holds per target ("position", "rotation", "scale")
+        public byte[] values; // set_transforms: little-endian float32 values (base64 in JSON)
+        public bool? local; // set_transforms: local instead of world position and rotation
     }
 
     [Serializable]
@@ -158,8 +175,21 @@ namespace UnityMcpBridge.Editor.Models
         public string assetType;
         public string destination;
         public string searchPattern;
+        public bool? asJob; // import: reply with a job ID instead of waiting for the import
         // Properties will be handled as a JSON string for flexibility
         public string properties;
+        public List<ManageAssetItem> items; // bulk: the operations to run in one asset editing scope
+    }
+
+    [Serializable]
+    public class ManageAssetItem
+    {
+        public string action; // "create", "move", "delete" or "save_as_prefab"
+        public string path;
+        public string assetType;
+        public string destination;
+        public string gameObject; // save_as_prefab: the GameObject to save
+        public JObject properties;
     }
 
     [Serializable]
@@ -168,6 +198,9 @@ namespace UnityMcpBridge.Editor.Models
         public string action;
         public System.Collections.Generic.List<string> types;
         public string filterText;
+        // Cursor from a previous reply's nextCursor ("end" skips existing entries)
+        public string sinceCursor;
+        public int? limit;
     }
 
     [Serializable]
@@ -175,4 +208,17 @@ namespace UnityMcpBridge.Editor.Models
     {
         public string menuPath;
     }
+
+    [Serializable]
+    public class JobStatusParams
+    {
+        public string jobId; // All jobs if empty
+    }
+
+    [Serializable]
+    public class BatchParams
+    {
+        public System.Collections.Generic.List<Command> commands;
+        public bool? stopOnError;
+    }
 }
@@ -17,6 +17,8 @@ namespace UnityMcpBridge.Editor.Tools
             try
             {
                 EditorApplication.ExecuteMenuItem(p.menuPath);
+                // Menu items such as GameObject/Create Empty change the hierarchy
+                GameObjectIndex.MarkDirty();
                 return JsonHelper.ToJson(Response.Success($"Menu item '{p.menuPath}' executed successfully."));
             }
             catch (Exception e)
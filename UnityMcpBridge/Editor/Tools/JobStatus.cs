@@ -0,0 +1,35 @@
+using System;
+using System.Linq;
+using UnityMcpBridge.Editor.Helpers;
+using UnityMcpBridge.Editor.Models;
+
+namespace UnityMcpBridge.Editor.Tools
+{
+    /// <summary>
+    /// Reports one job, or every job the bridge still remembers.
+    /// </summary>
+    public static class JobStatus
+    {
+        public static string Handle(JobStatusParams p)
+        {
+            try
+            {
+                if (string.IsNullOrEmpty(p?.jobId))
+                {
+                    var jobs = JobManager.All.Reverse().Select(JobManager.Describe).ToList();
+                    return JsonHelper.ToJson(Response.Success($"{jobs.Count} job(s).", new { jobs }));
+                }
+                JobManager.Job job = JobManager.Get(p.jobId);
+                if (job == null)
+                {
+                    return JsonHelper.ToJson(Response.Error($"Unknown job: '{p.jobId}'. Finished jobs are only kept for a while."));
+                }
+                return JsonHelper.ToJson(Response.Success($"Job {job.status}.", JobManager.Describe(job)));
+            }
+            catch (Exception e)
+            {
+                return JsonHelper.ToJson(Response.Error($"Failed to get job status: {e.Message}", e.StackTrace));
+            }
+        }
+    }
+}
@@ -2,6 +2,8 @@ using System;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
 using UnityEditor;
 using UnityEngine;
 using UnityMcpBridge.Editor.Helpers;
@@ -22,6 +24,8 @@ namespace UnityMcpBridge.Editor.Tools
                     case "delete": return JsonHelper.ToJson(DeleteAsset(p));
                     case "move": return JsonHelper.ToJson(MoveAsset(p));
                     case "search": return JsonHelper.ToJson(SearchAssets(p));
+                    case "import": return JsonHelper.ToJson(ImportAssets(p));
+                    case "bulk": return JsonHelper.ToJson(BulkAssets(p));
                     default: return JsonHelper.ToJson(Response.Error($"Unknown action: {p.action}"));
                 }
             }
@@ -143,6 +147,152 @@ namespace UnityMcpBridge.Editor.Tools
             return Response.Success("Asset search complete.", new { count = assetPaths.Count, paths = assetPaths });
         }
 
+        /// <summary>
+        /// Reimports an asset, every asset in a folder, or refreshes the whole project without a path.
+        /// As a job, assets are imported a few per editor tick so that other commands are answered meanwhile.
+        /// </summary>
+        private static object ImportAssets(ManageAssetParams p)
+        {
+            if (string.IsNullOrEmpty(p.path))
+            {
+                if (p.asJob != true)
+                {
+                    AssetDatabase.Refresh();
+                    return Response.Success("Asset database refreshed.");
+                }
+                var refresh = JobManager.Start("asset_import", job =>
+                {
+                    AssetDatabase.Refresh();
+                    JobManager.Complete(job, "Asset database refreshed.");
+                    return true;
+                }, "Refreshing the asset database.");
+                return JobManager.Started(refresh, "Refreshing the asset database.");
+            }
+
+            List<string> paths;
+            if (AssetDatabase.IsValidFolder(p.path))
+            {
+                paths = AssetDatabase.FindAssets("", new[] { p.path })
+                    .Select(AssetDatabase.GUIDToAssetPath)
+                    .Where(path => !AssetDatabase.IsValidFolder(path))
+                    .Distinct()
+                    .ToList();
+            }
+            else if (File.Exists(p.path))
+            {
+                paths = new List<string> { p.path };
+            }
+            else
+            {
+                return Response.Error($"Asset not found at '{p.path}'.");
+            }
+
+            if (p.asJob != true)
+            {
+                foreach (string path in paths)
+                {
+                    AssetDatabase.ImportAsset(path, ImportAssetOptions.ForceUpdate);
+                }
+                return Response.Success($"{paths.Count} asset(s) imported.", new { count = paths.Count });
+            }
+
+            int next = 0;
+            var import = JobManager.Start("asset_import", job =>
+            {
+                while (next < paths.Count && JobManager.TickBudgetLeft)
+                {
+                    AssetDatabase.ImportAsset(paths[next++], ImportAssetOptions.ForceUpdate);
+                }
+                job.progress = paths.Count == 0 ? 1f : (float)next / paths.Count;
+                job.message = $"{next} of {paths.Count} asset(s) imported.";
+                return next >= paths.Count;
+            }, $"Importing {paths.Count} asset(s).");
+            return JobManager.Started(import, $"Importing {paths.Count} asset(s).", new { count = paths.Count });
+        }
+
+        /// <summary>
+        /// Runs many create, move, delete and save_as_prefab operations inside one asset editing scope,
+        /// so that the asset database imports their results together and refreshes once at the end
+        /// instead of once per operation. A failed item does not stop the others.
+        /// </summary>
+        private static object BulkAssets(ManageAssetParams p)
+        {
+            if (p.items == null || p.items.Count == 0) return Response.Error("Items are required for bulk action.");
+
+            var results = new List<object>(p.items.Count);
+            int succeeded = 0;
+            AssetDatabase.StartAssetEditing();
+            try
+            {
+                for (int i = 0; i < p.items.Count; i++)
+                {
+                    ManageAssetItem item = p.items[i];
+                    object outcome;
+                    string path = item?.destination ?? item?.path;
+                    try
+                    {
+                        outcome = RunBulkItem(item, ref path);
+                    }
+                    catch (Exception e)
+                    {
+                        outcome = Response.Error($"Failed to execute asset action {item?.action}: {e.Message}");
+                    }
+                    if (outcome is Dictionary<string, object> error)
+                    {
+                        results.Add(new { index = i, status = "error", path, error = error["error"] });
+                    }
+                    else
+                    {
+                        succeeded++;
+                        results.Add(new { index = i, status = "success", path });
+                    }
+                }
+            }
+            finally
+            {
+                AssetDatabase.StopAssetEditing();
+            }
+            AssetDatabase.SaveAssets();
+            AssetDatabase.Refresh();
+
+            int failed = p.items.Count - succeeded;
+            return Response.Success($"Bulk asset operations done: {succeeded} succeeded, {failed} failed.",
+                new { results, succeeded, failed });
+        }
+
+        /// <summary>
+        /// Runs one bulk item with the single-asset handlers; `path` is set to the asset's resulting path.
+        /// </summary>
+        private static object RunBulkItem(ManageAssetItem item, ref string path)
+        {
+            if (item == null || string.IsNullOrEmpty(item.action)) return Response.Error("Action is required.");
+            var p = new ManageAssetParams
+            {
+                action = item.action.ToLower(),
+                path = item.path,
+                assetType = item.assetType,
+                destination = item.destination,
+                properties = item.properties?.ToString(Formatting.None),
+            };
+            switch (p.action)
+            {
+                case "create": return CreateAsset(p);
+                case "move": return MoveAsset(p);
+                case "delete": return DeleteAsset(p);
+                case "save_as_prefab":
+                    if (string.IsNullOrEmpty(item.gameObject)) return Response.Error("GameObject is required for save_as_prefab.");
+                    if (string.IsNullOrEmpty(p.path)) return Response.Error("Path is required for save_as_prefab.");
+                    var properties = item.properties ?? new JObject();
+                    properties["gameObjectName"] = item.gameObject;
+                    p.assetType = "Prefab";
+                    p.properties = properties.ToString(Formatting.None);
+                    if (!p.path.EndsWith(".prefab")) p.path += ".prefab";
+                    path = p.path;
+                    return CreateAsset(p);
+                default: return Response.Error($"Action '{item.action}' cannot be run in bulk.");
+            }
+        }
+
         // --- アセットプロパティ適用ヘルパー ---
         private static void ApplyAssetProperties(UnityEngine.Object asset, string propertiesJson)
         {
@@ -21,15 +21,18 @@ namespace UnityMcpBridge.Editor.Tools
             {
                 switch (action)
                 {
+                    // Play mode changes happen over later ticks (and often a domain reload); the job follows them
                     case "play":
                         EditorApplication.EnterPlaymode();
-                        return JsonHelper.ToJson(Response.Success("Editor entering play mode."));
+                        return JsonHelper.ToJson(JobManager.Started(
+                            JobManager.Start(JobManager.PlayKind, null, "Entering play mode."), "Editor entering play mode."));
                     case "pause":
                         EditorApplication.isPaused = true;
                         return JsonHelper.ToJson(Response.Success("Editor paused."));
                     case "stop":
                         EditorApplication.ExitPlaymode();
-                        return JsonHelper.ToJson(Response.Success("Editor exiting play mode."));
+                        return JsonHelper.ToJson(JobManager.Started(
+                            JobManager.Start(JobManager.StopKind, null, "Exiting play mode."), "Editor exiting play mode."));
                     case "get_state":
                         var response = Response.Success("Editor state retrieved.", new
                         {
@@ -11,26 +11,56 @@ namespace UnityMcpBridge.Editor.Tools
 {
     public static class ManageGameObject
     {
+        // Resolving a type name scans every loaded assembly, so the result is kept until the next domain reload
+        private static readonly Dictionary<string, Type> componentTypes = new Dictionary<string, Type>();
+
         public static string Handle(ManageGameObjectParams p)
         {
             if (string.IsNullOrEmpty(p.action)) return JsonHelper.ToJson(Response.Error("Action is required."));
+            string action = p.action.ToLower();
             try
             {
-                switch (p.action.ToLower())
+                switch (action)
                 {
                     case "create": return JsonHelper.ToJson(CreateGameObject(p));
                     case "find": return JsonHelper.ToJson(FindGameObject(p));
+                    case "find_many": return JsonHelper.ToJson(FindManyGameObjects(p));
                     case "modify": return JsonHelper.ToJson(ModifyGameObject(p));
+                    case "set_transforms": return JsonHelper.ToJson(SetTransforms(p));
                     case "delete": return JsonHelper.ToJson(DeleteGameObject(p));
                     default: return JsonHelper.ToJson(Response.Error($"Unknown action: {p.action}"));
                 }
             }
             catch (Exception e)
             {
+                // A write that threw part-way may have changed objects the index was not told about.
+                // Moving objects changes nothing the index looks up.
+                if (action != "find" && action != "find_many" && action != "set_transforms") GameObjectIndex.MarkDirty();
                 return JsonHelper.ToJson(Response.Error($"Failed to execute action {p.action}: {e.Message}", e.StackTrace));
             }
         }
 
+        /// <summary>
+        /// GameObject.Find, answered from the lookup index when it is enabled.
+        /// </summary>
+        private static GameObject FindTarget(string nameOrPath)
+        {
+            return GameObjectIndex.Enabled ? GameObjectIndex.Find(nameOrPath) : GameObject.Find(nameOrPath);
+        }
+
+        private static Type FindComponentType(string typeName)
+        {
+            if (!componentTypes.TryGetValue(typeName, out var type))
+            {
+                type = Type.GetType(typeName) ??
+                    AppDomain.CurrentDomain.GetAssemblies()
+                        .SelectMany(a => a.GetTypes())
+                        .FirstOrDefault(t => t.Name == typeName);
+                componentTypes[typeName] = type;
+            }
+            return type;
+        }
+
         private static object CreateGameObject(ManageGameObjectParams p)
         {
             GameObject go;
@@ -49,7 +79,17 @@ namespace UnityMcpBridge.Editor.Tools
             // Further modifications can be done via the ModifyGameObject logic
             ModifyGameObject(p, go);
 
-            return Response.Success($"GameObject '{go.name}' created.", new { name = go.name, instanceId = go.GetInstanceID() });
+            return Response.Success($"GameObject '{go.name}' created.", Describe(go));
+        }
+
+        /// <summary>
+        /// Identifies a written object, so clients can apply the write to a cached scene graph
+        /// even when its target name is shared by several objects.
+        /// </summary>
+        private static object Describe(GameObject go)
+        {
+            var parent = go.transform.parent;
+            return new { name = go.name, instanceId = go.GetInstanceID(), parentId = parent != null ? parent.gameObject.GetInstanceID() : (int?)null };
         }
 
         private static object FindGameObject(ManageGameObjectParams p)
@@ -57,62 +97,95 @@ namespace UnityMcpBridge.Editor.Tools
             if (string.IsNullOrEmpty(p.target) && string.IsNullOrEmpty(p.searchMethod))
                 return Response.Error("Target or searchMethod is required for find action.");
 
-            List<GameObject> found = new List<GameObject>();
             string method = p.searchMethod?.ToLower() ?? "by_name";
+            List<GameObject> found = FindMatches(method, p.target);
+            if (found == null)
+                return Response.Error($"Unknown searchMethod: {p.searchMethod}");
+
+            if (found.Count == 0)
+                return Response.Error($"No GameObject found by {method} for '{p.target}'");
+            if (found.Count == 1)
+                return Response.Success("GameObject found.", new { name = found[0].name, instanceId = found[0].GetInstanceID() });
+            return Response.Success($"{found.Count} GameObjects found.", found.Select(go => new { name = go.name, instanceId = go.GetInstanceID() }).ToList());
+        }
+
+        private static object FindManyGameObjects(ManageGameObjectParams p)
+        {
+            if (p.targets == null || p.targets.Count == 0)
+                return Response.Error("Targets are required for find_many action.");
+
+            string method = p.searchMethod?.ToLower() ?? "by_name";
+            var results = new List<object>(p.targets.Count);
+            int resolved = 0;
+            foreach (string target in p.targets)
+            {
+                List<GameObject> found = FindMatches(method, target);
+                if (found == null)
+                    return Response.Error($"Unknown searchMethod: {p.searchMethod}");
+                if (found.Count > 0) resolved++;
+                results.Add(new { target, matches = found.Select(go => new { name = go.name, instanceId = go.GetInstanceID() }).ToList() });
+            }
+            return Response.Success($"{resolved} of {p.targets.Count} targets found.", results);
+        }
+
+        /// <summary>
+        /// Returns the GameObjects matching target, or null for an unknown search method.
+        /// </summary>
+        private static List<GameObject> FindMatches(string method, string target)
+        {
+            List<GameObject> found = new List<GameObject>();
+            bool indexed = GameObjectIndex.Enabled;
 
             switch (method)
             {
                 case "by_name":
-                    if (!string.IsNullOrEmpty(p.target))
+                    if (!string.IsNullOrEmpty(target))
                     {
-                        var go = GameObject.Find(p.target);
+                        var go = FindTarget(target);
                         if (go != null) found.Add(go);
                     }
                     break;
                 case "by_tag":
-                    if (!string.IsNullOrEmpty(p.target))
+                    if (!string.IsNullOrEmpty(target))
                     {
-                        found.AddRange(GameObject.FindGameObjectsWithTag(p.target));
+                        found.AddRange(indexed ? GameObjectIndex.FindWithTag(target) : GameObject.FindGameObjectsWithTag(target).ToList());
                     }
                     break;
                 case "by_layer":
-                    if (!string.IsNullOrEmpty(p.target))
+                    if (!string.IsNullOrEmpty(target))
                     {
-                        int layer = LayerMask.NameToLayer(p.target);
-                        found.AddRange(GameObject.FindObjectsOfType<GameObject>().Where(go => go.layer == layer));
+                        int layer = LayerMask.NameToLayer(target);
+                        found.AddRange(indexed ? GameObjectIndex.FindInLayer(layer) : GameObject.FindObjectsOfType<GameObject>().Where(go => go.layer == layer).ToList());
                     }
                     break;
                 case "by_path":
-                    if (!string.IsNullOrEmpty(p.target))
+                    if (!string.IsNullOrEmpty(target))
                     {
-                        var go = GameObject.Find(p.target); // Unityのパス指定（"Parent/Child"）
+                        var go = FindTarget(target); // Unityのパス指定（"Parent/Child"）
                         if (go != null) found.Add(go);
                     }
                     break;
                 case "by_id":
-                    if (int.TryParse(p.target, out int id))
+                    if (int.TryParse(target, out int id))
                     {
                         var go = EditorUtility.InstanceIDToObject(id) as GameObject;
                         if (go != null) found.Add(go);
                     }
                     break;
                 case "by_component":
-                    if (!string.IsNullOrEmpty(p.target))
+                    if (!string.IsNullOrEmpty(target))
                     {
-                        var type = Type.GetType(p.target) ??
-                            AppDomain.CurrentDomain.GetAssemblies()
-                                .SelectMany(a => a.GetTypes())
-                                .FirstOrDefault(t => t.Name == p.target);
+                        var type = FindComponentType(target);
                         if (type != null && typeof(Component).IsAssignableFrom(type))
                         {
-                            found.AddRange(GameObject.FindObjectsOfType<GameObject>().Where(go => go.GetComponent(type) != null));
+                            found.AddRange(indexed ? GameObjectIndex.FindWithComponent(type) : GameObject.FindObjectsOfType<GameObject>().Where(go => go.GetComponent(type) != null).ToList());
                         }
                     }
                     break;
                 case "by_parent":
-                    if (!string.IsNullOrEmpty(p.target))
+                    if (!string.IsNullOrEmpty(target))
                     {
-                        var parentGo = GameObject.Find(p.target);
+                        var parentGo = FindTarget(target);
                         if (parentGo != null)
                         {
                             foreach (Transform child in parentGo.transform)
@@ -121,23 +194,18 @@ namespace UnityMcpBridge.Editor.Tools
                     }
                     break;
                 case "by_all":
-                    found.AddRange(GameObject.FindObjectsOfType<GameObject>());
+                    found.AddRange(indexed ? GameObjectIndex.FindAll() : GameObject.FindObjectsOfType<GameObject>().ToList());
                     break;
                 default:
-                    return Response.Error($"Unknown searchMethod: {p.searchMethod}");
+                    return null;
             }
-
-            if (found.Count == 0)
-                return Response.Error($"No GameObject found by {method} for '{p.target}'");
-            if (found.Count == 1)
-                return Response.Success("GameObject found.", new { name = found[0].name, instanceId = found[0].GetInstanceID() });
-            return Response.Success($"{found.Count} GameObjects found.", found.Select(go => new { name = go.name, instanceId = go.GetInstanceID() }).ToList());
+            return found;
         }
 
         private static object ModifyGameObject(ManageGameObjectParams p)
         {
              if (string.IsNullOrEmpty(p.target)) return Response.Error("Target is required for modify action.");
-             var go = GameObject.Find(p.target);
+             var go = FindTarget(p.target);
              if (go == null) return Response.Error($"GameObject '{p.target}' not found to modify.");
              
              return ModifyGameObject(p, go);
@@ -164,10 +232,7 @@ namespace UnityMcpBridge.Editor.Tools
             {
                 foreach (var componentName in p.componentsToAdd)
                 {
-                    var type = Type.GetType(componentName) ??
-                        AppDomain.CurrentDomain.GetAssemblies()
-                            .SelectMany(a => a.GetTypes())
-                            .FirstOrDefault(t => t.Name == componentName);
+                    var type = FindComponentType(componentName);
                     if (type != null && typeof(Component).IsAssignableFrom(type))
                     {
                         if (go.GetComponent(type) == null)
@@ -181,10 +246,7 @@ namespace UnityMcpBridge.Editor.Tools
             {
                 foreach (var componentName in p.componentsToRemove)
                 {
-                    var type = Type.GetType(componentName) ??
-                        AppDomain.CurrentDomain.GetAssemblies()
-                            .SelectMany(a => a.GetTypes())
-                            .FirstOrDefault(t => t.Name == componentName);
+                    var type = FindComponentType(componentName);
                     if (type != null)
                     {
                         var comp = go.GetComponent(type);
@@ -234,7 +296,7 @@ namespace UnityMcpBridge.Editor.Tools
             // --- 親子関係の設定 ---
             if (!string.IsNullOrEmpty(p.parent))
             {
-                var parentGo = GameObject.Find(p.parent);
+                var parentGo = FindTarget(p.parent);
                 if (parentGo != null)
                 {
                     go.transform.SetParent(parentGo.transform);
@@ -251,17 +313,101 @@ namespace UnityMcpBridge.Editor.Tools
             }
 #endif
 
-            return Response.Success($"GameObject '{go.name}' modified.");
+            GameObjectIndex.Reindex(go);
+            return Response.Success($"GameObject '{go.name}' modified.", Describe(go));
+        }
+
+        /// <summary>
+        /// Sets the position, rotation and/or scale of many GameObjects from packed float32 values,
+        /// recorded as a single Undo step. Targets that are not found are skipped and reported.
+        /// </summary>
+        private static object SetTransforms(ManageGameObjectParams p)
+        {
+            if (p.targets == null || p.targets.Count == 0)
+                return Response.Error("Targets are required for set_transforms action.");
+            List<string> fields = p.fields ?? new List<string> { "position" };
+            if (fields.Count == 0 || fields.Distinct().Count() != fields.Count ||
+                fields.Any(f => f != "position" && f != "rotation" && f != "scale"))
+                return Response.Error("Fields must be distinct names out of position, rotation and scale.");
+            int stride = 3 * fields.Count;
+            int expected = p.targets.Count * stride;
+            if (p.values == null || p.values.Length != expected * sizeof(float))
+                return Response.Error($"Expected {expected} float32 values ({p.targets.Count} targets x {stride}), got {(p.values?.Length ?? 0) / sizeof(float)}.");
+            string method = p.searchMethod?.ToLower() ?? "by_name";
+            if (method != "by_name" && method != "by_path" && method != "by_id")
+                return Response.Error($"Unsupported searchMethod for set_transforms: {p.searchMethod}");
+
+            var values = new float[expected];
+            Buffer.BlockCopy(p.values, 0, values, 0, p.values.Length);
+            if (!BitConverter.IsLittleEndian)
+            {
+                for (int i = 0; i < values.Length; i++)
+                {
+                    byte[] bytes = BitConverter.GetBytes(values[i]);
+                    Array.Reverse(bytes);
+                    values[i] = BitConverter.ToSingle(bytes, 0);
+                }
+            }
+
+            // Resolve every target first, so that Undo records them all at once
+            var transforms = new Transform[p.targets.Count];
+            var found = new List<Transform>(p.targets.Count);
+            var missing = new List<string>();
+            for (int i = 0; i < p.targets.Count; i++)
+            {
+                List<GameObject> matches = FindMatches(method, p.targets[i]);
+                if (matches.Count == 0)
+                {
+                    missing.Add(p.targets[i]);
+                    continue;
+                }
+                transforms[i] = matches[0].transform;
+                found.Add(transforms[i]);
+            }
+
+            Undo.IncrementCurrentGroup();
+            int group = Undo.GetCurrentGroup();
+            Undo.SetCurrentGroupName("Set Transforms");
+            Undo.RecordObjects(found.ToArray(), "Set Transforms");
+            bool local = p.local ?? false;
+            for (int i = 0; i < transforms.Length; i++)
+            {
+                Transform t = transforms[i];
+                if (t == null) continue;
+                int offset = i * stride;
+                foreach (string field in fields)
+                {
+                    var v = new Vector3(values[offset], values[offset + 1], values[offset + 2]);
+                    offset += 3;
+                    switch (field)
+                    {
+                        case "position":
+                            if (local) t.localPosition = v; else t.position = v;
+                            break;
+                        case "rotation":
+                            if (local) t.localRotation = Quaternion.Euler(v); else t.rotation = Quaternion.Euler(v);
+                            break;
+                        case "scale":
+                            t.localScale = v;
+                            break;
+                    }
+                }
+            }
+            Undo.CollapseUndoOperations(group);
+
+            return Response.Success($"{found.Count} of {p.targets.Count} transforms set.", new { applied = found.Count, missing });
         }
 
         private static object DeleteGameObject(ManageGameObjectParams p)
         {
             if (string.IsNullOrEmpty(p.target)) return Response.Error("Target is required for delete action.");
-            var go = GameObject.Find(p.target);
+            var go = FindTarget(p.target);
             if (go == null) return Response.Error($"GameObject '{p.target}' not found to delete.");
 
+            int instanceId = go.GetInstanceID();
             UnityEngine.Object.DestroyImmediate(go);
-            return Response.Success($"GameObject '{p.target}' deleted.");
+            GameObjectIndex.Remove(instanceId);
+            return Response.Success($"GameObject '{p.target}' deleted.", new { instanceId });
         }
     }
 } 
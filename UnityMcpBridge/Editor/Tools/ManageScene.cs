@@ -1,10 +1,12 @@
 using System;
+using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using UnityEditor;
 using UnityEditor.SceneManagement;
 using UnityEngine;
 using UnityEngine.SceneManagement;
+using Newtonsoft.Json.Linq;
 using UnityMcpBridge.Editor.Helpers;
 using UnityMcpBridge.Editor.Models;
 
@@ -12,6 +14,13 @@ namespace UnityMcpBridge.Editor.Tools
 {
     public static class ManageScene
     {
+        private static readonly string[] HierarchyFields =
+            { "name", "instanceId", "parentId", "active", "activeInHierarchy", "tag", "layer", "path", "depth", "childCount", "components", "componentTypes" };
+        private static readonly string[] DefaultPageFields = { "name", "instanceId", "active", "depth", "childCount" };
+        private static readonly string[] DefaultTreeFields = { "name", "active" };
+        private const int DefaultPageSize = 500;
+        private const int MaxPageSize = 10000;
+
         public static string Handle(ManageSceneParams parameters)
         {
             string action = parameters.action?.ToLower();
@@ -35,7 +44,7 @@ namespace UnityMcpBridge.Editor.Tools
                     case "get_active":
                         return JsonHelper.ToJson(GetActiveScene());
                     case "get_hierarchy":
-                        return JsonHelper.ToJson(GetHierarchy());
+                        return JsonHelper.ToJson(GetHierarchy(parameters));
                     default:
                         return JsonHelper.ToJson(Response.Error($"Unknown action for manage_scene: '{action}'"));
                 }
@@ -52,6 +61,7 @@ namespace UnityMcpBridge.Editor.Tools
                 return Response.Error("Scene name is required for 'create' action.");
 
             var newScene = EditorSceneManager.NewScene(NewSceneSetup.DefaultGameObjects, NewSceneMode.Single);
+            GameObjectIndex.MarkDirty();
             string scenePath = $"Assets/{p.name}.unity";
             if (!string.IsNullOrEmpty(p.path))
             {
@@ -81,10 +91,40 @@ namespace UnityMcpBridge.Editor.Tools
             if (!File.Exists(scenePath))
                 return Response.Error($"Scene not found at path: {scenePath}");
 
+            if (p.asJob == true)
+                return JobManager.Started(StartLoadJob(scenePath, p.name), $"Loading scene '{p.name}'.", new { path = scenePath });
+
             EditorSceneManager.OpenScene(scenePath, OpenSceneMode.Single);
+            GameObjectIndex.MarkDirty();
             return Response.Success($"Scene '{p.name}' loaded successfully.");
         }
 
+        /// <summary>
+        /// Loads a scene on the next editor tick. In play mode the load is asynchronous and reports progress.
+        /// </summary>
+        private static JobManager.Job StartLoadJob(string scenePath, string name)
+        {
+            AsyncOperation operation = null;
+            return JobManager.Start("scene_load", job =>
+            {
+                if (!EditorApplication.isPlaying)
+                {
+                    EditorSceneManager.OpenScene(scenePath, OpenSceneMode.Single);
+                    GameObjectIndex.MarkDirty();
+                    JobManager.Complete(job, $"Scene '{name}' loaded successfully.", new JObject { ["path"] = scenePath });
+                    return true;
+                }
+                operation ??= EditorSceneManager.LoadSceneAsyncInPlayMode(scenePath, new LoadSceneParameters(LoadSceneMode.Single));
+                // Unity reports at most 0.9 until the scene is activated
+                job.progress = Math.Min(1f, operation.progress / 0.9f);
+                if (!operation.isDone)
+                    return false;
+                GameObjectIndex.MarkDirty();
+                JobManager.Complete(job, $"Scene '{name}' loaded successfully.", new JObject { ["path"] = scenePath });
+                return true;
+            }, $"Loading scene '{name}'.");
+        }
+
         private static object SaveScene(ManageSceneParams p)
         {
             var activeScene = SceneManager.GetActiveScene();
@@ -109,26 +149,213 @@ namespace UnityMcpBridge.Editor.Tools
             return Response.Success("Active scene retrieved.", new { name = activeScene.name, path = activeScene.path });
         }
 
-        private static object GetHierarchy()
+        /// <summary>
+        /// Returns the scene graph. Without pageSize or cursor this is the nested tree;
+        /// with them it is a flat preorder page of nodes plus a cursor for the next page.
+        /// </summary>
+        private static object GetHierarchy(ManageSceneParams p)
         {
             var activeScene = SceneManager.GetActiveScene();
-            var rootObjects = activeScene.GetRootGameObjects();
-            var hierarchy = rootObjects.Select(go => GetObjectData(go)).ToList();
-            return Response.Success("Scene hierarchy retrieved.", hierarchy);
+            bool paged = p.pageSize.HasValue || !string.IsNullOrEmpty(p.cursor);
+            string[] fields = p.fields != null && p.fields.Count > 0
+                ? p.fields.ToArray()
+                : (paged ? DefaultPageFields : DefaultTreeFields);
+            string unknown = fields.FirstOrDefault(f => !HierarchyFields.Contains(f));
+            if (unknown != null)
+                return Response.Error($"Unknown hierarchy field '{unknown}'. Valid fields: {string.Join(", ", HierarchyFields)}");
+            int maxDepth = p.maxDepth ?? -1;
+
+            Transform root = null;
+            if (!string.IsNullOrEmpty(p.root))
+            {
+                root = FindByPath(activeScene, p.root);
+                if (root == null)
+                    return Response.Error($"Root '{p.root}' not found in the active scene.");
+            }
+
+            if (!paged)
+            {
+                var tops = root != null
+                    ? new[] { root }
+                    : activeScene.GetRootGameObjects().Select(go => go.transform).ToArray();
+                var hierarchy = tops.Select(t => GetObjectData(t, 0, maxDepth, fields)).ToList();
+                return Response.Success("Scene hierarchy retrieved.", hierarchy);
+            }
+
+            int pageSize = Math.Max(1, Math.Min(p.pageSize ?? DefaultPageSize, MaxPageSize));
+            var sceneRoots = activeScene.GetRootGameObjects();
+            Transform start;
+            int depth = 0;
+            if (string.IsNullOrEmpty(p.cursor))
+            {
+                start = root ?? (sceneRoots.Length > 0 ? sceneRoots[0].transform : null);
+            }
+            else
+            {
+                start = ResolveCursor(p.cursor, activeScene, root, maxDepth, out depth);
+                if (start == null)
+                    return Response.Error("Hierarchy cursor is no longer valid: its object was deleted or moved. Restart without a cursor.");
+            }
+
+            // Walking on from the cursor's object costs only the page, however deep into the scene it is
+            var items = new List<Dictionary<string, object>>(pageSize);
+            string nextCursor = null;
+            foreach (var (node, nodeDepth) in Preorder(start, depth, root, sceneRoots, maxDepth))
+            {
+                if (items.Count == pageSize)
+                {
+                    nextCursor = node.gameObject.GetInstanceID().ToString();
+                    break;
+                }
+                items.Add(GetNodeData(node, nodeDepth, fields));
+            }
+            // Pages cover only the active scene; sceneCount tells clients whether other scenes are loaded too
+            return Response.Success(
+                nextCursor == null ? "Scene hierarchy retrieved." : "Scene hierarchy page retrieved.",
+                new { items, nextCursor, sceneCount = SceneManager.sceneCount });
+        }
+
+        private static object GetObjectData(Transform t, int depth, int maxDepth, string[] fields)
+        {
+            var data = GetNodeData(t, depth, fields);
+            data["children"] = maxDepth < 0 || depth < maxDepth
+                ? Enumerable.Range(0, t.childCount)
+                    .Select(i => GetObjectData(t.GetChild(i), depth + 1, maxDepth, fields))
+                    .ToList()
+                : new List<object>();
+            return data;
+        }
+
+        private static Dictionary<string, object> GetNodeData(Transform t, int depth, string[] fields)
+        {
+            var go = t.gameObject;
+            var data = new Dictionary<string, object>(fields.Length + 1);
+            foreach (string field in fields)
+            {
+                switch (field)
+                {
+                    case "name": data[field] = go.name; break;
+                    case "instanceId": data[field] = go.GetInstanceID(); break;
+                    case "parentId": data[field] = t.parent != null ? t.parent.gameObject.GetInstanceID() : (int?)null; break;
+                    case "active": data[field] = go.activeSelf; break;
+                    case "activeInHierarchy": data[field] = go.activeInHierarchy; break;
+                    case "tag": data[field] = go.tag; break;
+                    case "layer": data[field] = LayerMask.LayerToName(go.layer); break;
+                    case "path": data[field] = GetPath(t); break;
+                    case "depth": data[field] = depth; break;
+                    case "childCount": data[field] = t.childCount; break;
+                    case "components":
+                        data[field] = go.GetComponents<Component>()
+                            .Where(c => c != null)
+                            .Select(c => c.GetType().Name)
+                            .ToList();
+                        break;
+                    case "componentTypes":
+                        data[field] = GetComponentTypes(go);
+                        break;
+                }
+            }
+            return data;
+        }
+
+        /// <summary>
+        /// Names of the components' types and their base types, i.e. every name GetComponent(type) would match.
+        /// </summary>
+        private static List<string> GetComponentTypes(GameObject go)
+        {
+            var names = new List<string>();
+            foreach (var component in go.GetComponents<Component>())
+            {
+                if (component == null)
+                    continue;
+                for (Type type = component.GetType(); type != null && type != typeof(Component); type = type.BaseType)
+                {
+                    if (!names.Contains(type.Name))
+                        names.Add(type.Name);
+                }
+            }
+            return names;
+        }
+
+        /// <summary>
+        /// Walks the hierarchy in preorder from `start`, staying inside `root` (or the scene) and above maxDepth.
+        /// </summary>
+        private static IEnumerable<(Transform, int)> Preorder(Transform start, int depth, Transform root, GameObject[] sceneRoots, int maxDepth)
+        {
+            Transform current = start;
+            while (current != null)
+            {
+                yield return (current, depth);
+                if (current.childCount > 0 && (maxDepth < 0 || depth < maxDepth))
+                {
+                    current = current.GetChild(0);
+                    depth++;
+                    continue;
+                }
+                while (current != null)
+                {
+                    if (current == root)
+                    {
+                        current = null;
+                        break;
+                    }
+                    Transform next = NextSibling(current, sceneRoots);
+                    if (next != null)
+                    {
+                        current = next;
+                        break;
+                    }
+                    current = current.parent;
+                    depth--;
+                }
+            }
+        }
+
+        private static Transform NextSibling(Transform t, GameObject[] sceneRoots)
+        {
+            int index = t.GetSiblingIndex() + 1;
+            if (t.parent != null)
+                return index < t.parent.childCount ? t.parent.GetChild(index) : null;
+            return index < sceneRoots.Length ? sceneRoots[index].transform : null;
         }
 
-        private static object GetObjectData(GameObject go)
+        /// <summary>
+        /// Finds the object a cursor points to and its depth, or null if it is gone or no longer under root.
+        /// </summary>
+        private static Transform ResolveCursor(string cursor, Scene scene, Transform root, int maxDepth, out int depth)
         {
-            return new
+            depth = 0;
+            if (!int.TryParse(cursor, out int id))
+                return null;
+            var go = EditorUtility.InstanceIDToObject(id) as GameObject;
+            if (go == null || go.scene != scene)
+                return null;
+            // Depth is counted from root, or from the scene's top level
+            for (Transform t = go.transform; t != root; t = t.parent)
             {
-                name = go.name,
-                active = go.activeSelf,
-                children = go.transform.childCount > 0
-                    ? Enumerable.Range(0, go.transform.childCount)
-                        .Select(i => GetObjectData(go.transform.GetChild(i).gameObject))
-                        .ToList()
-                    : new System.Collections.Generic.List<object>()
-            };
+                if (t == null)
+                    return null;
+                if (t.parent != null || root != null)
+                    depth++;
+            }
+            if (maxDepth >= 0 && depth > maxDepth)
+                return null;
+            return go.transform;
+        }
+
+        private static Transform FindByPath(Scene scene, string path)
+        {
+            string[] parts = path.Trim('/').Split(new[] { '/' }, 2);
+            var top = scene.GetRootGameObjects().FirstOrDefault(go => go.name == parts[0]);
+            if (top == null)
+                return null;
+            // Transform.Find also finds inactive children, unlike GameObject.Find
+            return parts.Length > 1 ? top.transform.Find(parts[1]) : top.transform;
+        }
+
+        private static string GetPath(Transform t)
+        {
+            return t.parent == null ? t.name : GetPath(t.parent) + "/" + t.name;
         }
     }
 } 
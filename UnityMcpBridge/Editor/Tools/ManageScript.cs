@@ -1,5 +1,7 @@
 using System;
 using System.IO;
+using System.Security.Cryptography;
+using System.Text;
 using System.Text.RegularExpressions;
 using UnityEditor;
 using UnityEngine;
@@ -11,6 +13,8 @@ namespace UnityMcpBridge.Editor.Tools
 {
     /// <summary>
     /// Handles CRUD operations for C# scripts within the Unity project.
+    /// Replies carry the SHA-256 of the script's text (UTF-8), which the server uses to skip unchanged reads
+    /// (ifNoneMatch) and to send small updates as patches against a known version (baseHash).
     /// </summary>
     public static class ManageScript
     {
@@ -26,12 +30,22 @@ namespace UnityMcpBridge.Editor.Tools
             string contents = parameters.contents;
             string scriptType = parameters.scriptType;
             string namespaceName = parameters.namespaceName;
+            bool deferCompile = parameters.deferCompile ?? false;
+            double debounceSeconds = parameters.debounceSeconds ?? 0;
+            string ifNoneMatch = parameters.ifNoneMatch;
+            string patch = parameters.patch;
+            string baseHash = parameters.baseHash;
+            string expectedHash = parameters.hash;
 
             // Validate required parameters
             if (string.IsNullOrEmpty(action))
             {
                 return JsonHelper.ToJson(Response.Error("Action parameter is required."));
             }
+            if (action == "commit")
+            {
+                return JsonHelper.ToJson(CommitScripts());
+            }
             if (string.IsNullOrEmpty(name))
             {
                 return JsonHelper.ToJson(Response.Error("Name parameter is required."));
@@ -81,19 +95,19 @@ namespace UnityMcpBridge.Editor.Tools
             switch (action)
             {
                 case "create":
-                    return JsonHelper.ToJson(CreateScript(fullPath, relativePath, name, contents, scriptType, namespaceName));
+                    return JsonHelper.ToJson(CreateScript(fullPath, relativePath, name, contents, scriptType, namespaceName, deferCompile, debounceSeconds));
                 case "read":
-                    return JsonHelper.ToJson(ReadScript(fullPath, relativePath));
+                    return JsonHelper.ToJson(ReadScript(fullPath, relativePath, ifNoneMatch));
                 case "update":
-                    return JsonHelper.ToJson(UpdateScript(fullPath, relativePath, name, contents));
+                    return JsonHelper.ToJson(UpdateScript(fullPath, relativePath, name, contents, patch, baseHash, expectedHash, deferCompile, debounceSeconds));
                 case "delete":
-                    return JsonHelper.ToJson(DeleteScript(fullPath, relativePath));
+                    return JsonHelper.ToJson(DeleteScript(fullPath, relativePath, deferCompile, debounceSeconds));
                 default:
-                    return JsonHelper.ToJson(Response.Error($"Unknown action: '{action}'. Valid actions are: create, read, update, delete."));
+                    return JsonHelper.ToJson(Response.Error($"Unknown action: '{action}'. Valid actions are: create, read, update, delete, commit."));
             }
         }
 
-        private static object CreateScript(string fullPath, string relativePath, string name, string contents, string scriptType, string namespaceName)
+        private static object CreateScript(string fullPath, string relativePath, string name, string contents, string scriptType, string namespaceName, bool deferCompile, double debounceSeconds)
         {
             // Check if script already exists
             if (File.Exists(fullPath))
@@ -110,9 +124,16 @@ namespace UnityMcpBridge.Editor.Tools
             try
             {
                 File.WriteAllText(fullPath, contents);
+                string hash = ContentHash(contents);
+                if (deferCompile)
+                {
+                    return Staged(relativePath, "write", debounceSeconds, $"Script '{name}.cs' created at '{relativePath}'", hash);
+                }
                 AssetDatabase.ImportAsset(relativePath);
                 AssetDatabase.Refresh();
-                return Response.Success($"Script '{name}.cs' created successfully at '{relativePath}'.", new { path = relativePath });
+                // The reply carries the job that follows the recompilation this write triggers
+                return JobManager.Started(JobManager.StartCompilation(relativePath),
+                    $"Script '{name}.cs' created successfully at '{relativePath}'.", new { path = relativePath, hash });
             }
             catch (Exception e)
             {
@@ -120,7 +141,7 @@ namespace UnityMcpBridge.Editor.Tools
             }
         }
 
-        private static object ReadScript(string fullPath, string relativePath)
+        private static object ReadScript(string fullPath, string relativePath, string ifNoneMatch)
         {
             if (!File.Exists(fullPath))
             {
@@ -130,10 +151,17 @@ namespace UnityMcpBridge.Editor.Tools
             try
             {
                 string contents = File.ReadAllText(fullPath);
+                string hash = ContentHash(contents);
+                if (hash == ifNoneMatch)
+                {
+                    return Response.Success($"Script '{Path.GetFileName(relativePath)}' is unchanged.",
+                        new { path = relativePath, hash, notModified = true });
+                }
                 var responseData = new
                 {
                     path = relativePath,
-                    contents = contents
+                    contents = contents,
+                    hash = hash
                 };
 
                 return Response.Success($"Script '{Path.GetFileName(relativePath)}' read successfully.", responseData);
@@ -144,23 +172,62 @@ namespace UnityMcpBridge.Editor.Tools
             }
         }
 
-        private static object UpdateScript(string fullPath, string relativePath, string name, string contents)
+        private static object UpdateScript(string fullPath, string relativePath, string name, string contents, string patch, string baseHash, string expectedHash, bool deferCompile, double debounceSeconds)
         {
             if (!File.Exists(fullPath))
             {
                 return Response.Error($"Script not found at '{relativePath}'. Use 'create' action to add a new script.");
             }
-            if (string.IsNullOrEmpty(contents))
+            if (patch == null && string.IsNullOrEmpty(contents))
             {
                 return Response.Error("Content is required for the 'update' action.");
             }
+            if (patch != null && string.IsNullOrEmpty(baseHash))
+            {
+                return Response.Error("A patch requires the content hash it applies to ('baseHash').");
+            }
 
             try
             {
+                string current = File.ReadAllText(fullPath);
+                if (patch != null)
+                {
+                    string currentHash = ContentHash(current);
+                    if (currentHash != baseHash)
+                    {
+                        return Response.Error($"Script '{relativePath}' no longer matches the patch's base hash; send the full contents.",
+                            new { path = relativePath, hash = currentHash });
+                    }
+                    try
+                    {
+                        contents = UnifiedDiff.Apply(current, patch);
+                    }
+                    catch (InvalidDataException e)
+                    {
+                        return Response.Error($"Could not apply the patch to '{relativePath}': {e.Message}");
+                    }
+                }
+                string hash = ContentHash(contents);
+                if (!string.IsNullOrEmpty(expectedHash) && hash != expectedHash)
+                {
+                    return Response.Error($"The patched script '{relativePath}' does not match the expected hash; send the full contents.");
+                }
+                if (contents == current)
+                {
+                    // Neither written nor imported, so no recompilation follows
+                    return Response.Success($"Script '{name}.cs' is unchanged; nothing was written.",
+                        new { path = relativePath, hash, unchanged = true });
+                }
+
                 File.WriteAllText(fullPath, contents);
+                if (deferCompile)
+                {
+                    return Staged(relativePath, "write", debounceSeconds, $"Script '{name}.cs' updated at '{relativePath}'", hash);
+                }
                 AssetDatabase.ImportAsset(relativePath);
                 AssetDatabase.Refresh();
-                return Response.Success($"Script '{name}.cs' updated successfully at '{relativePath}'.", new { path = relativePath });
+                return JobManager.Started(JobManager.StartCompilation(relativePath),
+                    $"Script '{name}.cs' updated successfully at '{relativePath}'.", new { path = relativePath, hash });
             }
             catch (Exception e)
             {
@@ -168,12 +235,17 @@ namespace UnityMcpBridge.Editor.Tools
             }
         }
 
-        private static object DeleteScript(string fullPath, string relativePath)
+        private static object DeleteScript(string fullPath, string relativePath, bool deferCompile, double debounceSeconds)
         {
             if (!File.Exists(fullPath))
             {
                 return Response.Error($"Script not found at '{relativePath}'. Cannot delete.");
             }
+            if (deferCompile)
+            {
+                // The script stays in place until the staged changes are committed
+                return Staged(relativePath, "delete", debounceSeconds, $"Script '{Path.GetFileName(relativePath)}' staged for deletion");
+            }
 
             try
             {
@@ -181,7 +253,8 @@ namespace UnityMcpBridge.Editor.Tools
                 if (deleted)
                 {
                     AssetDatabase.Refresh();
-                    return Response.Success($"Script '{Path.GetFileName(relativePath)}' moved to trash successfully.");
+                    return JobManager.Started(JobManager.StartCompilation(relativePath),
+                        $"Script '{Path.GetFileName(relativePath)}' moved to trash successfully.");
                 }
                 else
                 {
@@ -194,6 +267,57 @@ namespace UnityMcpBridge.Editor.Tools
             }
         }
 
+        /// <summary>
+        /// The reply to a staged change: the job that will compile it once the staged changes are committed.
+        /// </summary>
+        private static object Staged(string relativePath, string change, double debounceSeconds, string done, string hash = null)
+        {
+            JobManager.Job job = JobManager.StageScriptChange(relativePath, change, debounceSeconds);
+            string commit = debounceSeconds > 0
+                ? $"the commit, or {debounceSeconds:0.#} seconds without another staged change"
+                : "the commit";
+            object data = hash == null
+                ? new { path = relativePath, staged = true }
+                : new { path = relativePath, staged = true, hash };
+            return JobManager.Started(job, $"{done}; compilation deferred until {commit}.", data);
+        }
+
+        /// <summary>
+        /// Lowercase hex SHA-256 of the UTF-8 bytes of a script's text (the Python server computes the same).
+        /// </summary>
+        private static string ContentHash(string contents)
+        {
+            using var sha = SHA256.Create();
+            byte[] digest = sha.ComputeHash(Encoding.UTF8.GetBytes(contents ?? ""));
+            var hex = new StringBuilder(digest.Length * 2);
+            foreach (byte b in digest)
+            {
+                hex.Append(b.ToString("x2"));
+            }
+            return hex.ToString();
+        }
+
+        /// <summary>
+        /// Imports every staged script change at once; the reply carries the job following the compilation.
+        /// </summary>
+        private static object CommitScripts()
+        {
+            JobManager.Job job = JobManager.StagedCompilation();
+            if (job == null)
+            {
+                return Response.Success("No staged script changes to commit.");
+            }
+            try
+            {
+                JobManager.CommitStaged(job);
+                return JobManager.Started(job, job.message, new { files = job.state["files"] });
+            }
+            catch (Exception e)
+            {
+                return Response.Error($"Failed to commit staged script changes: {e.Message}");
+            }
+        }
+
         /// <summary>
         /// Generates basic C# script content based on name and type.
         /// </summary>
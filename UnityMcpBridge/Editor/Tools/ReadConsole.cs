@@ -1,7 +1,9 @@
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 using System.Reflection;
+using System.Text;
 using UnityEditor;
 using UnityEngine;
 using UnityMcpBridge.Editor.Helpers;
@@ -17,6 +19,12 @@ namespace UnityMcpBridge.Editor.Tools
         private static MethodInfo startGettingEntriesMethod;
         private static MethodInfo endGettingEntriesMethod;
         private static object logEntry;
+        private static FieldInfo messageField;
+        private static FieldInfo modeField;
+
+        // LogEntry.mode flags (UnityEditor.ConsoleWindow.Mode) of errors and warnings
+        private const int ErrorModes = 1 | 2 | 16 | 64 | 256 | 2048 | 8192 | 131072 | 1048576 | 2097152;
+        private const int WarningModes = 128 | 512 | 4096;
 
         static ReadConsole()
         {
@@ -30,6 +38,8 @@ namespace UnityMcpBridge.Editor.Tools
             
             var logEntryType = assembly.GetType("UnityEditor.LogEntry");
             logEntry = Activator.CreateInstance(logEntryType);
+            messageField = logEntryType.GetField("message");
+            modeField = logEntryType.GetField("mode");
         }
         
         public static string Handle(ReadConsoleParams p)
@@ -57,25 +67,114 @@ namespace UnityMcpBridge.Editor.Tools
         private static object GetLogs(ReadConsoleParams p)
         {
             var messages = new List<object>();
-            startGettingEntriesMethod.Invoke(null, null);
-            int count = (int)getCountMethod.Invoke(null, null);
+            HashSet<string> types = p.types != null && p.types.Count > 0
+                ? new HashSet<string>(p.types.Select(t => t.ToLower()))
+                : null;
+            int limit = p.limit ?? int.MaxValue;
+            if (limit < 0) return Response.Error("limit must not be negative.");
 
-            for (int i = 0; i < count; i++)
+            startGettingEntriesMethod.Invoke(null, null);
+            try
             {
-                getEntryMethod.Invoke(null, new object[] { i, logEntry });
-                var message = (string)logEntry.GetType().GetField("message").GetValue(logEntry);
-                var mode = (int)logEntry.GetType().GetField("mode").GetValue(logEntry);
+                int count = (int)getCountMethod.Invoke(null, null);
+
+                // Resume after the entry the cursor points past. A cursor whose entry is gone
+                // or different means the console was cleared since, so start over.
+                int start = 0;
+                bool reset = false;
+                if (p.sinceCursor == "end")
+                {
+                    start = count;
+                }
+                else if (!string.IsNullOrEmpty(p.sinceCursor))
+                {
+                    if (!TryParseCursor(p.sinceCursor, out start, out uint? hash))
+                        return Response.Error($"Invalid sinceCursor: {p.sinceCursor}");
+                    if (start > count || (hash.HasValue && start > 0 && Fnv1a(ReadEntry(start - 1, out _)) != hash.Value))
+                    {
+                        start = 0;
+                        reset = true;
+                    }
+                }
+
+                int i = start;
+                string lastMessage = null;
+                for (; i < count && messages.Count < limit; i++)
+                {
+                    var message = ReadEntry(i, out int mode);
+                    lastMessage = message;
+
+                    string type = TypeOf(mode);
+                    if (types != null && !types.Contains(type)) continue;
+                    if (!string.IsNullOrEmpty(p.filterText) && !message.Contains(p.filterText)) continue;
 
-                // Simple filtering
-                if (!string.IsNullOrEmpty(p.filterText) && !message.Contains(p.filterText)) continue;
-                
-                // Type filtering would go here (by checking 'mode')
+                    messages.Add(new { index = i, message, type, mode });
+                }
+                if (lastMessage == null && i > 0) lastMessage = ReadEntry(i - 1, out _);
 
-                messages.Add(new { message, mode });
+                return Response.Success("Logs retrieved.", new
+                {
+                    logs = messages,
+                    nextCursor = MakeCursor(i, lastMessage),
+                    total = count,
+                    reset
+                });
+            }
+            finally
+            {
+                endGettingEntriesMethod.Invoke(null, null);
             }
-            endGettingEntriesMethod.Invoke(null, null);
+        }
+
+        private static string ReadEntry(int index, out int mode)
+        {
+            getEntryMethod.Invoke(null, new object[] { index, logEntry });
+            mode = (int)modeField.GetValue(logEntry);
+            return (string)messageField.GetValue(logEntry);
+        }
+
+        /// <summary>
+        /// Maps LogEntry.mode flags to 'error', 'warning' or 'log'.
+        /// </summary>
+        private static string TypeOf(int mode)
+        {
+            if ((mode & ErrorModes) != 0) return "error";
+            if ((mode & WarningModes) != 0) return "warning";
+            return "log";
+        }
+
+        // A cursor is the index of the next entry plus a hash of the entry before it,
+        // so that a console cleared and refilled since is detected. A bare index is
+        // accepted too and is not checked.
+        private static string MakeCursor(int index, string previousMessage)
+        {
+            return index == 0 ? "0" : $"{index}:{Fnv1a(previousMessage):x8}";
+        }
+
+        private static bool TryParseCursor(string cursor, out int index, out uint? hash)
+        {
+            index = 0;
+            hash = null;
+            string[] parts = cursor.Split(':');
+            if (parts.Length > 2 || !int.TryParse(parts[0], out index) || index < 0) return false;
+            if (parts.Length == 1) return true;
+            if (!uint.TryParse(parts[1], NumberStyles.HexNumber, CultureInfo.InvariantCulture, out uint value)) return false;
+            hash = value;
+            return true;
+        }
 
-            return Response.Success("Logs retrieved.", new { logs = messages });
+        /// <summary>
+        /// 32-bit FNV-1a of the UTF-8 bytes of a message (the Python server computes the same).
+        /// </summary>
+        private static uint Fnv1a(string message)
+        {
+            uint hash = 2166136261;
+            foreach (byte b in Encoding.UTF8.GetBytes(message ?? ""))
+            {
+                hash ^= b;
+                hash *= 16777619;
+            }
+            return hash;
         }
     }
 } 
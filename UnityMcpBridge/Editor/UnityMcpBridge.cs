@@ -4,6 +4,7 @@ using System.IO;
 using System.Linq;
 using System.Net;
 using System.Net.Sockets;
+using System.Threading;
 using System.Threading.Tasks;
 using UnityEditor;
 using UnityEngine;
@@ -11,6 +12,7 @@ using UnityMcpBridge.Editor.Helpers;
 using UnityMcpBridge.Editor.Models;
 using UnityMcpBridge.Editor.Tools;
 using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
 
 namespace UnityMcpBridge.Editor
 {
@@ -19,11 +21,47 @@ namespace UnityMcpBridge.Editor
     {
         private static TcpListener listener;
         private static bool isRunning = false;
-        private static readonly object lockObj = new();
-        private static Dictionary<string, (string commandJson, TaskCompletionSource<string> tcs)> commandQueue = new();
-        private static readonly int unityPort = 6400; // Hardcoded port
+        public const int DefaultPort = 6400;
+        public const string PortEnvironmentVariable = "UNITY_MCP_PORT";
+        private static int unityPort = DefaultPort;
+        private static string projectName;
+        // Clients that asked for asset change notifications
+        private static readonly List<ClientSession> eventSessions = new();
 
         public static bool IsRunning => isRunning;
+        public static int ListeningPort => unityPort;
+
+        // Per project, so that editors of different projects can listen side by side
+        private static string PortPrefKey => $"UnityMcpBridge.Port.{Application.dataPath}";
+
+        /// <summary>
+        /// The port to listen on: UNITY_MCP_PORT if set, otherwise this project's setting, otherwise 6400.
+        /// </summary>
+        public static int ConfiguredPort
+        {
+            get
+            {
+                string fromEnvironment = Environment.GetEnvironmentVariable(PortEnvironmentVariable);
+                if (int.TryParse(fromEnvironment, out int port) && port > 0 && port < 65536)
+                {
+                    return port;
+                }
+                return EditorPrefs.GetInt(PortPrefKey, DefaultPort);
+            }
+        }
+
+        /// <summary>
+        /// Saves this project's port and restarts the bridge on it (UNITY_MCP_PORT still takes precedence).
+        /// </summary>
+        public static void SetProjectPort(int port)
+        {
+            if (port <= 0 || port >= 65536)
+            {
+                throw new ArgumentOutOfRangeException(nameof(port), "Port must be between 1 and 65535.");
+            }
+            EditorPrefs.SetInt(PortPrefKey, port);
+            Start();
+        }
 
         static UnityMcpBridge()
         {
@@ -40,6 +78,10 @@ namespace UnityMcpBridge.Editor
                 return;
             }
 
+            // Read on the main thread; the handshake reply names the project, so that a server driving
+            // several editors can tell them apart
+            unityPort = ConfiguredPort;
+            projectName = Application.productName;
             try
             {
                 listener = new TcpListener(IPAddress.Loopback, unityPort);
@@ -114,162 +156,463 @@ namespace UnityMcpBridge.Editor
             using (client)
             using (NetworkStream stream = client.GetStream())
             {
-                byte[] buffer = new byte[8192];
-                while (isRunning)
+                ClientSession session = new() { Stream = stream };
+                try
                 {
-                    try
+                    while (isRunning)
                     {
-                        int bytesRead = await stream.ReadAsync(buffer, 0, buffer.Length);
-                        if (bytesRead == 0)
+                        try
                         {
-                            break; // Client disconnected
-                        }
+                            string commandText;
+                            if (session.Framed)
+                            {
+                                commandText = await ReadFrameAsync(stream, session);
+                                if (commandText == null)
+                                {
+                                    break; // Client disconnected
+                                }
+                            }
+                            else
+                            {
+                                // Reassembled from as many reads as the message takes
+                                commandText = await session.Legacy.ReadMessageAsync(stream);
+                                if (commandText == null)
+                                {
+                                    break; // Client disconnected
+                                }
 
-                        string commandText = System.Text.Encoding.UTF8.GetString(buffer, 0, bytesRead);
-                        string commandId = Guid.NewGuid().ToString();
-                        TaskCompletionSource<string> tcs = new();
+                                // Handshake: "ping {options}" negotiates the wire mode for this client
+                                if (commandText.StartsWith(HandshakePrefix))
+                                {
+                                    Negotiate(session, commandText.Substring(HandshakePrefix.Length));
+                                    // The handshake reply itself is always unframed
+                                    await WriteMessageAsync(stream, session, BuildHandshakeResponse(session), false);
+                                    // Events are framed, so they may only follow the handshake reply
+                                    lock (eventSessions)
+                                    {
+                                        eventSessions.Remove(session);
+                                        if (session.AssetEvents)
+                                        {
+                                            eventSessions.Add(session);
+                                        }
+                                    }
+                                    continue;
+                                }
+                            }
 
-                        // Special handling for ping command to avoid JSON parsing
-                        if (commandText.Trim() == "ping")
-                        {
-                            // Direct response to ping without going through JSON parsing
-                            byte[] pingResponseBytes = System.Text.Encoding.UTF8.GetBytes(
-                                /*lang=json,strict*/
-                                "{\"status\":\"success\",\"result\":{\"message\":\"pong\"}}"
-                            );
-                            await stream.WriteAsync(pingResponseBytes, 0, pingResponseBytes.Length);
-                            continue;
-                        }
+                            // Continuations must not run on the main thread inside ProcessCommands
+                            TaskCompletionSource<string> tcs = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+                            // Special handling for ping command to avoid JSON parsing
+                            if (commandText.Trim() == "ping")
+                            {
+                                // Direct response to ping without going through JSON parsing
+                                await WriteMessageAsync(stream, session,
+                                    WithStateVersion(/*lang=json,strict*/ "{\"status\":\"success\",\"result\":{\"message\":\"pong\"}}"),
+                                    session.Framed
+                                );
+                                continue;
+                            }
+
+                            CommandScheduler.Enqueue(commandText, tcs);
+
+                            if (session.Pipelined)
+                            {
+                                // Keep reading: the reply is written, tagged with the request ID, once it is ready
+                                string requestId = JsonHelper.GetStringValue(commandText, "id");
+                                _ = RespondAsync(stream, session, tcs.Task, requestId);
+                                continue;
+                            }
 
-                        lock (lockObj)
+                            string response = WithStateVersion(await tcs.Task);
+                            Debug.Log($"[HandleClientAsync] Sending response: {response}");
+                            await WriteMessageAsync(stream, session, response, session.Framed);
+                        }
+                        catch (Exception ex)
                         {
-                            commandQueue[commandId] = (commandText, tcs);
+                            Debug.LogError($"Client handler error: {ex.Message}");
+                            break;
                         }
-
-                        string response = await tcs.Task;
-                        Debug.Log($"[HandleClientAsync] Sending response: {response}");
-                        byte[] responseBytes = System.Text.Encoding.UTF8.GetBytes(response);
-                        await stream.WriteAsync(responseBytes, 0, responseBytes.Length);
                     }
-                    catch (Exception ex)
+                }
+                finally
+                {
+                    lock (eventSessions)
                     {
-                        Debug.LogError($"Client handler error: {ex.Message}");
-                        break;
+                        eventSessions.Remove(session);
                     }
                 }
             }
         }
 
-        private static void ProcessCommands()
+        private const string HandshakePrefix = "ping ";
+        private const int FrameHeaderSize = 4;
+        private const int MaxFrameSize = 512 * 1024 * 1024;
+        private const int DefaultCompressionThreshold = 64 * 1024;
+        private const string AssetEventsName = "assets";
+
+        /// <summary>
+        /// Wire options negotiated by one client during the ping handshake
+        /// </summary>
+        private sealed class ClientSession
+        {
+            public bool Framed;
+            public bool Pipelined;
+            public bool MessagePack; // Framed message bodies are MessagePack instead of JSON text
+            public string Compression; // Algorithm for large framed bodies, or null
+            public int CompressionThreshold = DefaultCompressionThreshold;
+            public bool AssetEvents; // Push asset change notifications (pipelined connections only)
+            public NetworkStream Stream;
+            public readonly SemaphoreSlim WriteLock = new(1, 1);
+            public readonly MessageAssembler Legacy = new(MaxFrameSize); // Unframed messages, until the handshake
+        }
+
+        /// <summary>
+        /// Applies the handshake options requested by the client.
+        /// Pipelining, the MessagePack encoding and compression are only available on top of length-prefixed framing;
+        /// asset change notifications need pipelining, since they arrive between replies.
+        /// </summary>
+        private static void Negotiate(ClientSession session, string optionsJson)
+        {
+            try
+            {
+                JObject options = JObject.Parse(optionsJson);
+                session.Framed = options.Value<string>("framing") == "length";
+                session.Pipelined = session.Framed && options.Value<bool?>("pipelining") == true;
+                session.MessagePack = session.Framed && options.Value<string>("encoding") == "msgpack";
+                // The client lists what it can decode; zlib is the only algorithm the bridge implements
+                session.Compression = session.Framed && options["compression"] is JArray offered
+                    && offered.Any(name => name.Type == JTokenType.String && (string)name == ZlibCompression.Name)
+                    ? ZlibCompression.Name
+                    : null;
+                session.CompressionThreshold = Math.Max(1, options.Value<int?>("compressionThreshold") ?? DefaultCompressionThreshold);
+                session.AssetEvents = session.Pipelined && options["events"] is JArray events
+                    && events.Any(name => name.Type == JTokenType.String && (string)name == AssetEventsName);
+            }
+            catch (Exception ex)
+            {
+                Debug.LogWarning($"Invalid handshake options, staying in legacy mode: {ex.Message}");
+                session.Framed = false;
+                session.Pipelined = false;
+                session.MessagePack = false;
+                session.Compression = null;
+                session.AssetEvents = false;
+            }
+        }
+
+        private static string BuildHandshakeResponse(ClientSession session)
+        {
+            var result = new Dictionary<string, object> { { "message", "pong" }, { "project", projectName } };
+            if (session.Framed)
+            {
+                result["framing"] = "length";
+            }
+            if (session.Pipelined)
+            {
+                result["pipelining"] = true;
+            }
+            if (session.MessagePack)
+            {
+                result["encoding"] = "msgpack";
+            }
+            if (session.Compression != null)
+            {
+                result["compression"] = session.Compression;
+            }
+            if (session.AssetEvents)
+            {
+                result["events"] = new[] { AssetEventsName };
+            }
+            return JsonConvert.SerializeObject(new { status = "success", result });
+        }
+
+        internal static bool HasEventListeners
         {
-            List<string> processedIds = new();
-            lock (lockObj)
+            get
             {
-                foreach (KeyValuePair<string, (string commandJson, TaskCompletionSource<string> tcs)> kvp in commandQueue.ToList())
+                lock (eventSessions)
                 {
-                    string id = kvp.Key;
-                    string commandText = kvp.Value.commandJson;
-                    TaskCompletionSource<string> tcs = kvp.Value.tcs;
+                    return eventSessions.Count > 0;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Pushes an event message, a JSON object without an ID, to every client that asked for events.
+        /// </summary>
+        internal static void BroadcastEvent(string message)
+        {
+            List<ClientSession> sessions;
+            lock (eventSessions)
+            {
+                sessions = eventSessions.ToList();
+            }
+            foreach (ClientSession session in sessions)
+            {
+                _ = SendEventAsync(session, message);
+            }
+        }
+
+        private static async Task SendEventAsync(ClientSession session, string message)
+        {
+            try
+            {
+                // Encoded and written off the main thread
+                await Task.Run(() => WriteMessageAsync(session.Stream, session, message, true));
+            }
+            catch (Exception ex)
+            {
+                Debug.LogWarning($"Failed to send event: {ex.Message}");
+            }
+        }
+
+        /// <summary>
+        /// Writes a pipelined reply once its command has been processed.
+        /// </summary>
+        private static async Task RespondAsync(NetworkStream stream, ClientSession session, Task<string> pending, string requestId)
+        {
+            try
+            {
+                string response = await pending;
+                await WriteMessageAsync(stream, session, WithRequestId(WithStateVersion(response), requestId), session.Framed);
+            }
+            catch (Exception ex)
+            {
+                Debug.LogError($"Failed to send response for request {requestId}: {ex.Message}");
+            }
+        }
+
+        /// <summary>
+        /// Adds the request ID as the first field of a JSON object response.
+        /// </summary>
+        private static string WithRequestId(string response, string requestId)
+        {
+            return requestId == null ? response : PrependField(response, "\"id\":" + JsonConvert.ToString(requestId));
+        }
 
-                    try
+        /// <summary>
+        /// Adds the editor's state version to a JSON object response, for clients that memoize query results.
+        /// </summary>
+        private static string WithStateVersion(string response)
+        {
+            return PrependField(response, "\"stateVersion\":" + EditorStateVersion.Current);
+        }
+
+        private static string PrependField(string response, string field)
+        {
+            string trimmed = response.TrimStart();
+            if (!trimmed.StartsWith("{"))
+            {
+                return response;
+            }
+            string rest = trimmed.Substring(1).TrimStart();
+            return rest.StartsWith("}") ? "{" + field + rest : "{" + field + "," + rest;
+        }
+
+        /// <summary>
+        /// Reads one length-prefixed message as JSON text. Returns null if the client disconnected.
+        /// </summary>
+        private static async Task<string> ReadFrameAsync(NetworkStream stream, ClientSession session)
+        {
+            byte[] header = new byte[FrameHeaderSize];
+            if (!await ReadExactAsync(stream, header, FrameHeaderSize))
+            {
+                return null;
+            }
+            // The high bit marks a compressed body
+            bool compressed = (header[0] & 0x80) != 0;
+            int length = ((header[0] & 0x7f) << 24) | (header[1] << 16) | (header[2] << 8) | header[3];
+            if (length > MaxFrameSize)
+            {
+                throw new InvalidDataException($"Invalid frame length: {length}");
+            }
+            byte[] body = new byte[length];
+            if (!await ReadExactAsync(stream, body, length))
+            {
+                return null;
+            }
+            if (compressed)
+            {
+                if (session.Compression == null)
+                {
+                    throw new InvalidDataException("Compressed frame on a connection without compression");
+                }
+                body = ZlibCompression.Decompress(body, MaxFrameSize);
+            }
+            // MessagePack commands are maps; a raw ping stays text in every encoding
+            if (session.MessagePack && MessagePackJson.StartsWithMap(body))
+            {
+                return MessagePackJson.ToJson(body);
+            }
+            return System.Text.Encoding.UTF8.GetString(body, 0, body.Length);
+        }
+
+        private static async Task<bool> ReadExactAsync(NetworkStream stream, byte[] buffer, int count)
+        {
+            int offset = 0;
+            while (offset < count)
+            {
+                int bytesRead = await stream.ReadAsync(buffer, offset, count - offset);
+                if (bytesRead == 0)
+                {
+                    return false;
+                }
+                offset += bytesRead;
+            }
+            return true;
+        }
+
+        private static async Task WriteMessageAsync(NetworkStream stream, ClientSession session, string message, bool framed)
+        {
+            // Converted here, off the main thread; handlers keep producing JSON
+            byte[] body = framed && session.MessagePack
+                ? MessagePackJson.FromJson(message)
+                : System.Text.Encoding.UTF8.GetBytes(message);
+            bool compressed = false;
+            if (framed && session.Compression != null && body.Length >= session.CompressionThreshold)
+            {
+                byte[] packed = ZlibCompression.Compress(body);
+                // Incompressible bodies are sent as they are
+                if (packed.Length < body.Length)
+                {
+                    body = packed;
+                    compressed = true;
+                }
+            }
+            await session.WriteLock.WaitAsync();
+            try
+            {
+                if (framed)
+                {
+                    byte[] header =
                     {
-                        // Special case handling
-                        if (string.IsNullOrEmpty(commandText))
-                        {
-                            var emptyResponse = new
-                            {
-                                status = "error",
-                                error = "Empty command received",
-                            };
-                            tcs.SetResult(JsonHelper.ToJson(emptyResponse));
-                            processedIds.Add(id);
-                            continue;
-                        }
+                        (byte)((body.Length >> 24) | (compressed ? 0x80 : 0)),
+                        (byte)(body.Length >> 16),
+                        (byte)(body.Length >> 8),
+                        (byte)body.Length,
+                    };
+                    await stream.WriteAsync(header, 0, header.Length);
+                }
+                await stream.WriteAsync(body, 0, body.Length);
+            }
+            finally
+            {
+                session.WriteLock.Release();
+            }
+        }
 
-                        // Trim the command text to remove any whitespace
-                        commandText = commandText.Trim();
+        private static readonly System.Diagnostics.Stopwatch tickWatch = new();
 
-                        // Non-JSON direct commands handling (like ping)
-                        if (commandText == "ping")
-                        {
-                            var pingResponse = new
-                            {
-                                status = "success",
-                                result = new { message = "pong" },
-                            };
-                            tcs.SetResult(JsonHelper.ToJson(pingResponse));
-                            processedIds.Add(id);
-                            continue;
-                        }
+        private static void ProcessCommands()
+        {
+            // Jobs started by earlier commands advance before the next commands run
+            JobManager.Update();
 
-                        // Check if the command is valid JSON before attempting to deserialize
-                        if (!JsonHelper.IsValidJson(commandText))
-                        {
-                            var invalidJsonResponse = new
-                            {
-                                status = "error",
-                                error = "Invalid JSON format",
-                                receivedText = commandText.Length > 50 ? commandText[..50] + "..." : commandText,
-                            };
-                            tcs.SetResult(JsonHelper.ToJson(invalidJsonResponse));
-                            processedIds.Add(id);
-                            continue;
-                        }
+            // Commands are taken one at a time, so the listener threads keep queueing while they run;
+            // the rest waits for the next tick once the budget is spent, keeping the editor responsive
+            tickWatch.Restart();
+            while (tickWatch.Elapsed.TotalSeconds < CommandScheduler.TickBudgetSeconds
+                && CommandScheduler.TryDequeue(out CommandScheduler.QueuedCommand queued))
+            {
+                string responseJson = ProcessCommand(queued.Text);
+                queued.Completion.SetResult(WithQueueStats(responseJson, queued));
+            }
+        }
 
-                        // Normal JSON command processing
-                        Debug.Log($"[ProcessCommands] Raw command text: {commandText}");
-                        // フィールド名を変換: "params" -> "parameters"
-                        commandText = System.Text.RegularExpressions.Regex.Replace(
-                            commandText,
-                            "\\\"@params\\\"[ ]*:",
-                            "\"parameters\":",
-                            System.Text.RegularExpressions.RegexOptions.IgnoreCase
-                        );
-                        Debug.Log($"[ProcessCommands] After replacement: {commandText}");
-                        Command command = JsonHelper.FromJson<Command>(commandText);
-                        Debug.Log($"[ProcessCommands] Received command type: {command?.type ?? "null"}");
-                        Debug.Log($"[ProcessCommands] Command text: {commandText}");
-                        if (command == null)
-                        {
-                            Debug.LogError("[ProcessCommands] Failed to deserialize command");
-                            var nullCommandResponse = new
-                            {
-                                status = "error",
-                                error = "Command deserialized to null",
-                                details = "The command was valid JSON but could not be deserialized to a Command object",
-                            };
-                            tcs.SetResult(JsonHelper.ToJson(nullCommandResponse));
-                        }
-                        else
-                        {
-                            Debug.Log($"[ProcessCommands] Command type: {command.type}");
-                            Debug.Log($"[ProcessCommands] Parameters: {command.parameters}");
-                            string responseJson = ExecuteCommand(command);
-                            tcs.SetResult(responseJson);
-                        }
-                    }
-                    catch (Exception ex)
+        /// <summary>
+        /// Adds how many commands were still queued and how long this one waited to a JSON object response.
+        /// </summary>
+        private static string WithQueueStats(string response, CommandScheduler.QueuedCommand queued)
+        {
+            return PrependField(response,
+                "\"queueDepth\":" + queued.QueueDepth
+                + ",\"queueWaitMs\":" + Math.Round(queued.WaitMs, 3).ToString(System.Globalization.CultureInfo.InvariantCulture));
+        }
+
+        /// <summary>
+        /// Runs one queued command on the main thread and returns its JSON response.
+        /// </summary>
+        private static string ProcessCommand(string commandText)
+        {
+            try
+            {
+                // Special case handling
+                if (string.IsNullOrEmpty(commandText))
+                {
+                    var emptyResponse = new
                     {
-                        Debug.LogError($"Error processing command: {ex.Message}\n{ex.StackTrace}");
+                        status = "error",
+                        error = "Empty command received",
+                    };
+                    return JsonHelper.ToJson(emptyResponse);
+                }
 
-                        var response = new
-                        {
-                            status = "error",
-                            error = ex.Message,
-                            commandType = "Unknown (error during processing)",
-                            receivedText = commandText?.Length > 50 ? commandText[..50] + "..." : commandText,
-                        };
-                        string responseJson = JsonHelper.ToJson(response);
-                        tcs.SetResult(responseJson);
-                    }
+                // Trim the command text to remove any whitespace
+                commandText = commandText.Trim();
 
-                    processedIds.Add(id);
+                // Non-JSON direct commands handling (like ping)
+                if (commandText == "ping")
+                {
+                    var pingResponse = new
+                    {
+                        status = "success",
+                        result = new { message = "pong" },
+                    };
+                    return JsonHelper.ToJson(pingResponse);
                 }
 
-                foreach (string id in processedIds)
+                // Check if the command is valid JSON before attempting to deserialize
+                if (!JsonHelper.IsValidJson(commandText))
                 {
-                    commandQueue.Remove(id);
+                    var invalidJsonResponse = new
+                    {
+                        status = "error",
+                        error = "Invalid JSON format",
+                        receivedText = commandText.Length > 50 ? commandText[..50] + "..." : commandText,
+                    };
+                    return JsonHelper.ToJson(invalidJsonResponse);
+                }
+
+                // Normal JSON command processing
+                Debug.Log($"[ProcessCommands] Raw command text: {commandText}");
+                // フィールド名を変換: "params" -> "parameters"
+                commandText = System.Text.RegularExpressions.Regex.Replace(
+                    commandText,
+                    "\\\"@params\\\"[ ]*:",
+                    "\"parameters\":",
+                    System.Text.RegularExpressions.RegexOptions.IgnoreCase
+                );
+                Debug.Log($"[ProcessCommands] After replacement: {commandText}");
+                Command command = JsonHelper.FromJson<Command>(commandText);
+                Debug.Log($"[ProcessCommands] Received command type: {command?.type ?? "null"}");
+                Debug.Log($"[ProcessCommands] Command text: {commandText}");
+                if (command == null)
+                {
+                    Debug.LogError("[ProcessCommands] Failed to deserialize command");
+                    var nullCommandResponse = new
+                    {
+                        status = "error",
+                        error = "Command deserialized to null",
+                        details = "The command was valid JSON but could not be deserialized to a Command object",
+                    };
+                    return JsonHelper.ToJson(nullCommandResponse);
                 }
+                Debug.Log($"[ProcessCommands] Command type: {command.type}");
+                Debug.Log($"[ProcessCommands] Parameters: {command.parameters}");
+                return ExecuteCommand(command);
+            }
+            catch (Exception ex)
+            {
+                Debug.LogError($"Error processing command: {ex.Message}\n{ex.StackTrace}");
+
+                var response = new
+                {
+                    status = "error",
+                    error = ex.Message,
+                    commandType = "Unknown (error during processing)",
+                    receivedText = commandText?.Length > 50 ? commandText[..50] + "..." : commandText,
+                };
+                return JsonHelper.ToJson(response);
             }
         }
 
@@ -318,6 +661,15 @@ namespace UnityMcpBridge.Editor
                         var menuItemParams = JsonConvert.DeserializeObject<ExecuteMenuItemParams>(parametersJson);
                         Debug.Log($"[ExecuteCommand] Parsed menuPath: {menuItemParams?.menuPath}");
                         return ExecuteMenuItem.Handle(menuItemParams);
+                    case "job_status":
+                        // Polled while clients wait for jobs, so not logged
+                        var jobParams = JsonConvert.DeserializeObject<JobStatusParams>(parametersJson);
+                        return JobStatus.Handle(jobParams);
+                    case "batch":
+                        Debug.Log("[ExecuteCommand] Processing batch");
+                        var batchParams = JsonConvert.DeserializeObject<BatchParams>(parametersJson);
+                        Debug.Log($"[ExecuteCommand] Batch size: {batchParams?.commands?.Count ?? 0}");
+                        return ExecuteBatch(batchParams);
                     default:
                         Debug.LogError($"[ExecuteCommand] Unknown command type: {command.type}");
                         return JsonConvert.SerializeObject(Response.Error($"Unknown command type: {command.type}"));
@@ -329,5 +681,62 @@ namespace UnityMcpBridge.Editor
                 return JsonConvert.SerializeObject(Response.Error($"Error: {ex.Message}"));
             }
         }
+
+        /// <summary>
+        /// Executes an ordered list of commands in one editor tick and returns a result per command.
+        /// </summary>
+        private static string ExecuteBatch(BatchParams batchParams)
+        {
+            if (batchParams?.commands == null || batchParams.commands.Count == 0)
+            {
+                return JsonConvert.SerializeObject(Response.Error("Batch requires a non-empty 'commands' list."));
+            }
+
+            bool stopOnError = batchParams.stopOnError ?? true;
+            var results = new List<object>();
+            int succeeded = 0;
+            int failed = 0;
+            bool stopped = false;
+
+            for (int i = 0; i < batchParams.commands.Count; i++)
+            {
+                Command command = batchParams.commands[i];
+                string responseJson;
+                if (command == null || string.IsNullOrEmpty(command.type))
+                {
+                    responseJson = JsonConvert.SerializeObject(Response.Error("Command type is required."));
+                }
+                else if (command.type == "batch")
+                {
+                    responseJson = JsonConvert.SerializeObject(Response.Error("Nested batches are not supported."));
+                }
+                else
+                {
+                    responseJson = ExecuteCommand(command);
+                }
+
+                // Handlers put "status" first, so the lookup stops early and the response is embedded as-is.
+                bool success = JsonHelper.GetStringValue(responseJson, "status") == "success";
+                results.Add(new { index = i, type = command?.type, response = new JRaw(responseJson) });
+                if (success)
+                {
+                    succeeded++;
+                }
+                else
+                {
+                    failed++;
+                    if (stopOnError)
+                    {
+                        stopped = i < batchParams.commands.Count - 1;
+                        break;
+                    }
+                }
+            }
+
+            return JsonHelper.ToJson(Response.Success(
+                $"Batch executed: {succeeded} succeeded, {failed} failed.",
+                new { results, succeeded, failed, stopped }
+            ));
+        }
     }
 }
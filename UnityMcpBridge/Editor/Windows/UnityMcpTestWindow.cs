@@ -12,6 +12,7 @@ namespace UnityMcpBridge.Editor.Windows
         private Vector2 scrollPosition;
         private bool claudeConfigExists = false;
         private bool customMcpConfigured = false;
+        private int portField;
 
         [MenuItem("Window/Unity MCP Test")]
         public static void ShowWindow()
@@ -21,6 +22,7 @@ namespace UnityMcpBridge.Editor.Windows
 
         private void OnEnable()
         {
+            portField = UnityMcpBridge.ConfiguredPort;
             UpdateConnectionStatus();
             UpdateClaudeConfigStatus();
         }
@@ -29,7 +31,7 @@ namespace UnityMcpBridge.Editor.Windows
         {
             if (UnityMcpBridge.IsRunning)
             {
-                connectionStatus = "接続中 (ポート 6400)";
+                connectionStatus = $"接続中 (ポート {UnityMcpBridge.ListeningPort})";
                 statusColor = Color.green;
             }
             else
@@ -63,7 +65,18 @@ namespace UnityMcpBridge.Editor.Windows
             statusStyle.normal.textColor = statusColor;
             EditorGUILayout.LabelField($"状態: {connectionStatus}", statusStyle);
             
-            EditorGUILayout.LabelField($"ポート: 6400");
+            EditorGUILayout.BeginHorizontal();
+            portField = EditorGUILayout.IntField("ポート（このプロジェクト）", portField);
+            if (GUILayout.Button("適用", GUILayout.Width(60)) && portField > 0 && portField < 65536)
+            {
+                UnityMcpBridge.SetProjectPort(portField);
+                UpdateConnectionStatus();
+            }
+            EditorGUILayout.EndHorizontal();
+            if (!string.IsNullOrEmpty(Environment.GetEnvironmentVariable(UnityMcpBridge.PortEnvironmentVariable)))
+            {
+                EditorGUILayout.HelpBox($"環境変数 {UnityMcpBridge.PortEnvironmentVariable} が設定されているため、そのポートが優先されます。", MessageType.Info);
+            }
             EditorGUILayout.Space(5);
 
             EditorGUILayout.BeginHorizontal();
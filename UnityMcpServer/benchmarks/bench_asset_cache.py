@@ -0,0 +1,87 @@
+"""
+Benchmark: repeated manage_asset searches with and without the asset cache.
+
+Replays an agent-like workload against the fake bridge: searches drawn from a
+few patterns and folders, most of them repeats, with an asset created every
+`--write-every` calls. Each search costs `--find-latency` seconds on the fake
+bridge's main thread, standing in for AssetDatabase.FindAssets on a large
+project. Reported: median and p99 latency per search and the cache's hit rate
+(folder-scoped searches answered from an ancestor's cached search included).
+
+Usage:
+    python bench_asset_cache.py [--assets 20000] [--calls 500] [--find-latency 0.02] [--write-every 50]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool  # noqa: E402
+import asset_cache  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from fake_bridge import FakeBridge, asset_paths  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.WARNING)
+
+PATTERNS = ["*.prefab", "*.mat", "*.cs", "*.png", "Asset1*"]
+# "" searches the whole project
+FOLDERS = ["", "Assets", "Assets/Prefabs", "Assets/Prefabs/Props", "Assets/Materials", "Assets/Scripts"]
+
+
+async def replay(mcp: FastMCP, calls: int, write_every: int):
+    rng = random.Random(3)
+    latencies = []
+    for i in range(calls):
+        if write_every and i % write_every == write_every - 1:
+            await mcp.call_tool("manage_asset", {"action": "create", "path": f"Assets/Materials/New{i}.mat",
+                                                 "asset_type": "Material"})
+            continue
+        # A few searches make up most of the workload
+        pattern = PATTERNS[min(int(rng.expovariate(1.0)), len(PATTERNS) - 1)]
+        folder = FOLDERS[min(int(rng.expovariate(0.7)), len(FOLDERS) - 1)]
+        arguments = {"action": "search", "path": folder, "search_pattern": pattern}
+        start = time.perf_counter()
+        await mcp.call_tool("manage_asset", arguments)
+        latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+
+async def run(args) -> None:
+    mcp = FastMCP("bench-asset-cache")
+    register_all_tools(mcp)
+    print(f"{'cache':>6} {'p50 ms':>9} {'p99 ms':>9} {'hit rate':>9} {'ancestor hits':>14}")
+    with FakeBridge(port=config.unity_port, tick_rate=args.tick_rate) as bridge:
+        bridge.latencies["manage_asset"] = args.find_latency
+        for enabled in (False, True):
+            bridge.assets = asset_paths(args.assets)
+            config.asset_cache = enabled
+            asset_cache._asset_caches.clear()
+            latencies = await replay(mcp, args.calls, args.write_every)
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            stats = asset_cache.get_asset_cache().stats() if enabled else {}
+            print(f"{'on' if enabled else 'off':>6} {statistics.median(latencies) * 1000:9.2f} {p99 * 1000:9.2f} "
+                  f"{json.dumps(stats.get('hitRate')):>9} {stats.get('ancestorHits', '-'):>14}")
+    await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=20000, help="asset paths in the fake project")
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--find-latency", type=float, default=0.02, help="seconds one search takes in the bridge")
+    parser.add_argument("--tick-rate", type=float, default=0.0, help="editor ticks per second in the fake bridge")
+    parser.add_argument("--write-every", type=int, default=50, help="create an asset every N calls (0: never)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
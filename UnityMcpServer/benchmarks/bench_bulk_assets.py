@@ -0,0 +1,98 @@
+"""
+Benchmark: creating, moving and deleting many assets one call at a time or in bulk.
+
+Through FastMCP against a fake bridge whose main thread ticks `--tick-rate`
+times a second, where each asset operation takes `--write` seconds and the
+import and refresh after each asset editing scope `--refresh` seconds: once per
+manage_asset call, once per bridge call of bulk_assets. For `--assets` materials,
+three phases (create, move, delete) run as individual manage_asset calls and as
+bulk_assets calls with each of the `--chunk-sizes`; reported are the seconds
+each phase took, the bridge calls and refreshes, and the speedup.
+
+Usage:
+    python bench_bulk_assets.py [--assets 500] [--chunk-sizes 50,200,1000] [--write 0.001] [--refresh 0.02]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from fake_bridge import FakeBridge  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.CRITICAL)
+
+
+async def call(mcp: FastMCP, tool: str, arguments: dict) -> dict:
+    result = await mcp.call_tool(tool, arguments)
+    return json.loads((result[0] if isinstance(result, tuple) else result)[0].text)
+
+
+def phases(count: int) -> list:
+    """The items of each phase: create the materials, move them to another folder, delete them."""
+    return [
+        ("create", [{"action": "create", "path": f"Assets/Generated/M{i}.mat", "asset_type": "Material"}
+                    for i in range(count)]),
+        ("move", [{"action": "move", "path": f"Assets/Generated/M{i}.mat", "destination": f"Assets/Moved/M{i}.mat"}
+                  for i in range(count)]),
+        ("delete", [{"action": "delete", "path": f"Assets/Moved/M{i}.mat"} for i in range(count)]),
+    ]
+
+
+async def run_phase(mcp: FastMCP, items: list, chunk_size) -> None:
+    if chunk_size is None:
+        for item in items:
+            await call(mcp, "manage_asset", item)
+        return
+    result = await call(mcp, "bulk_assets", {"items": items, "chunk_size": chunk_size})
+    if result["data"]["failed"] or result["data"]["skipped"]:
+        raise RuntimeError(result["message"])
+
+
+async def run(args) -> None:
+    mcp = FastMCP("bench-bulk-assets")
+    register_all_tools(mcp)
+    modes = [None] + [int(size) for size in args.chunk_sizes.split(",")]
+    with FakeBridge(latency=args.latency, tick_rate=args.tick_rate) as bridge:
+        bridge.asset_write = args.write
+        bridge.asset_refresh = args.refresh
+        config.unity_port = bridge.port
+        print(f"{'mode':>12} {'create s':>9} {'move s':>8} {'delete s':>9} {'calls':>6} {'refreshes':>10} {'speedup':>8}")
+        baseline = None
+        for chunk_size in modes:
+            processed, scopes = bridge.commands_processed, bridge.asset_scopes
+            seconds = []
+            for _, items in phases(args.assets):
+                start = time.perf_counter()
+                await run_phase(mcp, items, chunk_size)
+                seconds.append(time.perf_counter() - start)
+            total = sum(seconds)
+            baseline = baseline or total
+            mode = "individual" if chunk_size is None else f"bulk/{chunk_size}"
+            print(f"{mode:>12} {seconds[0]:9.2f} {seconds[1]:8.2f} {seconds[2]:9.2f} "
+                  f"{bridge.commands_processed - processed:>6} {bridge.asset_scopes - scopes:>10} "
+                  f"{baseline / total:7.1f}x")
+        await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=500, help="materials created, moved and deleted")
+    parser.add_argument("--chunk-sizes", default="50,200,1000", help="comma separated bulk_assets chunk sizes")
+    parser.add_argument("--write", type=float, default=0.001, help="seconds each asset operation takes")
+    parser.add_argument("--refresh", type=float, default=0.02, help="seconds of import and refresh per editing scope")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds each command takes besides the asset work")
+    parser.add_argument("--tick-rate", type=float, default=60.0, help="editor ticks per second")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark: polling the Unity console for new errors.
+
+An agent waiting for compile errors calls read_console again and again while the
+console already holds thousands of entries. Three ways of polling are compared
+against the fake bridge, for several console sizes:
+
+- full:   read_console(types=["error"]) without a cursor, the buffer disabled;
+          every poll re-reads and re-sends the whole filtered console
+- cursor: read_console(since_cursor=...) with the buffer disabled; every poll
+          only carries what was logged since the last one
+- buffer: read_console(types=["error"]) with the ring buffer; the filter is
+          applied locally after fetching the new entries
+
+Between polls the fake bridge logs a few new entries. Reported per poll: the
+median latency, the size of the tool's reply and the bytes received from Unity.
+In the editor every entry Unity scans costs a reflection call on the main
+thread, which the fake bridge does not model; the bytes from Unity follow the
+number of entries scanned.
+
+Usage:
+    python bench_console.py [--entries 1000,10000,50000] [--polls 50] [--new 5] [--buffer-size 100000]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool  # noqa: E402
+from metrics import get_command_metrics  # noqa: E402
+import console_buffer  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from fake_bridge import FakeBridge  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.WARNING)
+
+
+def fill(bridge: FakeBridge, entries: int) -> None:
+    bridge.console = []
+    for i in range(entries):
+        log_new(bridge, i)
+
+
+def log_new(bridge: FakeBridge, i: int) -> None:
+    message_type = "error" if i % 50 == 0 else "warning" if i % 10 == 0 else "log"
+    bridge.log(f"Message {i}\nUnityEngine.Debug:Log (object)\nExample:Update () (at Assets/Scripts/Example.cs:{i % 100})",
+               message_type)
+
+
+async def poll(mcp: FastMCP, mode: str, bridge: FakeBridge, polls: int, new: int, buffer_size: int):
+    config.console_buffer_size = buffer_size if mode == "buffer" else 0
+    console_buffer._console_buffers.clear()
+    cursor = None
+    latencies, sizes = [], []
+    logged = len(bridge.console)
+    for i in range(polls + 1):
+        if i == 1:
+            get_command_metrics().reset()
+        for _ in range(new):
+            log_new(bridge, logged)
+            logged += 1
+        arguments = {"since_cursor": cursor} if mode == "cursor" else {"types": ["error"]}
+        start = time.perf_counter()
+        result = await mcp.call_tool("read_console", arguments)
+        latencies.append(time.perf_counter() - start)
+        # The tool's reply as the MCP client receives it
+        text = (result[0] if isinstance(result, tuple) else result)[0].text
+        sizes.append(len(text))
+        if mode == "cursor":
+            cursor = json.loads(text)["data"]["nextCursor"]
+    # The first poll of every mode reads the whole console
+    received = sum(entry["bytesIn"] for entry in get_command_metrics().snapshot()["commands"])
+    return statistics.median(latencies[1:]), statistics.median(sizes[1:]), received / polls
+
+
+async def run(entries, polls: int, new: int, buffer_size: int) -> None:
+    config.metrics = True
+    mcp = FastMCP("bench-console")
+    register_all_tools(mcp)
+    print(f"{'entries':>8} {'mode':>7} {'p50 ms':>9} {'reply KB':>10} {'Unity KB':>10}")
+    with FakeBridge(port=config.unity_port) as bridge:
+        for count in entries:
+            for mode in ("full", "cursor", "buffer"):
+                fill(bridge, count)
+                latency, size, received = await poll(mcp, mode, bridge, polls, new, buffer_size)
+                print(f"{count:>8} {mode:>7} {latency * 1000:9.2f} {size / 1024:10.1f} {received / 1024:10.1f}")
+    await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", default="1000,10000,50000", help="console entries before polling starts")
+    parser.add_argument("--polls", type=int, default=50)
+    parser.add_argument("--new", type=int, default=5, help="entries logged between polls")
+    parser.add_argument("--buffer-size", type=int, default=100000, help="config.console_buffer_size in buffer mode")
+    args = parser.parse_args()
+    asyncio.run(run([int(n) for n in args.entries.split(",")], args.polls, args.new, args.buffer_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: one server driving several Unity editors.
+
+Two measurements through FastMCP against `--max-editors` fake bridges, each an
+editor with its own main thread ticking `--tick-rate` times a second and
+`--latency` seconds of work per command:
+
+- throughput: `--agents` agents each make `--calls` manage_gameobject 'modify'
+              calls, agent i with target_editor set to editor i mod N, for N = 1,
+              2, 4, ... editors. One editor runs every agent's commands on its
+              single main thread; with more editors the same server spreads them.
+- fan-out:    manage_editor get_state (fresh) and read_console on every editor,
+              one target_editor at a time ('sequential') and with
+              target_editor='*' ('fan-out'), `--rounds` times.
+
+Usage:
+    python bench_editors.py [--max-editors 4] [--agents 8] [--calls 50] [--latency 0.005] [--tick-rate 60]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from contextlib import ExitStack
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from fake_bridge import FakeBridge  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.CRITICAL)
+
+
+async def call(mcp: FastMCP, tool: str, arguments: dict) -> dict:
+    result = await mcp.call_tool(tool, arguments)
+    return json.loads((result[0] if isinstance(result, tuple) else result)[0].text)
+
+
+def use_editors(bridges: list, count: int) -> list:
+    """Point the server at the first `count` bridges; the first one is the default editor."""
+    config.unity_port = bridges[0].port
+    config.unity_editors = {f"editor{i}": f"127.0.0.1:{bridge.port}" for i, bridge in enumerate(bridges[1:count], 1)}
+    return ["default"] + list(config.unity_editors)
+
+
+async def throughput(mcp: FastMCP, names: list, args) -> float:
+    async def agent(i: int) -> None:
+        for j in range(args.calls):
+            await call(mcp, "manage_gameobject", {"action": "modify", "target": f"Agent{i}",
+                                                  "position": [j, 0, 0], "target_editor": names[i % len(names)]})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(agent(i) for i in range(args.agents)))
+    return args.agents * args.calls / (time.perf_counter() - start)
+
+
+async def fan_out(mcp: FastMCP, names: list, mode: str, args) -> float:
+    latencies = []
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        if mode == "fan-out":
+            await call(mcp, "manage_editor", {"action": "get_state", "fresh": True, "target_editor": "*"})
+            await call(mcp, "read_console", {"action": "get", "types": ["error"], "target_editor": "*"})
+        else:
+            for name in names:
+                await call(mcp, "manage_editor", {"action": "get_state", "fresh": True, "target_editor": name})
+                await call(mcp, "read_console", {"action": "get", "types": ["error"], "target_editor": name})
+        latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies)
+
+
+async def run(args) -> None:
+    config.scene_cache = False
+    mcp = FastMCP("bench-editors")
+    register_all_tools(mcp)
+    counts = [n for n in (1, 2, 4, 8, 16) if n <= args.max_editors]
+    with ExitStack() as stack:
+        bridges = [stack.enter_context(FakeBridge(latency=args.latency, tick_rate=args.tick_rate))
+                   for _ in range(args.max_editors)]
+        for i, bridge in enumerate(bridges):
+            bridge.project = f"Project{i}"
+            for j in range(200):
+                bridge.log(f"Message {j}", "error" if j % 20 == 0 else "log")
+
+        print(f"{'editors':>8} {'calls/s':>9} {'speedup':>8}")
+        baseline = None
+        for count in counts:
+            names = use_editors(bridges, count)
+            await call(mcp, "list_editors", {})  # connect every editor
+            rate = await throughput(mcp, names, args)
+            baseline = baseline or rate
+            print(f"{count:>8} {rate:9.1f} {rate / baseline:7.2f}x")
+            await close_unity_pool()
+
+        names = use_editors(bridges, args.max_editors)
+        await call(mcp, "list_editors", {})
+        print(f"\n{'mode':>10} {'median ms':>10}  (get_state + read_console on {len(names)} editors)")
+        for mode in ("sequential", "fan-out"):
+            print(f"{mode:>10} {await fan_out(mcp, names, mode, args) * 1000:10.1f}")
+        await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-editors", type=int, default=4, help="fake editors started")
+    parser.add_argument("--agents", type=int, default=8, help="concurrent agents")
+    parser.add_argument("--calls", type=int, default=50, help="calls per agent")
+    parser.add_argument("--rounds", type=int, default=20, help="fan-out rounds")
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds each command takes in an editor")
+    parser.add_argument("--tick-rate", type=float, default=60.0, help="editor ticks per second")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Micro-benchmark: JSON vs. MessagePack message bodies.
+
+Compares encode time, decode time and wire size for the two payload shapes that
+dominate traffic: a get_hierarchy page (many small objects with strings and
+ints) and a batch of modify commands (mostly float vectors). JSON is encoded
+the way unity_connection does it (json.dumps then UTF-8), MessagePack straight
+to bytes. The bridge's indented JSON replies are measured too, since that is
+what the wire carries without MessagePack.
+
+Usage:
+    python bench_encoding.py [--nodes 100,2000,20000] [--commands 10,100,1000] [--repeat 20]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from unity_connection import ENCODING_JSON, ENCODING_MSGPACK, decode_message, encode_message, msgpack  # noqa: E402
+
+COMPONENTS = ["Transform", "MeshFilter", "MeshRenderer", "BoxCollider", "Rigidbody", "Animator", "AudioSource"]
+
+
+def hierarchy_reply(nodes: int) -> dict:
+    """A get_hierarchy page with the default fields, shaped like the bridge's reply."""
+    rng = random.Random(1)
+    items = []
+    for i in range(nodes):
+        depth = rng.randint(0, 6)
+        items.append({
+            "name": f"GameObject_{i}",
+            "instanceId": -10000 - i * 2,
+            "parentId": -10000 - rng.randrange(max(1, i)) * 2 if depth else None,
+            "active": rng.random() > 0.1,
+            "tag": "Untagged" if rng.random() > 0.05 else "Player",
+            "layer": "Default",
+            "path": "/".join(f"Node_{rng.randrange(100)}" for _ in range(depth + 1)),
+            "depth": depth,
+            "childCount": rng.randint(0, 8),
+            "components": rng.sample(COMPONENTS, rng.randint(1, 4)),
+        })
+    return {"status": "success", "result": {"message": "Scene hierarchy page retrieved.",
+                                             "data": {"items": items, "nextCursor": str(-10000 - nodes * 2)}}}
+
+
+def batch_command(commands: int) -> dict:
+    """A pipelined batch command moving many objects."""
+    rng = random.Random(2)
+
+    def vector():
+        return [round(rng.uniform(-100, 100), 4) for _ in range(3)]
+
+    return {"id": "1", "type": "batch", "parameters": {"stopOnError": True, "commands": [
+        {"type": "manage_gameobject", "parameters": {
+            "action": "modify", "target": f"GameObject_{i}", "searchMethod": "by_name",
+            "position": vector(), "rotation": vector(), "scale": [1.0, 1.0, 1.0],
+        }} for i in range(commands)
+    ]}}
+
+
+def best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(label: str, message: dict, repeat: int) -> None:
+    json_body = encode_message(message, ENCODING_JSON)
+    indented = json.dumps(message, indent=2).encode("utf-8")  # JsonHelper.ToJson on the bridge
+    packed = encode_message(message, ENCODING_MSGPACK)
+    json_encode = best_of(repeat, lambda: encode_message(message, ENCODING_JSON))
+    json_decode = best_of(repeat, lambda: decode_message(json_body, ENCODING_JSON))
+    packed_encode = best_of(repeat, lambda: encode_message(message, ENCODING_MSGPACK))
+    packed_decode = best_of(repeat, lambda: decode_message(packed, ENCODING_MSGPACK))
+    print(f"{label:<16} {len(indented) / 1024:10.1f} {len(json_body) / 1024:10.1f} {len(packed) / 1024:10.1f} "
+          f"{json_encode * 1000:9.2f} {packed_encode * 1000:9.2f} "
+          f"{json_decode * 1000:9.2f} {packed_decode * 1000:9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", default="100,2000,20000", help="objects per hierarchy page")
+    parser.add_argument("--commands", default="10,100,1000", help="commands per batch")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    if msgpack is None:
+        raise SystemExit("the msgpack package is not installed (pip install msgpack)")
+
+    print(f"{'payload':<16} {'indent KB':>10} {'json KB':>10} {'msgpack KB':>10} "
+          f"{'enc json':>9} {'enc mp':>9} {'dec json':>9} {'dec mp':>9}   (times in ms)")
+    for count in (int(n) for n in args.nodes.split(",")):
+        measure(f"hierarchy {count}", hierarchy_reply(count), args.repeat)
+    for count in (int(n) for n in args.commands.split(",")):
+        measure(f"batch {count}", batch_command(count), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
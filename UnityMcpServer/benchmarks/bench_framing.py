@@ -0,0 +1,61 @@
+"""
+Micro-benchmark: legacy parse-until-valid receive vs. length-prefixed framing.
+
+Usage:
+    python bench_framing.py [--sizes 1K,64K,1M,10M,50M] [--repeat 5]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config import config  # noqa: E402
+from unity_connection import UnityConnection  # noqa: E402
+from fake_bridge import FakeBridge, parse_size  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.WARNING)
+
+
+def run(bridge: FakeBridge, framing: bool, size: int, repeat: int) -> float:
+    config.framing = framing
+    bridge.payload_size = size
+    bridge.payload()  # build outside the timed region
+    conn = UnityConnection(host=bridge.host, port=bridge.port)
+    if not conn.connect():
+        raise SystemExit("could not connect to fake bridge")
+    assert conn.framed == framing
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.send_command("manage_scene", {"action": "get_hierarchy"})
+        best = min(best, time.perf_counter() - start)
+    conn.disconnect()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1K,64K,1M,10M,50M")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--legacy-limit", default="10M",
+                        help="skip the legacy path above this size (it is quadratic)")
+    args = parser.parse_args()
+    legacy_limit = parse_size(args.legacy_limit)
+
+    print(f"{'payload':>10} {'legacy ms':>12} {'framed ms':>12} {'speedup':>8}")
+    with FakeBridge() as bridge:
+        for label in args.sizes.split(","):
+            size = parse_size(label)
+            framed = run(bridge, True, size, args.repeat)
+            if size <= legacy_limit:
+                legacy = run(bridge, False, size, args.repeat)
+                print(f"{label:>10} {legacy * 1000:12.2f} {framed * 1000:12.2f} {legacy / framed:7.1f}x")
+            else:
+                print(f"{label:>10} {'skipped':>12} {framed * 1000:12.2f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
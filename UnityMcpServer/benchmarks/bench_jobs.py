@@ -0,0 +1,114 @@
+"""
+Benchmark: long editor operations as blocking calls versus jobs.
+
+An agent updates a script (the recompile takes `--compile` seconds), loads a
+scene (`--load` seconds of main thread work), reimports a folder (`--import`
+seconds of main thread work) and enters play mode (`--play` seconds), while it
+keeps querying the editor state every `--query-interval` seconds. Two ways of
+doing it are compared against the fake bridge:
+
+- blocking: one operation after the other, each waited for before the next;
+            scene loads and imports hold the main thread until they are done
+- jobs:     every operation starts as a job at once and the jobs are waited for
+            side by side; loads and imports run in slices between commands
+
+Reported: the time until all operations are done and the latency of the
+queries made meanwhile.
+
+Usage:
+    python bench_jobs.py [--compile 3] [--load 1] [--import 2] [--play 1] [--tick-rate 60]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from fake_bridge import FakeBridge  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.WARNING)
+
+
+async def call(mcp: FastMCP, tool: str, arguments: dict) -> dict:
+    result = await mcp.call_tool(tool, arguments)
+    return json.loads((result[0] if isinstance(result, tuple) else result)[0].text)
+
+
+def operations(as_job: bool):
+    return [
+        ("manage_script", {"action": "update", "name": "Player", "path": "Assets/Scripts", "contents": f"class Player {{}} // as_job={as_job}"}),
+        ("manage_scene", {"action": "load", "name": "Level1", "as_job": as_job}),
+        ("manage_asset", {"action": "import", "path": "Assets/Textures", "as_job": as_job}),
+        ("manage_editor", {"action": "play"}),
+    ]
+
+
+async def run_operations(mcp: FastMCP, mode: str) -> None:
+    if mode == "blocking":
+        for tool, arguments in operations(False):
+            data = (await call(mcp, tool, arguments)).get("data")
+            job_id = data.get("jobId") if isinstance(data, dict) else None
+            if job_id:
+                await call(mcp, "wait_job", {"job_id": job_id, "timeout": 120})
+        return
+    replies = [await call(mcp, tool, arguments) for tool, arguments in operations(True)]
+    await asyncio.gather(*(call(mcp, "wait_job", {"job_id": reply["data"]["jobId"], "timeout": 120})
+                           for reply in replies))
+
+
+async def query(mcp: FastMCP, interval: float, done: asyncio.Event, latencies: list) -> None:
+    while not done.is_set():
+        start = time.perf_counter()
+        await call(mcp, "manage_editor", {"action": "get_state"})
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+
+
+async def run(args) -> None:
+    config.scene_cache = False
+    mcp = FastMCP("bench-jobs")
+    register_all_tools(mcp)
+    print(f"{'mode':>9} {'total s':>8} {'queries':>8} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    with FakeBridge(port=config.unity_port, tick_rate=args.tick_rate) as bridge:
+        bridge.job_durations.update(compile=args.compile, scene_load=args.load, asset_import=args.import_,
+                                    play=args.play)
+        for mode in ("blocking", "jobs"):
+            await call(mcp, "manage_editor", {"action": "get_state"})  # warm up
+            latencies = []
+            done = asyncio.Event()
+            querying = asyncio.create_task(query(mcp, args.query_interval, done, latencies))
+            start = time.perf_counter()
+            await run_operations(mcp, mode)
+            total = time.perf_counter() - start
+            done.set()
+            await querying
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(f"{mode:>9} {total:8.2f} {len(latencies):8d} {statistics.median(latencies) * 1000:9.2f} "
+                  f"{p99 * 1000:9.2f} {latencies[-1] * 1000:9.2f}")
+    await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--compile", type=float, default=3.0, help="seconds a script recompile takes")
+    parser.add_argument("--load", type=float, default=1.0, help="main thread seconds a scene load takes")
+    parser.add_argument("--import", dest="import_", type=float, default=2.0,
+                        help="main thread seconds a folder reimport takes")
+    parser.add_argument("--play", type=float, default=1.0, help="seconds entering play mode takes")
+    parser.add_argument("--tick-rate", type=float, default=60.0, help="editor ticks per second in the fake bridge")
+    parser.add_argument("--query-interval", type=float, default=0.1, help="seconds between editor state queries")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark: memoized queries and staged script changes.
+
+Two parts run against the fake bridge:
+
+- queries: an agent asks for the editor state, the active scene, a script and
+           a GameObject `--calls` times, making a write every `--write-every`
+           calls, with the query cache off and on. Reported: latency of the
+           queries, hit rate and revalidation pings.
+- scripts: `--scripts` scripts are updated, each waited for until it compiled
+           (one recompile per script), and then staged with defer_compile and
+           compiled together by one commit_scripts (a single recompile).
+           Reported: the time until the last script compiled.
+
+Usage:
+    python bench_query_cache.py [--calls 1000] [--write-every 20] [--latency 0.002] [--tick-rate 60]
+                                [--scripts 10] [--compile 2]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool  # noqa: E402
+from query_cache import get_query_cache  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from fake_bridge import FakeBridge  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.WARNING)
+
+QUERIES = [
+    ("manage_editor", {"action": "get_state"}),
+    ("manage_scene", {"action": "get_active"}),
+    ("manage_script", {"action": "read", "name": "Player", "path": "Assets/Scripts"}),
+    ("manage_gameobject", {"action": "find", "target": "Main Camera", "search_method": "by_name"}),
+]
+
+WRITE = ("manage_gameobject", {"action": "modify", "target": "Main Camera", "position": [0, 1, 0]})
+
+
+async def call(mcp: FastMCP, tool: str, arguments: dict) -> dict:
+    result = await mcp.call_tool(tool, arguments)
+    return json.loads((result[0] if isinstance(result, tuple) else result)[0].text)
+
+
+async def run_queries(mcp: FastMCP, args) -> None:
+    print(f"{'query cache':>11} {'calls':>6} {'p50 ms':>9} {'p99 ms':>9} {'total s':>8} {'hit rate':>9} {'pings':>6}")
+    for enabled in (False, True):
+        config.query_cache = enabled
+        cache = get_query_cache()
+        cache.invalidate()
+        before = dict(cache.stats())
+        latencies = []
+        start = time.perf_counter()
+        for i in range(args.calls):
+            if args.write_every and i % args.write_every == args.write_every - 1:
+                await call(mcp, *WRITE)
+                continue
+            tool, arguments = QUERIES[i % len(QUERIES)]
+            t0 = time.perf_counter()
+            await call(mcp, tool, arguments)
+            latencies.append(time.perf_counter() - t0)
+        total = time.perf_counter() - start
+        stats = cache.stats()
+        hits = stats["hits"] - before["hits"]
+        lookups = hits + stats["misses"] - before["misses"]
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"{'on' if enabled else 'off':>11} {len(latencies):6d} {statistics.median(latencies) * 1000:9.3f} "
+              f"{p99 * 1000:9.3f} {total:8.2f} {hits / lookups if lookups else 0:9.1%} "
+              f"{stats['revalidations'] - before['revalidations']:6d}")
+
+
+async def run_scripts(mcp: FastMCP, args) -> None:
+    print(f"{'scripts':>11} {'compiles':>9} {'total s':>8}")
+    for mode in ("immediate", "deferred"):
+        start = time.perf_counter()
+        compiles = 0
+        for i in range(args.scripts):
+            arguments = {"action": "update", "name": f"Script{i}", "path": "Assets/Scripts",
+                         "contents": f"class Script{i} {{}} // {mode}"}
+            if mode == "immediate":
+                await call(mcp, "manage_script", dict(arguments, wait_for_compile=True))
+                compiles += 1
+            else:
+                await call(mcp, "manage_script", dict(arguments, defer_compile=True))
+        if mode == "deferred":
+            await call(mcp, "commit_scripts", {"wait_for_compile": True})
+            compiles += 1
+        print(f"{mode:>11} {compiles:9d} {time.perf_counter() - start:8.2f}")
+
+
+async def run(args) -> None:
+    config.scene_cache = False
+    config.job_wait_timeout = 600.0
+    mcp = FastMCP("bench-query-cache")
+    register_all_tools(mcp)
+    with FakeBridge(port=config.unity_port, latency=args.latency, tick_rate=args.tick_rate) as bridge:
+        bridge.job_durations.update(compile=args.compile)
+        await call(mcp, "manage_editor", {"action": "get_state"})  # warm up
+        await run_queries(mcp, args)
+        print()
+        await run_scripts(mcp, args)
+    await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1000, help="tool calls in the query part")
+    parser.add_argument("--write-every", type=int, default=20, help="make a write every this many calls (0: never)")
+    parser.add_argument("--latency", type=float, default=0.002, help="seconds each command takes in the fake bridge")
+    parser.add_argument("--tick-rate", type=float, default=60.0, help="editor ticks per second in the fake bridge")
+    parser.add_argument("--scripts", type=int, default=10, help="scripts updated in the script part")
+    parser.add_argument("--compile", type=float, default=2.0, help="seconds a script recompile takes")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
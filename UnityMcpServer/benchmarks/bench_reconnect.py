@@ -0,0 +1,105 @@
+"""
+Benchmark: a burst of tool calls across a domain reload, with and without retries.
+
+An agent keeps `--concurrency` calls in flight (editor state queries, finds and,
+every `--write-every` calls, a GameObject modify) while the fake bridge
+reloads: it drops every connection and stops listening for `--downtime`
+seconds, like the editor after a script change. The burst runs with retries off
+(max_retries = 0) and on.
+
+Reported: calls that succeeded and failed, the modifies among the failures
+(writes that lost their connection after being sent are not retried), retries
+and the time until the last call returned.
+
+Usage:
+    python bench_reconnect.py [--calls 200] [--concurrency 8] [--downtime 3] [--latency 0.005]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool, get_unity_pool  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from fake_bridge import FakeBridge  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.CRITICAL)
+
+QUERIES = [
+    ("manage_editor", {"action": "get_state"}),
+    ("manage_gameobject", {"action": "find", "target": "Main Camera"}),
+]
+
+WRITE = ("manage_gameobject", {"action": "modify", "target": "Main Camera", "position": [0, 1, 0]})
+
+
+async def call(mcp: FastMCP, tool: str, arguments: dict) -> dict:
+    result = await mcp.call_tool(tool, arguments)
+    return json.loads((result[0] if isinstance(result, tuple) else result)[0].text)
+
+
+async def burst(mcp: FastMCP, bridge: FakeBridge, args) -> dict:
+    semaphore = asyncio.Semaphore(args.concurrency)
+    counts = {"ok": 0, "failed": 0, "failedWrites": 0}
+
+    async def one(i):
+        write = args.write_every and i % args.write_every == args.write_every - 1
+        tool, arguments = WRITE if write else QUERIES[i % len(QUERIES)]
+        async with semaphore:
+            try:
+                await call(mcp, tool, arguments)
+                counts["ok"] += 1
+            except Exception:
+                counts["failed"] += 1
+                counts["failedWrites"] += 1 if write else 0
+
+    async def reload():
+        # Once the burst is under way
+        await asyncio.sleep(args.calls * args.latency / args.concurrency / 4)
+        await asyncio.to_thread(bridge.reload, args.downtime)
+
+    start = time.perf_counter()
+    await asyncio.gather(reload(), *(one(i) for i in range(args.calls)))
+    counts["seconds"] = time.perf_counter() - start
+    return counts
+
+
+async def run(args) -> None:
+    config.scene_cache = False
+    config.query_cache = False
+    mcp = FastMCP("bench-reconnect")
+    register_all_tools(mcp)
+    print(f"{'retries':>8} {'ok':>6} {'failed':>7} {'writes':>7} {'retried':>8} {'total s':>8}")
+    with FakeBridge(port=config.unity_port, latency=args.latency) as bridge:
+        for max_retries in (0, 3):
+            config.max_retries = max_retries
+            await call(mcp, "manage_editor", {"action": "get_state"})  # warm up
+            retries = get_unity_pool().stats()["retries"]
+            counts = await burst(mcp, bridge, args)
+            retried = get_unity_pool().stats()["retries"] - retries
+            print(f"{'on' if max_retries else 'off':>8} {counts['ok']:6d} {counts['failed']:7d} "
+                  f"{counts['failedWrites']:7d} {retried:8d} {counts['seconds']:8.2f}")
+            # Let the bridge come back before the next round
+            await asyncio.sleep(args.downtime + 0.5)
+    await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="tool calls in the burst")
+    parser.add_argument("--concurrency", type=int, default=8, help="calls in flight at once")
+    parser.add_argument("--downtime", type=float, default=3.0, help="seconds the bridge stops listening")
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds each command takes in the fake bridge")
+    parser.add_argument("--write-every", type=int, default=10, help="make a modify every this many calls (0: never)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
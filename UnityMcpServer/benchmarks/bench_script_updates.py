@@ -0,0 +1,108 @@
+"""
+Benchmark: script updates and reads with and without content hashes.
+
+`--scripts` scripts of `--lines` lines are created, then edited for `--rounds`
+rounds the way an agent works on them: each round reads every script again and
+updates it, with the same text for a `--noop` share of the updates (a file
+saved again unchanged) and with one changed line otherwise. Three ways run
+through FastMCP against the fake bridge:
+
+- rewrite: config.script_hashes off, against a bridge that writes (and so
+           recompiles) every update, as before content hashes
+- full:    config.script_hashes off; every update sends the whole text, and the
+           bridge only writes the ones that change the script; every read
+           returns the whole text
+- hashes:  config.script_hashes on; unchanged updates are skipped, small ones
+           sent as patches, and unchanged reads answered with `notModified`
+
+Reported: the total time, the bytes sent to and received from the bridge, and
+the script files the bridge wrote (each one a recompile and domain reload).
+
+Usage:
+    python bench_script_updates.py [--scripts 20] [--lines 400] [--rounds 10] [--noop 0.3]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool  # noqa: E402
+from metrics import get_command_metrics  # noqa: E402
+from script_store import get_script_store  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from fake_bridge import FakeBridge  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.CRITICAL)
+
+
+async def call(mcp: FastMCP, tool: str, arguments: dict) -> dict:
+    result = await mcp.call_tool(tool, arguments)
+    return json.loads((result[0] if isinstance(result, tuple) else result)[0].text)
+
+
+def script_text(name: str, lines: int) -> list:
+    body = [f"    public float field{i} = {i}f; // Tuning value {i}\n" for i in range(lines)]
+    return ["using UnityEngine;\n", "\n", f"public class {name} : MonoBehaviour\n", "{\n"] + body + ["}\n"]
+
+
+async def run_mode(mcp: FastMCP, mode: str, args) -> None:
+    rng = random.Random(0)
+    names = [f"{mode.capitalize()}Script{i}" for i in range(args.scripts)]
+    texts = {name: script_text(name, args.lines) for name in names}
+    for name in names:
+        await call(mcp, "manage_script", {"action": "create", "name": name, "contents": "".join(texts[name])})
+    for round_ in range(args.rounds):
+        for name in names:
+            await call(mcp, "manage_script", {"action": "read", "name": name})
+            if rng.random() >= args.noop:
+                line = rng.randrange(4, 4 + args.lines)
+                texts[name][line] = f"    public float field{line - 4} = {round_}.5f; // Tuned\n"
+            await call(mcp, "manage_script", {"action": "update", "name": name, "contents": "".join(texts[name])})
+
+
+async def run(args) -> None:
+    config.scene_cache = False
+    config.metrics = True
+    mcp = FastMCP("bench-script-updates")
+    register_all_tools(mcp)
+    print(f"{'mode':>8} {'total s':>8} {'sent KB':>9} {'received KB':>12} {'writes':>7}")
+    with FakeBridge(port=config.unity_port, latency=args.latency) as bridge:
+        await call(mcp, "manage_editor", {"action": "get_state"})  # warm up
+        for mode in ("rewrite", "full", "hashes"):
+            config.script_hashes = mode == "hashes"
+            bridge.skip_unchanged = mode != "rewrite"
+            get_script_store().clear()
+            get_command_metrics().reset()
+            writes = bridge.script_writes
+            start = time.perf_counter()
+            await run_mode(mcp, mode, args)
+            total = time.perf_counter() - start
+            commands = [entry for entry in get_command_metrics().snapshot()["commands"]
+                        if entry["command"] == "manage_script"]
+            sent = sum(entry["bytesOut"] for entry in commands)
+            received = sum(entry["bytesIn"] for entry in commands)
+            print(f"{mode:>8} {total:8.2f} {sent / 1024:9.1f} {received / 1024:12.1f} "
+                  f"{bridge.script_writes - writes:7d}")
+    await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scripts", type=int, default=20, help="scripts edited")
+    parser.add_argument("--lines", type=int, default=400, help="lines per script")
+    parser.add_argument("--rounds", type=int, default=10, help="read-and-update rounds over every script")
+    parser.add_argument("--noop", type=float, default=0.3, help="share of updates that change nothing")
+    parser.add_argument("--latency", type=float, default=0.001, help="seconds each command takes in the fake bridge")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
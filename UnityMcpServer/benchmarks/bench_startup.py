@@ -0,0 +1,181 @@
+"""
+Benchmark: server startup, to guard against regressions.
+
+Three measurements, each the best of `--runs` fresh processes:
+
+- imports:      `python -X importtime -c "import server"`, with the self time of
+                every module added up by origin: the server's own modules, the
+                standard library, optional packages (msgpack, zstandard, numpy)
+                and the other third-party packages (the mcp stack). Importing
+                `server` also runs its module body, tool registration included.
+- registration: FastMCP() and register_all_tools alone (tool schema generation).
+- initialize:   `server.py` started over stdio until it answers the client's
+                `initialize` and `tools/list`, with nothing listening on the
+                Unity port (the editor closed) and with the fake bridge.
+
+The server's modules are byte-compiled first, as they are after the first
+start (or an install), so that compilation is not counted.
+`--max-own-ms` and `--max-initialize-ms` set budgets; the script exits with
+status 1 when a measurement goes over its budget.
+
+Usage:
+    python bench_startup.py [--runs 5] [--top 8] [--max-own-ms 50] [--max-initialize-ms 3000]
+"""
+import argparse
+import compileall
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from fake_bridge import FakeBridge  # noqa: E402
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+OPTIONAL = {"msgpack", "zstandard", "numpy"}
+
+# Runs server.py as __main__ with the Unity port set first
+LAUNCH = ("import runpy, sys; from config import config; config.unity_port = int(sys.argv[1]); "
+          "runpy.run_path('server.py', run_name='__main__')")
+
+REGISTER = ("import time; from mcp.server.fastmcp import FastMCP; from tools import register_all_tools; "
+            "t = time.perf_counter(); mcp = FastMCP('bench'); register_all_tools(mcp); "
+            "print((time.perf_counter() - t) * 1000)")
+
+
+def own_modules() -> set:
+    return {name[:-3] for name in os.listdir(SRC) if name.endswith(".py")} | {"tools"}
+
+
+def origin(module: str, own: set) -> str:
+    top = module.split(".")[0]
+    if top in own:
+        return "own"
+    if top in OPTIONAL:
+        return "optional"
+    if top in sys.stdlib_module_names or top.startswith("_"):
+        return "stdlib"
+    return "third-party"
+
+
+def import_times() -> tuple:
+    """Self time (ms) of each module imported by `import server`, and the cumulative total."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import server"],
+                            cwd=SRC, capture_output=True, text=True, check=True)
+    modules, total = {}, 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        modules[name] = int(self_us) / 1000
+        if name == "server":
+            total = int(cumulative_us) / 1000
+    return modules, total
+
+
+def registration_ms() -> float:
+    result = subprocess.run([sys.executable, "-c", REGISTER], cwd=SRC, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def initialize_ms(port: int) -> tuple:
+    """Milliseconds from launch until the `initialize` reply, and until the `tools/list` reply."""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", LAUNCH, str(port)], cwd=SRC, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        def request(message: dict) -> None:
+            process.stdin.write(json.dumps(message) + "\n")
+            process.stdin.flush()
+
+        def reply(request_id: int) -> dict:
+            while True:
+                line = process.stdout.readline()
+                if not line:
+                    raise RuntimeError("server exited before replying")
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    continue  # Not a JSON-RPC message; a client would choke on it
+                if message.get("id") == request_id:
+                    return message
+
+        request({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {
+            "protocolVersion": "2024-11-05", "capabilities": {},
+            "clientInfo": {"name": "bench-startup", "version": "1"}}})
+        reply(1)
+        initialized = time.perf_counter()
+        request({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        request({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        tools = len(reply(2)["result"]["tools"])
+        listed = time.perf_counter()
+        return (initialized - start) * 1000, (listed - start) * 1000, tools
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per measurement (the best one counts)")
+    parser.add_argument("--top", type=int, default=8, help="slowest own modules and packages to list")
+    parser.add_argument("--max-own-ms", type=float, default=None,
+                        help="budget for the self time of the server's own modules")
+    parser.add_argument("--max-initialize-ms", type=float, default=None,
+                        help="budget for the initialize reply with Unity closed")
+    args = parser.parse_args()
+    own = own_modules()
+    compileall.compile_dir(SRC, quiet=1)
+
+    # Imports: the run with the smallest total, so that one slow disk read does not count
+    modules, total = min((import_times() for _ in range(args.runs)), key=lambda run: run[1])
+    by_origin, by_package = defaultdict(float), defaultdict(float)
+    for name, ms in modules.items():
+        by_origin[origin(name, own)] += ms
+        by_package[name.split(".")[0]] += ms
+    print(f"import server: {total:.1f} ms")
+    for kind in ("own", "stdlib", "third-party", "optional"):
+        print(f"  {kind:<12} {by_origin[kind]:8.1f} ms")
+    print("slowest own modules (self ms, module body included):")
+    for name, ms in sorted(((n, ms) for n, ms in modules.items() if origin(n, own) == "own"),
+                           key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<28} {ms:8.1f}")
+    print("slowest packages (self ms):")
+    for name, ms in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<28} {ms:8.1f}")
+    loaded = sorted(name for name in modules if name.split(".")[0] in OPTIONAL)
+    print(f"optional packages loaded: {', '.join(loaded) if loaded else 'none'}")
+
+    registration = min(registration_ms() for _ in range(args.runs))
+    print(f"\ntool registration: {registration:.1f} ms")
+
+    print(f"\n{'unity':>8} {'initialize ms':>14} {'tools/list ms':>14} {'tools':>6}")
+    port = closed_port()
+    closed = min(initialize_ms(port) for _ in range(args.runs))
+    print(f"{'closed':>8} {closed[0]:14.1f} {closed[1]:14.1f} {closed[2]:6d}")
+    with FakeBridge(port=0) as bridge:
+        running = min(initialize_ms(bridge.port) for _ in range(args.runs))
+    print(f"{'running':>8} {running[0]:14.1f} {running[1]:14.1f} {running[2]:6d}")
+
+    over = []
+    if args.max_own_ms is not None and by_origin["own"] > args.max_own_ms:
+        over.append(f"own modules took {by_origin['own']:.1f} ms (budget {args.max_own_ms:g})")
+    if args.max_initialize_ms is not None and closed[0] > args.max_initialize_ms:
+        over.append(f"initialize took {closed[0]:.1f} ms (budget {args.max_initialize_ms:g})")
+    for message in over:
+        print(f"OVER BUDGET: {message}")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+End-to-end benchmark: every registered MCP tool against the fake bridge.
+
+Tools are called through FastMCP.call_tool, so argument validation, the
+connection pool, the wire protocol and reply decoding are all measured. The
+fake bridge runs in its own process, so that it neither competes for the GIL
+nor shows up in the memory figures. For each payload size and concurrency
+level, every tool reports p50/p99 latency, commands per second and the peak
+RSS of this process.
+
+Usage:
+    python bench_suite.py [--payloads 1K,64K,1M] [--concurrency 1,8,32] [--requests 100]
+                          [--latency 0.002] [--tick-rate 60] [--tools manage_scene,batch]
+                          [--scene-cache] [--asset-cache] [--query-cache] [--encoding msgpack] [--compression zlib] [--json results.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.WARNING)
+
+FAKE_BRIDGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_bridge.py")
+
+# Arguments each tool is called with; a registered tool missing here is reported and skipped
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "manage_script": {"action": "read", "name": "PlayerController", "path": "Assets/Scripts"},
+    "manage_scene": {"action": "get_hierarchy"},
+    "manage_editor": {"action": "get_state"},
+    "manage_gameobject": {"action": "find", "target": "Main Camera"},
+    "manage_asset": {"action": "search", "path": "Assets", "search_pattern": "*.prefab"},
+    "read_console": {"action": "get"},
+    "execute_menu_item": {"menu_path": "File/Save Project"},
+    "batch": {"commands": [
+        {"type": "manage_gameobject", "parameters": {"action": "create", "name": f"Cube{i}", "primitiveType": "Cube"}}
+        for i in range(10)
+    ]},
+    "find_many": {"targets": [f"Cube{i}" for i in range(10)]},
+    "job_status": {},
+    "list_editors": {"connect": False},
+    "commit_scripts": {"wait_for_compile": False},
+    "set_transforms": {"targets": [f"Cube{i}" for i in range(10)], "values": [float(i) for i in range(30)]},
+    "bulk_assets": {"items": [{"action": "create", "path": f"Assets/Materials/M{i}.mat", "asset_type": "Material"}
+                              for i in range(10)]},
+}
+
+
+class RssSampler:
+    """Tracks the peak resident set size of this process while active."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def current() -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            # No procfs: fall back to the lifetime peak (kilobytes on Linux, bytes on macOS)
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == "darwin" else peak * 1024
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak = self.current()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def start_bridge(args, payload: str) -> subprocess.Popen:
+    command = [sys.executable, FAKE_BRIDGE, "--port", str(config.unity_port), "--payload", payload,
+               "--latency", str(args.latency), "--tick-rate", str(args.tick_rate)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if "listening" not in line:
+        process.kill()
+        raise SystemExit(f"fake bridge did not start on port {config.unity_port}")
+    return process
+
+
+async def run_tool(mcp: FastMCP, tool: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    arguments = SCENARIOS[tool]
+    await mcp.call_tool(tool, arguments)  # warm up: connections, caches
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                await mcp.call_tool(tool, arguments)
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    with RssSampler() as rss:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "tool": tool,
+        "p50Ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99Ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "commandsPerSecond": round(len(latencies) / elapsed, 1),
+        "peakRssMb": round(rss.peak / (1024 * 1024), 1),
+        "errors": errors,
+    }
+
+
+async def run(args) -> List[Dict[str, Any]]:
+    mcp = FastMCP("unity-mcp-bench")
+    register_all_tools(mcp)
+    registered = [tool.name for tool in await mcp.list_tools()]
+    tools = args.tools.split(",") if args.tools else registered
+    for tool in tools:
+        if tool not in SCENARIOS:
+            print(f"skipping {tool}: no scenario in bench_suite.SCENARIOS", file=sys.stderr)
+    tools = [tool for tool in tools if tool in SCENARIOS and tool in registered]
+
+    print(f"{'tool':<18} {'payload':>8} {'conc':>5} {'p50 ms':>9} {'p99 ms':>9} {'cmds/s':>9} {'RSS MB':>8} {'errors':>6}")
+    rows = []
+    for payload in args.payloads.split(","):
+        bridge = start_bridge(args, payload)
+        try:
+            for concurrency in (int(c) for c in args.concurrency.split(",")):
+                for tool in tools:
+                    row = await run_tool(mcp, tool, args.requests, concurrency)
+                    row.update(payload=payload, concurrency=concurrency)
+                    rows.append(row)
+                    print(f"{tool:<18} {payload:>8} {concurrency:>5} {row['p50Ms']:9.2f} {row['p99Ms']:9.2f} "
+                          f"{row['commandsPerSecond']:9.1f} {row['peakRssMb']:8.1f} {row['errors']:>6}")
+        finally:
+            await close_unity_pool()
+            bridge.terminate()
+            bridge.wait()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--payloads", default="1K,64K,1M", help="reply sizes of the fake bridge")
+    parser.add_argument("--concurrency", default="1,8,32", help="concurrent tool calls")
+    parser.add_argument("--requests", type=int, default=100, help="calls per tool and configuration")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds each command takes in the fake bridge")
+    parser.add_argument("--tick-rate", type=float, default=0.0, help="editor ticks per second in the fake bridge")
+    parser.add_argument("--tools", default="", help="comma-separated tools to run (default: all registered)")
+    parser.add_argument("--scene-cache", action="store_true",
+                        help="keep the scene cache on (finds may then never reach the bridge)")
+    parser.add_argument("--asset-cache", action="store_true",
+                        help="keep the asset search cache on (searches may then never reach the bridge)")
+    parser.add_argument("--query-cache", action="store_true",
+                        help="keep the query cache on (read-only queries may then never reach the bridge)")
+    parser.add_argument("--encoding", default="json", choices=["json", "msgpack"], help="message body encoding")
+    parser.add_argument("--compression", default="", choices=["", "zlib", "zstd"],
+                        help="compress bodies above config.compression_threshold")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    config.scene_cache = args.scene_cache
+    config.asset_cache = args.asset_cache
+    config.query_cache = args.query_cache
+    config.encoding = args.encoding
+    config.compression = args.compression
+
+    rows = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"latency": args.latency, "tickRate": args.tick_rate, "requests": args.requests,
+                       "encoding": args.encoding, "compression": args.compression, "results": rows}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
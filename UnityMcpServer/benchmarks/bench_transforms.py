@@ -0,0 +1,130 @@
+"""
+Benchmark: placing many GameObjects one call at a time versus set_transforms.
+
+`--objects` objects get a position, rotation and scale. The ways of sending
+them are compared through FastMCP against the fake bridge:
+
+- modify:        one manage_gameobject 'modify' per object, `--concurrency` at a time
+- batch:         the same modifies in one batch call
+- list:          set_transforms with the values as a flat list of numbers
+- base64:        set_transforms with the values as base64 of float32
+- numpy:         pack_transforms on a NumPy array, sent straight through the pool
+                 (skipped when NumPy is not installed)
+
+Reported: the total time, the time per object and the bytes of the commands
+sent to the bridge.
+
+Usage:
+    python bench_transforms.py [--objects 10000] [--concurrency 8] [--latency 0.0005] [--encoding msgpack]
+"""
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import os
+import random
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import close_unity_pool, get_unity_pool  # noqa: E402
+from metrics import get_command_metrics  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from tools.set_transforms import pack_transforms  # noqa: E402
+from fake_bridge import FakeBridge  # noqa: E402
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+logging.getLogger("unity-mcp-server").setLevel(logging.WARNING)
+
+FIELDS = ["position", "rotation", "scale"]
+
+
+async def call(mcp: FastMCP, tool: str, arguments: dict) -> dict:
+    result = await mcp.call_tool(tool, arguments)
+    return json.loads((result[0] if isinstance(result, tuple) else result)[0].text)
+
+
+def layout(count: int) -> list:
+    """Nine floats per object: position, rotation, scale."""
+    rng = random.Random(0)
+    values = []
+    for _ in range(count):
+        values += [rng.uniform(-100, 100) for _ in range(3)]
+        values += [rng.uniform(0, 360) for _ in range(3)]
+        values += [rng.uniform(0.5, 2) for _ in range(3)]
+    return values
+
+
+async def run_mode(mcp: FastMCP, mode: str, targets: list, values: list, concurrency: int) -> None:
+    if mode == "modify":
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def modify(i):
+            async with semaphore:
+                await call(mcp, "manage_gameobject", {
+                    "action": "modify", "target": targets[i], "position": values[i * 9:i * 9 + 3],
+                    "rotation": values[i * 9 + 3:i * 9 + 6], "scale": values[i * 9 + 6:i * 9 + 9]})
+
+        await asyncio.gather(*(modify(i) for i in range(len(targets))))
+    elif mode == "batch":
+        commands = [{"type": "manage_gameobject", "parameters": {
+            "action": "modify", "target": target, "position": values[i * 9:i * 9 + 3],
+            "rotation": values[i * 9 + 3:i * 9 + 6], "scale": values[i * 9 + 6:i * 9 + 9]}}
+            for i, target in enumerate(targets)]
+        await call(mcp, "batch", {"commands": commands})
+    elif mode == "list":
+        await call(mcp, "set_transforms", {"targets": targets, "values": values, "fields": FIELDS})
+    elif mode == "base64":
+        packed = base64.b64encode(struct.pack(f"<{len(values)}f", *values)).decode("ascii")
+        await call(mcp, "set_transforms", {"targets": targets, "values": packed, "fields": FIELDS})
+    else:
+        array = numpy.asarray(values, dtype=numpy.float64).reshape(len(targets), 9)
+        await get_unity_pool().send_command("manage_gameobject", {
+            "action": "set_transforms", "targets": targets, "fields": FIELDS,
+            "values": pack_transforms(array, len(targets), FIELDS)})
+
+
+async def run(args) -> None:
+    config.scene_cache = False
+    config.query_cache = False
+    config.metrics = True
+    config.encoding = args.encoding
+    mcp = FastMCP("bench-transforms")
+    register_all_tools(mcp)
+    targets = [f"Object{i}" for i in range(args.objects)]
+    values = layout(args.objects)
+    modes = ["modify", "batch", "list", "base64"] + (["numpy"] if numpy is not None else [])
+    print(f"{'mode':>8} {'objects':>8} {'total s':>9} {'us/object':>10} {'sent MB':>9}")
+    with FakeBridge(port=config.unity_port, latency=args.latency) as bridge:
+        await call(mcp, "manage_editor", {"action": "get_state"})  # warm up
+        for mode in modes:
+            get_command_metrics().reset()
+            start = time.perf_counter()
+            await run_mode(mcp, mode, targets, values, args.concurrency)
+            total = time.perf_counter() - start
+            sent = sum(entry["bytesOut"] for entry in get_command_metrics().snapshot()["commands"])
+            print(f"{mode:>8} {args.objects:8d} {total:9.3f} {total / args.objects * 1e6:10.1f} {sent / 1e6:9.2f}")
+    await close_unity_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=10000, help="objects to place")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent modify calls")
+    parser.add_argument("--latency", type=float, default=0.0005,
+                        help="seconds each command takes in the fake bridge (set_transforms pays it once)")
+    parser.add_argument("--encoding", default="json", choices=["json", "msgpack"], help="message body encoding")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,929 @@
+"""
+A minimal stand-in for the UnityMcpBridge TCP listener, for benchmarks.
+
+Speaks the same wire protocol as the bridge: raw `ping`, the `ping {options}`
+handshake (framing, pipelining, compression, asset change notifications and
+MessagePack encoding when the msgpack package is installed; the reply names
+`FakeBridge.project`), legacy unframed
+JSON, length-prefixed frames, compressed frames, ID-tagged replies and pushed
+events. `batch` commands get a success result per sub-command, `manage_gameobject`
+`find_many` a match per target, `set_transforms` unpacks its float32 values,
+`read_console` pages through `FakeBridge.console` with cursors and `manage_asset`
+searches and edits `FakeBridge.assets` (pushing asset change notifications; a
+`bulk` edit gets a result per item and pushes one notification).
+`manage_script` keeps the text of each script in `FakeBridge.scripts` and, like
+ManageScript, reports content hashes, answers `ifNoneMatch` reads with
+`notModified`, applies `patch` updates against their `baseHash` and writes
+nothing for updates that change nothing; scripts missing from it are taken to
+exist with unknown text (reads get the synthetic payload, updates write them).
+Script writes, play/stop, and scene loads and asset imports with `asJob` start
+jobs answered by `job_status`, like JobManager; script changes with
+`deferCompile` are staged until a `commit` (or their debounce). Every other
+command is answered with a synthetic hierarchy-like payload whose size is set
+through `FakeBridge.payload_size`. Replies carry `FakeBridge.state_version`,
+which commands other than queries and finished jobs bump, like EditorStateVersion;
+bump it by hand to stand in for edits made in the editor. `FakeBridge.reload`
+drops every client and stops listening for a while, like a domain reload.
+
+Like the editor, commands run one at a time on a single "main thread". With
+`tick_rate` set, that thread only picks up commands on EditorApplication.update
+ticks; `latency` (or a per-type entry in `latencies`) is the time each command
+takes to execute there. Like CommandScheduler, queries and job polls run before
+writes (unless a write has waited `MAX_WRITE_DELAY`), a tick runs commands until
+`tick_budget` seconds are spent (with ticks), and replies carry `queueDepth` and
+`queueWaitMs`; `prioritize = False` with `tick_budget = None` runs every queued
+command in arrival order instead. Raw pings are answered by the listener
+without waiting. Legacy (unframed) messages are reassembled from as many reads
+as they take.
+`job_durations` sets how long each kind of job takes: scene loads and imports are
+main thread work, sharing `JOB_TICK_BUDGET` seconds per tick as jobs or all at once
+by the command otherwise; compilation and play mode changes only take time.
+`asset_write` is the time each asset create, move or delete takes and
+`asset_refresh` the import and refresh that follows every asset editing scope:
+once per single-asset command, once per `bulk` command.
+
+Run it standalone to point the real server at it:
+    python fake_bridge.py [--port 6400] [--latency 0.002] [--tick-rate 60] [--payload 64K] [--console 1000]
+"""
+import argparse
+import base64
+import fnmatch
+import hashlib
+import json
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+import uuid
+import zlib
+from collections import deque
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FRAME_HEADER = struct.Struct(">I")
+FRAME_COMPRESSED = 0x80000000
+FRAME_LENGTH_MASK = 0x7FFFFFFF
+PONG = b'{"status":"success","result":{"message":"pong"}}'
+
+UNITS = {"K": 1024, "M": 1024 * 1024}
+
+# LogEntry.mode flags the bridge maps to each message type
+CONSOLE_MODES = {"error": 256, "warning": 512, "log": 1024}
+
+# Main thread seconds the jobs may share per editor tick, as in JobManager
+JOB_TICK_BUDGET = 0.05
+# Main thread seconds the commands may take per editor tick, and the wait after which a write
+# goes before queued reads, as in CommandScheduler
+COMMAND_TICK_BUDGET = 0.02
+MAX_WRITE_DELAY = 0.25
+# Jobs that are main thread work; the others wait for Unity (compiler, play mode)
+MAIN_THREAD_JOBS = {"scene_load", "asset_import"}
+# Actions that leave the editor's state version alone; read_console and job_status never bump it
+QUERY_ACTIONS = {"find", "find_many", "get_state", "get_active", "get_active_scene", "get_hierarchy", "read", "search"}
+# manage_asset actions that change one asset each, alone or as bulk items
+ASSET_EDITS = {"create", "move", "delete", "save_as_prefab"}
+# Commands that start a job: (type, action) -> kind; None if only with asJob
+JOB_COMMANDS = {
+    ("manage_script", "create"): "compile",
+    ("manage_script", "update"): "compile",
+    ("manage_script", "delete"): "compile",
+    ("manage_editor", "play"): "play",
+    ("manage_editor", "stop"): "stop",
+    ("manage_scene", "load"): "scene_load",
+    ("manage_asset", "import"): "asset_import",
+}
+
+
+def parse_size(text: str) -> int:
+    """Parse a size such as 512, 64K or 1.5M into bytes."""
+    text = text.strip().upper()
+    if text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+def handshake_reply(framed: bool, pipelined: bool, encoding, compression=None, events=None, project=None) -> bytes:
+    """The bridge's answer to `ping {options}`, listing the modes it agreed to and naming the project."""
+    result = {"message": "pong", "project": project}
+    if framed:
+        result["framing"] = "length"
+    if pipelined:
+        result["pipelining"] = True
+    if encoding:
+        result["encoding"] = encoding
+    if compression:
+        result["compression"] = compression
+    if events:
+        result["events"] = events
+    return json.dumps({"status": "success", "result": result}, separators=(",", ":")).encode("utf-8")
+
+
+def compress(data: bytes, algorithm: str) -> bytes:
+    if algorithm == "zstd":
+        return zstandard.ZstdCompressor(level=1).compress(data)
+    return zlib.compress(data, 1)
+
+
+def decompress(data: bytes, algorithm: str) -> bytes:
+    if algorithm == "zstd":
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return zlib.decompress(data)
+
+
+def console_cursor(index: int, previous_message: str) -> str:
+    """The bridge's console cursor: the next index and the FNV-1a hash of the entry before it."""
+    if index == 0:
+        return "0"
+    value = 2166136261
+    for byte in previous_message.encode("utf-8"):
+        value = ((value ^ byte) * 16777619) & 0xFFFFFFFF
+    return f"{index}:{value:08x}"
+
+
+def script_path(params: dict) -> str:
+    """The asset path of the script a manage_script command names, as ManageScript builds it."""
+    folder = (params.get("path") or "Scripts").replace("\\", "/").strip("/")
+    if folder.lower().startswith("assets/"):
+        folder = folder[len("assets/"):].lstrip("/")
+    return f"Assets/{folder or 'Scripts'}/{params.get('name')}.cs"
+
+
+def content_hash(contents: str) -> str:
+    """SHA-256 of a script's UTF-8 text, as ManageScript reports it."""
+    return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+
+def split_lines(text: str) -> list:
+    """Split after each newline, keeping line endings, like UnifiedDiff."""
+    lines = text.split("\n")
+    return [line + "\n" for line in lines[:-1]] + ([lines[-1]] if lines[-1] else [])
+
+
+def apply_patch(original: str, patch: str) -> str:
+    """Apply a unified diff like UnifiedDiff.Apply; ValueError if it does not match."""
+    hunks = []  # (0-based start, [(kind, text)])
+    for line in split_lines(patch):
+        if not hunks and line.startswith(("--- ", "+++ ")):
+            continue
+        if line.startswith("@@"):
+            old = line.split()[1][1:].split(",")
+            hunks.append((int(old[0]) if len(old) > 1 and old[1] == "0" else int(old[0]) - 1, []))
+        elif line.startswith("\\"):
+            kind, text = hunks[-1][1][-1]
+            hunks[-1][1][-1] = (kind, text[:-1])  # No newline at end of file
+        else:
+            hunks[-1][1].append((line[0], line[1:]))
+    lines, result, cursor = split_lines(original), [], 0
+    for start, body in hunks:
+        if start < cursor or start > len(lines):
+            raise ValueError(f"Hunk at line {start + 1} is out of order")
+        result.extend(lines[cursor:start])
+        cursor = start
+        for kind, text in body:
+            if kind == "+":
+                result.append(text)
+                continue
+            if cursor >= len(lines) or lines[cursor] != text:
+                raise ValueError(f"Patch does not match the file at line {cursor + 1}")
+            if kind == " ":
+                result.append(text)
+            cursor += 1
+    return "".join(result + lines[cursor:])
+
+
+def asset_paths(count: int) -> list:
+    """Asset paths spread over a few folders, like a project's Assets directory."""
+    folders = ["Assets/Prefabs", "Assets/Prefabs/Props", "Assets/Materials", "Assets/Scripts", "Assets/Textures"]
+    extensions = {"Prefabs": "prefab", "Props": "prefab", "Materials": "mat", "Scripts": "cs", "Textures": "png"}
+    paths = []
+    for i in range(count):
+        folder = folders[i % len(folders)]
+        paths.append(f"{folder}/Asset{i}.{extensions[folder.rsplit('/', 1)[-1]]}")
+    return paths
+
+
+def build_payload(size: int) -> bytes:
+    """Build a success response of roughly `size` bytes shaped like a scene hierarchy."""
+    node = {"name": "GameObject", "instanceID": 0, "active": True, "path": "Root/Child/GameObject", "children": []}
+    node_size = len(json.dumps(node)) + 2
+    nodes = [dict(node, instanceID=i) for i in range(max(1, size // node_size))]
+    return json.dumps(
+        {"status": "success", "result": {"message": "Scene hierarchy retrieved.", "data": nodes}},
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        bridge = self.server.bridge
+        sock = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        send_lock = threading.Lock()
+        framed = False
+        pipelined = False
+        packed = False  # MessagePack bodies
+        compression = None  # Algorithm for bodies of at least `threshold` bytes
+        threshold = 64 * 1024
+
+        def send(response: bytes, framed_reply: bool):
+            length = len(response)
+            if framed_reply and compression and length >= threshold:
+                compressed = compress(response, compression)
+                if len(compressed) < length:
+                    response, length = compressed, len(compressed) | FRAME_COMPRESSED
+            # Pipelined replies are written from the main thread, so writes are serialized
+            with send_lock:
+                sock.sendall(FRAME_HEADER.pack(length) + response if framed_reply else response)
+
+        push = None  # Sends events to this client once it has asked for them
+        bridge.add_client(sock)
+        try:
+            while True:
+                if framed:
+                    header = self._read_exactly(FRAME_HEADER.size)
+                    if header is None:
+                        return
+                    (length,) = FRAME_HEADER.unpack(header)
+                    message = self._read_exactly(length & FRAME_LENGTH_MASK)
+                    if message is None:
+                        return
+                    if length & FRAME_COMPRESSED:
+                        message = decompress(message, compression)
+                else:
+                    message = self._read_legacy()
+                    if message is None:
+                        return
+                    if message.startswith(b"ping "):
+                        options = json.loads(message[5:])
+                        framed = bridge.framing and options.get("framing") == "length"
+                        pipelined = framed and bridge.pipelining and options.get("pipelining") is True
+                        packed = framed and bridge.msgpack and msgpack is not None and options.get("encoding") == "msgpack"
+                        offered = (options.get("compression") or []) if framed else []
+                        compression = next((name for name in offered if name in bridge.compressions), None)
+                        threshold = options.get("compressionThreshold", threshold)
+                        events = ["assets"] if pipelined and bridge.events and "assets" in (options.get("events") or []) else None
+                        send(handshake_reply(framed, pipelined, "msgpack" if packed else None, compression, events,
+                                             bridge.project), False)
+                        if events:
+                            # Like the bridge, events only follow the handshake reply
+                            def push(event: bytes, packed=packed):
+                                send(bridge.to_msgpack(event) if packed else event, True)
+                            bridge.add_event_sender(push)
+                        continue
+                if message.strip() == b"ping":
+                    send(bridge.tag_reply(PONG, packed=packed), framed)
+                    continue
+                command = msgpack.unpackb(message, raw=False) if packed else json.loads(message)
+                if pipelined:
+                    # Keep reading; the reply is tagged with the request ID once the command has run
+                    bridge.submit(command, lambda response, queued, request_id=command["id"], packed=packed:
+                                  send(bridge.tag_reply(response, request_id, packed, queued), True))
+                    continue
+                replies = queue.Queue(maxsize=1)
+                bridge.submit(command, lambda response, queued: replies.put((response, queued)))
+                response, queued = replies.get()
+                send(bridge.tag_reply(response, packed=packed, queued=queued), framed)
+        finally:
+            bridge.remove_event_sender(push)
+            bridge.remove_client(sock)
+
+    def _read_legacy(self):
+        """Read one unframed message, like the bridge's MessageAssembler: a JSON object (or a
+        handshake) once it is complete, other text as it was read."""
+        data = bytearray()
+        while True:
+            chunk = self.request.recv(65536)
+            if not chunk:
+                return None
+            data += chunk
+            message = bytes(data).strip()
+            body = message[5:] if message.startswith(b"ping ") else message
+            if not body.startswith(b"{"):
+                return message
+            if body.endswith(b"}"):
+                try:
+                    json.loads(body)
+                    return message
+                except ValueError:
+                    pass  # A brace inside the message ended this read
+
+    def _read_exactly(self, size):
+        data = bytearray()
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return bytes(data)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class FakeBridge:
+    """Runs the fake bridge on background threads."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        framing: bool = True,
+        pipelining: bool = True,
+        latency: float = 0.0,
+        tick_rate: float = 0.0,
+        msgpack: bool = True,
+        compression: bool = True,
+        events: bool = True,
+    ):
+        self.framing = framing
+        self.pipelining = pipelining
+        self.msgpack = msgpack  # Agree to MessagePack bodies when asked (and the package is installed)
+        # Compression algorithms agreed to when offered; the real bridge only implements zlib
+        self.compressions = (["zlib"] + (["zstd"] if zstandard is not None else [])) if compression else []
+        self.events = events  # Agree to push asset change notifications when asked
+        self.project = "FakeProject"  # Application.productName, named in the handshake reply
+        self.payload_size = 1024
+        self.latency = latency  # Seconds each command takes on the main thread
+        self.latencies = {}  # Per command type overrides of `latency`
+        self.tick_rate = tick_rate  # EditorApplication.update ticks per second; 0 runs commands as they arrive
+        self.tick_budget = COMMAND_TICK_BUDGET  # Seconds of commands per tick; None runs every queued command
+        self.prioritize = True  # Run queries before writes, like CommandScheduler
+        self.commands_processed = 0
+        self.console = []  # Console entries: {"message", "type", "mode"}
+        self.assets = []  # Asset paths searched by manage_asset
+        self.scripts = {}  # Asset path -> text of the scripts manage_script reads and writes
+        self.script_writes = 0  # Script files written (each one imported and compiled, unless deferred)
+        self.skip_unchanged = True  # Write nothing for updates that change nothing, like ManageScript
+        self._untouched = False  # Set by a command that left the editor's state alone
+        self.job_durations = {"compile": 0.0, "play": 0.0, "stop": 0.0, "scene_load": 0.0, "asset_import": 0.0}
+        self.asset_write = 0.0  # Seconds each asset create, move or delete takes
+        self.asset_refresh = 0.0  # Seconds of import and refresh after each asset editing scope
+        self.asset_scopes = 0  # Asset editing scopes run (each one refreshed the asset database)
+        self.jobs = {}  # jobId -> job as job_status reports it, plus its remaining work
+        self._job_rotation = 0
+        self.state_version = 1  # Reported with every reply, like EditorStateVersion
+        self.reloads = 0
+        self._event_senders = set()
+        self._event_lock = threading.Lock()
+        self._clients = set()
+        self._relisten = None  # Timer that listens again after a reload
+        self._payloads = {}
+        self._payload_objects = {}
+        self._queue = queue.Queue()
+        # Commands taken off `_queue` by the main thread, waiting for their turn
+        self._reads = deque()
+        self._writes = deque()
+        self._server = _Server((host, port), _Handler)
+        self._server.bridge = self
+        self.host, self.port = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._main_thread = threading.Thread(target=self._main_loop, daemon=True)
+
+    def add_client(self, sock) -> None:
+        with self._event_lock:
+            self._clients.add(sock)
+
+    def remove_client(self, sock) -> None:
+        with self._event_lock:
+            self._clients.discard(sock)
+
+    def reload(self, downtime: float) -> None:
+        """Stand in for a domain reload: close the listener and every client, and listen again after `downtime` seconds.
+
+        Commands still queued for the main thread are dropped unanswered, like those of the old domain.
+        """
+        if self._relisten is not None and self._relisten.is_alive():
+            # Still down from the previous reload
+            self._relisten.cancel()
+        else:
+            self._server.shutdown()
+            self._server.server_close()
+        with self._event_lock:
+            clients = list(self._clients)
+        for sock in clients:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                return
+        self._reads.clear()
+        self._writes.clear()
+        self.reloads += 1
+        self.state_version += 1
+        self._relisten = threading.Timer(downtime, self._listen)
+        self._relisten.daemon = True
+        self._relisten.start()
+
+    def _listen(self) -> None:
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.bridge = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, command: dict, reply) -> None:
+        """Queue a command for the main thread; `reply(response_bytes, (queue_depth, queue_wait_ms))`
+        is called once it has run."""
+        self._queue.put((command, reply, time.monotonic()))
+
+    def _main_loop(self) -> None:
+        while True:
+            # Running jobs need ticks even when no command arrives
+            running = any(job["status"] == "running" for job in self.jobs.values())
+            try:
+                if self._reads or self._writes:
+                    pending = [self._queue.get_nowait()]
+                else:
+                    pending = [self._queue.get(timeout=1.0 / (self.tick_rate or 60) if running else None)]
+            except queue.Empty:
+                pending = []
+            if self.tick_rate > 0:
+                # Commands wait for the next editor tick
+                interval = 1.0 / self.tick_rate
+                time.sleep(interval - time.monotonic() % interval)
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in pending:
+                if item is None:
+                    return
+                is_read = self.prioritize and self.is_read(item[0])
+                (self._reads if is_read else self._writes).append(item)
+            # Jobs started by earlier commands advance first
+            self.advance_jobs()
+            start = time.monotonic()
+            while self._reads or self._writes:
+                self.run_next()
+                if self.tick_rate > 0 and self.tick_budget is not None and time.monotonic() - start >= self.tick_budget:
+                    break  # The rest waits for the next tick
+
+    def run_next(self) -> None:
+        """Run the next command: a read, unless the oldest write has waited too long."""
+        now = time.monotonic()
+        if self._reads and not (self._writes and now - self._writes[0][2] > MAX_WRITE_DELAY):
+            command, reply, enqueued_at = self._reads.popleft()
+        else:
+            command, reply, enqueued_at = self._writes.popleft()
+        queued = (len(self._reads) + len(self._writes), round((now - enqueued_at) * 1000, 3))
+        delay = self.command_latency(command)
+        if delay > 0:
+            time.sleep(delay)
+        self._untouched = False
+        response = self.respond(command)
+        params = command.get("parameters") or {}
+        if command.get("type") not in ("read_console", "job_status") and params.get("action") not in QUERY_ACTIONS \
+                and not self._untouched:
+            self.state_version += 1
+        self.commands_processed += 1
+        try:
+            reply(response, queued)
+        except OSError:
+            pass  # The client went away
+
+    @staticmethod
+    def is_read(command: dict) -> bool:
+        """Whether CommandScheduler would take the command for a read."""
+        if command.get("type") == "job_status":
+            return True
+        if command.get("type") == "batch":
+            return False
+        action = (command.get("parameters") or {}).get("action")
+        return isinstance(action, str) and (action.lower() in QUERY_ACTIONS or action.lower() == "get")
+
+    def command_latency(self, command: dict) -> float:
+        """Seconds a command takes to run; a batch takes as long as its sub-commands."""
+        if command.get("type") == "batch":
+            return sum(self.command_latency(sub) for sub in command["parameters"]["commands"])
+        latency = self.latencies.get(command.get("type"), self.latency)
+        params = command.get("parameters") or {}
+        kind = JOB_COMMANDS.get((command.get("type"), params.get("action")))
+        if kind in MAIN_THREAD_JOBS and not params.get("asJob"):
+            # Without a job the command does all the work before replying
+            latency += self.job_durations[kind]
+        if command.get("type") == "manage_asset":
+            if params.get("action") == "bulk":
+                latency += len(params.get("items") or []) * self.asset_write + self.asset_refresh
+            elif params.get("action") in ASSET_EDITS:
+                latency += self.asset_write + self.asset_refresh
+        return latency
+
+    def respond(self, command: dict) -> bytes:
+        """Build the reply to one parsed command."""
+        params = command.get("parameters") or {}
+        if command.get("type") == "batch":
+            sub_commands = params["commands"]
+            results = [
+                {"index": i, "type": sub["type"],
+                 "response": {"status": "success", "result": {"message": f"{sub['type']} executed."}}}
+                for i, sub in enumerate(sub_commands)
+            ]
+            return json.dumps({"status": "success", "result": {
+                "message": f"Batch executed: {len(results)} succeeded, 0 failed.",
+                "data": {"results": results, "succeeded": len(results), "failed": 0, "stopped": False},
+            }}).encode("utf-8")
+        if command.get("type") == "manage_gameobject" and params.get("action") == "find_many":
+            targets = params["targets"]
+            results = [{"target": target, "matches": [{"name": target, "instanceId": i + 1}]}
+                       for i, target in enumerate(targets)]
+            return json.dumps({"status": "success", "result": {
+                "message": f"{len(targets)} of {len(targets)} targets found.", "data": results,
+            }}).encode("utf-8")
+        if command.get("type") == "manage_gameobject" and params.get("action") == "set_transforms":
+            # Binary with MessagePack, base64 with JSON
+            values = params["values"]
+            data = values if isinstance(values, bytes) else base64.b64decode(values)
+            struct.unpack(f"<{len(data) // 4}f", data)
+            targets = params["targets"]
+            return json.dumps({"status": "success", "result": {
+                "message": f"{len(targets)} of {len(targets)} transforms set.",
+                "data": {"applied": len(targets), "missing": []},
+            }}).encode("utf-8")
+        if command.get("type") == "read_console":
+            return json.dumps(self.read_console(params)).encode("utf-8")
+        if command.get("type") == "job_status":
+            return json.dumps(self.job_status(params)).encode("utf-8")
+        if command.get("type") == "manage_script" and params.get("action") in ("read", "create", "update", "delete"):
+            reply = self.manage_script(params)
+            if reply is not None:
+                return json.dumps(reply).encode("utf-8")
+        if command.get("type") == "manage_script" and (params.get("action") == "commit" or params.get("deferCompile")):
+            return json.dumps(self.stage_script(params)).encode("utf-8")
+        kind = JOB_COMMANDS.get((command.get("type"), params.get("action")))
+        if kind is not None and (kind not in MAIN_THREAD_JOBS or params.get("asJob")):
+            # An imported script change also compiles the staged ones
+            staged = self.staged_job() if kind == "compile" else None
+            if staged is not None:
+                self.commit_staged(staged)
+            job = staged or self.start_job(kind)
+            if kind == "compile":
+                job["files"].append(script_path(params))
+            data = {"path": params["path"]} if params.get("path") else {}
+            if command["type"] == "manage_script" and script_path(params) in self.scripts:
+                data = {"path": script_path(params), "hash": content_hash(self.scripts[script_path(params)])}
+            return json.dumps({"status": "success", "result": {
+                "message": f"{command['type']} {params['action']} started.",
+                "data": {**data, "jobId": job["jobId"], "jobStatus": job["status"]},
+            }}).encode("utf-8")
+        if command.get("type") == "manage_asset":
+            return json.dumps(self.manage_asset(params)).encode("utf-8")
+        return self.payload()
+
+    def manage_script(self, params: dict):
+        """Read or change `scripts` like ManageScript. Returns the reply, or None for a write that goes on
+        to compile (or to be staged)."""
+        action, path = params.get("action"), script_path(params)
+        current = self.scripts.get(path)
+        if action == "create":
+            if current is not None:
+                return {"status": "error", "error": f"Script already exists at '{path}'."}
+            self.scripts[path] = params.get("contents") or f"public class {params.get('name')} {{ }}\n"
+            self.script_writes += 1
+            return None
+        if current is None:
+            if action == "update" and "patch" not in params:
+                self.scripts[path] = params.get("contents")
+                self.script_writes += 1
+                return None
+            if action == "update":
+                return {"status": "error", "error": f"Script '{path}' no longer matches the patch's base hash."}
+            return None  # An existing script of unknown text
+        digest = content_hash(current)
+        if action == "read":
+            if params.get("ifNoneMatch") == digest:
+                return {"status": "success", "result": {"message": "Script is unchanged.", "data": {
+                    "path": path, "hash": digest, "notModified": True}}}
+            return {"status": "success", "result": {"message": "Script read successfully.", "data": {
+                "path": path, "contents": current, "hash": digest}}}
+        if action == "delete":
+            if not params.get("deferCompile"):
+                del self.scripts[path]
+            return None
+        contents = params.get("contents")
+        if "patch" in params:
+            if params.get("baseHash") != digest:
+                return {"status": "error", "error": f"Script '{path}' no longer matches the patch's base hash.",
+                        "data": {"path": path, "hash": digest}}
+            try:
+                contents = apply_patch(current, params["patch"])
+            except ValueError as e:
+                return {"status": "error", "error": f"Could not apply the patch to '{path}': {e}"}
+            if params.get("hash") and content_hash(contents) != params["hash"]:
+                return {"status": "error", "error": f"The patched script '{path}' does not match the expected hash."}
+        if contents == current and self.skip_unchanged:
+            self._untouched = True
+            return {"status": "success", "result": {"message": "Script is unchanged; nothing was written.", "data": {
+                "path": path, "hash": digest, "unchanged": True}}}
+        self.scripts[path] = contents
+        self.script_writes += 1
+        return None
+
+    def start_job(self, kind: str) -> dict:
+        duration = self.job_durations[kind]
+        job = {"jobId": uuid.uuid4().hex, "kind": kind, "status": "running",
+               "progress": 0.0 if kind in MAIN_THREAD_JOBS else None, "message": f"{kind} running.",
+               "error": None, "result": None, "startedAt": time.monotonic(), "finishedAt": None,
+               "work": duration, "duration": duration, "files": []}
+        self.jobs[job["jobId"]] = job
+        return job
+
+    def staged_job(self):
+        return next((job for job in self.jobs.values() if job.get("staged")), None)
+
+    def stage_script(self, params: dict) -> dict:
+        """Stage a deferred script change, or commit the staged ones, like JobManager's staged compile job."""
+        job = self.staged_job()
+        if params.get("action") == "commit":
+            if job is None:
+                return {"status": "success", "result": {"message": "No staged script changes to commit."}}
+            self.commit_staged(job)
+            return {"status": "success", "result": {"message": job["message"], "data": {
+                "files": job["files"], "jobId": job["jobId"], "jobStatus": job["status"]}}}
+        if job is None:
+            job = self.start_job("compile")
+            job["staged"] = True
+        job["files"].append(script_path(params))
+        job.update(stagedAt=time.monotonic(), debounce=params.get("debounceSeconds") or 0,
+                   message=f"{len(job['files'])} script change(s) staged, waiting for a commit.")
+        data = {"path": script_path(params), "staged": True, "jobId": job["jobId"], "jobStatus": job["status"]}
+        if params.get("action") != "delete" and script_path(params) in self.scripts:
+            data["hash"] = content_hash(self.scripts[script_path(params)])
+        return {"status": "success", "result": {"message": "Script change staged.", "data": data}}
+
+    def commit_staged(self, job: dict) -> None:
+        """Start compiling the staged script changes."""
+        job.update(staged=False, startedAt=time.monotonic(),
+                   message=f"{len(job['files'])} script change(s) committed, compiling.")
+
+    def advance_jobs(self) -> None:
+        """Run one tick of every running job, like JobManager.Update."""
+        now = time.monotonic()
+        for job in self.jobs.values():
+            if job.get("staged") and job["debounce"] > 0 and now - job["stagedAt"] >= job["debounce"]:
+                self.commit_staged(job)
+        running = [job for job in self.jobs.values() if job["status"] == "running" and not job.get("staged")]
+        self._job_rotation = (self._job_rotation + 1) % len(running) if running else 0
+        budget = JOB_TICK_BUDGET
+        for job in running[self._job_rotation:] + running[:self._job_rotation]:
+            if job["kind"] in MAIN_THREAD_JOBS:
+                spent = min(budget, job["work"])
+                budget -= spent
+                if spent > 0:
+                    time.sleep(spent)
+                job["work"] -= spent
+                job["progress"] = 1.0 - job["work"] / job["duration"] if job["duration"] else 1.0
+                done = job["work"] <= 0
+            else:
+                done = now - job["startedAt"] >= job["duration"]
+            if done:
+                job.update(status="succeeded", progress=1.0, message=f"{job['kind']} done.",
+                           finishedAt=time.monotonic())
+                if job["kind"] == "compile":
+                    job["result"] = {"errors": [], "files": {path: [] for path in job["files"]}}
+                self.state_version += 1
+
+    def job_status(self, params: dict) -> dict:
+        """Answer job_status like JobStatus.cs."""
+        def describe(job):
+            described = {key: job[key] for key in ("jobId", "kind", "status", "progress", "message", "error", "result")}
+            described["elapsed"] = round((job["finishedAt"] or time.monotonic()) - job["startedAt"], 3)
+            return described
+        job_id = params.get("jobId")
+        if not job_id:
+            jobs = [describe(job) for job in reversed(list(self.jobs.values()))]
+            return {"status": "success", "result": {"message": f"{len(jobs)} job(s).", "data": {"jobs": jobs}}}
+        if job_id not in self.jobs:
+            return {"status": "error", "error": f"Unknown job: '{job_id}'."}
+        job = self.jobs[job_id]
+        return {"status": "success", "result": {"message": f"Job {job['status']}.", "data": describe(job)}}
+
+    def manage_asset(self, params: dict) -> dict:
+        """Search `assets` like AssetDatabase.FindAssets (name pattern, recursive folder scope) or edit it."""
+        action = params.get("action")
+        path = params.get("path") or ""
+        if action == "search":
+            prefix = path.rstrip("/") + "/" if path else ""
+            pattern = params.get("searchPattern") or "*"
+            paths = [asset for asset in self.assets
+                     if asset.startswith(prefix) and fnmatch.fnmatch(asset.rsplit("/", 1)[-1], pattern)]
+            return {"status": "success", "result": {"message": "Asset search complete.",
+                                                    "data": {"count": len(paths), "paths": paths}}}
+        if action == "bulk":
+            items = params.get("items") or []
+            if not items:
+                return {"status": "error", "error": "Items are required for bulk action."}
+            results, changed = [], []
+            for index, item in enumerate(items):
+                item_action = str(item.get("action") or "").lower()
+                item_path = item.get("path") or ""
+                if item_action == "save_as_prefab" and not item_path.endswith(".prefab"):
+                    item_path += ".prefab"
+                if item_action not in ASSET_EDITS:
+                    results.append({"index": index, "status": "error", "path": item_path,
+                                    "error": f"Action '{item.get('action')}' cannot be run in bulk."})
+                    continue
+                if item_action in ("move", "delete") and item_path not in self.assets:
+                    results.append({"index": index, "status": "error", "path": item_path,
+                                    "error": f"Asset not found at '{item_path}'."})
+                    continue
+                changed.extend(self.edit_asset(item_action, item_path, item.get("destination")))
+                results.append({"index": index, "status": "success", "path": item.get("destination") or item_path})
+            self.asset_scopes += 1
+            if changed:
+                self.push_event({"event": "assetsChanged", "paths": changed})
+            succeeded = sum(1 for result in results if result["status"] == "success")
+            return {"status": "success", "result": {
+                "message": f"Bulk asset operations done: {succeeded} succeeded, {len(items) - succeeded} failed.",
+                "data": {"results": results, "succeeded": succeeded, "failed": len(items) - succeeded}}}
+        changed = self.edit_asset(action, path, params.get("destination"))
+        if action in ASSET_EDITS:
+            self.asset_scopes += 1
+        self.push_event({"event": "assetsChanged", "paths": changed})
+        return {"status": "success", "result": {"message": f"Asset {action} done."}}
+
+    def edit_asset(self, action: str, path: str, destination: str = None) -> list:
+        """Apply one asset edit to `assets` and return the paths it changed."""
+        changed = [path]
+        if action in ("create", "save_as_prefab"):
+            self.assets.append(path)
+        elif action == "delete":
+            self.assets = [asset for asset in self.assets if asset != path and not asset.startswith(path + "/")]
+        elif action == "move":
+            self.assets = [destination + asset[len(path):] if asset == path or asset.startswith(path + "/") else asset
+                           for asset in self.assets]
+            changed.append(destination)
+        return changed
+
+    def add_event_sender(self, sender) -> None:
+        with self._event_lock:
+            self._event_senders.add(sender)
+
+    def remove_event_sender(self, sender) -> None:
+        with self._event_lock:
+            self._event_senders.discard(sender)
+
+    def push_event(self, event: dict) -> None:
+        """Push an event to every client that asked for notifications, like AssetChangeNotifier."""
+        message = json.dumps(event).encode("utf-8")
+        with self._event_lock:
+            senders = list(self._event_senders)
+        for sender in senders:
+            try:
+                sender(message)
+            except OSError:
+                pass  # The client went away
+
+    def log(self, message: str, message_type: str = "log") -> None:
+        """Append a console entry ('error', 'warning' or 'log')."""
+        self.console.append({"message": message, "type": message_type, "mode": CONSOLE_MODES[message_type]})
+
+    def read_console(self, params: dict) -> dict:
+        """Answer read_console like ReadConsole.cs: cursors, limit, type and text filters."""
+        if params.get("action") == "clear":
+            self.console = []
+            return {"status": "success", "result": {"message": "Console cleared."}}
+        entries = list(self.console)
+        start, reset = 0, False
+        cursor = params.get("sinceCursor")
+        if cursor == "end":
+            start = len(entries)
+        elif cursor:
+            index, _, digest = cursor.partition(":")
+            start = int(index)
+            if start > len(entries) or (digest and start > 0 and
+                                        console_cursor(start, entries[start - 1]["message"]) != cursor):
+                start, reset = 0, True
+        types = {t.lower() for t in params.get("types") or []}
+        text = params.get("filterText")
+        limit = params.get("limit")
+        logs = []
+        i = start
+        while i < len(entries) and (limit is None or len(logs) < limit):
+            entry = entries[i]
+            i += 1
+            if (types and entry["type"] not in types) or (text and text not in entry["message"]):
+                continue
+            logs.append({"index": i - 1, **entry})
+        return {"status": "success", "result": {"message": "Logs retrieved.", "data": {
+            "logs": logs, "nextCursor": console_cursor(i, entries[i - 1]["message"] if i else ""),
+            "total": len(entries), "reset": reset,
+        }}}
+
+    def payload(self) -> bytes:
+        if self.payload_size not in self._payloads:
+            self._payloads[self.payload_size] = build_payload(self.payload_size)
+        return self._payloads[self.payload_size]
+
+    def tag_reply(self, response: bytes, request_id=None, packed: bool = False, queued=None) -> bytes:
+        """Put the request ID (when pipelined), the state version and the queue figures (for queued
+        commands) first in a reply, like the bridge."""
+        if packed:
+            return self.to_msgpack(response, request_id, self.state_version, queued)
+        fields = b'"id":' + json.dumps(request_id).encode() + b"," if request_id is not None else b""
+        fields += b'"stateVersion":%d,' % self.state_version
+        if queued is not None:
+            fields += b'"queueDepth":%d,"queueWaitMs":%s,' % (queued[0], repr(queued[1]).encode())
+        return b"{" + fields + response[1:]
+
+    def to_msgpack(self, response: bytes, request_id=None, state_version=None, queued=None) -> bytes:
+        """Re-encode a JSON reply as MessagePack, tagged with the request ID when pipelined."""
+        if response is self._payloads.get(self.payload_size):
+            # Decoded once, so that large payloads cost the bridge about as much as in JSON
+            message = self._payload_objects.get(self.payload_size)
+            if message is None:
+                message = self._payload_objects[self.payload_size] = json.loads(response)
+        else:
+            message = json.loads(response)
+        if queued is not None:
+            message = {"queueDepth": queued[0], "queueWaitMs": queued[1], **message}
+        if state_version is not None:
+            message = {"stateVersion": state_version, **message}
+        if request_id is not None:
+            message = {"id": request_id, **message}
+        return msgpack.packb(message, use_bin_type=True)
+
+    def __enter__(self):
+        self._main_thread.start()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+        self._queue.put(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6400, help="0 picks a free port")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds each command takes")
+    parser.add_argument("--latency-for", action="append", default=[], metavar="TYPE=SECONDS",
+                        help="latency of one command type, e.g. manage_asset=0.05 (repeatable)")
+    parser.add_argument("--tick-rate", type=float, default=0.0, help="editor ticks per second (0: no ticks)")
+    parser.add_argument("--job-duration", action="append", default=[], metavar="KIND=SECONDS",
+                        help="duration of one kind of job, e.g. compile=3 or scene_load=1 (repeatable)")
+    parser.add_argument("--payload", default="1K", help="reply size for other commands, e.g. 64K or 1M")
+    parser.add_argument("--console", type=int, default=1000, help="console entries to start with")
+    parser.add_argument("--no-framing", action="store_true", help="refuse length-prefixed framing")
+    parser.add_argument("--no-pipelining", action="store_true", help="refuse pipelining")
+    parser.add_argument("--no-msgpack", action="store_true", help="refuse the MessagePack encoding")
+    parser.add_argument("--no-compression", action="store_true", help="refuse compression")
+    parser.add_argument("--no-events", action="store_true", help="refuse asset change notifications")
+    parser.add_argument("--assets", type=int, default=1000, help="asset paths manage_asset searches")
+    parser.add_argument("--no-priority", action="store_true",
+                        help="run commands in arrival order without a tick budget, like the old bridge")
+    parser.add_argument("--project", default="FakeProject", help="project name reported in the handshake")
+    args = parser.parse_args()
+
+    bridge = FakeBridge(args.host, args.port, framing=not args.no_framing, pipelining=not args.no_pipelining,
+                        latency=args.latency, tick_rate=args.tick_rate, msgpack=not args.no_msgpack,
+                        compression=not args.no_compression, events=not args.no_events)
+    bridge.payload_size = parse_size(args.payload)
+    bridge.project = args.project
+    bridge.payload()
+    if args.no_priority:
+        bridge.prioritize = False
+        bridge.tick_budget = None
+    for i in range(args.console):
+        message_type = "error" if i % 50 == 0 else "warning" if i % 10 == 0 else "log"
+        bridge.log(f"Message {i}\nUnityEngine.Debug:Log (object)\nExample:Update () (at Assets/Scripts/Example.cs:{i % 100})",
+                   message_type)
+    bridge.assets = asset_paths(args.assets)
+    for entry in args.latency_for:
+        command_type, seconds = entry.split("=", 1)
+        bridge.latencies[command_type] = float(seconds)
+    for entry in args.job_duration:
+        kind, seconds = entry.split("=", 1)
+        bridge.job_durations[kind] = float(seconds)
+    with bridge:
+        # Benchmarks wait for this line before connecting
+        print(f"Fake Unity bridge listening on {bridge.host}:{bridge.port}", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Record an agent session's commands, and replay them as a load test.
+
+record: `--agents` concurrent agents make `--calls` tool calls each through
+        FastMCP, picking tools from bench_suite.SCENARIOS and pausing `--think`
+        seconds on average between calls, against an in-process fake bridge (or a
+        bridge on `--port`), while the server records every command it sends to
+        Unity to TRACE (see src/command_trace.py).
+replay: sends the commands of TRACE, recorded this way or by a server running
+        with config.trace_path, through a connection pool to a bridge on `--port`,
+        or to an in-process fake bridge with `--fake`, at `--speed` 1 (the recorded
+        pace), N (N times faster) or max (as fast as `--concurrency` allows).
+        Reported per command: the replay's latency percentiles next to the recorded
+        ones, errors, and the drift of the reply sizes against the recording; then
+        the throughput and the commands whose sizes drifted by more than `--drift`.
+        Commands that refer to state of the recorded session (e.g. job IDs) may fail.
+
+`--max-p99-ms` sets a budget for the replay's overall p99 latency, and
+`--fail-on-drift` makes drifted reply sizes fail the run: the script then exits
+with status 1, to catch regressions before rollout.
+
+Usage:
+    python replay_trace.py record TRACE [--agents 4] [--calls 50] [--think 0.05] [--port PORT]
+    python replay_trace.py replay TRACE [--speed 1|N|max] [--concurrency 32] [--fake] [--port 6400]
+                                        [--max-gap 5] [--drift 0.1] [--max-p99-ms MS] [--json report.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from contextlib import nullcontext
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from config import config  # noqa: E402
+from connection_pool import UnityConnectionPool, close_unity_pool  # noqa: E402
+from command_trace import read_trace, replay, start_trace, stop_trace, summarize  # noqa: E402
+from tools import register_all_tools  # noqa: E402
+from bench_suite import SCENARIOS  # noqa: E402
+from fake_bridge import FakeBridge, parse_size  # noqa: E402
+
+logging.getLogger("unity-mcp-server").setLevel(logging.CRITICAL)
+
+
+async def record(args) -> None:
+    mcp = FastMCP("replay-trace-record")
+    register_all_tools(mcp)
+    tools = sorted(set(SCENARIOS) & {tool.name for tool in await mcp.list_tools()})
+    fake = FakeBridge(latency=args.latency, tick_rate=args.tick_rate) if args.port is None else nullcontext()
+    with fake as bridge:
+        config.unity_port = bridge.port if args.port is None else args.port
+        recorder = start_trace(args.trace)
+
+        async def agent(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(args.calls):
+                tool = rng.choice(tools)
+                try:
+                    await mcp.call_tool(tool, SCENARIOS[tool])
+                except Exception:
+                    pass  # Recorded as failed
+                await asyncio.sleep(rng.expovariate(1 / args.think) if args.think > 0 else 0)
+
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(agent(i) for i in range(args.agents)))
+        finally:
+            stats = stop_trace()
+            await close_unity_pool()
+    print(f"recorded {stats['commands']} commands ({recorder.bytes / 1024:.1f} KB before compression) "
+          f"in {time.perf_counter() - start:.2f} s to {args.trace}")
+
+
+def fmt(value) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+
+async def run_replay(args) -> int:
+    records = sorted(read_trace(args.trace), key=lambda record: record["at"])
+    if not records:
+        raise SystemExit(f"no commands in {args.trace}")
+    speed = 0.0 if args.speed == "max" else float(args.speed)
+    fake = FakeBridge(latency=args.latency, tick_rate=args.tick_rate) if args.fake else nullcontext()
+    with fake as bridge:
+        if args.fake:
+            bridge.payload_size = parse_size(args.payload)
+        pool = UnityConnectionPool(host=args.host, port=bridge.port if args.fake else args.port, editor="replay")
+        try:
+            start = time.perf_counter()
+            results = await replay(records, pool.send_command, speed=speed, concurrency=args.concurrency,
+                                   max_gap=args.max_gap)
+            elapsed = time.perf_counter() - start
+        finally:
+            await pool.close()
+    report = summarize(results, args.drift)
+
+    print(f"{'command':<18} {'action':<16} {'count':>6} {'errors':>7} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'rec p50':>8} {'rec p99':>8} {'size drift':>11}")
+    for entry in report["commands"]:
+        drift = "-" if entry["sizeDrift"] is None else f"{entry['sizeDrift'] * 100:+.1f}%"
+        print(f"{entry['command']:<18} {entry['action'] or '-':<16} {entry['count']:>6} "
+              f"{entry['errors']:>3}/{entry['recordedErrors']:<3} {fmt(entry['replayMs']['p50']):>8} "
+              f"{fmt(entry['replayMs']['p99']):>8} {fmt(entry['recordedMs']['p50']):>8} "
+              f"{fmt(entry['recordedMs']['p99']):>8} {drift:>11}")
+    total = report["total"]
+    recorded_span = records[-1]["at"] - records[0]["at"]
+    print(f"\n{total['count']} commands in {elapsed:.2f} s ({total['count'] / elapsed:.1f}/s; recorded over "
+          f"{recorded_span:.2f} s), {total['errors']} errors, p50 {fmt(total['replayMs']['p50'])} ms, "
+          f"p99 {fmt(total['replayMs']['p99'])} ms, at most {total['maxLateMs']:.1f} ms behind schedule")
+    for entry in report["drifted"]:
+        print(f"DRIFT: {entry['command']} {entry['action'] or ''} replies {entry['recordedBytesIn']} -> "
+              f"{entry['replayBytesIn']} bytes ({entry['sizeDrift'] * 100:+.1f}%)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**report, "elapsedSeconds": elapsed, "speed": args.speed}, f, indent=2)
+
+    over = []
+    p99 = total["replayMs"]["p99"]
+    if args.max_p99_ms is not None and p99 is not None and p99 > args.max_p99_ms:
+        over.append(f"p99 {p99:.2f} ms (budget {args.max_p99_ms:g})")
+    if args.fail_on_drift and report["drifted"]:
+        over.append(f"{len(report['drifted'])} commands' reply sizes drifted")
+    for message in over:
+        print(f"OVER BUDGET: {message}")
+    return 1 if over else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+    recording = subparsers.add_parser("record", help="record a synthetic agent session")
+    recording.add_argument("trace", help="trace file to append to (.gz to compress)")
+    recording.add_argument("--agents", type=int, default=4, help="concurrent agents")
+    recording.add_argument("--calls", type=int, default=50, help="tool calls per agent")
+    recording.add_argument("--think", type=float, default=0.05, help="mean seconds between an agent's calls")
+    recording.add_argument("--port", type=int, default=None, help="record against a bridge on this port")
+    replaying = subparsers.add_parser("replay", help="replay a trace")
+    replaying.add_argument("trace", help="trace file (.gz if compressed)")
+    replaying.add_argument("--speed", default="1", help="1 (recorded pace), N (N times faster) or max")
+    replaying.add_argument("--concurrency", type=int, default=32, help="commands in flight at once")
+    replaying.add_argument("--max-gap", type=float, default=5.0, help="longest recorded pause kept, in seconds")
+    replaying.add_argument("--host", default="localhost")
+    replaying.add_argument("--port", type=int, default=6400, help="port of the bridge to replay against")
+    replaying.add_argument("--fake", action="store_true", help="replay against an in-process fake bridge")
+    replaying.add_argument("--payload", default="1K", help="reply size of the fake bridge, e.g. 64K")
+    replaying.add_argument("--drift", type=float, default=0.1, help="relative reply size change reported as drift")
+    replaying.add_argument("--fail-on-drift", action="store_true", help="exit with status 1 if a reply size drifted")
+    replaying.add_argument("--max-p99-ms", type=float, default=None, help="budget for the overall p99 latency")
+    replaying.add_argument("--json", help="also write the report to this file")
+    for sub in (recording, replaying):
+        sub.add_argument("--latency", type=float, default=0.002, help="seconds each command takes in the fake bridge")
+        sub.add_argument("--tick-rate", type=float, default=60.0, help="editor ticks per second in the fake bridge")
+    args = parser.parse_args()
+    if args.mode == "record":
+        asyncio.run(record(args))
+    else:
+        sys.exit(asyncio.run(run_replay(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Client-side cache of manage_asset search results.
+
+AssetDatabase.FindAssets walks the asset database on the editor's main thread,
+and agents repeat the same search pattern and folder many times in a session.
+Results are kept per (pattern, folder) in an LRU of
+`config.asset_cache_max_entries`. The folders form a path trie: a search in a
+folder is answered from a cached search of the same pattern in one of its
+ancestors, and a change to an asset drops exactly the searches whose folder
+contains it.
+
+Writes that pass through the connection pool drop the searches they affect:
+manage_asset create, delete, move (alone or in bulk) and the other non-search
+actions, script and scene writes, and prefabs saved by manage_gameobject;
+anything else that may touch assets (menu items) drops them all. When the bridge pushes asset change
+notifications, cached searches stay valid until a notification drops them;
+otherwise, or once the last connection carrying notifications closes, they
+expire after `config.asset_cache_ttl`.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from config import config
+from connection_pool import UnityConnectionPool, get_unity_pool
+
+logger = logging.getLogger("unity-mcp-server")
+
+# Commands that never change assets, as (command type, action); None matches every action
+_NO_ASSET_CHANGES = {
+    ("ping", None),
+    ("read_console", None),
+    ("job_status", None),
+    ("manage_editor", None),
+    ("manage_asset", "search"),
+    ("manage_script", "read"),
+    ("manage_scene", "get_hierarchy"),
+    ("manage_scene", "get_active"),
+    ("manage_scene", "get_active_scene"),
+    ("manage_scene", "load"),
+}
+
+# Writes whose effect is limited to the asset paths in these parameters
+_PATH_PARAMS = {
+    "manage_asset": ("path", "destination"),
+    "manage_script": ("path",),
+    "manage_scene": ("path",),
+    "manage_gameobject": ("prefabPath",),
+}
+
+def _segments(path: Optional[str]) -> List[str]:
+    """Split an asset path or folder into its names; the project root has none."""
+    if not path:
+        return []
+    return [name for name in path.replace("\\", "/").split("/") if name]
+
+class _Entry:
+    """One cached search."""
+    __slots__ = ("result", "paths", "stored_at", "notified")
+
+    def __init__(self, result: Dict[str, Any], stored_at: float, notified: bool):
+        self.result = result
+        self.paths: List[str] = ((result.get("data") or {}).get("paths")) or []
+        self.stored_at = stored_at
+        # True if asset change notifications were live when the search was stored
+        self.notified = notified
+
+class _Folder:
+    """A node of the path trie: the searches scoped to one folder, by pattern."""
+    __slots__ = ("children", "searches")
+
+    def __init__(self):
+        self.children: Dict[str, "_Folder"] = {}
+        self.searches: Dict[str, _Entry] = {}
+
+class AssetCache:
+    """manage_asset search results for one Unity endpoint."""
+
+    def __init__(self, bridge: UnityConnectionPool, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        self.bridge = bridge
+        self.ttl = ttl if ttl is not None else config.asset_cache_ttl
+        self.max_entries = max_entries if max_entries is not None else config.asset_cache_max_entries
+        self.generation = 0  # Bumped by every invalidation, so searches that raced one are not stored
+        self._root = _Folder()
+        # LRU order of the cached searches: (pattern, folder names) -> None
+        self._lru: "OrderedDict[Tuple[str, Tuple[str, ...]], None]" = OrderedDict()
+        self._counters = {"hits": 0, "ancestorHits": 0, "misses": 0, "stored": 0,
+                          "invalidations": 0, "notifications": 0}
+
+    # --- Lookups ---
+
+    def get(self, pattern: str, folder: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Answer a manage_asset search from the cache, or return None to ask Unity."""
+        names = _segments(folder)
+        # The folder's own search, else the nearest ancestor's with the same pattern
+        chain = [self._root]
+        for name in names:
+            node = chain[-1].children.get(name)
+            if node is None:
+                break
+            chain.append(node)
+        now = time.monotonic()
+        for depth in range(len(chain) - 1, -1, -1):
+            entry = chain[depth].searches.get(pattern)
+            if entry is None:
+                continue
+            if not self._valid(entry, now):
+                self._drop(chain[depth], pattern, tuple(names[:depth]))
+                continue
+            self._lru.move_to_end((pattern, tuple(names[:depth])))
+            self._counters["hits"] += 1
+            if depth == len(names):
+                return entry.result
+            self._counters["ancestorHits"] += 1
+            # FindAssets searches folders recursively, so the folder's results are the ancestor's below it
+            prefix = "/".join(names) + "/"
+            paths = [path for path in entry.paths if path.startswith(prefix)]
+            return {"message": "Asset search complete.", "data": {"count": len(paths), "paths": paths}}
+        self._counters["misses"] += 1
+        return None
+
+    def store(self, pattern: str, folder: Optional[str], result: Dict[str, Any], generation: int) -> None:
+        """Keep a search result, unless an invalidation happened since `generation` was read."""
+        if generation != self.generation or self.max_entries <= 0:
+            return
+        names = tuple(_segments(folder))
+        node = self._root
+        for name in names:
+            node = node.children.setdefault(name, _Folder())
+        node.searches[pattern] = _Entry(result, time.monotonic(), self.bridge.notifications_live)
+        key = (pattern, names)
+        self._lru[key] = None
+        self._lru.move_to_end(key)
+        self._counters["stored"] += 1
+        while len(self._lru) > self.max_entries:
+            old_pattern, old_names = next(iter(self._lru))
+            self._drop(self._find(old_names), old_pattern, old_names)
+
+    def _valid(self, entry: _Entry, now: float) -> bool:
+        return entry.notified or now - entry.stored_at <= self.ttl
+
+    def _find(self, names: Iterable[str]) -> Optional[_Folder]:
+        node = self._root
+        for name in names:
+            node = node.children.get(name)
+            if node is None:
+                return None
+        return node
+
+    def _drop(self, node: Optional[_Folder], pattern: str, names: Tuple[str, ...]) -> None:
+        if node is not None:
+            node.searches.pop(pattern, None)
+        self._lru.pop((pattern, names), None)
+
+    # --- Invalidation ---
+
+    def invalidate_path(self, path: Optional[str]) -> None:
+        """Drop the searches that may include `path`: those in its folders and, if it is a folder, below it."""
+        names = _segments(path)
+        if not names:
+            self.invalidate()
+            return
+        self.generation += 1
+        self._counters["invalidations"] += 1
+        node = self._root
+        for depth, name in enumerate(names):
+            self._clear(node, tuple(names[:depth]))
+            node = node.children.get(name)
+            if node is None:
+                return
+        self._clear_subtree(node, tuple(names))
+
+    def invalidate(self) -> None:
+        """Drop every cached search."""
+        self.generation += 1
+        self._counters["invalidations"] += 1
+        self._root = _Folder()
+        self._lru.clear()
+
+    def _clear(self, node: _Folder, names: Tuple[str, ...]) -> None:
+        for pattern in node.searches:
+            self._lru.pop((pattern, names), None)
+        node.searches.clear()
+
+    def _clear_subtree(self, node: _Folder, names: Tuple[str, ...]) -> None:
+        self._clear(node, names)
+        for name, child in node.children.items():
+            self._clear_subtree(child, names + (name,))
+        node.children.clear()
+
+    def observe(self, command_type: str, params: Dict[str, Any], result: Optional[Dict[str, Any]],
+                error: Optional[BaseException]) -> None:
+        """Connection pool observer: drop the searches a write may have affected (even a failed one)."""
+        action = str(params.get("action") or "").lower()
+        if (command_type, None) in _NO_ASSET_CHANGES or (command_type, action) in _NO_ASSET_CHANGES:
+            return
+        if command_type == "manage_gameobject" and not params.get("prefabPath") and not params.get("saveAsPrefab"):
+            return
+        if command_type == "manage_asset" and action == "bulk":
+            items = [item for item in params.get("items") or [] if isinstance(item, dict)]
+            paths = [item.get(name) for item in items for name in _PATH_PARAMS[command_type]]
+        else:
+            paths = [params.get(name) for name in _PATH_PARAMS.get(command_type, ())]
+        paths = [path for path in paths if path]
+        if not paths:
+            self.invalidate()
+            return
+        for path in paths:
+            self.invalidate_path(path)
+
+    def on_event(self, event: Dict[str, Any]) -> None:
+        """Connection pool event listener: apply the bridge's asset change notifications."""
+        kind = event.get("event")
+        if kind == "assetsChanged":
+            self._counters["notifications"] += 1
+            if event.get("all"):
+                self.invalidate()
+                return
+            for path in event.get("paths") or []:
+                self.invalidate_path(path)
+        elif kind == "closed" and not self.bridge.notifications_live:
+            # Changes made from now on would go unnoticed
+            self._drop_notified()
+
+    def _drop_notified(self) -> None:
+        for pattern, names in list(self._lru):
+            node = self._find(names)
+            entry = node.searches.get(pattern) if node is not None else None
+            if entry is not None and entry.notified:
+                self._drop(node, pattern, names)
+        self.generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        lookups = self._counters["hits"] + self._counters["misses"]
+        return {
+            "enabled": config.asset_cache,
+            "entries": len(self._lru),
+            "maxEntries": self.max_entries,
+            "ttl": self.ttl,
+            "notificationsLive": self.bridge.notifications_live,
+            **self._counters,
+            "hitRate": round(self._counters["hits"] / lookups, 3) if lookups else None,
+        }
+
+# Caches by editor name, for the shared connection pools
+_asset_caches: Dict[str, AssetCache] = {}
+
+def get_asset_cache(editor: Optional[str] = None) -> AssetCache:
+    """Return the asset cache of an editor's pool, creating it and its listeners on first use."""
+    pool = get_unity_pool(editor)
+    cache = _asset_caches.get(pool.editor)
+    if cache is None or cache.bridge is not pool:
+        cache = _asset_caches[pool.editor] = AssetCache(pool)
+        pool.add_observer(cache.observe)
+        pool.add_event_listener(cache.on_event)
+    return cache
@@ -0,0 +1,288 @@
+"""
+Command traces: recording the commands sent to the bridge, and replaying them.
+
+While a trace is recording (`config.trace_path`, or the command_trace tool),
+every command that UnityConnection or AsyncUnityConnection sends is appended to
+the trace file as one JSON line, when it finishes: the wall clock time it
+started, its type and parameters, the bytes sent and received, how long it took
+and waited in the bridge's queue, and whether it failed. The timings come from
+the connections' metrics timers (see metrics.add_sink), so they are those of
+the wire, after the server's caches. Health probe pings are not recorded. A
+path ending in ".gz" is gzip-compressed; each recording appends a new gzip
+member, so traces of several sessions can share a file. Lines are flushed every
+`config.trace_flush_interval` seconds and when the recording stops.
+
+`replay` sends the commands of a trace again through a connection pool, at the
+recorded pace (speed 1), N times faster (speed N) or as fast as `concurrency`
+allows (speed 0), and `summarize` reports the latency distribution and the drift
+of the reply sizes against the recording, per command. Paced replays are open
+loop, like the agents that made the recording: a command is sent when its time
+comes whether or not earlier ones have been answered. Commands replayed
+concurrently may run in another order than they were recorded in.
+"""
+import asyncio
+import base64
+import gzip
+import json
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+from config import config
+from metrics import CommandTimer, command_key, get_command_metrics
+
+logger = logging.getLogger("unity-mcp-server")
+
+# Marks a bytes value (e.g. set_transforms values sent as MessagePack binary) in a recorded line
+_BYTES_KEY = "$b64"
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {_BYTES_KEY: base64.b64encode(bytes(value)).decode("ascii")}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _decode_value(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and _BYTES_KEY in obj:
+        return base64.b64decode(obj[_BYTES_KEY])
+    return obj
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+class TraceRecorder:
+    """Appends every finished command to a trace file; a sink of the command metrics. Thread-safe."""
+
+    def __init__(self, path: str, flush_interval: Optional[float] = None):
+        self.path = path
+        self.flush_interval = flush_interval if flush_interval is not None else config.trace_flush_interval
+        self._lock = threading.Lock()
+        self._file = _open(path, "a")
+        # Wall clock time of a time.perf_counter() value
+        self._wall_offset = time.time() - time.perf_counter()
+        self._flushed_at = time.monotonic()
+        self.commands = 0
+        self.bytes = 0
+        self.started = time.time()
+
+    def record(self, timer: CommandTimer, end: float, error: bool) -> None:
+        entry = {
+            "at": round(self._wall_offset + timer.start, 6),
+            "type": timer.command_type,
+            "params": timer.params or {},
+            "out": timer.bytes_out,
+            "in": timer.bytes_in,
+            "ms": round((end - timer.start) * 1000, 3),
+        }
+        if timer.queue_wait is not None:
+            entry["queueMs"] = round(timer.queue_wait * 1000, 3)
+        if error:
+            entry["error"] = True
+        try:
+            line = json.dumps(entry, separators=(",", ":"), default=_encode_value) + "\n"
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Command not traced, its parameters cannot be written: {str(e)}")
+            return
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write(line)
+                if time.monotonic() - self._flushed_at >= self.flush_interval:
+                    self._file.flush()
+                    self._flushed_at = time.monotonic()
+            except OSError as e:
+                logger.warning(f"Stopped tracing to {self.path}: {str(e)}")
+                self._close()
+                return
+            self.commands += 1
+            self.bytes += len(line)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.warning(f"Could not close trace {self.path}: {str(e)}")
+            self._file = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {"recording": self._file is not None, "path": self.path, "commands": self.commands,
+                "bytes": self.bytes, "started": self.started}
+
+# Recording in progress, if any
+_recorder: Optional[TraceRecorder] = None
+
+def start_trace(path: Optional[str] = None) -> TraceRecorder:
+    """Start recording commands to `path` (default: config.trace_path), stopping any other recording."""
+    global _recorder
+    path = path or config.trace_path
+    if not path:
+        raise ValueError("No trace path given")
+    stop_trace()
+    _recorder = TraceRecorder(path)
+    get_command_metrics().add_sink(_recorder.record)
+    logger.info(f"Recording commands to {path}")
+    return _recorder
+
+def stop_trace() -> Optional[Dict[str, Any]]:
+    """Stop the recording in progress and return its stats, or None if none was."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is None:
+        return None
+    get_command_metrics().remove_sink(recorder.record)
+    recorder.close()
+    return recorder.stats()
+
+def get_trace() -> Optional[TraceRecorder]:
+    """Return the recording in progress, if any."""
+    return _recorder
+
+def read_trace(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the commands of a trace file in the order they were recorded; a torn last line is skipped."""
+    with _open(path, "r") as f:
+        for line in f:
+            try:
+                yield json.loads(line, object_hook=_decode_value)
+            except ValueError:
+                logger.warning(f"Skipped an incomplete line in {path}")
+
+def schedule(records: List[Dict[str, Any]], speed: float = 1.0, max_gap: Optional[float] = None) -> List[float]:
+    """Seconds after the start of a replay at which each command is sent.
+
+    Pauses longer than `max_gap` seconds (e.g. between recorded sessions) are
+    shortened to it; speed 0 sends everything at once.
+    """
+    if speed <= 0 or not records:
+        return [0.0] * len(records)
+    offsets, elapsed, previous = [], 0.0, records[0]["at"]
+    for record in records:
+        gap = max(0.0, record["at"] - previous)
+        elapsed += gap if max_gap is None else min(gap, max_gap)
+        previous = record["at"]
+        offsets.append(elapsed / speed)
+    return offsets
+
+async def replay(
+    records: List[Dict[str, Any]],
+    send: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    speed: float = 1.0,
+    concurrency: int = 32,
+    max_gap: Optional[float] = 5.0,
+) -> List[Dict[str, Any]]:
+    """Send the commands of a trace again and return what happened to each.
+
+    Args:
+        records: Commands as read by read_trace.
+        send: Sends one command, e.g. a connection pool's send_command.
+        speed: 1 replays at the recorded pace, N N times faster, 0 as fast as possible.
+        concurrency: Commands in flight at once. Paced replays only wait for it when
+            the replay falls this far behind the recording.
+        max_gap: Longest pause kept from the recording, in recorded seconds (None keeps all).
+
+    Returns:
+        For each record, in order: {'record', 'ms' (None if not sent), 'in' (reply bytes,
+        None if unknown), 'error' (None or the message), 'lateMs' (how far behind its
+        scheduled time it was sent)}.
+    """
+    loop = asyncio.get_running_loop()
+    offsets = schedule(records, speed, max_gap)
+    results: List[Dict[str, Any]] = [{"record": record, "ms": None, "in": None, "error": None, "lateMs": 0.0}
+                                     for record in records]
+    # Reply sizes come from the connections' timers, matched to the parameters sent
+    sizes: Dict[int, int] = {}
+
+    def sink(timer: CommandTimer, end: float, error: bool) -> None:
+        if timer.params is not None:
+            sizes[id(timer.params)] = timer.bytes_in
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    start = loop.time()
+
+    async def run(index: int) -> None:
+        result = results[index]
+        record = result["record"]
+        params = dict(record.get("params") or {})
+        async with semaphore:
+            sent = loop.time()
+            result["lateMs"] = round(max(0.0, sent - start - offsets[index]) * 1000, 3)
+            try:
+                await send(record["type"], params)
+            except Exception as e:
+                result["error"] = str(e)
+            result["ms"] = round((loop.time() - sent) * 1000, 3)
+            result["in"] = sizes.pop(id(params), None)
+
+    metrics = get_command_metrics()
+    metrics.add_sink(sink)
+    tasks = []
+    try:
+        for index, offset in enumerate(offsets):
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(loop.create_task(run(index)))
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        metrics.remove_sink(sink)
+    return results
+
+def _percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    values = sorted(values)
+    if not values:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    percentiles = {name: values[min(len(values) - 1, int(fraction * len(values)))]
+                   for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))}
+    return {**percentiles, "max": values[-1]}
+
+def summarize(results: List[Dict[str, Any]], drift_threshold: float = 0.1) -> Dict[str, Any]:
+    """Latency percentiles (ms) of the replay and of the recording, and reply size drift, per command.
+
+    A command's drift is the relative change of its total reply bytes against the
+    recording; commands whose drift exceeds `drift_threshold` are listed in 'drifted'.
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for result in results:
+        record = result["record"]
+        groups.setdefault(command_key(record["type"], record.get("params")), []).append(result)
+    commands, drifted = [], []
+    for (command_type, action), group in sorted(groups.items()):
+        sized = [r for r in group if r["in"] is not None and not r["error"]]
+        recorded_bytes = sum(r["record"].get("in", 0) for r in sized)
+        replayed_bytes = sum(r["in"] for r in sized)
+        drift = (replayed_bytes - recorded_bytes) / recorded_bytes if recorded_bytes else None
+        entry = {
+            "command": command_type,
+            "action": action or None,
+            "count": len(group),
+            "errors": sum(1 for r in group if r["error"]),
+            "recordedErrors": sum(1 for r in group if r["record"].get("error")),
+            "replayMs": _percentiles([r["ms"] for r in group if r["ms"] is not None and not r["error"]]),
+            "recordedMs": _percentiles([r["record"]["ms"] for r in group
+                                        if "ms" in r["record"] and not r["record"].get("error")]),
+            "recordedBytesIn": recorded_bytes,
+            "replayBytesIn": replayed_bytes,
+            "sizeDrift": round(drift, 4) if drift is not None else None,
+        }
+        commands.append(entry)
+        if drift is not None and abs(drift) > drift_threshold:
+            drifted.append(entry)
+    latencies = [r["ms"] for r in results if r["ms"] is not None and not r["error"]]
+    return {
+        "commands": commands,
+        "total": {
+            "count": len(results),
+            "errors": sum(1 for r in results if r["error"]),
+            "replayMs": _percentiles(latencies),
+            "maxLateMs": max((r["lateMs"] for r in results), default=0.0),
+        },
+        "drifted": drifted,
+    }
@@ -0,0 +1,116 @@
+"""
+Compression of large message bodies on bridge connections.
+
+Compression is negotiated per connection during the ping handshake: the client
+lists the algorithms it can decode, preferred first, together with its size
+threshold ({"compression": ["zstd", "zlib"], "compressionThreshold": 65536}),
+and the bridge answers with the one it picked. From then on either side may
+compress a framed message body of at least the threshold; the high bit of the
+length header marks a compressed body. zlib is always available; zstd needs
+the optional zstandard package.
+"""
+import logging
+import time
+import zlib
+from typing import Any, List, Optional, Tuple
+from config import config
+from metrics import get_command_metrics
+
+# Optional: only needed for config.compression = "zstd", and imported by _load_zstandard when asked for
+zstandard = None
+
+logger = logging.getLogger("unity-mcp-server")
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+# High bit of the frame length header: the body is compressed
+FRAME_COMPRESSED = 0x80000000
+FRAME_LENGTH_MASK = 0x7FFFFFFF
+
+def _load_zstandard() -> Any:
+    """Import zstandard on first use, keeping it off the server's startup path; None if it is not installed."""
+    global zstandard
+    if zstandard is None:
+        try:
+            import zstandard as module
+        except ImportError:
+            return None
+        zstandard = module
+    return zstandard
+
+def requested_compressions() -> List[str]:
+    """Return the algorithms to offer the bridge, preferred first; empty when compression is off."""
+    if not config.compression:
+        return []
+    if config.compression == ZSTD:
+        # zstd is only used once offered and picked, so it is loaded from here on
+        if _load_zstandard() is not None:
+            return [ZSTD, ZLIB]
+        logger.warning("config.compression is 'zstd' but the zstandard package is not installed; using zlib")
+        return [ZLIB]
+    if config.compression == ZLIB:
+        return [ZLIB]
+    logger.warning(f"Unknown config.compression {config.compression!r}; compression disabled")
+    return []
+
+def compress_body(payload: bytes, algorithm: Optional[str]) -> Tuple[bytes, bool]:
+    """Compress a message body if compression was negotiated and the body is large enough.
+
+    Returns the body to send and whether it is compressed. Bodies that do not
+    shrink are sent as they are.
+    """
+    if algorithm is None or len(payload) < config.compression_threshold:
+        return payload, False
+    start = time.thread_time() if config.metrics else 0.0
+    if algorithm == ZSTD:
+        compressed = zstandard.ZstdCompressor(level=config.compression_level).compress(payload)
+    else:
+        compressed = zlib.compress(payload, config.compression_level)
+    if config.metrics:
+        get_command_metrics().record_compression("out", len(payload), len(compressed), time.thread_time() - start)
+    if len(compressed) >= len(payload):
+        return payload, False
+    return compressed, True
+
+class Decompressor:
+    """Streaming decompressor for one compressed frame body.
+
+    Chunks are decompressed as they are received, so the compressed body is
+    never held in full. The output is bounded by config.max_frame_size.
+    """
+
+    def __init__(self, algorithm: Optional[str]):
+        if algorithm == ZSTD:
+            self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+        elif algorithm == ZLIB:
+            self._decompressor = zlib.decompressobj()
+        else:
+            raise Exception("Received a compressed frame, but no compression was negotiated")
+        self._zlib = algorithm == ZLIB
+        self.raw = 0
+        self.wire = 0
+        self.cpu = 0.0
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Decompress the next piece of the body."""
+        start = time.thread_time() if config.metrics else 0.0
+        if self._zlib:
+            # One byte past the limit is enough to know it was exceeded
+            data = self._decompressor.decompress(chunk, config.max_frame_size - self.raw + 1)
+        else:
+            data = self._decompressor.decompress(chunk)
+        if config.metrics:
+            self.cpu += time.thread_time() - start
+        self.wire += len(chunk)
+        self.raw += len(data)
+        if self.raw > config.max_frame_size:
+            raise Exception(f"Decompressed frame exceeds max_frame_size ({config.max_frame_size})")
+        return data
+
+    def finish(self) -> None:
+        """Check that the body was complete and record the statistics."""
+        if not self._decompressor.eof:
+            raise Exception("Compressed frame ended before its compressed stream")
+        if config.metrics:
+            get_command_metrics().record_compression("in", self.raw, self.wire, self.cpu)
@@ -3,7 +3,8 @@ Configuration settings for the Unity MCP Server.
 This file contains all configurable parameters for the server.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict
 
 @dataclass
 class ServerConfig:
@@ -13,18 +14,93 @@ class ServerConfig:
     unity_host: str = "localhost"
     unity_port: int = 6400
     mcp_port: int = 6500
+
+    # Editor settings
+    unity_editors: Dict[str, str] = field(default_factory=dict)  # More editors by name, as "host:port" or "port"; "default" is unity_host:unity_port
+    default_editor: str = "default"  # Editor the tools address when not given target_editor
+    fan_out_timeout: float = 10.0  # Seconds each editor has to answer a target_editor="*" call
     
     # Connection settings
     connection_timeout: float = 86400.0  # 24 hours timeout
     buffer_size: int = 16 * 1024 * 1024  # 16MB buffer
+
+    # Protocol settings
+    framing: bool = True  # Negotiate length-prefixed framing during the ping handshake
+    max_frame_size: int = 512 * 1024 * 1024  # 512MB upper bound for a single framed message
+    pipelining: bool = True  # Tag commands with IDs and keep several in flight on one connection
+    encoding: str = "json"  # Message body encoding to ask for: "json" or "msgpack" (needs the msgpack package)
+    compression: str = ""  # Compress large message bodies: "zlib", "zstd" (needs the zstandard package) or "" (off)
+    compression_threshold: int = 64 * 1024  # Only bodies of at least this many bytes are compressed
+    compression_level: int = 1  # Level used to compress commands (the bridge picks its own)
+
+    # Pool settings
+    pool_max_size: int = 4  # Maximum number of connections to the bridge
+    pool_max_in_flight: int = 16  # Requests sharing one pipelined connection before another is opened
+    pool_idle_timeout: float = 300.0  # Close pooled connections unused for this many seconds
+    pool_acquire_timeout: float = 30.0  # Seconds to wait for a free connection before failing
+
+    # Batch settings
+    batch_max_bytes: int = 4 * 1024 * 1024  # Split batches whose serialized commands exceed this size
+    batch_max_commands: int = 1000  # Split batches with more commands than this
+    bulk_asset_chunk_size: int = 200  # Asset operations sent per bridge call (and asset editing scope) by bulk_assets
+
+    # Scene cache settings
+    scene_cache: bool = True  # Answer GameObject finds and repeated get_hierarchy calls from a local cache
+    scene_cache_ttl: float = 10.0  # Seconds before cached scene data must be reloaded (edits made in the editor are not seen)
+    scene_cache_max_nodes: int = 100000  # Scenes with more objects are not cached; also bounds cached hierarchy replies
+    scene_cache_max_responses: int = 16  # get_hierarchy replies kept
+    scene_cache_page_size: int = 2000  # Objects per get_hierarchy page when loading the cache
+
+    # Asset cache settings
+    asset_cache: bool = True  # Answer repeated manage_asset searches from a local cache
+    asset_cache_ttl: float = 30.0  # Seconds a cached search is trusted without the bridge's asset change notifications
+    asset_cache_max_entries: int = 256  # Cached searches kept (least recently used are dropped)
+    asset_events: bool = True  # Ask the bridge to push asset change notifications on pipelined connections
+
+    # Query cache settings
+    query_cache: bool = True  # Memoize replies to read-only queries (editor state, active scene, finds, script reads)
+    query_cache_ttl: float = 1.0  # Seconds the bridge's last reported state version is trusted before a ping checks it
+    query_cache_max_entries: int = 256  # Memoized replies kept (least recently used are dropped)
+
+    # Console settings
+    console_buffer_size: int = 5000  # Recent console entries kept to answer read_console locally (0 disables)
+    console_poll_interval: float = 0.25  # Seconds between polls while read_console tails the console
+    console_tail_timeout: float = 30.0  # Default seconds a tail waits for new messages
+
+    # Script settings
+    script_commit_debounce: float = 30.0  # Seconds without another deferred script change before the bridge commits them (0: only commit_scripts)
+    script_hashes: bool = True  # Skip unchanged script updates and reads, and send small updates as patches
+    script_patch_ratio: float = 0.5  # Send an update as a patch when the diff is at most this fraction of the new text
+    script_store_max_bytes: int = 8 * 1024 * 1024  # Script texts kept to diff against (least recently used are dropped)
+
+    # Job settings
+    job_poll_interval: float = 0.25  # Seconds between job_status polls while waiting for a job
+    job_wait_timeout: float = 60.0  # Default seconds to wait for a job before returning it still running
+
+    # Health settings
+    health_idle_threshold: float = 30.0  # Ping before reuse only after this many idle seconds
+    heartbeat_interval: float = 0.0  # Seconds between background pings while idle (0 disables)
+
+    # Metrics settings
+    metrics: bool = False  # Time each command's phases and count bytes, retries and reconnects
+    metrics_dump_path: str = ""  # Also write the metrics to this file while the server runs ("" disables)
+    metrics_dump_format: str = "json"  # "json" or "prometheus"
+    metrics_dump_interval: float = 60.0  # Seconds between metrics dumps
+
+    # Trace settings
+    trace_path: str = ""  # Record every command sent to Unity to this JSONL file, gzip-compressed if it ends in ".gz" ("" disables)
+    trace_flush_interval: float = 1.0  # Seconds between flushes of the trace file
     
     # Logging settings
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
     # Server settings
-    max_retries: int = 3
-    retry_delay: float = 1.0
+    max_retries: int = 3  # Times a call is sent again after its connection to the bridge failed
+    retry_delay: float = 1.0  # Seconds before the first retry; doubles with each further retry (with jitter)
+    retry_max_delay: float = 8.0  # Upper bound for the delay before a retry
+    reconnect_poll_interval: float = 0.25  # Seconds between checks whether the bridge listens again
+    command_deadline: float = 60.0  # Seconds after a call's first attempt during which it may be retried
 
 # Create a global config instance
 config = ServerConfig()
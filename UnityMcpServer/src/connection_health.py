@@ -0,0 +1,71 @@
+"""
+Connection health tracking for the Unity bridge connection.
+
+Instead of pinging Unity before every command, a connection remembers when it
+was last known to be good: every successful exchange refreshes that timestamp,
+and every send/recv error marks the connection dead. A ping is only needed once
+the connection has been idle for longer than `config.health_idle_threshold`.
+"""
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+from config import config
+
+@dataclass
+class ConnectionHealth:
+    """Health state and probe counters for one Unity endpoint."""
+    idle_threshold: float = config.health_idle_threshold
+    healthy: bool = False
+    last_ok: float = 0.0  # time.monotonic() of the last successful exchange
+    probes_sent: int = 0
+    probes_skipped: int = 0
+    probes_failed: int = 0
+    failures: int = 0  # send/recv errors seen on regular commands
+    reconnects: int = 0
+    last_error: Optional[str] = None
+
+    def mark_ok(self) -> None:
+        """Record a successful exchange with Unity."""
+        self.healthy = True
+        self.last_ok = time.monotonic()
+
+    def mark_failed(self, error: str) -> None:
+        """Record a send/recv error; the connection must be re-established."""
+        self.healthy = False
+        self.failures += 1
+        self.last_error = error
+
+    def idle_for(self) -> float:
+        """Seconds since the last successful exchange."""
+        return time.monotonic() - self.last_ok if self.last_ok else float("inf")
+
+    def needs_probe(self) -> bool:
+        """True if the connection must be verified with a ping before use."""
+        return not self.healthy or self.idle_for() > self.idle_threshold
+
+    def record_probe(self, ok: bool, error: Optional[str] = None) -> None:
+        self.probes_sent += 1
+        if ok:
+            self.mark_ok()
+        else:
+            self.probes_failed += 1
+            self.healthy = False
+            self.last_error = error
+
+    def record_skipped_probe(self) -> None:
+        self.probes_skipped += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the health state as a JSON-serializable dictionary."""
+        idle = self.idle_for()
+        return {
+            "healthy": self.healthy,
+            "idleSeconds": None if idle == float("inf") else round(idle, 3),
+            "idleThreshold": self.idle_threshold,
+            "probesSent": self.probes_sent,
+            "probesSkipped": self.probes_skipped,
+            "probesFailed": self.probes_failed,
+            "failures": self.failures,
+            "reconnects": self.reconnects,
+            "lastError": self.last_error,
+        }
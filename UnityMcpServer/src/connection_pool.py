@@ -0,0 +1,474 @@
+"""
+Bounded pool of Unity bridge connections shared by the MCP tools.
+
+Tools check a connection out, send their command and check it back in. A
+pipelined connection can be shared by up to `config.pool_max_in_flight`
+requests at once; a serialized (legacy) connection serves one request at a
+time. New connections are opened only when every existing one is at capacity,
+up to `config.pool_max_size`, after which callers wait in line until a
+connection frees up or `config.pool_acquire_timeout` passes. Connections left
+unused for `config.pool_idle_timeout` seconds are closed.
+
+Commands and batches that fail because the bridge went away, e.g. while the
+editor reloads its scripts, are retried with backoff once it listens again:
+any command that could not be sent, and idempotent ones that were sent but
+lost their connection (see `unity_connection.send_with_retries`).
+
+Each Unity editor the server drives has a pool of its own. The editors are
+named: "default" is `config.unity_host:unity_port`, and `config.unity_editors`
+adds more as "host:port". Tools address one with their `target_editor`
+parameter, `config.default_editor` otherwise.
+"""
+import asyncio
+import logging
+import time
+from contextlib import aclosing, asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Tuple
+from config import config
+from metrics import get_command_metrics
+from unity_connection import (AsyncUnityConnection, UnityCommandError, UnityUnavailableError,
+                              get_unity_connection_health, send_with_retries)
+
+logger = logging.getLogger("unity-mcp-server")
+
+# Called as observer(command_type, params, result, error) after each command sent through the pool
+CommandObserver = Callable[[str, Dict[str, Any], Optional[Dict[str, Any]], Optional[BaseException]], None]
+# Called with each event the bridge pushes on a pooled connection
+EventListener = Callable[[Dict[str, Any]], None]
+
+# Name of the editor at config.unity_host:unity_port, and the target_editor that addresses every editor
+DEFAULT_EDITOR = "default"
+ALL_EDITORS = "*"
+
+class _PoolEntry:
+    """A pooled connection and the number of requests currently using it."""
+    __slots__ = ("connection", "load", "last_used")
+
+    def __init__(self, connection: AsyncUnityConnection):
+        self.connection = connection
+        self.load = 0
+        self.last_used = time.monotonic()
+
+    @property
+    def capacity(self) -> int:
+        return config.pool_max_in_flight if self.connection.pipelined else 1
+
+class UnityConnectionPool:
+    """Hands out AsyncUnityConnections to concurrent tool calls."""
+
+    def __init__(
+        self,
+        host: str = config.unity_host,
+        port: int = config.unity_port,
+        max_size: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        acquire_timeout: Optional[float] = None,
+        editor: str = DEFAULT_EDITOR,
+    ):
+        self.host = host
+        self.port = port
+        self.editor = editor
+        self.max_size = max_size if max_size is not None else config.pool_max_size
+        self.idle_timeout = idle_timeout if idle_timeout is not None else config.pool_idle_timeout
+        self.acquire_timeout = acquire_timeout if acquire_timeout is not None else config.pool_acquire_timeout
+        self._entries: List[_PoolEntry] = []
+        self._opening = 0
+        self._waiting = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._observers: List[CommandObserver] = []
+        self._event_listeners: List[EventListener] = []
+        self._counters = {"checkouts": 0, "waits": 0, "timeouts": 0, "opened": 0, "evicted": 0, "discarded": 0,
+                          "retries": 0}
+
+    def _cond(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def checkout(self, timeout: Optional[float] = None) -> AsyncUnityConnection:
+        """Get a connection with spare capacity, opening or waiting for one if needed.
+
+        Raises:
+            ConnectionError: If no connection frees up within the timeout, or Unity is unreachable.
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        self._start_heartbeat()
+        while True:
+            entry = await self._reserve(deadline)
+            if entry is None:
+                # A slot is reserved for a new connection
+                return await self._open()
+            connection = entry.connection
+            if not connection.health.needs_probe():
+                connection.health.record_skipped_probe()
+                return connection
+            try:
+                await connection.send_command("ping", timeout=max(deadline - time.monotonic(), 0.001))
+                return connection
+            except Exception as e:
+                logger.warning(f"Pooled connection failed its health check: {str(e)}")
+                get_command_metrics().record_reconnect()
+                await self.checkin(connection)
+
+    async def _reserve(self, deadline: float) -> Optional[_PoolEntry]:
+        """Reserve capacity on an existing connection, or a slot to open a new one (None)."""
+        cond = self._cond()
+        async with cond:
+            while True:
+                self._evict_idle()
+                available = [e for e in self._entries if e.connection.connected and e.load < e.capacity]
+                if available:
+                    entry = min(available, key=lambda e: e.load)
+                    entry.load += 1
+                    self._counters["checkouts"] += 1
+                    return entry
+                if len(self._entries) + self._opening < self.max_size:
+                    self._opening += 1
+                    self._counters["checkouts"] += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters["timeouts"] += 1
+                    raise ConnectionError(f"Timed out waiting for a Unity connection ({self.max_size} in use)")
+                self._counters["waits"] += 1
+                self._waiting += 1
+                try:
+                    await asyncio.wait_for(cond.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    self._waiting -= 1
+
+    async def _open(self) -> AsyncUnityConnection:
+        """Open a connection into a slot reserved by _reserve."""
+        connection = AsyncUnityConnection(host=self.host, port=self.port, event_handler=self._dispatch_event)
+        try:
+            if not await connection.connect():
+                raise UnityUnavailableError("Could not connect to Unity. Ensure the Unity Editor and MCP Bridge are running.")
+            # Verify the new connection works, unless the handshake already did
+            if connection.health.needs_probe():
+                await connection.send_command("ping")
+        except Exception as e:
+            await connection.disconnect()
+            async with self._cond():
+                self._opening -= 1
+                self._cond().notify()
+            if isinstance(e, UnityUnavailableError):
+                raise
+            raise UnityUnavailableError(f"Could not establish valid Unity connection: {str(e)}")
+        async with self._cond():
+            self._opening -= 1
+            entry = _PoolEntry(connection)
+            entry.load = 1
+            self._entries.append(entry)
+            self._counters["opened"] += 1
+            # A pipelined connection can take waiting callers too
+            self._cond().notify_all()
+        logger.info(f"Opened pooled Unity connection ({len(self._entries)}/{self.max_size})")
+        return connection
+
+    async def checkin(self, connection: AsyncUnityConnection) -> None:
+        """Return a connection; dead connections are dropped from the pool."""
+        cond = self._cond()
+        async with cond:
+            entry = next((e for e in self._entries if e.connection is connection), None)
+            if entry is None:
+                return
+            entry.load -= 1
+            entry.last_used = time.monotonic()
+            if not connection.connected:
+                self._entries.remove(entry)
+                self._counters["discarded"] += 1
+            cond.notify()
+        if not connection.connected:
+            await connection.disconnect()
+
+    def _evict_idle(self) -> None:
+        """Close connections nobody has used for idle_timeout seconds. Caller holds the lock."""
+        now = time.monotonic()
+        for entry in list(self._entries):
+            if entry.load == 0 and (not entry.connection.connected or now - entry.last_used > self.idle_timeout):
+                self._entries.remove(entry)
+                self._counters["evicted"] += 1
+                asyncio.get_running_loop().create_task(entry.connection.disconnect())
+
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncIterator[AsyncUnityConnection]:
+        """Check out a connection for the duration of a `async with` block."""
+        connection = await self.checkout(timeout)
+        try:
+            yield connection
+        finally:
+            await self.checkin(connection)
+
+    async def send_command(
+        self,
+        command_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send one command on a pooled connection. See AsyncUnityConnection.send_command.
+
+        Connection failures are retried until `deadline` seconds (default:
+        config.command_deadline) have passed; see unity_connection.send_with_retries.
+        """
+        async def attempt(limit: Optional[float]) -> Dict[str, Any]:
+            async with self.connection(limit) as connection:
+                return await connection.send_command(command_type, params, timeout=_attempt_timeout(timeout, limit))
+
+        try:
+            result = await send_with_retries(attempt, command_type, params, self.host, self.port, deadline,
+                                             self._count_retry)
+        except Exception as e:
+            self._notify(command_type, params, None, e)
+            raise
+        self._notify(command_type, params, result, None)
+        return result
+
+    async def send_batch(
+        self,
+        commands: List[Dict[str, Any]],
+        stop_on_error: bool = True,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run a batch on a pooled connection. See AsyncUnityConnection.send_batch.
+
+        A batch is only sent again after losing its connection if every command in it is idempotent.
+        """
+        async def attempt(limit: Optional[float]) -> Dict[str, Any]:
+            async with self.connection(limit) as connection:
+                return await connection.send_batch(commands, stop_on_error=stop_on_error,
+                                                   timeout=_attempt_timeout(timeout, limit))
+
+        try:
+            result = await send_with_retries(attempt, "batch", {"commands": commands}, self.host, self.port,
+                                             deadline, self._count_retry)
+        except Exception as e:
+            # Part of the batch may have run
+            self._notify("batch", {"commands": commands}, None, e)
+            raise
+        # Observers see each command that ran, as if it had been sent on its own
+        for entry in result["data"]["results"]:
+            params = commands[entry["index"]].get("parameters") or {}
+            if entry["status"] == "success":
+                self._notify(entry["type"], params, entry["result"], None)
+            elif entry["status"] == "error":
+                self._notify(entry["type"], params, None, UnityCommandError(entry["error"]))
+        return result
+
+    async def stream_command(
+        self,
+        command_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        path: Tuple[str, ...] = ("result", "data"),
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """Stream one array of a command's response on a pooled connection. See AsyncUnityConnection.stream_command."""
+        async with self.connection() as connection:
+            try:
+                async with aclosing(connection.stream_command(command_type, params, path=path, timeout=timeout)) as items:
+                    async for item in items:
+                        yield item
+            except Exception as e:
+                self._notify(command_type, params, None, e)
+                raise
+        self._notify(command_type, params, None, None)
+
+    def _count_retry(self, error: BaseException) -> None:
+        self._counters["retries"] += 1
+
+    def add_observer(self, observer: CommandObserver) -> None:
+        """Call `observer(command_type, params, result, error)` after every command sent through the pool.
+
+        `result` is None for failed and streamed commands. Observers run on the
+        event loop and must not block.
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer: CommandObserver) -> None:
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def _notify(
+        self,
+        command_type: str,
+        params: Optional[Dict[str, Any]],
+        result: Optional[Dict[str, Any]],
+        error: Optional[BaseException],
+    ) -> None:
+        for observer in list(self._observers):
+            try:
+                observer(command_type, params or {}, result, error)
+            except Exception as e:
+                logger.warning(f"Command observer failed: {str(e)}")
+
+    @property
+    def notifications_live(self) -> bool:
+        """True while a pooled connection receives the bridge's asset change notifications."""
+        return any(e.connection.notifications for e in self._entries)
+
+    @property
+    def state_version(self) -> Tuple[Optional[int], float]:
+        """The editor state version from the latest reply on any pooled connection, and when it arrived.
+
+        The version is None until the bridge reports one (bridges that predate it never do).
+        """
+        latest = max(self._entries, key=lambda e: e.connection.state_version_at, default=None)
+        if latest is None or latest.connection.state_version is None:
+            return None, 0.0
+        return latest.connection.state_version, latest.connection.state_version_at
+
+    @property
+    def project(self) -> Optional[str]:
+        """The name of the editor's project, as reported in the handshake (None until connected, or if not reported)."""
+        return next((e.connection.project for e in self._entries if e.connection.project), None)
+
+    def add_event_listener(self, listener: EventListener) -> None:
+        """Call `listener(event)` with every event the bridge pushes, e.g. asset change notifications.
+
+        A {"event": "closed"} event follows the loss of a connection that received
+        notifications. Listeners run on the event loop and must not block.
+        """
+        self._event_listeners.append(listener)
+
+    def remove_event_listener(self, listener: EventListener) -> None:
+        if listener in self._event_listeners:
+            self._event_listeners.remove(listener)
+
+    def _dispatch_event(self, event: Dict[str, Any]) -> None:
+        for listener in list(self._event_listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"Event listener failed: {str(e)}")
+
+    def _start_heartbeat(self) -> None:
+        """Start the background heartbeat if it is enabled and not already running."""
+        if config.heartbeat_interval <= 0 or (self._heartbeat_task is not None and not self._heartbeat_task.done()):
+            return
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+
+    async def _heartbeat(self) -> None:
+        """Ping idle connections so that checkouts rarely need to."""
+        interval = config.heartbeat_interval
+        while True:
+            await asyncio.sleep(interval)
+            for entry in list(self._entries):
+                connection = entry.connection
+                if not connection.connected or connection.health.idle_for() < interval:
+                    continue
+                try:
+                    await connection.send_command("ping", timeout=interval)
+                except Exception as e:
+                    # The connection has been reset; it is discarded on the next checkout.
+                    logger.warning(f"Heartbeat ping failed: {str(e)}")
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        entries, self._entries = self._entries, []
+        for entry in entries:
+            await entry.connection.disconnect()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool occupancy, counters and per-connection health."""
+        return {
+            "editor": self.editor,
+            "endpoint": f"{self.host}:{self.port}",
+            "project": self.project,
+            "size": len(self._entries),
+            "maxSize": self.max_size,
+            "inFlight": sum(e.load for e in self._entries),
+            "waiting": self._waiting,
+            **self._counters,
+            "connections": [
+                {
+                    "load": e.load,
+                    "capacity": e.capacity,
+                    "pipelined": e.connection.pipelined,
+                    "notifications": e.connection.notifications,
+                    # As reported with the latest reply: commands queued in the bridge and how long it waited
+                    "bridgeQueue": {"depth": e.connection.queue_depth, "waitMs": e.connection.queue_wait_ms},
+                    "health": e.connection.health.snapshot(),
+                }
+                for e in self._entries
+            ],
+        }
+
+def _attempt_timeout(timeout: Optional[float], limit: Optional[float]) -> Optional[float]:
+    """The reply timeout of one attempt: a retry must not outlive the call's deadline."""
+    if limit is None:
+        return timeout
+    return min(timeout if timeout is not None else config.connection_timeout, max(limit, 0.001))
+
+def editor_endpoints() -> Dict[str, Tuple[str, int]]:
+    """Return the (host, port) of every named editor, the default one first."""
+    endpoints = {DEFAULT_EDITOR: (config.unity_host, config.unity_port)}
+    for name, address in config.unity_editors.items():
+        host, _, port = str(address).rpartition(":")
+        try:
+            endpoints[name] = (host or config.unity_host, int(port))
+        except ValueError:
+            raise ValueError(f"Invalid address '{address}' for Unity editor '{name}'; expected 'host:port'")
+    return endpoints
+
+def editor_names() -> List[str]:
+    """Return the names of the configured editors, the default one first."""
+    return list(editor_endpoints())
+
+def resolve_editor(editor: Optional[str] = None) -> str:
+    """Return the name of the editor a tool call addresses (default: config.default_editor).
+
+    Raises:
+        ValueError: If no editor has that name.
+    """
+    name = editor or config.default_editor
+    if name == ALL_EDITORS:
+        raise ValueError("target_editor='*' is only accepted by read-only queries (get, find, search, read); "
+                         "name one editor")
+    if name not in editor_endpoints():
+        raise ValueError(f"Unknown Unity editor '{name}'; configured editors: {', '.join(editor_names())}")
+    return name
+
+# Pools by editor name, shared by all tools
+_unity_pools: Dict[str, UnityConnectionPool] = {}
+
+def get_unity_pool(editor: Optional[str] = None) -> UnityConnectionPool:
+    """Return the connection pool of an editor (default: config.default_editor), creating it on first use.
+
+    Raises:
+        ValueError: If no editor has that name.
+    """
+    name = resolve_editor(editor)
+    pool = _unity_pools.get(name)
+    if pool is None:
+        host, port = editor_endpoints()[name]
+        pool = _unity_pools[name] = UnityConnectionPool(host=host, port=port, editor=name)
+    return pool
+
+async def close_unity_pool() -> None:
+    """Close the connection pools of every editor."""
+    pools = list(_unity_pools.values())
+    _unity_pools.clear()
+    for pool in pools:
+        await pool.close()
+
+def get_connection_health() -> Dict[str, Any]:
+    """Return health state and probe counters for the pools and the sync connection.
+
+    'pool' is the default editor's pool; 'editors' has the pool of every other
+    editor addressed so far.
+    """
+    default = get_unity_pool()
+    return {
+        "pool": default.stats(),
+        "editors": {name: pool.stats() for name, pool in _unity_pools.items() if pool is not default},
+        "sync": get_unity_connection_health(),
+        "heartbeatInterval": config.heartbeat_interval,
+    }
@@ -0,0 +1,181 @@
+"""
+Client-side ring buffer of recent Unity console entries.
+
+read_console pages through the console with cursors: every reply carries a
+`nextCursor`, and a later `sinceCursor` returns only the entries added since.
+A cursor is the index of the next entry plus a hash of the entry before it, so
+the bridge notices when the console was cleared (and maybe refilled) and starts
+over, flagging the reply with `reset`.
+
+The buffer keeps the last `config.console_buffer_size` entries, unfiltered.
+Before a query it fetches what was added since its own cursor (usually nothing),
+then answers type and text filters locally. Queries reaching back past the
+oldest buffered entry go to Unity.
+"""
+import asyncio
+import logging
+from collections import deque
+from itertools import islice
+from typing import Dict, Any, Iterable, Optional, Tuple
+from config import config
+from connection_pool import UnityConnectionPool, get_unity_pool
+
+logger = logging.getLogger("unity-mcp-server")
+
+def fnv1a(message: str) -> int:
+    """32-bit FNV-1a of the UTF-8 bytes of a message, as the bridge computes it."""
+    value = 2166136261
+    for byte in message.encode("utf-8"):
+        value = ((value ^ byte) * 16777619) & 0xFFFFFFFF
+    return value
+
+def make_cursor(index: int, previous_message: Optional[str]) -> str:
+    """Build the cursor of the entry at `index`, given the message of the entry before it."""
+    return "0" if index == 0 else f"{index}:{fnv1a(previous_message or ''):08x}"
+
+def parse_cursor(cursor: str) -> Optional[Tuple[int, Optional[int]]]:
+    """Split a cursor into (index, hash of the previous entry); None if it is malformed."""
+    index, _, digest = cursor.partition(":")
+    try:
+        position = int(index)
+        value = int(digest, 16) if digest else None
+    except ValueError:
+        return None
+    if position < 0:
+        return None
+    return position, value
+
+class ConsoleBuffer:
+    """The most recent console entries of one Unity endpoint."""
+
+    def __init__(self, bridge: UnityConnectionPool, size: Optional[int] = None):
+        self.bridge = bridge
+        self.size = size if size is not None else config.console_buffer_size
+        self.supported = True  # False against bridges without cursor support
+        # Entries in console order, with consecutive indices
+        self._entries: "deque[Dict[str, Any]]" = deque(maxlen=self.size)
+        self._end = 0  # Index after the last entry seen
+        self._cursor = "0"  # Cursor of _end
+        self._lock = asyncio.Lock()
+        self._counters = {"hits": 0, "misses": 0, "syncs": 0, "resets": 0}
+
+    @property
+    def _start(self) -> int:
+        """Index of the oldest buffered entry."""
+        return self._entries[0]["index"] if self._entries else self._end
+
+    async def sync(self) -> None:
+        """Fetch the entries added to the console since the last sync."""
+        async with self._lock:
+            cursor = self._cursor
+            while True:
+                result = await self.bridge.send_command(
+                    "read_console", {"action": "get", "sinceCursor": cursor, "limit": self.size})
+                data = result.get("data") or {}
+                if "nextCursor" not in data:
+                    logger.info("The Unity bridge does not support console cursors; console buffer disabled")
+                    self.supported = False
+                    return
+                self._counters["syncs"] += 1
+                if data.get("reset"):
+                    self._counters["resets"] += 1
+                    self._entries.clear()
+                self._entries.extend(data["logs"])
+                self._cursor = data["nextCursor"]
+                self._end = parse_cursor(self._cursor)[0]
+                if self._end >= data["total"]:
+                    return
+                # More arrived than the buffer holds: skip to the last `size` entries
+                self._entries.clear()
+                skip_to = max(self._end, data["total"] - self.size)
+                self._end, self._cursor = skip_to, str(skip_to)
+                cursor = self._cursor
+
+    def query(
+        self,
+        since_cursor: Optional[str] = None,
+        types: Optional[Iterable[str]] = None,
+        filter_text: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Answer a read_console get from the buffer, or return None to ask Unity.
+
+        Call sync() first. The reply has the bridge's shape: 'logs', 'nextCursor',
+        'total' and 'reset'.
+        """
+        if since_cursor is None:
+            start = 0
+        elif since_cursor == "end":
+            start = self._end
+        else:
+            parsed = parse_cursor(since_cursor)
+            if parsed is None or parsed[0] > self._end:
+                # Malformed, or from before a clear: Unity reports it
+                self._counters["misses"] += 1
+                return None
+            start, digest = parsed
+            if digest is not None and start > 0 and not self._check(start - 1, digest):
+                self._counters["misses"] += 1
+                return None
+        first = self._start
+        if start < first:
+            self._counters["misses"] += 1
+            return None
+
+        # The bridge's filters: type, then a case-sensitive substring
+        wanted = {t.lower() for t in types} if types else None
+        logs = []
+        position = start
+        for entry in islice(self._entries, start - first, None):
+            if limit is not None and len(logs) >= limit:
+                break
+            position += 1
+            if wanted is not None and entry["type"] not in wanted:
+                continue
+            if filter_text and filter_text not in entry["message"]:
+                continue
+            logs.append(entry)
+        if position == self._end:
+            cursor = self._cursor
+        elif position > first:
+            cursor = make_cursor(position, self._entries[position - 1 - first]["message"])
+        else:
+            cursor = str(position)
+        self._counters["hits"] += 1
+        return {"logs": logs, "nextCursor": cursor, "total": self._end, "reset": False}
+
+    def _check(self, index: int, digest: int) -> bool:
+        """True if the buffered entry at `index` has the given hash; False if it is not buffered."""
+        first = self._start
+        if not first <= index < self._end:
+            return False
+        return fnv1a(self._entries[index - first]["message"]) == digest
+
+    def invalidate(self) -> None:
+        """Forget everything, e.g. after the console was cleared."""
+        self._entries.clear()
+        self._end = 0
+        self._cursor = "0"
+
+    def stats(self) -> Dict[str, Any]:
+        """Buffer size and hit counters, for connection_health."""
+        queries = self._counters["hits"] + self._counters["misses"]
+        return {
+            "enabled": self.supported,
+            "size": self.size,
+            "entries": len(self._entries),
+            "end": self._end,
+            **self._counters,
+            "hitRate": round(self._counters["hits"] / queries, 3) if queries else None,
+        }
+
+# Buffers by editor name, for the shared connection pools
+_console_buffers: Dict[str, ConsoleBuffer] = {}
+
+def get_console_buffer(editor: Optional[str] = None) -> ConsoleBuffer:
+    """Return the console buffer of an editor's pool, creating it on first use."""
+    pool = get_unity_pool(editor)
+    buffer = _console_buffers.get(pool.editor)
+    if buffer is None or buffer.bridge is not pool:
+        buffer = _console_buffers[pool.editor] = ConsoleBuffer(pool)
+    return buffer
@@ -0,0 +1,101 @@
+"""
+Running tool calls on several Unity editors.
+
+Every tool takes a `target_editor`: the name of the editor to address (see
+connection_pool.editor_endpoints), or "*" for every configured editor. With
+"*", read-only calls (the queries the bridge itself schedules as reads: gets,
+finds, searches, script reads, job status) run on all editors at once, and
+their replies are merged into one, keyed by editor name. Each editor has
+`config.fan_out_timeout` seconds to answer, so a closed or reloading editor
+delays the call by at most that and is reported as failed. Writes are never
+fanned out.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+from config import config
+from connection_pool import ALL_EDITORS, editor_names, get_unity_pool
+
+logger = logging.getLogger("unity-mcp-server")
+
+# Command types, and actions of any command type, that only read the editor's state (as in the
+# bridge's CommandScheduler)
+_READ_TYPES = {"ping", "job_status"}
+_READ_ACTIONS = {"get", "get_state", "get_active", "get_active_scene", "get_hierarchy", "find", "find_many",
+                 "search", "read"}
+
+def is_read(command_type: str, params: Optional[Dict[str, Any]] = None) -> bool:
+    """True if the command only reads the editor's state, so that it may run on every editor."""
+    if command_type in _READ_TYPES:
+        return True
+    return str((params or {}).get("action") or "").lower() in _READ_ACTIONS
+
+async def on_editors(
+    target_editor: Optional[str],
+    command_type: str,
+    params: Dict[str, Any],
+    run: Callable[[Optional[str]], Awaitable[Dict[str, Any]]],
+    merge: Optional[Callable[[Dict[str, Dict[str, Any]]], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Run a tool call on the editor it targets, or on every editor for "*".
+
+    Args:
+        target_editor: The tool's target_editor (None: config.default_editor).
+        command_type: The bridge command the call sends, to check that "*" only reads.
+        params: Its parameters.
+        run: Runs the call on one editor, given its name, and returns the reply.
+        merge: For "*", called with the replies of the editors that answered, by name;
+            returns data to add to the merged reply next to 'editors'.
+
+    Returns:
+        The editor's reply, or for "*" {'success', 'message', 'data': {'editors': {name:
+        reply}}}, where a failed editor's reply is {'success': False, 'message': error}
+        and each reply has the editor's 'project'.
+
+    Raises:
+        ValueError: If "*" targets a write, or target_editor names no configured editor.
+    """
+    if target_editor != ALL_EDITORS:
+        return await run(target_editor)
+    if not is_read(command_type, params):
+        raise ValueError(f"target_editor='*' only runs read-only commands; "
+                         f"'{params.get('action') or command_type}' changes the editor")
+    names = editor_names()
+    replies = await asyncio.gather(*(_run_on(name, run) for name in names))
+    editors = dict(zip(names, replies))
+    answered = {name: reply for name, reply in editors.items() if reply.get("success") is not False}
+    failed = len(editors) - len(answered)
+    data: Dict[str, Any] = {"editors": editors}
+    if merge is not None:
+        data.update(merge(answered))
+    return {
+        "success": failed == 0,
+        "message": f"Ran on {len(editors)} editors" + (f", {failed} failed." if failed else "."),
+        "data": data,
+    }
+
+async def _run_on(name: str, run: Callable[[Optional[str]], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """One editor's share of a fanned-out call; errors become a failed reply."""
+    try:
+        reply = await asyncio.wait_for(run(name), config.fan_out_timeout)
+    except asyncio.TimeoutError:
+        reply = {"success": False, "message": f"No reply within {config.fan_out_timeout:g} seconds"}
+    except Exception as e:
+        logger.debug(f"Call on Unity editor '{name}' failed: {str(e)}")
+        reply = {"success": False, "message": str(e)}
+    return {**reply, "project": get_unity_pool(name).project}
+
+def list_editors() -> Dict[str, Any]:
+    """Return each configured editor's endpoint, project and connection state, by name."""
+    editors = {}
+    for name in editor_names():
+        pool = get_unity_pool(name)
+        stats = pool.stats()
+        editors[name] = {
+            "endpoint": stats["endpoint"],
+            "project": stats["project"],
+            "connections": stats["size"],
+            "inFlight": stats["inFlight"],
+            "default": name == config.default_editor,
+        }
+    return editors
@@ -0,0 +1,80 @@
+"""
+Waiting for the bridge's jobs.
+
+Long editor operations (script recompiles, scene loads with `asJob`, asset
+imports with `asJob`, entering and leaving play mode) reply at once with a
+`jobId` in their data, and the bridge advances them on later editor ticks while
+it keeps answering other commands. The `job_status` command reports a job's
+status ('running', 'succeeded' or 'failed'), progress and result.
+
+Waiting polls job_status every `config.job_poll_interval` seconds. Script
+compilation and play mode changes usually reload the editor's scripts, which
+restarts the bridge: polls that fail to reach it are retried until the wait
+times out.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+from config import config
+from connection_pool import UnityConnectionPool, get_unity_pool
+from unity_connection import UnityCommandError
+
+logger = logging.getLogger("unity-mcp-server")
+
+RUNNING = "running"
+
+async def get_job(job_id: str, bridge: Optional[UnityConnectionPool] = None,
+                  timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Return a job as reported by the bridge: jobId, kind, status, progress, message, error, result, elapsed."""
+    bridge = bridge or get_unity_pool()
+    result = await bridge.send_command("job_status", {"jobId": job_id}, timeout=timeout, deadline=timeout)
+    return result["data"]
+
+async def wait_for_job(
+    job_id: str,
+    timeout: Optional[float] = None,
+    on_progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    bridge: Optional[UnityConnectionPool] = None,
+) -> Dict[str, Any]:
+    """Wait until a job finishes or `timeout` passes, and return its last reported state.
+
+    Args:
+        job_id: The 'jobId' from the reply of the command that started the job.
+        timeout: Seconds to wait (default: config.job_wait_timeout). The job is returned
+            still 'running' if it has not finished by then.
+        on_progress: Awaited with the job whenever its progress or message changes.
+        bridge: Pool to use (default: the shared pool).
+
+    Raises:
+        UnityCommandError: If the bridge does not know the job.
+        ConnectionError: If the bridge could not be reached before the timeout.
+    """
+    bridge = bridge or get_unity_pool()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + (timeout if timeout is not None else config.job_wait_timeout)
+    job: Optional[Dict[str, Any]] = None
+    reported = None
+    while True:
+        remaining = deadline - loop.time()
+        try:
+            # A poll never outlives the wait by much, even while the editor is busy reloading
+            job = await get_job(job_id, bridge, timeout=max(remaining, config.job_poll_interval))
+        except UnityCommandError:
+            raise
+        except Exception as e:
+            # The bridge restarts after a domain reload
+            logger.debug(f"Job {job_id} poll failed, retrying: {str(e)}")
+            if deadline - loop.time() <= 0:
+                if job is None:
+                    raise ConnectionError(f"Could not reach Unity while waiting for job {job_id}: {str(e)}")
+                return job
+        else:
+            if job.get("status") != RUNNING:
+                return job
+            if on_progress is not None and (job.get("progress"), job.get("message")) != reported:
+                reported = (job.get("progress"), job.get("message"))
+                await on_progress(job)
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return job
+        await asyncio.sleep(min(config.job_poll_interval, remaining))
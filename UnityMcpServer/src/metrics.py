@@ -0,0 +1,377 @@
+"""
+Per-command latency metrics for the Unity bridge connections.
+
+When `config.metrics` is on, every command sent by UnityConnection or
+AsyncUnityConnection records how long each phase took (serialize, send, wait for
+the first reply byte, receive, parse), the bytes sent and received, how long
+it waited in the bridge's command queue (part of "wait", as reported by the
+bridge) and whether it failed, aggregated by command type and action. Retries,
+reconnects and compressed frames (bytes before and after, CPU time) are
+counted as well. When it is off, connections get a shared no-op
+timer, so the instrumentation costs a few empty method calls per command.
+Sinks (see `add_sink`, used by command traces) are handed every finished
+timer, whether or not the metrics themselves are on.
+
+The figures are available as JSON (`snapshot`) or in the Prometheus text
+format (`prometheus_text`), and can be written to `config.metrics_dump_path`.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from config import config
+
+logger = logging.getLogger("unity-mcp-server")
+
+PHASES = ("serialize", "send", "wait", "receive", "parse")
+
+# Upper bounds (seconds) of the command duration histogram
+DURATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Durations kept per command for the percentiles in snapshots
+RECENT_SAMPLES = 1000
+
+CommandKey = Tuple[str, str]  # (command type, action or "")
+
+# Compressed frames by direction: "in" (replies) and "out" (commands)
+DIRECTIONS = ("in", "out")
+
+def command_key(command_type: str, params: Optional[Dict[str, Any]]) -> CommandKey:
+    action = params.get("action") if params else None
+    return command_type, action.lower() if isinstance(action, str) else ""
+
+class _NullTimer:
+    """Timer handed out while metrics are off; records nothing."""
+    __slots__ = ()
+
+    def serialized(self, size: int) -> None:
+        pass
+
+    def sent(self) -> None:
+        pass
+
+    def first_byte(self, at: Optional[float] = None) -> None:
+        pass
+
+    def received(self, size: int, at: Optional[float] = None) -> None:
+        pass
+
+    def queued(self, seconds: float) -> None:
+        pass
+
+    def finish(self, error: bool = False) -> None:
+        pass
+
+NULL_TIMER = _NullTimer()
+
+class CommandTimer:
+    """Timestamps of one command's phases, reported to the registry by finish()."""
+    __slots__ = ("registry", "key", "command_type", "params", "start", "serialized_at", "sent_at",
+                 "first_byte_at", "received_at", "bytes_out", "bytes_in", "queue_wait")
+
+    def __init__(self, registry: "CommandMetrics", command_type: str, params: Optional[Dict[str, Any]] = None):
+        self.registry = registry
+        self.key = command_key(command_type, params)
+        self.command_type = command_type
+        self.params = params
+        self.start = time.perf_counter()
+        self.serialized_at = self.sent_at = self.first_byte_at = self.received_at = 0.0
+        self.bytes_out = self.bytes_in = 0
+        self.queue_wait: Optional[float] = None
+
+    def serialized(self, size: int) -> None:
+        self.serialized_at = time.perf_counter()
+        self.bytes_out = size
+
+    def sent(self) -> None:
+        self.sent_at = time.perf_counter()
+
+    def first_byte(self, at: Optional[float] = None) -> None:
+        self.first_byte_at = at or time.perf_counter()
+
+    def received(self, size: int, at: Optional[float] = None) -> None:
+        self.received_at = at or time.perf_counter()
+        self.bytes_in = size
+
+    def queued(self, seconds: float) -> None:
+        self.queue_wait = seconds
+
+    def finish(self, error: bool = False) -> None:
+        self.registry.record(self, time.perf_counter(), error)
+
+# Called as sink(timer, end, error) with each finished command; `end` is a time.perf_counter() value
+TimerSink = Callable[[CommandTimer, float, bool], None]
+
+class _CommandStats:
+    """Aggregates for one (command type, action)."""
+    __slots__ = ("count", "errors", "retries", "bytes_out", "bytes_in", "duration_sum", "buckets",
+                 "phase_sum", "phase_max", "queued", "queue_wait_sum", "queue_wait_max", "recent")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.duration_sum = 0.0
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)
+        self.phase_sum = dict.fromkeys(PHASES, 0.0)
+        self.phase_max = dict.fromkeys(PHASES, 0.0)
+        self.queued = 0  # Successful commands whose reply reported a queue wait
+        self.queue_wait_sum = 0.0
+        self.queue_wait_max = 0.0
+        self.recent: Deque[float] = deque(maxlen=RECENT_SAMPLES)
+
+class _CompressionStats:
+    """Aggregates for the frames compressed in one direction."""
+    __slots__ = ("frames", "raw_bytes", "wire_bytes", "cpu_seconds")
+
+    def __init__(self):
+        self.frames = 0
+        self.raw_bytes = 0
+        self.wire_bytes = 0
+        self.cpu_seconds = 0.0
+
+class CommandMetrics:
+    """Process-wide registry of command metrics. Thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[CommandKey, _CommandStats] = {}
+        self._compression = {direction: _CompressionStats() for direction in DIRECTIONS}
+        self.reconnects = 0
+        self.since = time.time()
+        self._sinks: List[TimerSink] = []
+
+    def start(self, command_type: str, params: Optional[Dict[str, Any]] = None):
+        """Return a timer for one command, or the no-op timer if metrics are off and nothing else listens."""
+        if not config.metrics and not self._sinks:
+            return NULL_TIMER
+        return CommandTimer(self, command_type, params)
+
+    def add_sink(self, sink: "TimerSink") -> None:
+        """Call `sink(timer, end, error)` with every finished command, even while metrics are off.
+
+        Sinks run on the thread or event loop that sent the command and must not block.
+        """
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink: "TimerSink") -> None:
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    def _entry(self, key: CommandKey) -> _CommandStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _CommandStats()
+        return stats
+
+    def record(self, timer: CommandTimer, end: float, error: bool) -> None:
+        for sink in list(self._sinks):
+            try:
+                sink(timer, end, error)
+            except Exception as e:
+                logger.warning(f"Command timer sink failed: {str(e)}")
+        if not config.metrics:
+            return
+        duration = end - timer.start
+        # Phases whose end was not observed (e.g. streamed replies have no parse step) are left out
+        marks = (timer.start, timer.serialized_at, timer.sent_at, timer.first_byte_at, timer.received_at, end)
+        with self._lock:
+            stats = self._entry(timer.key)
+            stats.count += 1
+            stats.bytes_out += timer.bytes_out
+            stats.bytes_in += timer.bytes_in
+            if error:
+                stats.errors += 1
+                return
+            stats.duration_sum += duration
+            stats.buckets[_bucket(duration)] += 1
+            stats.recent.append(duration)
+            for phase, begin, finish in zip(PHASES, marks, marks[1:]):
+                if begin and finish:
+                    elapsed = finish - begin
+                    stats.phase_sum[phase] += elapsed
+                    if elapsed > stats.phase_max[phase]:
+                        stats.phase_max[phase] = elapsed
+            if timer.queue_wait is not None:
+                stats.queued += 1
+                stats.queue_wait_sum += timer.queue_wait
+                if timer.queue_wait > stats.queue_wait_max:
+                    stats.queue_wait_max = timer.queue_wait
+
+    def record_retry(self, command_type: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Count a command that had to be sent again."""
+        if config.metrics:
+            with self._lock:
+                self._entry(command_key(command_type, params)).retries += 1
+
+    def record_reconnect(self) -> None:
+        """Count a connection re-opened after the previous one failed."""
+        if config.metrics:
+            with self._lock:
+                self.reconnects += 1
+
+    def record_compression(self, direction: str, raw_bytes: int, wire_bytes: int, cpu_seconds: float) -> None:
+        """Count a frame body compressed ("out") or decompressed ("in"), and the CPU time it took."""
+        if config.metrics:
+            with self._lock:
+                stats = self._compression[direction]
+                stats.frames += 1
+                stats.raw_bytes += raw_bytes
+                stats.wire_bytes += wire_bytes
+                stats.cpu_seconds += cpu_seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._compression = {direction: _CompressionStats() for direction in DIRECTIONS}
+            self.reconnects = 0
+            self.since = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serializable dictionary, with times in milliseconds."""
+        with self._lock:
+            commands = []
+            for (command_type, action), stats in sorted(self._stats.items()):
+                ok = stats.count - stats.errors
+                recent = sorted(stats.recent)
+                commands.append({
+                    "command": command_type,
+                    "action": action or None,
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "bytesOut": stats.bytes_out,
+                    "bytesIn": stats.bytes_in,
+                    "meanMs": _ms(stats.duration_sum / ok) if ok else None,
+                    "p50Ms": _ms(_percentile(recent, 0.50)) if recent else None,
+                    "p99Ms": _ms(_percentile(recent, 0.99)) if recent else None,
+                    "phases": {
+                        phase: {"meanMs": _ms(stats.phase_sum[phase] / ok) if ok else None,
+                                "maxMs": _ms(stats.phase_max[phase])}
+                        for phase in PHASES
+                    },
+                    "queueWait": {"meanMs": _ms(stats.queue_wait_sum / stats.queued) if stats.queued else None,
+                                  "maxMs": _ms(stats.queue_wait_max)},
+                })
+            compression = {
+                direction: {
+                    "frames": stats.frames,
+                    "rawBytes": stats.raw_bytes,
+                    "wireBytes": stats.wire_bytes,
+                    "ratio": round(stats.raw_bytes / stats.wire_bytes, 2) if stats.wire_bytes else None,
+                    "cpuMs": _ms(stats.cpu_seconds),
+                }
+                for direction, stats in self._compression.items()
+            }
+            return {
+                "enabled": config.metrics,
+                "since": self.since,
+                "reconnects": self.reconnects,
+                "commands": commands,
+                "compression": compression,
+            }
+
+    def prometheus_text(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            items = sorted(self._stats.items())
+            family("unity_mcp_commands_total", "counter", "Commands sent to Unity.")
+            for key, stats in items:
+                lines.append(f"unity_mcp_commands_total{{{_labels(key)}}} {stats.count}")
+            family("unity_mcp_command_errors_total", "counter", "Commands that failed.")
+            for key, stats in items:
+                lines.append(f"unity_mcp_command_errors_total{{{_labels(key)}}} {stats.errors}")
+            family("unity_mcp_command_retries_total", "counter", "Commands sent again after a failure.")
+            for key, stats in items:
+                lines.append(f"unity_mcp_command_retries_total{{{_labels(key)}}} {stats.retries}")
+            family("unity_mcp_command_sent_bytes_total", "counter", "Bytes of commands sent to Unity.")
+            for key, stats in items:
+                lines.append(f"unity_mcp_command_sent_bytes_total{{{_labels(key)}}} {stats.bytes_out}")
+            family("unity_mcp_command_received_bytes_total", "counter", "Bytes of replies received from Unity.")
+            for key, stats in items:
+                lines.append(f"unity_mcp_command_received_bytes_total{{{_labels(key)}}} {stats.bytes_in}")
+            family("unity_mcp_command_phase_seconds_total", "counter",
+                   "Time spent in each phase of successful commands.")
+            for key, stats in items:
+                for phase in PHASES:
+                    lines.append(f"unity_mcp_command_phase_seconds_total{{{_labels(key)},phase=\"{phase}\"}} "
+                                 f"{stats.phase_sum[phase]:.6f}")
+            family("unity_mcp_command_queue_wait_seconds_total", "counter",
+                   "Time successful commands waited in the bridge's command queue.")
+            for key, stats in items:
+                lines.append(f"unity_mcp_command_queue_wait_seconds_total{{{_labels(key)}}} {stats.queue_wait_sum:.6f}")
+            family("unity_mcp_command_duration_seconds", "histogram", "Duration of successful commands.")
+            for key, stats in items:
+                labels = _labels(key)
+                cumulative = 0
+                for bound, count in zip(DURATION_BUCKETS + (float("inf"),), stats.buckets):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"unity_mcp_command_duration_seconds_bucket{{{labels},le=\"{le}\"}} {cumulative}")
+                lines.append(f"unity_mcp_command_duration_seconds_sum{{{labels}}} {stats.duration_sum:.6f}")
+                lines.append(f"unity_mcp_command_duration_seconds_count{{{labels}}} {cumulative}")
+            family("unity_mcp_reconnects_total", "counter", "Connections re-opened after a failure.")
+            lines.append(f"unity_mcp_reconnects_total {self.reconnects}")
+            compression = sorted(self._compression.items())
+            family("unity_mcp_compressed_frames_total", "counter", "Frame bodies compressed (out) or decompressed (in).")
+            for direction, stats in compression:
+                lines.append(f"unity_mcp_compressed_frames_total{{direction=\"{direction}\"}} {stats.frames}")
+            family("unity_mcp_compression_raw_bytes_total", "counter", "Uncompressed bytes of those frame bodies.")
+            for direction, stats in compression:
+                lines.append(f"unity_mcp_compression_raw_bytes_total{{direction=\"{direction}\"}} {stats.raw_bytes}")
+            family("unity_mcp_compression_wire_bytes_total", "counter", "Compressed bytes of those frame bodies.")
+            for direction, stats in compression:
+                lines.append(f"unity_mcp_compression_wire_bytes_total{{direction=\"{direction}\"}} {stats.wire_bytes}")
+            family("unity_mcp_compression_cpu_seconds_total", "counter", "CPU time spent compressing and decompressing.")
+            for direction, stats in compression:
+                lines.append(f"unity_mcp_compression_cpu_seconds_total{{direction=\"{direction}\"}} "
+                             f"{stats.cpu_seconds:.6f}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: Optional[str] = None, fmt: Optional[str] = None) -> str:
+        """Write the metrics to a file, replacing it atomically, and return its path."""
+        path = path or config.metrics_dump_path
+        fmt = fmt or config.metrics_dump_format
+        text = self.prometheus_text() if fmt == "prometheus" else json.dumps(self.snapshot(), indent=2)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+        return path
+
+def _bucket(duration: float) -> int:
+    for i, bound in enumerate(DURATION_BUCKETS):
+        if duration <= bound:
+            return i
+    return len(DURATION_BUCKETS)
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+def _labels(key: CommandKey) -> str:
+    command_type, action = key
+    return f"command=\"{_escape(command_type)}\",action=\"{_escape(action)}\""
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+# Registry shared by all connections
+_command_metrics = CommandMetrics()
+
+def get_command_metrics() -> CommandMetrics:
+    """Return the process-wide command metrics registry."""
+    return _command_metrics
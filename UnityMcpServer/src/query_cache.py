@@ -0,0 +1,183 @@
+"""
+Memoized replies to read-only queries.
+
+Queries such as manage_editor get_state, manage_scene get_active, script reads
+and GameObject finds keep returning the same answer until something changes the
+editor. Tools send commands through `QueryCache.send_command`, which keeps the
+replies to the queries listed in `_MEMOIZED` in an LRU of
+`config.query_cache_max_entries`, keyed by command and parameters. A reply is
+served again while two versions are unchanged:
+
+- the cache's generation, bumped by every other command sent through the
+  connection pool except the read-only ones in `_READ_ONLY` (the server's own
+  writes), and
+- the editor state version the bridge puts in each reply, which the editor bumps
+  when the hierarchy, the assets, the open scenes, play mode or compilation
+  change, edits made by hand included.
+
+The bridge's version is only known as of the latest reply, so once it is older
+than `config.query_cache_ttl` seconds a raw ping, answered without waiting for
+the editor's main thread, checks it again. With bridges that do not report a
+version, replies are served for `config.query_cache_ttl` seconds. Tools pass
+`fresh=True` to skip the cache; the new reply replaces the cached one.
+"""
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from config import config
+from connection_pool import UnityConnectionPool, get_unity_pool
+from unity_connection import UnityCommandError
+
+logger = logging.getLogger("unity-mcp-server")
+
+# Queries whose replies are memoized, as (command type, action)
+_MEMOIZED = {
+    ("manage_editor", "get_state"),
+    ("manage_scene", "get_active"),
+    ("manage_scene", "get_active_scene"),
+    ("manage_gameobject", "find"),
+    ("manage_gameobject", "find_many"),
+    ("manage_script", "read"),
+}
+
+# Other commands that never change the editor's state; None matches every action.
+# get_hierarchy and asset searches have caches of their own.
+_READ_ONLY = {
+    ("ping", None),
+    ("read_console", None),
+    ("job_status", None),
+    ("manage_scene", "get_hierarchy"),
+    ("manage_asset", "search"),
+}
+
+def memoized(command_type: str, params: Dict[str, Any]) -> bool:
+    """True if replies to this command are memoized."""
+    return (command_type, str(params.get("action") or "").lower()) in _MEMOIZED
+
+class _Entry:
+    """One memoized reply."""
+    __slots__ = ("result", "generation", "version", "stored_at")
+
+    def __init__(self, result: Dict[str, Any], generation: int, version: Optional[int], stored_at: float):
+        self.result = result
+        self.generation = generation
+        self.version = version
+        self.stored_at = stored_at
+
+class QueryCache:
+    """Memoized query replies for one Unity endpoint."""
+
+    def __init__(self, bridge: UnityConnectionPool, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+        self.bridge = bridge
+        self.ttl = ttl if ttl is not None else config.query_cache_ttl
+        self.max_entries = max_entries if max_entries is not None else config.query_cache_max_entries
+        self.generation = 0  # Bumped by every write sent through the pool
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._counters = {"hits": 0, "misses": 0, "revalidations": 0, "discarded": 0,
+                          "evictions": 0, "invalidations": 0}
+
+    async def send_command(self, command_type: str, params: Dict[str, Any], fresh: bool = False) -> Dict[str, Any]:
+        """Send a command through the pool, answering memoized queries from the cache unless `fresh`."""
+        if not config.query_cache or not memoized(command_type, params):
+            return await self.bridge.send_command(command_type, params)
+        key = json.dumps([command_type, params], sort_keys=True)
+        if not fresh:
+            cached = await self._lookup(key)
+            if cached is not None:
+                return cached
+        generation, (version, _) = self.generation, self.bridge.state_version
+        result = await self.bridge.send_command(command_type, params)
+        self._store(key, result, generation, version)
+        return result
+
+    async def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        # Checking may wait for a ping, during which the entry can be evicted or invalidated
+        if entry is not None and await self._current(entry) and self._entries.get(key) is entry:
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry.result
+        if entry is not None and self._entries.get(key) is entry:
+            self._entries.pop(key)
+        self._counters["misses"] += 1
+        return None
+
+    async def _current(self, entry: _Entry) -> bool:
+        return await self.unchanged_since(entry.generation, entry.version, entry.stored_at)
+
+    async def unchanged_since(self, generation: int, version: Optional[int], stored_at: float) -> bool:
+        """True if neither a write nor, as far as the bridge's state version tells, the editor changed
+        since the cache's generation and the bridge's version were `generation` and `version`."""
+        if generation != self.generation:
+            return False
+        current, reported_at = self.bridge.state_version
+        if current is None:
+            # The bridge does not report versions
+            return version is None and time.monotonic() - stored_at <= self.ttl
+        if time.monotonic() - reported_at > self.ttl:
+            # The reply to a raw ping carries the current version
+            self._counters["revalidations"] += 1
+            try:
+                await self.bridge.send_command("ping")
+            except Exception as e:
+                logger.debug(f"Query cache revalidation failed: {str(e)}")
+                return False
+            current = self.bridge.state_version[0]
+        return generation == self.generation and version == current
+
+    def _store(self, key: str, result: Dict[str, Any], generation: int, version: Optional[int]) -> None:
+        """Keep a reply, unless a write or an editor change happened while it was on its way."""
+        if generation != self.generation or self.bridge.state_version[0] != version:
+            self._counters["discarded"] += 1
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+        self._entries[key] = _Entry(result, generation, version, time.monotonic())
+
+    def observe(self, command_type: str, params: Dict[str, Any], result: Optional[Dict[str, Any]],
+                error: Optional[BaseException]) -> None:
+        """Connection pool observer: writes, and lost connections, drop every memoized reply."""
+        action = str(params.get("action") or "").lower()
+        if error is None or isinstance(error, UnityCommandError):
+            if (command_type, None) in _READ_ONLY or (command_type, action) in _READ_ONLY \
+                    or (command_type, action) in _MEMOIZED:
+                return
+        # A failed write may have been partly applied, and a lost connection may mean a restarted
+        # editor, whose state version starts over
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop every memoized reply."""
+        self.generation += 1
+        if self._entries:
+            self._counters["invalidations"] += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss counters."""
+        lookups = self._counters["hits"] + self._counters["misses"]
+        return {
+            "enabled": config.query_cache,
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "ttl": self.ttl,
+            "stateVersion": self.bridge.state_version[0],
+            **self._counters,
+            "hitRate": round(self._counters["hits"] / lookups, 3) if lookups else None,
+        }
+
+# Caches by editor name, for the shared connection pools
+_query_caches: Dict[str, QueryCache] = {}
+
+def get_query_cache(editor: Optional[str] = None) -> QueryCache:
+    """Return the query cache of an editor's pool, creating it and its write observer on first use."""
+    pool = get_unity_pool(editor)
+    cache = _query_caches.get(pool.editor)
+    if cache is None or cache.bridge is not pool:
+        cache = _query_caches[pool.editor] = QueryCache(pool)
+        pool.add_observer(cache.observe)
+    return cache
@@ -0,0 +1,446 @@
+"""
+Client-side cache of the active scene's GameObjects.
+
+Agents look up the same objects again and again while nothing in the scene
+changes. The cache loads the scene graph once (a paged get_hierarchy), keyed by
+instance ID, answers manage_gameobject finds by name, path, tag, layer, ID,
+component and parent locally, and keeps recent get_hierarchy replies.
+
+Writes that pass through the connection pool keep it current: GameObject
+create, modify and delete are applied to the cached graph, while scene
+load/create, play mode and any other write drop it. Scene loads and play mode
+changes run as jobs drop it again once job_status reports them finished.
+Edits made by hand in the editor are not seen, so nothing is served once the
+graph is older than `config.scene_cache_ttl`; the lookup goes to Unity and the
+graph is reloaded in the background.
+
+The graph covers the active scene only, while the bridge searches every loaded
+scene, so nothing is cached while several scenes are loaded. Names shared by
+several objects are not resolved locally either: GameObject.Find's pick among
+them is not known here.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from config import config
+from connection_pool import UnityConnectionPool, get_unity_pool
+
+logger = logging.getLogger("unity-mcp-server")
+
+# Commands that never change the scene graph, as (command type, action); None matches every action
+_READ_ONLY = {
+    ("ping", None),
+    ("read_console", None),
+    ("manage_scene", "get_hierarchy"),
+    ("manage_scene", "get_active"),
+    ("manage_scene", "get_active_scene"),
+    ("manage_scene", "save"),
+    ("manage_gameobject", "find"),
+    ("manage_gameobject", "find_many"),
+    ("manage_editor", "get_state"),
+    ("manage_editor", "add_tag"),
+    ("manage_editor", "add_layer"),
+    ("manage_script", "read"),
+    ("manage_asset", "search"),
+}
+
+# Jobs that replace the scene graph when they finish
+_SCENE_JOBS = {"scene_load", "play", "stop"}
+
+# Hierarchy fields needed to answer every find search method
+_GRAPH_FIELDS = ["name", "instanceId", "parentId", "active", "tag", "layer", "componentTypes"]
+
+class _Node:
+    """One cached GameObject."""
+    __slots__ = ("instance_id", "name", "parent_id", "active", "tag", "layer", "component_types")
+
+    def __init__(self, instance_id: int, name: str, parent_id: Optional[int], active: bool,
+                 tag: str, layer: str, component_types: Optional[List[str]]):
+        self.instance_id = instance_id
+        self.name = name
+        self.parent_id = parent_id
+        self.active = active
+        self.tag = tag
+        self.layer = layer
+        # Component type names including base types; None when unknown after a patch
+        self.component_types = component_types
+
+class SceneCache:
+    """Scene graph and get_hierarchy replies for one Unity endpoint."""
+
+    def __init__(self, bridge: UnityConnectionPool, ttl: Optional[float] = None, max_nodes: Optional[int] = None):
+        self.bridge = bridge
+        self.ttl = ttl if ttl is not None else config.scene_cache_ttl
+        self.max_nodes = max_nodes if max_nodes is not None else config.scene_cache_max_nodes
+        self.generation = 0  # Bumped by every write, so replies and refreshes that raced one are dropped
+        self._nodes: Optional[Dict[int, _Node]] = None
+        self._children: Dict[Optional[int], List[int]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._loaded_at = 0.0
+        self._retry_at = 0.0
+        self._too_large = False
+        self._multi_scene = False
+        self._refresh_task: Optional[asyncio.Task] = None
+        # get_hierarchy replies: key -> (result, generation, stored at, node count)
+        self._responses: "OrderedDict[str, Tuple[Dict[str, Any], int, float, int]]" = OrderedDict()
+        self._response_nodes = 0
+        self._finished_jobs: set = set()  # Scene jobs already seen finished
+        self._counters = {"hits": 0, "misses": 0, "refreshes": 0, "refreshFailures": 0,
+                          "discardedRefreshes": 0, "patches": 0, "invalidations": 0}
+
+    @property
+    def fresh(self) -> bool:
+        """True if the cached graph can be trusted."""
+        return self._nodes is not None and time.monotonic() - self._loaded_at <= self.ttl
+
+    # --- Lookups ---
+
+    def find(self, search_method: Optional[str], target: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Answer a manage_gameobject find like the bridge would, or return None to ask Unity.
+
+        A stale graph starts a background reload. Searches that find nothing also
+        go to Unity, which reports the error.
+        """
+        if not self.fresh:
+            self._counters["misses"] += 1
+            self._schedule_refresh()
+            return None
+        matches = self._match((search_method or "by_name").lower(), target)
+        if not matches:
+            self._counters["misses"] += 1
+            return None
+        self._counters["hits"] += 1
+        if len(matches) == 1:
+            return {"message": "GameObject found.",
+                    "data": {"name": matches[0].name, "instanceId": matches[0].instance_id}}
+        return {"message": f"{len(matches)} GameObjects found.",
+                "data": [{"name": node.name, "instanceId": node.instance_id} for node in matches]}
+
+    def _match(self, method: str, target: Optional[str]) -> Optional[List[_Node]]:
+        nodes = self._nodes
+        if method == "by_all":
+            return [node for node in nodes.values() if self._active_in_hierarchy(node)]
+        if not target:
+            return None
+        if method in ("by_name", "by_path"):
+            node = self._find_one(target)
+            return [node] if node else []
+        if method == "by_id":
+            try:
+                node = nodes.get(int(target))
+            except ValueError:
+                return None
+            return [node] if node else []
+        if method == "by_tag":
+            return [node for node in nodes.values() if node.tag == target and self._active_in_hierarchy(node)]
+        if method == "by_layer":
+            return [node for node in nodes.values() if node.layer == target and self._active_in_hierarchy(node)]
+        if method == "by_component":
+            type_name = target.rsplit(".", 1)[-1]
+            if any(node.component_types is None for node in nodes.values()):
+                return None
+            return [node for node in nodes.values()
+                    if type_name in node.component_types and self._active_in_hierarchy(node)]
+        if method == "by_parent":
+            parent = self._find_one(target)
+            if parent is None:
+                return []
+            return [nodes[child] for child in self._children.get(parent.instance_id, [])]
+        return None
+
+    def _find_one(self, name_or_path: str) -> Optional[_Node]:
+        """Resolve a target like GameObject.Find: active objects only, '/' separates a path.
+
+        Returns None unless exactly one object matches.
+        """
+        parts = name_or_path.strip("/").split("/")
+        rooted = name_or_path.startswith("/")
+        found = None
+        for instance_id in self._by_name.get(parts[-1], []):
+            node = self._nodes[instance_id]
+            if not self._active_in_hierarchy(node):
+                continue
+            ancestor = node
+            for name in reversed(parts[:-1]):
+                ancestor = self._nodes.get(ancestor.parent_id) if ancestor.parent_id is not None else None
+                if ancestor is None or ancestor.name != name:
+                    break
+            else:
+                if not rooted or ancestor.parent_id is None:
+                    if found is not None:
+                        return None
+                    found = node
+        return found
+
+    def _active_in_hierarchy(self, node: _Node) -> bool:
+        while node is not None:
+            if not node.active:
+                return False
+            node = self._nodes.get(node.parent_id) if node.parent_id is not None else None
+        return True
+
+    # --- get_hierarchy replies ---
+
+    def get_response(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a cached get_hierarchy reply for these parameters, if still valid."""
+        key = json.dumps(params, sort_keys=True)
+        entry = self._responses.get(key)
+        if entry is None or entry[1] != self.generation or time.monotonic() - entry[2] > self.ttl:
+            self._counters["misses"] += 1
+            return None
+        self._responses.move_to_end(key)
+        self._counters["hits"] += 1
+        return entry[0]
+
+    def store_response(self, params: Dict[str, Any], result: Dict[str, Any], generation: int) -> None:
+        """Keep a get_hierarchy reply, unless a write happened since `generation` was read."""
+        if generation != self.generation:
+            return
+        size = _count_nodes(result.get("data"))
+        if size > self.max_nodes:
+            return
+        key = json.dumps(params, sort_keys=True)
+        self._pop_response(key)
+        while self._responses and (self._response_nodes + size > self.max_nodes
+                                   or len(self._responses) >= config.scene_cache_max_responses):
+            self._pop_response(next(iter(self._responses)))
+        self._responses[key] = (result, generation, time.monotonic(), size)
+        self._response_nodes += size
+
+    def _pop_response(self, key: str) -> None:
+        entry = self._responses.pop(key, None)
+        if entry is not None:
+            self._response_nodes -= entry[3]
+
+    # --- Keeping the graph current ---
+
+    def observe(self, command_type: str, params: Dict[str, Any], result: Optional[Dict[str, Any]],
+                error: Optional[BaseException]) -> None:
+        """Connection pool observer: patch or drop the cache after writes."""
+        action = str(params.get("action") or "").lower()
+        if command_type == "job_status":
+            if not self._scene_job_finished(result):
+                return
+        elif (command_type, None) in _READ_ONLY or (command_type, action) in _READ_ONLY:
+            return
+        self.generation += 1
+        self._responses.clear()
+        self._response_nodes = 0
+        if self._nodes is None:
+            return
+        # A failed write may have been partly applied
+        if error is None and command_type == "manage_gameobject" and self._patch(action, params, result):
+            self._counters["patches"] += 1
+            return
+        self.invalidate()
+
+    def _scene_job_finished(self, result: Optional[Dict[str, Any]]) -> bool:
+        """True if a job_status reply shows a scene load or play mode change finishing for the first time."""
+        data = (result or {}).get("data") or {}
+        finished = False
+        for job in data.get("jobs", [data]):
+            if job.get("kind") in _SCENE_JOBS and job.get("status") not in (None, "running") \
+                    and job.get("jobId") not in self._finished_jobs:
+                self._finished_jobs.add(job.get("jobId"))
+                finished = True
+        return finished
+
+    def invalidate(self) -> None:
+        """Drop the cached graph; the next lookup reloads it."""
+        if self._nodes is not None:
+            self._counters["invalidations"] += 1
+        self._nodes = None
+        self._children = {}
+        self._by_name = {}
+
+    def _patch(self, action: str, params: Dict[str, Any], result: Optional[Dict[str, Any]]) -> bool:
+        """Apply a GameObject write to the graph. Returns False if its effect is not certain.
+
+        The written object and its parent are taken from the reply's instanceId and
+        parentId; replies without them are applied only if the names in the
+        parameters resolve to exactly one cached object.
+        """
+        data = (result or {}).get("data") or {}
+        if action == "create":
+            if data.get("instanceId") is None or len(self._nodes) >= self.max_nodes:
+                return False
+            known, parent_id = self._written_parent(params, data, None)
+            if not known:
+                return False
+            node = _Node(data["instanceId"], data.get("name", ""), parent_id, params.get("setActive", True),
+                         params.get("tag") or "Untagged", params.get("layer") or "Default", None)
+            self._add(node)
+            return True
+        if action == "set_transforms":
+            # Transforms are not part of the graph
+            return True
+
+        if data.get("instanceId") is not None:
+            node = self._nodes.get(data["instanceId"])
+        else:
+            node = self._find_one(params["target"]) if params.get("target") else None
+        if node is None:
+            return False
+        if action == "delete":
+            self._remove(node)
+            return True
+        if action != "modify":
+            return False
+        known, parent_id = self._written_parent(params, data, node.parent_id)
+        if not known:
+            return False
+        new_parent = self._nodes[parent_id] if parent_id is not None else None
+        if new_parent is not None and self._is_descendant(new_parent, node):
+            return False
+        name = data.get("name") or params.get("name")
+        if name and name != node.name:
+            self._by_name[node.name].remove(node.instance_id)
+            node.name = name
+            self._by_name.setdefault(node.name, []).append(node.instance_id)
+        if params.get("tag"):
+            node.tag = params["tag"]
+        if params.get("layer"):
+            node.layer = params["layer"]
+        if "setActive" in params:
+            node.active = bool(params["setActive"])
+        if params.get("componentsToAdd") or params.get("componentsToRemove"):
+            node.component_types = None
+        if parent_id != node.parent_id:
+            self._children[node.parent_id].remove(node.instance_id)
+            node.parent_id = parent_id
+            self._children.setdefault(node.parent_id, []).append(node.instance_id)
+        return True
+
+    def _written_parent(self, params: Dict[str, Any], data: Dict[str, Any],
+                        current: Optional[int]) -> Tuple[bool, Optional[int]]:
+        """Return (known, parent ID) of an object after a create or modify, from the reply or else the parameters."""
+        if "parentId" in data:
+            parent_id = data["parentId"]
+            return parent_id is None or parent_id in self._nodes, parent_id
+        if not params.get("parent"):
+            return True, current
+        parent = self._find_one(params["parent"])
+        return parent is not None, parent.instance_id if parent else None
+
+    def _is_descendant(self, node: _Node, ancestor: _Node) -> bool:
+        while node is not None:
+            if node is ancestor:
+                return True
+            node = self._nodes.get(node.parent_id) if node.parent_id is not None else None
+        return False
+
+    def _add(self, node: _Node) -> None:
+        self._nodes[node.instance_id] = node
+        self._children.setdefault(node.parent_id, []).append(node.instance_id)
+        self._by_name.setdefault(node.name, []).append(node.instance_id)
+
+    def _remove(self, node: _Node) -> None:
+        """Remove an object and everything under it."""
+        self._children[node.parent_id].remove(node.instance_id)
+        stack = [node.instance_id]
+        while stack:
+            removed = self._nodes.pop(stack.pop())
+            self._by_name[removed.name].remove(removed.instance_id)
+            stack.extend(self._children.pop(removed.instance_id, []))
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        if time.monotonic() < self._retry_at:
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(self.refresh())
+
+    async def refresh(self) -> bool:
+        """Reload the scene graph from Unity.
+
+        Returns False if the reload failed, the scene has more than max_nodes
+        objects, several scenes are loaded, or a write raced it; a later lookup
+        then tries again.
+        """
+        # Imported here because the tools package imports this module
+        from tools.manage_scene import iter_hierarchy_pages
+
+        generation = self.generation
+        nodes: Dict[int, _Node] = {}
+        try:
+            async for page in iter_hierarchy_pages(page_size=config.scene_cache_page_size, fields=_GRAPH_FIELDS,
+                                                   bridge=self.bridge):
+                if page.get("sceneCount", 1) > 1:
+                    # Finds would miss the other scenes' objects
+                    logger.info(f"{page['sceneCount']} scenes are loaded; not caching the scene graph")
+                    self._multi_scene = True
+                    self._retry_at = time.monotonic() + self.ttl
+                    self.invalidate()
+                    return False
+                for item in page.get("items", []):
+                    if len(nodes) >= self.max_nodes:
+                        logger.info(f"Scene has more than {self.max_nodes} objects; not caching it")
+                        self._too_large = True
+                        self._retry_at = time.monotonic() + self.ttl
+                        return False
+                    nodes[item["instanceId"]] = _Node(
+                        item["instanceId"], item["name"], item.get("parentId"), item["active"],
+                        item["tag"], item["layer"], item["componentTypes"])
+        except Exception as e:
+            logger.warning(f"Scene cache refresh failed: {str(e)}")
+            self._counters["refreshFailures"] += 1
+            self._retry_at = time.monotonic() + self.ttl
+            return False
+        if generation != self.generation:
+            self._counters["discardedRefreshes"] += 1
+            return False
+
+        self._nodes = {}
+        self._children = {}
+        self._by_name = {}
+        for node in nodes.values():
+            self._add(node)
+        self._loaded_at = time.monotonic()
+        self._retry_at = 0.0
+        self._too_large = False
+        self._multi_scene = False
+        self._counters["refreshes"] += 1
+        logger.debug(f"Scene cache loaded {len(nodes)} objects")
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size, freshness and hit/miss counters."""
+        lookups = self._counters["hits"] + self._counters["misses"]
+        return {
+            "enabled": config.scene_cache,
+            "fresh": self.fresh,
+            "nodes": len(self._nodes) if self._nodes is not None else 0,
+            "maxNodes": self.max_nodes,
+            "tooLarge": self._too_large,
+            "multiScene": self._multi_scene,
+            "ageSeconds": round(time.monotonic() - self._loaded_at, 3) if self._nodes is not None else None,
+            "ttl": self.ttl,
+            "cachedResponses": len(self._responses),
+            **self._counters,
+            "hitRate": round(self._counters["hits"] / lookups, 3) if lookups else None,
+        }
+
+def _count_nodes(data: Any) -> int:
+    """Count the nodes in a get_hierarchy reply (paged or nested)."""
+    if isinstance(data, dict):
+        if "items" in data:
+            return len(data["items"])
+        return 1 + _count_nodes(data.get("children"))
+    if isinstance(data, list):
+        return sum(_count_nodes(node) for node in data)
+    return 0
+
+# Caches by editor name, for the shared connection pools
+_scene_caches: Dict[str, SceneCache] = {}
+
+def get_scene_cache(editor: Optional[str] = None) -> SceneCache:
+    """Return the scene cache of an editor's pool, creating it and its write observer on first use."""
+    pool = get_unity_pool(editor)
+    cache = _scene_caches.get(pool.editor)
+    if cache is None or cache.bridge is not pool:
+        cache = _scene_caches[pool.editor] = SceneCache(pool)
+        pool.add_observer(cache.observe)
+    return cache
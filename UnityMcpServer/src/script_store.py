@@ -0,0 +1,227 @@
+"""
+Content hashes of the C# scripts the server has read or written.
+
+manage_script keeps the text of every script it read, created or updated,
+keyed by asset path, with the SHA-256 of its UTF-8 bytes, the hash the bridge
+reports in its replies. With it:
+
+- an update to the text the script already has is not sent at all, as long as
+  no write went through the connection pool and the editor's state version did
+  not change since that text was seen (see QueryCache.unchanged_since); the
+  bridge itself also leaves an unchanged script alone, so neither path imports
+  or recompiles anything,
+- other updates to a known script are sent as a unified diff against the known
+  text, with its hash as `baseHash` and the new text's hash as `hash`, when the
+  diff is at most `config.script_patch_ratio` of the new text's length. The
+  bridge refuses a patch whose base no longer matches the file, and the update
+  is sent again with the full contents, and
+- reads send the known hash as `ifNoneMatch`; the bridge answers `notModified`
+  without the contents when the file still has that hash, and the reply is
+  completed from the kept text.
+
+Texts are kept up to `config.script_store_max_bytes` in total; the least
+recently used are dropped.
+"""
+import difflib
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+from config import config
+from query_cache import QueryCache, get_query_cache
+from unity_connection import UnityCommandError
+
+logger = logging.getLogger("unity-mcp-server")
+
+def content_hash(contents: str) -> str:
+    """Lowercase hex SHA-256 of the UTF-8 bytes of a script's text, as the bridge computes it."""
+    return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+def script_path(name: str, path: Optional[str] = None) -> str:
+    """The asset path the bridge gives a script, from the tool's name and folder."""
+    folder = (path or "Scripts").replace("\\", "/").strip("/")
+    if folder.lower().startswith("assets/"):
+        folder = folder[len("assets/"):].lstrip("/")
+    return f"Assets/{folder or 'Scripts'}/{name}.cs"
+
+def _lines(text: str) -> List[str]:
+    """Split after each newline, keeping line endings (as the bridge's UnifiedDiff does)."""
+    lines = text.split("\n")
+    return [line + "\n" for line in lines[:-1]] + ([lines[-1]] if lines[-1] else [])
+
+_HUNK_START = re.compile(r"([-+])(\d+)")
+
+def _shift_hunk(header: str, offset: int) -> str:
+    """Move the line numbers of a hunk header ("@@ -1,2 +1,3 @@") down by `offset` lines."""
+    return _HUNK_START.sub(lambda m: f"{m.group(1)}{int(m.group(2)) + offset}", header, count=2)
+
+def make_patch(old: str, new: str, context: int = 3) -> str:
+    """A unified diff from `old` to `new`; empty if they are equal."""
+    a, b = _lines(old), _lines(new)
+    # Only the lines between the common head and tail (and their context) are diffed, as edits
+    # are usually local and difflib's cost grows with the length of the text
+    head, limit = 0, min(len(a), len(b))
+    while head < limit and a[head] == b[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+    start, trim = max(0, head - context), max(0, tail - context)
+    patch = []
+    for line in difflib.unified_diff(a[start:len(a) - trim], b[start:len(b) - trim], "a", "b", n=context):
+        patch.append(_shift_hunk(line, start) if line.startswith("@@") and start else line)
+        if not line.endswith("\n"):
+            patch.append("\n\\ No newline at end of file\n")
+    return "".join(patch)
+
+class _Script:
+    """The known text of one script."""
+    __slots__ = ("contents", "hash", "generation", "version", "stored_at")
+
+    def __init__(self, contents: str, hash: str, generation: int, version: Optional[int], stored_at: float):
+        self.contents = contents
+        self.hash = hash
+        self.generation = generation
+        self.version = version
+        self.stored_at = stored_at
+
+class ScriptStore:
+    """Known script texts for one Unity endpoint, sending manage_script commands through its query cache."""
+
+    def __init__(self, cache: QueryCache, max_bytes: Optional[int] = None, patch_ratio: Optional[float] = None):
+        self.cache = cache
+        self.max_bytes = max_bytes if max_bytes is not None else config.script_store_max_bytes
+        self.patch_ratio = patch_ratio if patch_ratio is not None else config.script_patch_ratio
+        self._scripts: "OrderedDict[str, _Script]" = OrderedDict()
+        self._bytes = 0
+        self._counters = {"skipped": 0, "patched": 0, "fullUpdates": 0, "patchFallbacks": 0,
+                          "notModified": 0, "fullReads": 0, "bytesSaved": 0, "evictions": 0}
+
+    async def send_command(self, params: Dict[str, Any], fresh: bool = False) -> Dict[str, Any]:
+        """Send a manage_script command, using the known texts for reads and updates."""
+        action = str(params.get("action") or "").lower()
+        if not config.script_hashes or not params.get("name"):
+            return await self.cache.send_command("manage_script", params, fresh=fresh)
+        path = script_path(params["name"], params.get("path"))
+        if action == "read":
+            return await self._read(path, params, fresh)
+        if action == "update" and params.get("contents"):
+            return await self._update(path, params)
+        if action == "delete":
+            self.forget(path)
+        result = await self.cache.send_command("manage_script", params, fresh=fresh)
+        if action == "create" and params.get("contents"):
+            self._record(path, params["contents"], result)
+        return result
+
+    async def _read(self, path: str, params: Dict[str, Any], fresh: bool) -> Dict[str, Any]:
+        known = self._scripts.get(path)
+        if "ifNoneMatch" in params or known is None:
+            # A caller's own hash: a notModified reply is passed on as it is
+            sent = params
+        else:
+            sent = {**params, "ifNoneMatch": known.hash}
+        generation, version = self.cache.generation, self.cache.bridge.state_version[0]
+        result = await self.cache.send_command("manage_script", sent, fresh=fresh)
+        data = result.get("data")
+        if not isinstance(data, dict):
+            return result
+        if data.get("notModified"):
+            self._counters["notModified"] += 1
+            if sent is params:
+                return result
+            self._scripts.move_to_end(path)
+            self._counters["bytesSaved"] += len(known.contents)
+            # Replies may be memoized, so the contents go into a copy
+            completed = {key: value for key, value in data.items() if key != "notModified"}
+            return {**result, "data": {**completed, "contents": known.contents}}
+        if isinstance(data.get("contents"), str):
+            self._counters["fullReads"] += 1
+            self._store(data.get("path") or path, data["contents"], data.get("hash"), generation, version)
+        return result
+
+    async def _update(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        contents = params["contents"]
+        digest = content_hash(contents)
+        known = self._scripts.get(path)
+        if known is not None and known.hash == digest \
+                and await self.cache.unchanged_since(known.generation, known.version, known.stored_at):
+            self._scripts.move_to_end(path)
+            self._counters["skipped"] += 1
+            self._counters["bytesSaved"] += len(contents)
+            return {"message": f"Script '{params['name']}.cs' is unchanged; nothing was sent to Unity.",
+                    "data": {"path": path, "hash": digest, "unchanged": True}}
+        if known is not None:
+            patch = make_patch(known.contents, contents)
+            if len(patch) <= self.patch_ratio * len(contents):
+                patched = {k: v for k, v in params.items() if k != "contents"}
+                patched.update(patch=patch, baseHash=known.hash, hash=digest)
+                try:
+                    result = await self.cache.send_command("manage_script", patched)
+                except UnityCommandError as e:
+                    # The script changed since it was seen; the full contents follow
+                    logger.debug(f"Script patch for '{path}' refused, sending the full contents: {str(e)}")
+                    self._counters["patchFallbacks"] += 1
+                    self.forget(path)
+                else:
+                    self._counters["patched"] += 1
+                    self._counters["bytesSaved"] += len(contents) - len(patch)
+                    self._record(path, contents, result)
+                    return result
+        self._counters["fullUpdates"] += 1
+        result = await self.cache.send_command("manage_script", params)
+        self._record(path, contents, result)
+        return result
+
+    def _record(self, path: str, contents: str, result: Dict[str, Any]) -> None:
+        """Keep the text the server just wrote; the pool's observer has already counted the write."""
+        data = result.get("data")
+        data = data if isinstance(data, dict) else {}
+        self._store(data.get("path") or path, contents, data.get("hash"), self.cache.generation,
+                    self.cache.bridge.state_version[0])
+
+    def _store(self, path: str, contents: str, hash: Optional[str], generation: int, version: Optional[int]) -> None:
+        self.forget(path)
+        size = len(contents)
+        if size > self.max_bytes:
+            return
+        while self._scripts and self._bytes + size > self.max_bytes:
+            _, dropped = self._scripts.popitem(last=False)
+            self._bytes -= len(dropped.contents)
+            self._counters["evictions"] += 1
+        self._scripts[path] = _Script(contents, hash or content_hash(contents), generation, version, time.monotonic())
+        self._bytes += size
+
+    def forget(self, path: str) -> None:
+        """Drop the known text of a script."""
+        dropped = self._scripts.pop(path, None)
+        if dropped is not None:
+            self._bytes -= len(dropped.contents)
+
+    def clear(self) -> None:
+        self._scripts.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of known scripts and the update/read counters."""
+        return {
+            "enabled": config.script_hashes,
+            "scripts": len(self._scripts),
+            "bytes": self._bytes,
+            "maxBytes": self.max_bytes,
+            "patchRatio": self.patch_ratio,
+            **self._counters,
+        }
+
+# Stores by editor name, for the shared connection pools
+_script_stores: Dict[str, ScriptStore] = {}
+
+def get_script_store(editor: Optional[str] = None) -> ScriptStore:
+    """Return the script store of an editor's query cache, creating it on first use."""
+    cache = get_query_cache(editor)
+    store = _script_stores.get(cache.bridge.editor)
+    if store is None or store.cache is not cache:
+        store = _script_stores[cache.bridge.editor] = ScriptStore(cache)
+    return store
@@ -2,9 +2,18 @@ from mcp.server.fastmcp import FastMCP, Context
 import logging
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, List
+import asyncio
+import json
+from typing import AsyncIterator, Dict, Any, List, Optional
 from config import config
-from unity_connection import get_unity_connection, UnityConnection
+from connection_pool import get_unity_pool, close_unity_pool, editor_names, get_connection_health, UnityConnectionPool
+from metrics import get_command_metrics
+from command_trace import get_trace, start_trace, stop_trace
+from scene_cache import get_scene_cache
+from console_buffer import get_console_buffer
+from asset_cache import get_asset_cache
+from query_cache import get_query_cache
+from script_store import get_script_store
 from tools import register_all_tools
 
 # Configure logging using settings from config
@@ -15,28 +24,59 @@ logging.basicConfig(
 logger = logging.getLogger("unity-mcp-server")
 
 # Global connection state
-_unity_connection: UnityConnection | None = None
+_unity_pool: UnityConnectionPool | None = None
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     """Handle server startup and shutdown."""
-    global _unity_connection
+    global _unity_pool
     logger.info("Unity MCP Server starting up")
+    _unity_pool = get_unity_pool()
+    # Open the first pooled connection of every editor in the background: the transport starts serving
+    # at once, and the first tool calls wait for the connection instead of the client's initialize
+    connect_tasks = [asyncio.get_running_loop().create_task(_connect_on_startup(get_unity_pool(name)))
+                     for name in editor_names()]
+    dump_task = None
+    if config.metrics and config.metrics_dump_path:
+        dump_task = asyncio.get_running_loop().create_task(_dump_metrics())
+    if config.trace_path:
+        try:
+            start_trace(config.trace_path)
+        except OSError as e:
+            logger.warning(f"Could not record commands to {config.trace_path}: {str(e)}")
     try:
-        _unity_connection = get_unity_connection()
-        logger.info("Connected to Unity on startup")
-    except Exception as e:
-        logger.warning(f"Could not connect to Unity on startup: {str(e)}")
-        _unity_connection = None
-    try:
-        # Yield the connection object so it can be attached to the context
-        yield {"bridge": _unity_connection}
+        # Yield the pool so it can be attached to the context
+        yield {"bridge": _unity_pool}
     finally:
-        if _unity_connection:
-            _unity_connection.disconnect()
-            _unity_connection = None
+        for task in connect_tasks:
+            task.cancel()
+        if dump_task is not None:
+            dump_task.cancel()
+            get_command_metrics().dump()
+        stop_trace()
+        await close_unity_pool()
+        _unity_pool = None
         logger.info("Unity MCP Server shut down")
 
+async def _connect_on_startup(pool: UnityConnectionPool) -> None:
+    """Open the first pooled connection, waiting up to command_deadline for Unity to come up."""
+    try:
+        await pool.send_command("ping")
+        logger.info(f"Connected to Unity editor '{pool.editor}' on startup")
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"Could not connect to Unity editor '{pool.editor}' on startup: {str(e)}")
+
+async def _dump_metrics() -> None:
+    """Write the command metrics to config.metrics_dump_path every metrics_dump_interval seconds."""
+    while True:
+        await asyncio.sleep(config.metrics_dump_interval)
+        try:
+            get_command_metrics().dump()
+        except OSError as e:
+            logger.warning(f"Could not write metrics to {config.metrics_dump_path}: {str(e)}")
+
 # Initialize MCP server
 mcp = FastMCP(
     "unity-mcp-server",
@@ -49,11 +89,11 @@ register_all_tools(mcp)
 
 # Basic ping test tool
 @mcp.tool()
-def test_unity_connection(ctx: Context) -> Dict[str, Any]:
+async def test_unity_connection(ctx: Context) -> Dict[str, Any]:
     """Test the connection to Unity Editor with a simple ping."""
     try:
         # Get Unity connection from context
-        bridge = getattr(ctx, 'bridge', None) or get_unity_connection()
+        bridge = getattr(ctx, 'bridge', None) or get_unity_pool()
         
         if bridge is None:
             return {
@@ -62,7 +102,7 @@ def test_unity_connection(ctx: Context) -> Dict[str, Any]:
             }
         
         # Send ping command
-        result = bridge.send_command("ping")
+        result = await bridge.send_command("ping")
         
         return {
             "success": True,
@@ -76,6 +116,89 @@ def test_unity_connection(ctx: Context) -> Dict[str, Any]:
             "message": f"Unity connection test failed: {str(e)}"
         }
 
+# Connection health and probe counters
+@mcp.tool()
+def connection_health(ctx: Context) -> Dict[str, Any]:
+    """Report Unity connection pool state, health, ping probe counters and cache hit rates (scene, assets, queries, scripts, console)."""
+    return {
+        "success": True,
+        "data": {
+            **get_connection_health(),
+            "sceneCache": get_scene_cache().stats() if config.scene_cache else {"enabled": False},
+            "assetCache": get_asset_cache().stats() if config.asset_cache else {"enabled": False},
+            "queryCache": get_query_cache().stats() if config.query_cache else {"enabled": False},
+            "scriptStore": get_script_store().stats() if config.script_hashes else {"enabled": False},
+            "consoleBuffer": get_console_buffer().stats() if config.console_buffer_size > 0 else {"enabled": False}
+        }
+    }
+
+# Per-command latency metrics
+@mcp.tool()
+def command_metrics(
+    ctx: Context,
+    format: str = "json",
+    reset: bool = False,
+    enable: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """Report per-command latency metrics: phase timings, bytes, errors, retries and reconnects.
+
+    Args:
+        ctx: The MCP context.
+        format: 'json' for a structured report or 'prometheus' for the Prometheus text format.
+        reset: If True, clear the metrics after reporting them.
+        enable: Turn metrics collection on or off (off by default).
+
+    Returns:
+        Dictionary with the metrics in 'data'.
+    """
+    metrics = get_command_metrics()
+    if enable is not None:
+        config.metrics = enable
+    data = metrics.prometheus_text() if format == "prometheus" else metrics.snapshot()
+    if reset:
+        metrics.reset()
+    return {"success": True, "data": data}
+
+# Command traces for load testing
+@mcp.tool()
+def command_trace(
+    ctx: Context,
+    action: str = "status",
+    path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Records every command sent to Unity to a file, to replay the session later (benchmarks/replay_trace.py).
+
+    Args:
+        ctx: The MCP context.
+        action: 'start' to record to `path` (appending), 'stop' to finish the recording,
+            'status' to report it.
+        path: For 'start', the trace file (JSON lines; gzip-compressed if it ends in '.gz').
+            Defaults to the configured trace_path.
+
+    Returns:
+        Dictionary with the recording's 'path', 'commands' and 'bytes' written in 'data'.
+    """
+    action = action.lower()
+    try:
+        if action == "start":
+            recorder = start_trace(path)
+            return {"success": True, "message": f"Recording commands to {recorder.path}.", "data": recorder.stats()}
+        if action == "stop":
+            stats = stop_trace()
+            return {"success": True, "message": "Recording stopped." if stats else "No recording in progress.",
+                    "data": stats}
+    except (OSError, ValueError) as e:
+        return {"success": False, "message": str(e)}
+    if action != "status":
+        return {"success": False, "message": f"Unknown action '{action}'; use 'start', 'stop' or 'status'."}
+    recorder = get_trace()
+    return {"success": True, "data": recorder.stats() if recorder else {"recording": False}}
+
+@mcp.resource("unity://metrics", mime_type="application/json")
+def metrics_resource() -> str:
+    """Per-command latency metrics of the Unity connection, as JSON."""
+    return json.dumps(get_command_metrics().snapshot())
+
 # Asset Creation Strategy
 @mcp.prompt()
 def asset_creation_strategy() -> str:
@@ -83,16 +206,35 @@ def asset_creation_strategy() -> str:
     return (
         "Available Unity MCP Server Tools:\\n\\n"
         "- `test_unity_connection`: Test connection to Unity Editor\\n"
+        "- `connection_health`: Reports connection pool state, health, ping probe counters and cache hit rates\\n"
+        "- `command_metrics`: Reports per-command latency, bytes, retries and reconnects (enable it first)\\n"
+        "- `command_trace`: Records the commands sent to Unity to a file, to replay them as a load test\\n"
         "- `manage_editor`: Controls editor state and queries info.\\n"
         "- `execute_menu_item`: Executes Unity Editor menu items by path.\\n"
-        "- `read_console`: Reads or clears Unity console messages, with filtering options.\\n"
+        "- `read_console`: Reads, tails or clears Unity console messages, with filtering options and cursors.\\n"
         "- `manage_scene`: Manages scenes.\\n"
         "- `manage_gameobject`: Manages GameObjects in the scene.\\n"
         "- `manage_script`: Manages C# script files.\\n"
-        "- `manage_asset`: Manages prefabs and assets.\\n\\n"
+        "- `commit_scripts`: Compiles script changes staged with defer_compile in one go.\\n"
+        "- `manage_asset`: Manages prefabs and assets.\\n"
+        "- `batch`: Runs many commands in one round trip.\\n"
+        "- `find_many`: Finds the GameObjects for many targets in one call.\\n"
+        "- `set_transforms`: Sets the position, rotation and scale of many GameObjects in one call.\\n"
+        "- `bulk_assets`: Creates, moves, deletes or saves as prefabs many assets in one call.\\n"
+        "- `job_status` / `wait_job`: Follow long editor jobs (recompiles, play mode, scene loads, imports).\\n"
+        "- `list_editors`: Lists the Unity editors this server drives, for the tools' target_editor.\\n\\n"
         "Tips:\\n"
         "- Use test_unity_connection first to verify Unity Editor connection\\n"
         "- Create prefabs for reusable GameObjects.\\n"
+        "- Use batch when creating or modifying many GameObjects at once.\\n"
+        "- Use set_transforms (by_id targets, base64 float32 values) to move or lay out many objects.\\n"
+        "- Use bulk_assets to create many materials or prefabs: Unity refreshes its assets once per call, not per asset.\\n"
+        "- Poll read_console with since_cursor (or action='tail') instead of re-reading the whole console.\\n"
+        "- Start slow operations as jobs, keep working, then wait_job for their 'jobId'.\\n"
+        "- When changing several scripts, pass defer_compile=True to each and call commit_scripts once.\\n"
+        "- Script reads return a 'hash'; pass it as if_none_match to re-read a script only if it changed.\\n"
+        "- Repeated queries are answered from memory until the editor changes; pass fresh=True to force a new answer.\\n"
+        "- With several editors, pass target_editor to every tool; target_editor='*' runs a read (get_state, read_console) on all of them.\\n"
         "- Always include a camera and main light in your scenes.\\n"
     )
 
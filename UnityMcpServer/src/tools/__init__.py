@@ -1,3 +1,4 @@
+import logging
 from .manage_script import register_manage_script_tools
 from .manage_scene import register_manage_scene_tools
 from .manage_editor import register_manage_editor_tools
@@ -5,11 +6,19 @@ from .manage_gameobject import register_manage_gameobject_tools
 from .manage_asset import register_manage_asset_tools
 from .read_console import register_read_console_tools
 from .execute_menu_item import register_execute_menu_item_tools
+from .batch import register_batch_tools
+from .find_many import register_find_many_tools
+from .set_transforms import register_set_transforms_tools
+from .job_status import register_job_status_tools
+from .list_editors import register_list_editors_tools
+from .bulk_assets import register_bulk_assets_tools
 
+logger = logging.getLogger("unity-mcp-server")
 
 def register_all_tools(mcp):
     """Register all tools with the MCP server."""
-    print("Registering Unity MCP Server tools...")
+    # Logged rather than printed: stdout carries the stdio transport
+    logger.info("Registering Unity MCP Server tools...")
     register_manage_script_tools(mcp)
     register_manage_scene_tools(mcp)
     register_manage_editor_tools(mcp)
@@ -17,4 +26,10 @@ def register_all_tools(mcp):
     register_manage_asset_tools(mcp)
     register_read_console_tools(mcp)
     register_execute_menu_item_tools(mcp)
-    print("Unity MCP Server tool registration complete.")
+    register_batch_tools(mcp)
+    register_find_many_tools(mcp)
+    register_set_transforms_tools(mcp)
+    register_job_status_tools(mcp)
+    register_list_editors_tools(mcp)
+    register_bulk_assets_tools(mcp)
+    logger.info("Unity MCP Server tool registration complete.")
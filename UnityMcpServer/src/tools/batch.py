@@ -0,0 +1,42 @@
+"""
+Defines the batch tool for executing many Unity commands in one round trip.
+"""
+from typing import Dict, Any, List, Optional
+from mcp.server.fastmcp import FastMCP, Context
+from connection_pool import get_unity_pool
+
+def register_batch_tools(mcp: FastMCP):
+    """Registers the batch tool with the MCP server."""
+
+    @mcp.tool()
+    async def batch(
+        ctx: Context,
+        commands: List[Dict[str, Any]],
+        stop_on_error: bool = True,
+        target_editor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Executes an ordered list of Unity commands in a single round trip.
+
+        Use this instead of many separate manage_gameobject/manage_asset calls,
+        e.g. when building a scene. Very large batches are split automatically.
+
+        Args:
+            ctx: The MCP context.
+            commands: Commands to run in order, each {"type": ..., "parameters": {...}}.
+                'type' is a bridge command such as 'manage_gameobject' or 'manage_asset';
+                'parameters' use the bridge's camelCase names (e.g. {"action": "create",
+                "name": "Cube", "primitiveType": "Cube", "position": [0, 1, 0]}).
+            stop_on_error: If True, stop at the first failing command; later commands are
+                reported as 'skipped'. If False, run every command.
+            target_editor: Name of the Unity editor to run the commands in (see list_editors;
+                default: the default editor). To change several editors, send one batch to each.
+
+        Returns:
+            Dictionary with per-command 'results' (status and result or error) and
+            'succeeded', 'failed' and 'skipped' counts.
+        """
+        try:
+            bridge = get_unity_pool(target_editor)
+            return await bridge.send_batch(commands, stop_on_error=stop_on_error)
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
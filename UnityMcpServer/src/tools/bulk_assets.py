@@ -0,0 +1,120 @@
+"""
+Defines the bulk_assets tool for creating, moving and deleting many assets in one call.
+"""
+import logging
+from typing import Dict, Any, List, Optional
+from mcp.server.fastmcp import FastMCP, Context
+from config import config
+from connection_pool import get_unity_pool
+
+logger = logging.getLogger("unity-mcp-server")
+
+# Operations a bulk item may run
+BULK_ACTIONS = ("create", "move", "delete", "save_as_prefab")
+
+# Item keys as the tool takes them -> as the bridge expects them
+_ITEM_KEYS = {
+    "action": "action",
+    "path": "path",
+    "asset_type": "assetType",
+    "destination": "destination",
+    "game_object": "gameObject",
+    "properties": "properties",
+}
+
+def bridge_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Check bulk items and convert them to the bridge's parameter names.
+
+    Raises:
+        ValueError: If an item is not a dictionary, has an unknown key, or an unknown action.
+    """
+    converted = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValueError(f"Item {index} must be a dictionary")
+        unknown = set(item) - set(_ITEM_KEYS)
+        if unknown:
+            raise ValueError(f"Item {index} has unknown keys: {', '.join(sorted(unknown))}")
+        action = str(item.get("action") or "").lower()
+        if action not in BULK_ACTIONS:
+            raise ValueError(f"Item {index}: action must be one of {', '.join(BULK_ACTIONS)}")
+        entry = {_ITEM_KEYS[key]: value for key, value in item.items() if value is not None}
+        entry["action"] = action
+        converted.append(entry)
+    return converted
+
+def register_bulk_assets_tools(mcp: FastMCP):
+    """Registers the bulk_assets tool with the MCP server."""
+
+    @mcp.tool()
+    async def bulk_assets(
+        ctx: Context,
+        items: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        target_editor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Creates, moves, deletes and saves prefabs for many assets in a single call.
+
+        Use this instead of many manage_asset calls, e.g. to generate hundreds of
+        materials or prefabs: Unity imports the results together and refreshes its
+        asset database once per chunk instead of once per asset. Progress is
+        reported after each chunk.
+
+        Args:
+            ctx: The MCP context.
+            items: The operations, run in order. Each has an 'action' ('create', 'move',
+                'delete' or 'save_as_prefab') and a 'path'; 'create' also takes 'asset_type'
+                and 'properties' as in manage_asset, 'move' a 'destination', and
+                'save_as_prefab' the 'game_object' (name) to save at path.
+            chunk_size: Items per bridge call (default 200). A failed item does not stop the
+                others; a chunk that cannot be sent leaves the rest skipped.
+            target_editor: Name of the Unity editor whose project to change (see list_editors;
+                default: the default editor).
+
+        Returns:
+            Dictionary with 'message' and 'data': per item, in order, {'index', 'status'
+            ('success', 'error' or 'skipped'), 'path' (the asset's resulting path), 'error'},
+            and the 'succeeded', 'failed' and 'skipped' counts.
+        """
+        if not items:
+            return {"success": False, "message": "items must not be empty"}
+        try:
+            converted = bridge_items(items)
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+        size = max(1, chunk_size or config.bulk_asset_chunk_size)
+        bridge = get_unity_pool(target_editor)
+
+        results: List[Dict[str, Any]] = []
+        error: Optional[str] = None
+        for start in range(0, len(converted), size):
+            chunk = converted[start:start + size]
+            try:
+                response = await bridge.send_command("manage_asset", {"action": "bulk", "items": chunk})
+            except Exception as e:
+                # The chunk may or may not have run: report it and skip the rest
+                logger.warning(f"Bulk asset chunk at item {start} failed: {str(e)}")
+                error = str(e)
+                break
+            for entry in (response.get("data") or {}).get("results", []):
+                results.append({**entry, "index": start + entry["index"]})
+            try:
+                await ctx.report_progress(len(results), len(converted),
+                                          f"{len(results)} of {len(converted)} asset operations done.")
+            except ValueError:
+                pass  # Not called from an MCP request
+
+        for index in range(len(results), len(converted)):
+            entry = {"index": index, "status": "skipped", "path": converted[index].get("path")}
+            if error is not None and index < start + size:
+                entry.update(status="error", error=f"Unknown outcome, the chunk failed: {error}")
+            results.append(entry)
+        succeeded = sum(1 for entry in results if entry["status"] == "success")
+        failed = sum(1 for entry in results if entry["status"] == "error")
+        skipped = len(results) - succeeded - failed
+        return {
+            "success": error is None,
+            "message": f"Bulk asset operations done: {succeeded} succeeded, {failed} failed, {skipped} skipped."
+                       + (f" Stopped: {error}" if error else ""),
+            "data": {"results": results, "succeeded": succeeded, "failed": failed, "skipped": skipped},
+        }
@@ -1,31 +1,34 @@
 """
 Defines the execute_menu_item tool for executing menu items in Unity.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection
+from connection_pool import get_unity_pool
 
 def register_execute_menu_item_tools(mcp: FastMCP):
     """Registers the execute_menu_item tool with the MCP server."""
 
     @mcp.tool()
-    def execute_menu_item(
+    async def execute_menu_item(
         ctx: Context,
         menu_path: str,
+        target_editor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Executes a Unity Editor menu item via its path (e.g., "File/Save Project").
 
         Args:
             ctx: The MCP context.
             menu_path: The full path of the menu item to execute.
+            target_editor: Name of the Unity editor to run it in (see list_editors; default: the
+                default editor).
 
         Returns:
             A dictionary indicating success or failure, with optional message/error.
         """
-        bridge = get_unity_connection()
+        bridge = get_unity_pool(target_editor)
 
         params_dict = {
             "menuPath": menu_path,
         }
 
-        return bridge.send_command("execute_menu_item", params_dict) 
+        return await bridge.send_command("execute_menu_item", params_dict) 
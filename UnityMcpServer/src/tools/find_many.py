@@ -0,0 +1,77 @@
+"""
+Defines the find_many tool for resolving many GameObject targets in one call.
+"""
+from typing import Dict, Any, List, Optional
+from mcp.server.fastmcp import FastMCP, Context
+from config import config
+from editors import on_editors
+from query_cache import get_query_cache
+from scene_cache import get_scene_cache
+
+async def _find(editor: Optional[str], targets: List[str], search_method: Optional[str],
+                fresh: bool) -> Dict[str, Any]:
+    """find_many on one editor."""
+    results: List[Optional[Dict[str, Any]]] = [None] * len(targets)
+    missing = list(range(len(targets)))
+
+    # Answer what the scene cache can, and ask Unity for the rest in one command
+    if config.scene_cache and not fresh:
+        cache = get_scene_cache(editor)
+        missing = []
+        for i, target in enumerate(targets):
+            cached = cache.find(search_method, target)
+            if cached is None:
+                missing.append(i)
+                continue
+            data = cached["data"]
+            results[i] = {"target": target, "matches": data if isinstance(data, list) else [data]}
+
+    if missing:
+        params_dict = {
+            "action": "find_many",
+            "targets": [targets[i] for i in missing],
+            "searchMethod": search_method,
+        }
+        params_dict = {k: v for k, v in params_dict.items() if v is not None}
+        response = await get_query_cache(editor).send_command("manage_gameobject", params_dict, fresh=fresh)
+        for i, entry in zip(missing, response["data"]):
+            results[i] = entry
+
+    found = sum(1 for entry in results if entry["matches"])
+    return {"message": f"{found} of {len(targets)} targets found.", "data": results}
+
+def register_find_many_tools(mcp: FastMCP):
+    """Registers the find_many tool with the MCP server."""
+
+    @mcp.tool()
+    async def find_many(
+        ctx: Context,
+        targets: List[str],
+        search_method: Optional[str] = None,
+        fresh: bool = False,
+        target_editor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Finds the GameObjects for a list of targets in a single call.
+
+        Use this instead of many manage_gameobject 'find' calls, e.g. to resolve
+        every object a plan refers to before modifying them.
+
+        Args:
+            ctx: The MCP context.
+            targets: Names, paths, tags, layers, component types or instance IDs to look up.
+            search_method: How to interpret every target ('by_name' (default), 'by_path',
+                'by_tag', 'by_layer', 'by_component', 'by_id', 'by_parent').
+            fresh: Ask Unity for every target instead of answering from the server's caches.
+            target_editor: Name of the Unity editor to search (see list_editors; default: the
+                default editor). '*' searches every editor at once and returns each editor's
+                reply in 'data.editors'.
+
+        Returns:
+            Dictionary with 'message' and 'data', a list of {'target', 'matches'} in the
+            order of `targets`; 'matches' lists {'name', 'instanceId'} and is empty for
+            targets that were not found.
+        """
+        if not targets:
+            return {"success": False, "message": "targets must not be empty"}
+        return await on_editors(target_editor, "manage_gameobject", {"action": "find_many"},
+                                lambda editor: _find(editor, targets, search_method, fresh))
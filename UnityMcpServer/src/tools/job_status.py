@@ -0,0 +1,73 @@
+"""
+Defines the job_status and wait_job tools for following long-running editor jobs in Unity.
+"""
+from typing import Dict, Any, Optional
+from mcp.server.fastmcp import FastMCP, Context
+from connection_pool import get_unity_pool
+from editors import on_editors
+from jobs import wait_for_job
+
+def register_job_status_tools(mcp: FastMCP):
+    """Registers the job_status and wait_job tools with the MCP server."""
+
+    @mcp.tool()
+    async def job_status(
+        ctx: Context,
+        job_id: Optional[str] = None,
+        target_editor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Gets the state of a long-running editor job, or lists the recent jobs.
+
+        Script recompiles (after manage_script create/update/delete), manage_editor
+        play/stop, and manage_scene load or manage_asset import with as_job=True
+        reply at once with a 'jobId' in 'data' instead of blocking until done.
+
+        Args:
+            ctx: The MCP context.
+            job_id: The job to report. Defaults to every job the editor still remembers, newest first.
+            target_editor: Name of the Unity editor that runs the job (see list_editors; default:
+                the default editor). '*' lists the jobs of every editor, in 'data.editors'.
+
+        Returns:
+            Dictionary with the job in 'data' ('jobId', 'kind', 'status' ('running',
+            'succeeded' or 'failed'), 'progress' (0-1 or null), 'message', 'error',
+            'result', 'elapsed' seconds), or 'data.jobs' without job_id.
+        """
+        params_dict = {"jobId": job_id} if job_id else {}
+        return await on_editors(target_editor, "job_status", params_dict,
+                                lambda editor: get_unity_pool(editor).send_command("job_status", params_dict))
+
+    @mcp.tool()
+    async def wait_job(
+        ctx: Context,
+        job_id: str,
+        timeout: Optional[float] = None,
+        target_editor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Waits for a long-running editor job to finish, reporting its progress.
+
+        Start several jobs first and wait for them afterwards: they run side by side,
+        and the editor keeps answering other tools meanwhile.
+
+        Args:
+            ctx: The MCP context.
+            job_id: The 'jobId' returned by the command that started the job.
+            timeout: Seconds to wait (default 60). If the job is still running by then,
+                it is returned with status 'running'; call wait_job again to keep waiting.
+            target_editor: Name of the Unity editor that runs the job (see list_editors; default:
+                the default editor).
+
+        Returns:
+            Dictionary with the job in 'data', as for job_status.
+        """
+        async def report(job: Dict[str, Any]) -> None:
+            if job.get("progress") is None:
+                return
+            try:
+                await ctx.report_progress(job["progress"], 1.0, job.get("message"))
+            except ValueError:
+                pass  # Not called from an MCP request
+
+        job = await wait_for_job(job_id, timeout, on_progress=report, bridge=get_unity_pool(target_editor))
+        message = job.get("error") if job["status"] == "failed" else job.get("message")
+        return {"message": message or f"Job {job['status']}.", "data": job}
@@ -0,0 +1,44 @@
+"""
+Defines the list_editors tool for discovering the Unity editors the server drives.
+"""
+import asyncio
+from typing import Dict, Any
+from mcp.server.fastmcp import FastMCP, Context
+from config import config
+from connection_pool import editor_names, get_unity_pool
+from editors import list_editors as editor_registry
+
+def register_list_editors_tools(mcp: FastMCP):
+    """Registers the list_editors tool with the MCP server."""
+
+    @mcp.tool()
+    async def list_editors(
+        ctx: Context,
+        connect: bool = True,
+    ) -> Dict[str, Any]:
+        """Lists the Unity editors this server can drive, by name, for the tools' target_editor.
+
+        Args:
+            ctx: The MCP context.
+            connect: If True (default), ping every editor first (at once, up to 10 seconds each),
+                so that each reports whether it is reachable and which project it has open.
+
+        Returns:
+            Dictionary with 'data' mapping each editor name to its 'endpoint' (host:port),
+            'project', 'connections', 'inFlight', 'default' (the editor tools use without
+            target_editor) and, when connecting, 'reachable'.
+        """
+        names = editor_names()
+        reachable = {}
+        if connect:
+            async def ping(name: str) -> bool:
+                try:
+                    await asyncio.wait_for(get_unity_pool(name).send_command("ping"), config.fan_out_timeout)
+                    return True
+                except Exception:
+                    return False
+            reachable = dict(zip(names, await asyncio.gather(*(ping(name) for name in names))))
+        editors = editor_registry()
+        for name, up in reachable.items():
+            editors[name]["reachable"] = up
+        return {"message": f"{len(editors)} Unity editors configured.", "data": editors}
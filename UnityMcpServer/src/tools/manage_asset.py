@@ -3,7 +3,10 @@ Defines the manage_asset tool for asset management in Unity.
 """
 from typing import Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection
+from config import config
+from connection_pool import get_unity_pool
+from asset_cache import get_asset_cache
+from editors import on_editors
 
 def register_manage_asset_tools(mcp: FastMCP):
     """Registers the manage_asset tool with the MCP server."""
@@ -17,23 +20,31 @@ def register_manage_asset_tools(mcp: FastMCP):
         properties: Optional[Dict[str, Any]] = None,
         destination: Optional[str] = None,
         search_pattern: Optional[str] = None,
+        as_job: bool = False,
+        fresh: bool = False,
+        target_editor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Performs asset operations (import, create, modify, delete, etc.) in Unity.
 
         Args:
             ctx: The MCP context.
-            action: Operation (e.g., 'import', 'create', 'search').
+            action: Operation (e.g., 'import', 'create', 'search'). 'import' reimports the asset
+                or folder at path, or refreshes the whole project for an empty path.
             path: Asset path or search scope.
             asset_type: Type for 'create' action (e.g., 'Material', 'Folder').
             properties: Properties for 'create' or 'modify'.
             destination: Target path for 'move' or 'duplicate'.
             search_pattern: Search pattern (e.g., '*.prefab').
+            as_job: import: reply at once with a 'jobId' in 'data' and import a few assets per
+                editor tick, so other tools are answered meanwhile; follow it with wait_job.
+            fresh: For 'search', ask Unity instead of answering from the server's cache.
+            target_editor: Name of the Unity editor whose project to work on (see list_editors;
+                default: the default editor). '*' runs 'search' in every editor's project at
+                once and returns each editor's reply in 'data.editors'.
 
         Returns:
             A dictionary with operation results ('success', 'data', 'error').
         """
-        bridge = get_unity_connection()
-
         params_dict = {
             "action": action.lower(),
             "path": path,
@@ -41,10 +52,24 @@ def register_manage_asset_tools(mcp: FastMCP):
             "properties": properties,
             "destination": destination,
             "searchPattern": search_pattern,
+            "asJob": as_job or None,
         }
 
         params_dict = {k: v for k, v in params_dict.items() if v is not None}
 
-        # Note: Even though this tool is async, the underlying connection is sync.
-        # This is a placeholder for a future fully async implementation.
-        return bridge.send_command("manage_asset", params_dict) 
+        async def run(editor: Optional[str]) -> Dict[str, Any]:
+            bridge = get_unity_pool(editor)
+            # Repeated searches are answered from the asset cache
+            if params_dict["action"] == "search" and search_pattern and config.asset_cache:
+                cache = get_asset_cache(editor)
+                cached = cache.get(search_pattern, path) if not fresh else None
+                if cached is not None:
+                    return cached
+                generation = cache.generation
+                result = await bridge.send_command("manage_asset", params_dict)
+                cache.store(search_pattern, path, result, generation)
+                return result
+            return await bridge.send_command("manage_asset", params_dict)
+
+        return await on_editors(target_editor, "manage_asset", params_dict, run)
+
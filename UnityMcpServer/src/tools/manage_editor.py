@@ -3,35 +3,45 @@ Defines the manage_editor tool for editor control in Unity.
 """
 from typing import Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection
+from connection_pool import get_unity_pool
+from editors import on_editors
+from jobs import wait_for_job
+from query_cache import get_query_cache
 
 def register_manage_editor_tools(mcp: FastMCP):
     """Registers the manage_editor tool with the MCP server."""
 
     @mcp.tool()
-    def manage_editor(
+    async def manage_editor(
         ctx: Context,
         action: str,
         wait_for_completion: Optional[bool] = None,
         tool_name: Optional[str] = None,
         tag_name: Optional[str] = None,
         layer_name: Optional[str] = None,
+        fresh: bool = False,
+        target_editor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Controls and queries the Unity editor's state and settings.
 
         Args:
             ctx: The MCP context.
             action: Operation (e.g., 'play', 'pause', 'get_state', 'set_active_tool', 'add_tag').
-            wait_for_completion: Optional. If True, waits for certain actions.
+                'play' and 'stop' reply at once with a 'jobId' in 'data'; follow it with wait_job.
+            wait_for_completion: Optional. If True, 'play' and 'stop' wait (up to 60 seconds) until
+                the editor has entered or left play mode.
             tool_name: The name of the tool to set active.
             tag_name: The name of the tag to add or check.
             layer_name: The name of the layer to add or check.
+            fresh: For 'get_state' and tag/layer checks, ask Unity instead of answering from
+                the server's memoized replies.
+            target_editor: Name of the Unity editor to control (see list_editors; default: the
+                default editor). '*' runs 'get_state' on every editor at once and returns each
+                editor's reply in 'data.editors'.
 
         Returns:
             Dictionary with operation results ('success', 'message', 'data').
         """
-        bridge = get_unity_connection()
-
         params_dict = {
             "action": action.lower(),
             "waitForCompletion": wait_for_completion,
@@ -42,4 +52,15 @@ def register_manage_editor_tools(mcp: FastMCP):
 
         params_dict = {k: v for k, v in params_dict.items() if v is not None}
 
-        return bridge.send_command("manage_editor", params_dict) 
+        async def run(editor: Optional[str]) -> Dict[str, Any]:
+            result = await get_query_cache(editor).send_command("manage_editor", params_dict, fresh=fresh)
+            data = result.get("data")
+            job_id = data.get("jobId") if isinstance(data, dict) else None
+            if wait_for_completion and job_id:
+                job = await wait_for_job(job_id, bridge=get_unity_pool(editor))
+                data["jobStatus"] = job["status"]
+                data["job"] = job
+            return result
+
+        return await on_editors(target_editor, "manage_editor", params_dict, run)
+
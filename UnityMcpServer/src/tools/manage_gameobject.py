@@ -3,13 +3,16 @@ Defines the manage_gameobject tool for GameObject management in Unity.
 """
 from typing import Dict, Any, Optional, List
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection
+from config import config
+from editors import on_editors
+from query_cache import get_query_cache
+from scene_cache import get_scene_cache
 
 def register_manage_gameobject_tools(mcp: FastMCP):
     """Registers the manage_gameobject tool with the MCP server."""
 
     @mcp.tool()
-    def manage_gameobject(
+    async def manage_gameobject(
         ctx: Context,
         action: str,
         target: Optional[str] = None,
@@ -28,6 +31,8 @@ def register_manage_gameobject_tools(mcp: FastMCP):
         set_active: Optional[bool] = None,
         save_as_prefab: Optional[bool] = None,
         prefab_path: Optional[str] = None,
+        fresh: bool = False,
+        target_editor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Manages GameObjects: create, modify, delete, find, and component operations.
 
@@ -50,12 +55,14 @@ def register_manage_gameobject_tools(mcp: FastMCP):
             set_active: Sets the active state of the GameObject.
             save_as_prefab: If true, saves the created/modified GameObject as a prefab.
             prefab_path: Path to save the prefab (e.g., "Assets/Prefabs/MyObject.prefab").
+            fresh: For 'find', ask Unity instead of answering from the server's caches.
+            target_editor: Name of the Unity editor whose scene to work on (see list_editors;
+                default: the default editor). '*' runs 'find' in every editor at once and
+                returns each editor's reply in 'data.editors'.
 
         Returns:
             Dictionary with operation results ('success', 'message', 'data').
         """
-        bridge = get_unity_connection()
-
         params_dict = {
             "action": action.lower(),
             "target": target,
@@ -78,4 +85,14 @@ def register_manage_gameobject_tools(mcp: FastMCP):
 
         params_dict = {k: v for k, v in params_dict.items() if v is not None}
 
-        return bridge.send_command("manage_gameobject", params_dict) 
+        async def run(editor: Optional[str]) -> Dict[str, Any]:
+            if config.scene_cache:
+                cache = get_scene_cache(editor)
+                if params_dict["action"] == "find" and not fresh:
+                    cached = cache.find(search_method, target)
+                    if cached is not None:
+                        return cached
+            return await get_query_cache(editor).send_command("manage_gameobject", params_dict, fresh=fresh)
+
+        return await on_editors(target_editor, "manage_gameobject", params_dict, run)
+
@@ -1,42 +1,152 @@
 """
 Defines the manage_scene tool for scene management in Unity.
 """
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection
+from config import config
+from connection_pool import get_unity_pool, UnityConnectionPool
+from editors import on_editors
+from query_cache import get_query_cache
+from scene_cache import get_scene_cache
+
+def _hierarchy_params(
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    max_depth: Optional[int] = None,
+    root: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Build the get_hierarchy options in the bridge's camelCase form."""
+    return {
+        "pageSize": page_size,
+        "cursor": cursor,
+        "maxDepth": max_depth,
+        "root": root,
+        "fields": fields
+    }
+
+async def iter_hierarchy_pages(
+    page_size: int = 500,
+    max_depth: Optional[int] = None,
+    root: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    bridge: Optional[UnityConnectionPool] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the active scene's hierarchy one page at a time, fetching the next page only when needed.
+
+    Each page has `items` (nodes in preorder), `nextCursor` and `sceneCount`,
+    the number of loaded scenes. Arguments are as for iter_hierarchy.
+
+    Raises:
+        Exception: If Unity reports an error, e.g. a cursor made stale by deleting its object.
+    """
+    bridge = bridge or get_unity_pool()
+    cursor = None
+    while True:
+        params_dict = {"action": "get_hierarchy", **_hierarchy_params(page_size, cursor, max_depth, root, fields)}
+        params_dict = {k: v for k, v in params_dict.items() if v is not None}
+        result = await bridge.send_command("manage_scene", params_dict)
+        page = result.get("data") or {}
+        yield page
+        cursor = page.get("nextCursor")
+        if not cursor:
+            return
+
+async def iter_hierarchy(
+    page_size: int = 500,
+    max_depth: Optional[int] = None,
+    root: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    bridge: Optional[UnityConnectionPool] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield every node of the active scene in preorder, fetching the next page only when needed.
+
+    Args:
+        page_size: Nodes per request.
+        max_depth: Skip nodes deeper than this (0 = root objects only).
+        root: Path of the object to start from, e.g. "Environment/Props".
+        fields: Node fields to return (default: name, instanceId, active, depth, childCount).
+        bridge: Pool or connection to use (default: the shared pool).
+
+    Raises:
+        Exception: If Unity reports an error, e.g. a cursor made stale by deleting its object.
+    """
+    async for page in iter_hierarchy_pages(page_size, max_depth, root, fields, bridge):
+        for node in page.get("items", []):
+            yield node
 
 def register_manage_scene_tools(mcp: FastMCP):
     """Registers the manage_scene tool with the MCP server."""
 
     @mcp.tool()
-    def manage_scene(
+    async def manage_scene(
         ctx: Context,
         action: str,
         name: Optional[str] = None,
         path: Optional[str] = None,
-        build_index: Optional[int] = None
+        build_index: Optional[int] = None,
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        max_depth: Optional[int] = None,
+        root: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        as_job: bool = False,
+        fresh: bool = False,
+        target_editor: Optional[str] = None
     ) -> Dict[str, Any]:
         """Manages Unity scenes (load, save, create, get hierarchy, etc.).
 
+        For large scenes, pass page_size to 'get_hierarchy' to get a flat preorder
+        page ('data.items') and pass the returned 'data.nextCursor' back as cursor
+        for the next page. It is null on the last page.
+
         Args:
             ctx: The MCP context.
             action: Operation (e.g., 'load', 'save', 'create', 'get_hierarchy').
             name: Scene name (no extension) for create/load/save.
             path: Asset path for scene operations (default: "Assets/").
             build_index: Build index for load/build settings actions.
+            page_size: get_hierarchy: nodes per page (max 10000). Enables paging.
+            cursor: get_hierarchy: 'nextCursor' from the previous page.
+            max_depth: get_hierarchy: skip nodes deeper than this (0 = root objects only).
+            root: get_hierarchy: path of the object to start from, e.g. "Environment/Props".
+            fields: get_hierarchy: node fields to return, from name, instanceId, parentId, active,
+                activeInHierarchy, tag, layer, path, depth, childCount, components, componentTypes.
+            as_job: load: reply at once with a 'jobId' in 'data' and load the scene in the
+                background (with progress in play mode); follow it with wait_job.
+            fresh: For 'get_hierarchy' and 'get_active', ask Unity instead of answering from the
+                server's caches.
+            target_editor: Name of the Unity editor to work in (see list_editors; default: the
+                default editor). '*' runs 'get_active' or 'get_hierarchy' in every editor at once
+                and returns each editor's reply in 'data.editors'.
 
         Returns:
             Dictionary with results ('success', 'message', 'data').
         """
-        bridge = get_unity_connection()
-
         params_dict = {
             "action": action.lower(),
             "name": name,
             "path": path,
-            "buildIndex": build_index
+            "buildIndex": build_index,
+            "asJob": as_job or None,
+            **_hierarchy_params(page_size, cursor, max_depth, root, fields)
         }
 
         params_dict = {k: v for k, v in params_dict.items() if v is not None}
 
-        return bridge.send_command("manage_scene", params_dict) 
+        async def run(editor: Optional[str]) -> Dict[str, Any]:
+            if config.scene_cache:
+                # Creating the cache also starts watching writes, which keeps it current
+                cache = get_scene_cache(editor)
+                if params_dict["action"] == "get_hierarchy":
+                    cached = cache.get_response(params_dict) if not fresh else None
+                    if cached is not None:
+                        return cached
+                    generation = cache.generation
+                    result = await get_unity_pool(editor).send_command("manage_scene", params_dict)
+                    cache.store_response(params_dict, result, generation)
+                    return result
+            return await get_query_cache(editor).send_command("manage_scene", params_dict, fresh=fresh)
+
+        return await on_editors(target_editor, "manage_scene", params_dict, run)
+
@@ -1,22 +1,31 @@
 """
-Defines the manage_script tool for C# script management in Unity.
+Defines the manage_script and commit_scripts tools for C# script management in Unity.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection
+from config import config
+from connection_pool import get_unity_pool
+from editors import on_editors
+from jobs import wait_for_job
+from script_store import get_script_store
 
 def register_manage_script_tools(mcp: FastMCP):
-    """Registers the manage_script tool with the MCP server."""
+    """Registers the manage_script and commit_scripts tools with the MCP server."""
 
     @mcp.tool()
-    def manage_script(
+    async def manage_script(
         ctx: Context,
         action: str,
         name: str,
         path: str = None,
         contents: str = None,
         script_type: str = None,
-        namespace: str = None
+        namespace: str = None,
+        wait_for_compile: bool = False,
+        defer_compile: bool = False,
+        fresh: bool = False,
+        if_none_match: str = None,
+        target_editor: str = None
     ) -> Dict[str, Any]:
         """Manages C# scripts in Unity (create, read, update, delete).
         Make reference variables public for easier access in the Unity Editor.
@@ -29,14 +38,27 @@ def register_manage_script_tools(mcp: FastMCP):
             contents: C# code for 'create'/'update'.
             script_type: Type hint (e.g., 'MonoBehaviour').
             namespace: Script namespace.
+            wait_for_compile: If True, 'create', 'update' and 'delete' also wait (up to 60 seconds)
+                for the recompilation they trigger and return it in 'data.job', with the compile
+                errors in 'data.job.result.errors'. Otherwise follow 'data.jobId' with wait_job.
+            defer_compile: If True, 'create', 'update' and 'delete' are staged without
+                recompiling: the file is written at once (a deleted script stays until the commit),
+                and every staged change is imported and compiled together by commit_scripts, or
+                once no change has been staged for a while (30 seconds by default). Use it when
+                changing several scripts.
+            fresh: For 'read', ask Unity instead of answering from the server's memoized replies.
+            if_none_match: For 'read', the 'hash' of an earlier read or write of the script. If the
+                script still has that hash, the reply has 'data.notModified' and no contents.
+            target_editor: Name of the Unity editor whose project to work on (see list_editors;
+                default: the default editor). '*' runs 'read' in every editor's project at once
+                and returns each editor's reply in 'data.editors'.
 
         Returns:
-            Dictionary with results ('success', 'message', 'data').
+            Dictionary with results ('success', 'message', 'data'). Reads and writes return the
+            script's content hash in 'data.hash'. An update that would not change the script
+            returns 'data.unchanged' and triggers no recompilation.
         """
         
-        # Get the Unity connection
-        bridge = get_unity_connection()
-
         # Prepare parameters for the C# handler
         params_dict = {
             "action": action.lower(),
@@ -44,11 +66,56 @@ def register_manage_script_tools(mcp: FastMCP):
             "path": path,
             "contents": contents,
             "scriptType": script_type,
-            "namespace": namespace
+            "namespace": namespace,
+            "ifNoneMatch": if_none_match,
+            "deferCompile": defer_compile or None,
+            "debounceSeconds": config.script_commit_debounce if defer_compile else None
         }
 
         # Remove None values to avoid sending unnecessary nulls
         params_dict = {k: v for k, v in params_dict.items() if v is not None}
 
-        # Forward the command using the bridge's send_command method
-        return bridge.send_command("manage_script", params_dict)
+        async def run(editor: Optional[str]) -> Dict[str, Any]:
+            # Forward the command; unchanged updates are skipped, small ones sent as patches, and reads
+            # may be answered from memoized replies or the known text
+            result = await get_script_store(editor).send_command(params_dict, fresh=fresh)
+            data = result.get("data")
+            job_id = data.get("jobId") if isinstance(data, dict) else None
+            if wait_for_compile and job_id and not defer_compile:
+                job = await wait_for_job(job_id, bridge=get_unity_pool(editor))
+                data["jobStatus"] = job["status"]
+                data["job"] = job
+            return result
+
+        return await on_editors(target_editor, "manage_script", params_dict, run)
+
+    @mcp.tool()
+    async def commit_scripts(
+        ctx: Context,
+        wait_for_compile: bool = True,
+        target_editor: str = None
+    ) -> Dict[str, Any]:
+        """Imports every script change staged with manage_script(defer_compile=True) at once,
+        so that they cost a single recompilation and domain reload.
+
+        Args:
+            ctx: The MCP context.
+            wait_for_compile: If True (default), wait (up to 60 seconds) for the recompilation and
+                return it in 'data.job'. Otherwise follow 'data.jobId' with wait_job.
+            target_editor: Name of the Unity editor whose staged changes to commit (see
+                list_editors; default: the default editor).
+
+        Returns:
+            Dictionary with results ('success', 'message', 'data'). Once compiled, the job's
+            'result.files' maps each staged script to the compile errors reported in it, and
+            'result.errors' lists every compile error.
+        """
+        bridge = get_unity_pool(target_editor)
+        result = await bridge.send_command("manage_script", {"action": "commit"})
+        data = result.get("data")
+        job_id = data.get("jobId") if isinstance(data, dict) else None
+        if wait_for_compile and job_id:
+            job = await wait_for_job(job_id, bridge=bridge)
+            data["jobStatus"] = job["status"]
+            data["job"] = job
+        return result
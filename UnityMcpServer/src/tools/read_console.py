@@ -1,44 +1,125 @@
 """
 Defines the read_console tool for reading console logs in Unity.
 """
+import asyncio
 from typing import Dict, Any, Optional, List
 from mcp.server.fastmcp import FastMCP, Context
-from unity_connection import get_unity_connection
+from config import config
+from connection_pool import get_unity_pool
+from console_buffer import get_console_buffer
+from editors import on_editors
+
+def _merge_logs(replies: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """The logs of every editor, each tagged with its editor, and each editor's next cursor."""
+    logs, cursors = [], {}
+    for editor, reply in replies.items():
+        data = reply.get("data") or {}
+        logs.extend({**entry, "editor": editor} for entry in data.get("logs", []))
+        cursors[editor] = data.get("nextCursor")
+    return {"logs": logs, "cursors": cursors}
 
 def register_read_console_tools(mcp: FastMCP):
     """Registers the read_console tool with the MCP server."""
 
+    async def get_logs(
+        since_cursor: Optional[str],
+        types: Optional[List[str]],
+        filter_text: Optional[str],
+        limit: Optional[int],
+        editor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        # Answer from the local buffer when it reaches back far enough
+        if config.console_buffer_size > 0:
+            buffer = get_console_buffer(editor)
+            if buffer.supported:
+                await buffer.sync()
+                data = buffer.query(since_cursor, types, filter_text, limit)
+                if data is not None:
+                    return {"message": "Logs retrieved.", "data": data}
+
+        bridge = get_unity_pool(editor)
+        params_dict = {
+            "action": "get",
+            "types": types,
+            "filterText": filter_text,
+            "sinceCursor": since_cursor,
+            "limit": limit,
+        }
+        params_dict = {k: v for k, v in params_dict.items() if v is not None}
+        return await bridge.send_command("read_console", params_dict)
+
     @mcp.tool()
-    def read_console(
+    async def read_console(
         ctx: Context,
         action: str = "get",
         types: Optional[List[str]] = None,
         filter_text: Optional[str] = None,
+        since_cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        target_editor: Optional[str] = None,
         clear: bool = False # Legacy, for backward compatibility
     ) -> Dict[str, Any]:
-        """Gets messages from or clears the Unity Editor console.
+        """Gets messages from, waits for messages in, or clears the Unity Editor console.
+
+        Poll with cursors instead of re-reading the whole console: pass the
+        'nextCursor' of the previous reply as `since_cursor` to get only the
+        messages added since.
 
         Args:
             ctx: The MCP context.
-            action: Operation ('get' or 'clear'). Defaults to 'get'.
+            action: Operation ('get', 'tail' or 'clear'). Defaults to 'get'. 'tail' waits
+                until messages matching the filters arrive after `since_cursor` (or after
+                the current end of the console), or until `timeout` passes.
             types: Message types to get ('error', 'warning', 'log'). Defaults to all.
-            filter_text: Text filter for messages.
+            filter_text: Text filter for messages (case-sensitive).
+            since_cursor: Only return messages after this cursor, from a previous reply's 'nextCursor'.
+            limit: Return at most this many messages; continue from 'nextCursor'.
+            timeout: Seconds 'tail' waits for new messages (default 30).
+            target_editor: Name of the Unity editor to read (see list_editors; default: the default
+                editor). '*' gets the messages of every editor at once: 'data.logs' has each
+                message's 'editor', and 'data.cursors' each editor's 'nextCursor', to pass back
+                as since_cursor with that editor as target_editor.
             clear: If True, clears the console after getting messages. Deprecated in favor of action='clear'.
 
         Returns:
-            Dictionary with results. For 'get', includes 'data' (messages).
+            Dictionary with results. For 'get' and 'tail', 'data' includes 'logs'
+            ({'index', 'message', 'type', 'mode'}), 'nextCursor', 'total' and 'reset'
+            (True if the console was cleared since `since_cursor`).
         """
-        bridge = get_unity_connection()
-        
         # Handle the legacy `clear` parameter
         effective_action = "clear" if clear else action.lower()
 
+        if effective_action == "get":
+            return await on_editors(
+                target_editor, "read_console", {"action": "get"},
+                lambda editor: get_logs(since_cursor, types, filter_text, limit, editor),
+                merge=_merge_logs,
+            )
+
+        if effective_action == "tail":
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + (timeout if timeout is not None else config.console_tail_timeout)
+            cursor = since_cursor or "end"
+            while True:
+                response = await get_logs(cursor, types, filter_text, limit, target_editor)
+                data = response["data"]
+                remaining = deadline - loop.time()
+                if data["logs"] or remaining <= 0:
+                    return response
+                cursor = data["nextCursor"]
+                await asyncio.sleep(min(config.console_poll_interval, remaining))
+
+        bridge = get_unity_pool(target_editor)
         params_dict = {
             "action": effective_action,
             "types": types,
             "filterText": filter_text,
         }
-        
+
         params_dict = {k: v for k, v in params_dict.items() if v is not None}
-        
-        return bridge.send_command("read_console", params_dict) 
+
+        response = await bridge.send_command("read_console", params_dict)
+        if effective_action == "clear" and config.console_buffer_size > 0:
+            get_console_buffer(target_editor).invalidate()
+        return response
@@ -0,0 +1,115 @@
+"""
+Defines the set_transforms tool for placing many GameObjects in one call.
+"""
+import base64
+import binascii
+import math
+import sys
+from array import array
+from typing import Dict, Any, List, Optional, Union
+from mcp.server.fastmcp import FastMCP, Context
+from connection_pool import get_unity_pool
+
+# Transform properties a packed buffer can hold, three floats each, in the order given by `fields`
+TRANSFORM_FIELDS = ("position", "rotation", "scale")
+
+def pack_transforms(values: Any, count: int, fields: List[str]) -> bytes:
+    """Check transform values for `count` objects and pack them as little-endian float32.
+
+    Args:
+        values: A flat sequence of numbers, base64 of little-endian float32 values, their
+            bytes, or a NumPy array of any float dtype whose size fits (e.g. shaped
+            (count, 3 * len(fields))). Per object, the x, y and z of each field follow in order.
+        count: Number of objects.
+        fields: Names out of TRANSFORM_FIELDS.
+
+    Raises:
+        ValueError: If the fields are unknown or repeated, the number of values does not
+            fit, or a value is not a finite float32.
+    """
+    if not fields or len(set(fields)) != len(fields) or any(f not in TRANSFORM_FIELDS for f in fields):
+        raise ValueError(f"fields must be distinct names out of {', '.join(TRANSFORM_FIELDS)}")
+    expected = count * 3 * len(fields)
+    if hasattr(values, "astype") and hasattr(values, "tobytes"):
+        # A NumPy array, converted without importing NumPy here
+        data = values.astype("<f4").tobytes()
+    elif isinstance(values, str):
+        try:
+            data = base64.b64decode(values, validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"values is not valid base64: {str(e)}")
+    elif isinstance(values, (bytes, bytearray, memoryview)):
+        data = bytes(values)
+    else:
+        try:
+            floats = array("f", values)
+        except (TypeError, OverflowError) as e:
+            raise ValueError(f"values must be numbers: {str(e)}")
+        if sys.byteorder == "big":
+            floats.byteswap()
+        data = floats.tobytes()
+    if len(data) != expected * 4:
+        raise ValueError(f"Expected {expected} values ({count} objects x {3 * len(fields)} floats), "
+                         f"got {len(data) / 4:g}")
+    floats = array("f", data)
+    if sys.byteorder == "big":
+        floats.byteswap()
+    if not all(map(math.isfinite, floats)):
+        raise ValueError("values must be finite float32 numbers")
+    return data
+
+def register_set_transforms_tools(mcp: FastMCP):
+    """Registers the set_transforms tool with the MCP server."""
+
+    @mcp.tool()
+    async def set_transforms(
+        ctx: Context,
+        targets: List[str],
+        values: Union[str, List[float]],
+        fields: Optional[List[str]] = None,
+        search_method: Optional[str] = None,
+        local: bool = False,
+        target_editor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Sets the position, rotation and/or scale of many GameObjects in a single call.
+
+        Use this instead of many manage_gameobject 'modify' calls, e.g. to lay out
+        generated objects. Every change is undone as one step.
+
+        Args:
+            ctx: The MCP context.
+            targets: GameObjects to change, in the order of `values`.
+            values: For each target, x, y and z of each of `fields`: a flat list of numbers,
+                or base64 of little-endian float32 values (smaller and faster for many objects).
+            fields: What `values` holds per target, in order: 'position', 'rotation' (Euler
+                angles in degrees) and/or 'scale' (default: ['position']).
+            search_method: How to interpret every target: 'by_name' (default), 'by_path' or
+                'by_id' (instance IDs, the fastest to resolve).
+            local: Set positions and rotations relative to the parent instead of in world space.
+                Scale is always local.
+            target_editor: Name of the Unity editor whose scene to change (see list_editors;
+                default: the default editor).
+
+        Returns:
+            Dictionary with 'message' and 'data' ('applied' count and the 'missing' targets,
+            which were left out).
+        """
+        fields = fields or ["position"]
+        if not targets:
+            return {"success": False, "message": "targets must not be empty"}
+        try:
+            packed = pack_transforms(values, len(targets), fields)
+        except ValueError as e:
+            return {"success": False, "message": str(e)}
+
+        params_dict = {
+            "action": "set_transforms",
+            "targets": targets,
+            "fields": fields,
+            # Sent as binary with MessagePack and as base64 with JSON
+            "values": packed,
+            "searchMethod": search_method,
+            "local": local or None,
+        }
+        params_dict = {k: v for k, v in params_dict.items() if v is not None}
+        return await get_unity_pool(target_editor).send_command("manage_gameobject", params_dict)
@@ -1,9 +1,25 @@
+import asyncio
+import base64
+import codecs
+import itertools
+import random
+import re
 import socket
+import struct
 import json
+import threading
+import time
 import logging
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, Any, Iterator, List, Optional, Tuple, TypeVar
 from config import config
+from connection_health import ConnectionHealth
+from metrics import NULL_TIMER, get_command_metrics
+from compression import FRAME_COMPRESSED, FRAME_LENGTH_MASK, Decompressor, compress_body, requested_compressions
+
+# Optional: only needed for config.encoding = "msgpack", and imported by _load_msgpack when asked for
+msgpack = None
 
 # Configure logging using settings from config
 logging.basicConfig(
@@ -12,12 +28,604 @@ logging.basicConfig(
 )
 logger = logging.getLogger("unity-mcp-server")
 
+# Framed wire mode: every message is a 4-byte big-endian length followed by the UTF-8 body.
+# The high bit of the length marks a compressed body (see compression.py).
+FRAME_HEADER = struct.Struct(">I")
+FRAMING_LENGTH = "length"
+# Pipelined replies start with the request ID, e.g. {"id":"42",...
+_REPLY_ID = re.compile(rb'\{"id":"([^"\\]*)"')
+_REPLY_ID_PEEK = 64
+# ...or, in MessagePack, a map header followed by the "id" key and a short string
+_MSGPACK_REPLY_ID = re.compile(rb'(?:[\x80-\x8f]|\xde..|\xdf....)\xa2id([\xa0-\xbf])', re.DOTALL)
+
+# Message body encodings; MessagePack is negotiated during the handshake and needs framing
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+
+# Notifications the bridge can push on pipelined connections, as {"event": ..., ...} messages
+# without an ID. The connection reports its own loss as a "closed" event.
+EVENTS_ASSETS = "assets"
+
+def build_handshake(options: Dict[str, Any]) -> bytes:
+    """Build the ping handshake that asks the bridge to switch wire modes.
+
+    Bridges that predate the handshake treat it as an invalid command and answer
+    with an error, which the client takes as a request to stay in legacy mode.
+    """
+    return b"ping " + json.dumps(options, separators=(",", ":")).encode("utf-8")
+
+def encode_frame(payload: bytes, compressed: bool = False) -> bytes:
+    """Prefix a message body with its length header."""
+    return FRAME_HEADER.pack(len(payload) | FRAME_COMPRESSED if compressed else len(payload)) + payload
+
+def decode_frame_header(header: bytes) -> Tuple[int, bool]:
+    """Return the body length and whether the body is compressed."""
+    (value,) = FRAME_HEADER.unpack(header)
+    length = value & FRAME_LENGTH_MASK
+    if length > config.max_frame_size:
+        raise Exception(f"Frame of {length} bytes exceeds max_frame_size ({config.max_frame_size})")
+    return length, bool(value & FRAME_COMPRESSED)
+
+def handshake_options(**options: Any) -> Dict[str, Any]:
+    """Add the optional encoding and compression requests to the handshake options."""
+    encoding = requested_encoding()
+    if encoding:
+        options["encoding"] = encoding
+    compressions = requested_compressions()
+    if compressions:
+        options["compression"] = compressions
+        options["compressionThreshold"] = config.compression_threshold
+    return options
+
+def negotiated_compression(result: Dict[str, Any], options: Dict[str, Any]) -> Optional[str]:
+    """The compression the bridge picked from the ones offered, if any."""
+    compression = result.get("compression")
+    return compression if compression in options.get("compression", ()) else None
+
+def _load_msgpack() -> Any:
+    """Import msgpack on first use, keeping it off the server's startup path; None if it is not installed."""
+    global msgpack
+    if msgpack is None:
+        try:
+            import msgpack as module
+        except ImportError:
+            return None
+        msgpack = module
+    return msgpack
+
+def requested_encoding() -> Optional[str]:
+    """Return the body encoding to ask the bridge for, or None to stay with JSON."""
+    if config.encoding == ENCODING_MSGPACK:
+        # Only a negotiated encoding uses msgpack, so it is loaded from here on
+        if _load_msgpack() is not None:
+            return ENCODING_MSGPACK
+        logger.warning("config.encoding is 'msgpack' but the msgpack package is not installed; using JSON")
+    return None
+
+def encode_message(message: Dict[str, Any], encoding: str = ENCODING_JSON) -> bytes:
+    """Serialize a command straight to the bytes of the negotiated encoding.
+
+    Parameters may hold bytes: MessagePack sends them as binary, JSON as base64
+    strings, and the bridge reads either into a byte[] field.
+    """
+    if encoding == ENCODING_MSGPACK:
+        return msgpack.packb(message, use_bin_type=True)
+    return json.dumps(message, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode('ascii')
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def decode_message(data: bytes, encoding: str = ENCODING_JSON) -> Dict[str, Any]:
+    """Parse a message body received in the negotiated encoding."""
+    if encoding == ENCODING_MSGPACK:
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    return json.loads(data)
+
+def peek_reply_id(head: bytes, encoding: str = ENCODING_JSON) -> Optional[str]:
+    """Return the request ID at the start of a pipelined reply, if it can be read from `head`."""
+    if encoding == ENCODING_MSGPACK:
+        match = _MSGPACK_REPLY_ID.match(head)
+        if not match:
+            return None
+        end = match.end() + (match.group(1)[0] & 0x1f)
+        return head[match.end():end].decode('utf-8') if end <= len(head) else None
+    match = _REPLY_ID.match(head)
+    return match.group(1).decode('utf-8') if match else None
+
+class UnityCommandError(Exception):
+    """Unity received and answered the command, but reported an error.
+
+    Unlike socket failures, this leaves the connection healthy and reusable.
+    """
+
+class UnityUnavailableError(ConnectionError):
+    """The bridge could not be reached, so the command was never sent."""
+
+def decode_response(response_data: Optional[bytes], encoding: str = ENCODING_JSON) -> Dict[str, Any]:
+    """Parse a command response and return its result, raising on Unity errors."""
+    return response_result(decode_envelope(response_data, encoding))
+
+def decode_envelope(response_data: Optional[bytes], encoding: str = ENCODING_JSON) -> Dict[str, Any]:
+    """Parse a command response into its envelope ('status', 'result' or 'error', 'stateVersion')."""
+    if response_data is None:
+        raise Exception("No response received from Unity")
+    try:
+        return decode_message(response_data, encoding)
+    except ValueError as je:
+        # JSONDecodeError, UnicodeDecodeError and msgpack's unpack errors are all ValueErrors
+        kind = "MessagePack" if encoding == ENCODING_MSGPACK else "JSON"
+        logger.error(f"{kind} decode error: {str(je)}")
+        raise Exception(f"Invalid {kind} response from Unity: {str(je)}")
+
+def response_result(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the result of a parsed command response, raising on Unity errors."""
+    if response.get("status") == "error":
+        error_message = response.get("error") or response.get("message", "Unknown Unity error")
+        logger.error(f"Unity error: {error_message}")
+        raise UnityCommandError(error_message)
+
+    return response.get("result", {})
+
+# Everything up to the next bracket, complete strings included, is skipped by one regex match.
+# A match that stops at a quote has found a string that continues in the next chunk.
+_UNTIL_BRACKET = re.compile(rb'(?:[^"{}\[\]]++|"(?:[^"\\]++|\\.)*+")*+', re.DOTALL)
+# Structural bytes, needed to follow object keys on the way to a streamed array.
+_STRUCTURAL_BYTES = re.compile(rb'[{}\[\]",:]')
+_STRING_BYTES = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+_OPEN_OBJECT, _OPEN_ARRAY, _CLOSE_OBJECT, _CLOSE_ARRAY = b"{[}]"
+_QUOTE, _COLON = b'"'[0], b":"[0]
+_JSON_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_ELEMENT_DELIMITERS = " \t\r\n,]"
+_element_decoder = json.JSONDecoder()
+
+class JsonStreamDecoder:
+    """Incremental decoder for one JSON message arriving in pieces.
+
+    feed() only tracks nesting and string state, jumping from one structural
+    byte to the next, so the end of the message is found without re-parsing the
+    bytes received so far. The message accumulates in `buffer` and can be
+    parsed once with message().
+
+    With a `path` such as ("result", "data"), the decoder streams the array at
+    that path instead: feed() returns each element as soon as it is complete and
+    releases its bytes, so only the element being received is held in memory.
+    The rest of the message, with that array left empty, is parsed by envelope().
+    """
+
+    def __init__(self, path: Optional[Tuple[str, ...]] = None):
+        self.path = tuple(path) if path is not None else None
+        self.buffer = bytearray()
+        self.done = False
+        self.end = 0  # Offset just past the message in buffer, once done
+        self.items_decoded = 0
+        self._pos = 0
+        # One [opening byte, key of the current child, expecting a key] entry per open container
+        self._stack: List[list] = []
+        self._in_string = False
+        self._escape = False  # A backslash ended the last chunk
+        self._key_start: Optional[int] = None
+        self._target_depth = 0  # Stack depth of the streamed array while inside it
+        self._item_start: Optional[int] = None
+        self._fast_stop = -1  # Where the fast path last stopped during this feed
+        self._after_element = False  # The fast path stopped right after an element
+        self._copied = 0  # Bytes of buffer already copied to (or skipped for) the envelope
+        self._rest = bytearray()
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add received bytes. Returns the streamed array elements they completed."""
+        if self.done:
+            raise ValueError("JSON message is already complete")
+        self.buffer += data
+        self._fast_stop = -1
+        items: List[Any] = []
+        self._scan(items)
+        if self.path is not None:
+            self._compact()
+        return items
+
+    def message(self) -> bytearray:
+        """Return the complete message bytes (not available when streaming a path)."""
+        if not self.done or self.path is not None:
+            raise ValueError("No complete JSON message")
+        return self.buffer if self.end == len(self.buffer) else self.buffer[:self.end]
+
+    def envelope(self) -> Any:
+        """Parse the complete message, or everything but the streamed elements."""
+        if not self.done:
+            raise ValueError("JSON message is incomplete")
+        return json.loads(self._rest if self.path is not None else self.message())
+
+    def _scan(self, items: List[Any]) -> None:
+        buf = self.buffer
+        stack = self._stack
+        tracking = self.path is not None
+        pos = self._pos
+        if self._escape:
+            # Skip the escaped byte, which arrived with this chunk
+            pos += 1
+            self._escape = False
+        while True:
+            if self._in_string:
+                m = _STRING_BYTES.search(buf, pos)
+                if m is None:
+                    pos = len(buf)
+                    break
+                pos = m.end()
+                if buf[m.start()] != _QUOTE:
+                    pos += 1
+                    if pos > len(buf):
+                        self._escape = True
+                        pos = len(buf)
+                        break
+                    continue
+                self._in_string = False
+                if self._key_start is not None:
+                    stack[-1][1] = json.loads(buf[self._key_start:pos])
+                    self._key_start = None
+                continue
+
+            if not stack:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == len(buf):
+                    break
+                if buf[pos] not in (_OPEN_OBJECT, _OPEN_ARRAY):
+                    raise ValueError(f"Expected a JSON object or array at byte {pos}")
+
+            if self._target_depth == len(stack) and pos == self._item_start and pos != self._fast_stop:
+                pos = self._decode_elements(items, pos)
+                continue
+
+            # Keys and separators only matter outside the elements of the streamed array
+            structural = tracking and (self._target_depth == 0 or len(stack) == self._target_depth)
+            if structural:
+                m = _STRUCTURAL_BYTES.search(buf, pos)
+                if m is None:
+                    pos = len(buf)
+                    break
+                start = m.start()
+            else:
+                start = _UNTIL_BRACKET.match(buf, pos).end()
+                if start == len(buf):
+                    pos = start
+                    break
+            pos = start + 1
+            byte = buf[start]
+            if byte == _QUOTE:
+                self._in_string = True
+                if structural and not self._target_depth and stack[-1][0] == _OPEN_OBJECT and stack[-1][2]:
+                    self._key_start = start
+            elif byte == _OPEN_OBJECT or byte == _OPEN_ARRAY:
+                entering = (structural and not self._target_depth and byte == _OPEN_ARRAY
+                            and tuple(frame[1] for frame in stack) == self.path)
+                stack.append([byte, None, byte == _OPEN_OBJECT])
+                if entering:
+                    self._rest += buf[self._copied:pos]
+                    self._copied = pos
+                    self._target_depth = len(stack)
+                    self._item_start = pos
+                    self._after_element = False
+            elif byte == _CLOSE_OBJECT or byte == _CLOSE_ARRAY:
+                if structural and self._target_depth:
+                    self._emit(items, start)
+                    self._target_depth = 0
+                    self._copied = start
+                stack.pop()
+                if not stack:
+                    self.done = True
+                    self.end = pos
+                    break
+            elif byte == _COLON:
+                stack[-1][2] = False
+            elif self._target_depth:
+                self._emit(items, start)
+                self._item_start = pos
+            elif stack[-1][0] == _OPEN_OBJECT:
+                stack[-1][1] = None
+                stack[-1][2] = True
+        self._pos = pos
+
+    def _decode_elements(self, items: List[Any], pos: int) -> int:
+        """Fast path: decode whole elements of the streamed array with the C JSON scanner.
+
+        Stops before the closing bracket or at an element that is not complete
+        yet, and returns the byte offset reached. That element is then scanned
+        byte by byte like the rest of the message.
+        """
+        text, _ = codecs.utf_8_decode(self.buffer[pos:], "strict", False)
+        i = 0
+        expecting_element = not self._after_element
+        while True:
+            i = _JSON_WHITESPACE.match(text, i).end()
+            if i == len(text) or text[i] == "]":
+                break
+            if not expecting_element:
+                if text[i] != ",":
+                    raise ValueError(f"Expected ',' or ']' in streamed array, got {text[i]!r}")
+                i += 1
+                expecting_element = True
+                continue
+            try:
+                element, end = _element_decoder.raw_decode(text, i)
+            except json.JSONDecodeError:
+                end = len(text)
+            if end == len(text) or text[end] not in _ELEMENT_DELIMITERS:
+                # Incomplete, or a number that may continue in the next chunk
+                break
+            items.append(element)
+            self.items_decoded += 1
+            i = end
+            expecting_element = False
+        pos += self._utf8_length(text, i)
+        self._item_start = self._fast_stop = pos
+        self._after_element = not expecting_element
+        return pos
+
+    @staticmethod
+    def _utf8_length(text: str, end: int) -> int:
+        """Number of UTF-8 bytes in text[:end]."""
+        return end if text.isascii() else len(text[:end].encode("utf-8"))
+
+    def _emit(self, items: List[Any], end: int) -> None:
+        """Parse the streamed element that ends at `end`."""
+        element = self.buffer[self._item_start:end]
+        self._item_start = None
+        if element.strip():
+            items.append(json.loads(element))
+            self.items_decoded += 1
+
+    def _compact(self) -> None:
+        """Drop bytes that are no longer needed, keeping the envelope's share."""
+        keep = self.end if self.done else self._pos
+        for offset in (self._item_start, self._key_start):
+            if offset is not None:
+                keep = min(keep, offset)
+        if not self._target_depth:
+            self._rest += self.buffer[self._copied:keep]
+        del self.buffer[:keep]
+        self._copied = 0
+        self._pos -= keep
+        if self.done:
+            self.end -= keep
+        if self._item_start is not None:
+            self._item_start -= keep
+        if self._key_start is not None:
+            self._key_start -= keep
+
+class MessagePackStreamDecoder:
+    """Counterpart of JsonStreamDecoder for replies in MessagePack.
+
+    A MessagePack array cannot be split off a partial message as cheaply as a
+    JSON one, so the message is buffered and the array at `path` is returned
+    all at once when the message is complete. The unpacker resumes where the
+    previous chunk ended, so every byte is still parsed only once.
+    """
+
+    def __init__(self, path: Optional[Tuple[str, ...]] = None):
+        self.path = tuple(path) if path is not None else None
+        self.done = False
+        self.end = 0
+        self.items_decoded = 0
+        self._unpacker = msgpack.Unpacker(raw=False, strict_map_key=False, max_buffer_size=config.max_frame_size)
+        self._message: Any = None
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add received bytes. Returns the streamed array once the message is complete."""
+        if self.done:
+            raise ValueError("MessagePack message is already complete")
+        self._unpacker.feed(data)
+        self.end += len(data)
+        try:
+            self._message = self._unpacker.unpack()
+        except msgpack.OutOfData:
+            return []
+        self.done = True
+        if self.path is None:
+            return []
+        container = self._message
+        for key in self.path[:-1]:
+            container = container.get(key) if isinstance(container, dict) else None
+        items = container.get(self.path[-1]) if isinstance(container, dict) else None
+        if not isinstance(items, list):
+            return []
+        # Like JsonStreamDecoder, the envelope keeps the streamed array empty
+        container[self.path[-1]] = []
+        self.items_decoded = len(items)
+        return items
+
+    def envelope(self) -> Any:
+        """Return the message, with the streamed array left empty."""
+        if not self.done:
+            raise ValueError("MessagePack message is not complete yet")
+        return self._message
+
+def stream_decoder(path: Optional[Tuple[str, ...]], encoding: str = ENCODING_JSON):
+    """Return an incremental decoder for a reply in the given encoding."""
+    if encoding == ENCODING_MSGPACK:
+        return MessagePackStreamDecoder(path)
+    return JsonStreamDecoder(path)
+
+def plan_batch(commands: List[Dict[str, Any]]) -> List[List[Tuple[int, Dict[str, Any]]]]:
+    """Validate batch commands and split them into chunks that fit in one message.
+
+    Each chunk holds (original index, command) pairs and stays within
+    config.batch_max_bytes of serialized commands and config.batch_max_commands.
+    """
+    chunks: List[List[Tuple[int, Dict[str, Any]]]] = [[]]
+    chunk_bytes = 0
+    for index, item in enumerate(commands):
+        command_type = item.get("type") if isinstance(item, dict) else None
+        if not isinstance(command_type, str) or not command_type:
+            raise ValueError(f"Batch command {index} needs a 'type'")
+        if command_type in ("batch", "ping"):
+            raise ValueError(f"Batch command {index}: '{command_type}' cannot be batched")
+        command = {"type": command_type, "parameters": item.get("parameters") or {}}
+        size = len(json.dumps(command, ensure_ascii=False, default=_json_default).encode('utf-8'))
+        chunk = chunks[-1]
+        if chunk and (chunk_bytes + size > config.batch_max_bytes or len(chunk) >= config.batch_max_commands):
+            chunk = []
+            chunks.append(chunk)
+            chunk_bytes = 0
+        chunk.append((index, command))
+        chunk_bytes += size
+    return [chunk for chunk in chunks if chunk]
+
+def batch_chunk_results(chunk: List[Tuple[int, Dict[str, Any]]], result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Map the bridge's per-command responses for one chunk back to the caller's indices."""
+    entries = []
+    for entry in (result.get("data") or {}).get("results", []):
+        index, command = chunk[entry["index"]]
+        response = entry.get("response") or {}
+        if response.get("status") == "success":
+            entries.append({"index": index, "type": command["type"], "status": "success",
+                            "result": response.get("result", {})})
+        else:
+            entries.append({"index": index, "type": command["type"], "status": "error",
+                            "error": response.get("error") or response.get("message", "Unknown Unity error")})
+    return entries
+
+def merge_batch_results(total: int, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine chunk results; commands that never ran are reported as skipped."""
+    by_index = {entry["index"]: entry for entry in entries}
+    results = [by_index.get(i, {"index": i, "status": "skipped"}) for i in range(total)]
+    succeeded = sum(1 for r in results if r["status"] == "success")
+    failed = sum(1 for r in results if r["status"] == "error")
+    skipped = total - succeeded - failed
+    return {
+        "message": f"Batch executed: {succeeded} succeeded, {failed} failed, {skipped} skipped.",
+        "data": {"results": results, "succeeded": succeeded, "failed": failed, "skipped": skipped},
+    }
+
+# Commands that can run twice without changing the outcome, as (command type, action); None
+# matches every action. Only these are sent again after a connection fails mid-command, since
+# the bridge may have run the command before the connection went down.
+IDEMPOTENT_COMMANDS = {
+    ("ping", None),
+    ("job_status", None),
+    ("read_console", None),
+    ("manage_editor", "get_state"),
+    ("manage_editor", "add_tag"),
+    ("manage_editor", "add_layer"),
+    ("manage_scene", "get_hierarchy"),
+    ("manage_scene", "get_active"),
+    ("manage_scene", "get_active_scene"),
+    ("manage_gameobject", "find"),
+    ("manage_gameobject", "find_many"),
+    ("manage_gameobject", "set_transforms"),
+    ("manage_asset", "search"),
+    ("manage_script", "read"),
+}
+
+def is_idempotent(command_type: str, params: Optional[Dict[str, Any]] = None) -> bool:
+    """True if the command can safely be sent again; a batch is if all of its commands are."""
+    params = params or {}
+    if command_type == "batch":
+        commands = params.get("commands") or []
+        return bool(commands) and all(isinstance(c, dict) and is_idempotent(c.get("type"), c.get("parameters"))
+                                      for c in commands)
+    action = params.get("action")
+    action = action.lower() if isinstance(action, str) else None
+    return (command_type, None) in IDEMPOTENT_COMMANDS or (command_type, action) in IDEMPOTENT_COMMANDS
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number `attempt` (from 0).
+
+    The delay doubles from config.retry_delay up to config.retry_max_delay, and a
+    random half of it is dropped so that calls that failed together retry apart.
+    """
+    delay = min(config.retry_max_delay, config.retry_delay * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+async def wait_for_bridge(host: str, port: int, deadline: float) -> bool:
+    """Wait until the bridge's port accepts connections, or time.monotonic() reaches `deadline`.
+
+    A probe only opens and closes a TCP connection, without a handshake, so
+    polling every config.reconnect_poll_interval seconds while the editor
+    reloads its scripts costs neither side much. Returns False on the deadline.
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), max(remaining, 0.001))
+            writer.close()
+            return True
+        except (OSError, TimeoutError):
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(config.reconnect_poll_interval, remaining))
+
+_T = TypeVar("_T")
+
+async def send_with_retries(
+    attempt: Callable[[Optional[float]], Awaitable[_T]],
+    command_type: str,
+    params: Optional[Dict[str, Any]],
+    host: str,
+    port: int,
+    deadline: Optional[float] = None,
+    on_retry: Optional[Callable[[BaseException], None]] = None,
+) -> _T:
+    """Run `attempt` until it succeeds, retrying when the connection to the bridge fails.
+
+    A command that could not be sent (UnityUnavailableError) is retried whatever
+    it is; one whose connection failed after it was sent only if it is idempotent
+    (see IDEMPOTENT_COMMANDS). Before each retry the call backs off (backoff_delay)
+    and waits for the bridge to listen again (wait_for_bridge), which lets a burst
+    of calls outlast the bridge restart that follows a domain reload. Errors
+    reported by Unity, timeouts and cancellations are not retried.
+
+    Args:
+        attempt: Sends the command once. Called with None the first time, then with
+            the seconds left before the deadline, which the retry must not outlive.
+        command_type: The bridge command, to decide whether it is idempotent.
+        params: Its parameters.
+        host: The bridge's host, polled while waiting for it.
+        port: The bridge's port.
+        deadline: Seconds after the first attempt during which retries may start
+            (default: config.command_deadline). At most config.max_retries are made.
+        on_retry: Called with the error before each retry.
+    """
+    deadline_at = time.monotonic() + (config.command_deadline if deadline is None else deadline)
+    retries = 0
+    limit: Optional[float] = None
+    while True:
+        try:
+            return await attempt(limit)
+        except ConnectionError as e:
+            if retries >= config.max_retries or not (isinstance(e, UnityUnavailableError)
+                                                     or is_idempotent(command_type, params)):
+                raise
+            delay = backoff_delay(retries)
+            if time.monotonic() + delay >= deadline_at:
+                raise
+            retries += 1
+            logger.warning(f"{command_type} failed ({str(e)}); retry {retries}/{config.max_retries} "
+                           f"in {delay:.2f}s")
+            if on_retry is not None:
+                on_retry(e)
+            get_command_metrics().record_retry(command_type, params)
+            await asyncio.sleep(delay)
+            if not await wait_for_bridge(host, port, deadline_at):
+                raise
+            limit = deadline_at - time.monotonic()
+
 @dataclass
 class UnityConnection:
     """Manages the socket connection to the Unity Editor."""
     host: str = config.unity_host
     port: int = config.unity_port
     sock: Optional[socket.socket] = None  # Socket for Unity communication
+    framed: bool = False  # True once the bridge has agreed to length-prefixed framing
+    encoding: str = ENCODING_JSON  # Message body encoding agreed with the bridge
+    compression: Optional[str] = None  # Compression of large bodies agreed with the bridge
+    health: ConnectionHealth = field(default_factory=ConnectionHealth)
+    # Serializes exchanges so threads sharing this connection never interleave bytes
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
 
     def connect(self) -> bool:
         """Establish a connection to the Unity Editor."""
@@ -25,13 +633,42 @@ class UnityConnection:
             return True
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.sock.connect((self.host, self.port))
             logger.info(f"Connected to Unity at {self.host}:{self.port}")
-            return True
         except Exception as e:
             logger.error(f"Failed to connect to Unity: {str(e)}")
             self.sock = None
             return False
+        self.framed = False
+        self.encoding = ENCODING_JSON
+        self.compression = None
+        if config.framing:
+            self.negotiate()
+        return True
+
+    def negotiate(self) -> None:
+        """Ask the bridge for framed mode, falling back to legacy mode if it declines."""
+        options = handshake_options(framing=FRAMING_LENGTH)
+        encoding = options.get("encoding")
+        try:
+            self.sock.sendall(build_handshake(options))
+            response_data = self.receive_full_response(self.sock)
+            response = json.loads(response_data.decode('utf-8'))
+            # Any well-formed reply, even a legacy bridge's rejection, proves the socket works
+            self.health.mark_ok()
+            result = response.get("result") or {}
+            self.framed = response.get("status") == "success" and result.get("framing") == FRAMING_LENGTH
+            # Bridges that predate an encoding leave it out of the reply and keep JSON
+            self.encoding = encoding if self.framed and encoding and result.get("encoding") == encoding else ENCODING_JSON
+            self.compression = negotiated_compression(result, options) if self.framed else None
+        except Exception as e:
+            logger.warning(f"Framing handshake failed, using legacy mode: {str(e)}")
+            self.framed = False
+            self.encoding = ENCODING_JSON
+            self.compression = None
+        logger.debug(f"Unity wire mode: {'framed' if self.framed else 'legacy'}, {self.encoding}"
+                     f"{', ' + self.compression if self.compression else ''}")
 
     def disconnect(self):
         """Close the connection to the Unity Editor."""
@@ -42,9 +679,16 @@ class UnityConnection:
                 logger.error(f"Error disconnecting from Unity: {str(e)}")
             finally:
                 self.sock = None
+                self.framed = False
+                self.encoding = ENCODING_JSON
+                self.compression = None
 
     def send_command(self, command_type: str, params: Dict[str, Any] = {}) -> Dict[str, Any]:
-        """Send a command to Unity and return its response."""
+        """Send a command to Unity and return its response. Safe to call from several threads."""
+        with self.lock:
+            return self._send_command(command_type, params)
+
+    def _send_command(self, command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Unity")
         if self.sock is None:
@@ -54,93 +698,243 @@ class UnityConnection:
         if command_type == "ping":
             try:
                 logger.debug("Sending ping to verify connection")
-                self.sock.sendall(b"ping")
-                response_data = self.receive_full_response(self.sock)
+                response_data = self._exchange(b"ping")
                 if response_data is None:
                     raise ConnectionError("No response received from Unity")
-                response = json.loads(response_data.decode('utf-8'))
+                response = decode_message(response_data, self.encoding)
                 
                 if response.get("status") != "success":
                     logger.warning("Ping response was not successful")
-                    self.sock = None
                     raise ConnectionError("Connection verification failed")
-                    
+
+                self.health.record_probe(True)
                 return {"message": "pong"}
             except Exception as e:
                 logger.error(f"Ping error: {str(e)}")
-                self.sock = None
+                self.health.record_probe(False, str(e))
+                self.disconnect()
                 raise ConnectionError(f"Connection verification failed: {str(e)}")
         
         # Normal command handling
+        timer = get_command_metrics().start(command_type, params)
         command = {"type": command_type, "parameters": params or {}}
         try:
-            command_json = json.dumps(command, ensure_ascii=False)
-            logger.info(f"Sending command: {command_type}")
+            payload = encode_message(command, self.encoding)
+            timer.serialized(len(payload))
+            logger.debug(f"Sending command: {command_type}")
             
             if self.sock is None:
                 raise ConnectionError("Socket is not connected")
-            self.sock.sendall(command_json.encode('utf-8'))
-            
-            response_data = self.receive_full_response(self.sock)
-            if response_data is None:
-                raise Exception("No response received from Unity")
-            try:
-                response = json.loads(response_data.decode('utf-8'))
-            except json.JSONDecodeError as je:
-                logger.error(f"JSON decode error: {str(je)}")
-                raise Exception(f"Invalid JSON response from Unity: {str(je)}")
-            
-            if response.get("status") == "error":
-                error_message = response.get("error") or response.get("message", "Unknown Unity error")
-                logger.error(f"Unity error: {error_message}")
-                raise Exception(error_message)
-            
-            return response.get("result", {})
+            response_data = self._exchange(payload, timer)
+            result = decode_response(response_data, self.encoding)
+            self.health.mark_ok()
+            timer.finish()
+            return result
+        except UnityCommandError as e:
+            # Unity answered, so the socket is still good
+            self.health.mark_ok()
+            timer.finish(error=True)
+            raise UnityCommandError(f"Failed to communicate with Unity: {str(e)}")
         except Exception as e:
+            timer.finish(error=True)
             logger.error(f"Communication error with Unity: {str(e)}")
-            self.sock = None
+            self.health.mark_failed(str(e))
+            self.disconnect()
             raise Exception(f"Failed to communicate with Unity: {str(e)}")
 
-    def receive_full_response(self, sock, buffer_size=None) -> Optional[bytes]:
+    def send_batch(self, commands: List[Dict[str, Any]], stop_on_error: bool = True) -> Dict[str, Any]:
+        """Execute many commands with one round trip per chunk.
+
+        Args:
+            commands: Ordered list of {"type": ..., "parameters": {...}} commands.
+            stop_on_error: Stop at the first failing command instead of continuing.
+
+        Returns:
+            The per-command results plus succeeded/failed/skipped counts.
+        """
+        entries: List[Dict[str, Any]] = []
+        for chunk in plan_batch(commands):
+            with self.lock:
+                result = self._send_command("batch", {
+                    "commands": [command for _, command in chunk],
+                    "stopOnError": stop_on_error,
+                })
+            chunk_entries = batch_chunk_results(chunk, result)
+            entries.extend(chunk_entries)
+            if stop_on_error and any(entry["status"] == "error" for entry in chunk_entries):
+                break
+        return merge_batch_results(len(commands), entries)
+
+    def stream_command(
+        self,
+        command_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        path: Tuple[str, ...] = ("result", "data"),
+    ) -> Iterator[Any]:
+        """Send a command and yield the elements of one array in its response as they arrive.
+
+        Only the element being received is held in memory, so callers can work
+        through huge hierarchies or find results while they stream in. Unity
+        errors are raised once the whole response has arrived. The connection is
+        held until the generator finishes; abandoning it early closes the socket.
+
+        Args:
+            command_type: The bridge command.
+            params: Command parameters.
+            path: Keys leading to the array to stream, e.g. ("result", "data").
+        """
+        with self.lock:
+            if not self.sock and not self.connect():
+                raise ConnectionError("Not connected to Unity")
+            timer = get_command_metrics().start(command_type, params)
+            command = {"type": command_type, "parameters": params or {}}
+            decoder = stream_decoder(path, self.encoding)
+            complete = False
+            received = 0
+            try:
+                logger.debug(f"Streaming command: {command_type}")
+                payload = encode_message(command, self.encoding)
+                timer.serialized(len(payload))
+                self.sock.sendall(self._frame(payload) if self.framed else payload)
+                timer.sent()
+                for chunk in self._receive_chunks(self.sock, decoder):
+                    if not received:
+                        timer.first_byte()
+                    received += len(chunk)
+                    yield from decoder.feed(chunk)
+                complete = True
+                timer.received(received)
+                logger.debug(f"Received complete response ({decoder.items_decoded} streamed items)")
+            except Exception as e:
+                logger.error(f"Communication error with Unity: {str(e)}")
+                self.health.mark_failed(str(e))
+                timer.finish(error=True)
+                raise Exception(f"Failed to communicate with Unity: {str(e)}")
+            finally:
+                if not complete:
+                    # Unread reply bytes would be taken for the answer to the next command
+                    self.disconnect()
+            self.health.mark_ok()
+            try:
+                response_result(decoder.envelope())
+            except UnityCommandError as e:
+                timer.finish(error=True)
+                raise UnityCommandError(f"Failed to communicate with Unity: {str(e)}")
+            timer.finish()
+
+    def _receive_chunks(self, sock, decoder) -> Iterator[bytes]:
+        """Yield the pieces of one reply as they are received."""
+        sock.settimeout(config.connection_timeout)
+        remaining = None
+        if self.framed:
+            remaining, compressed = decode_frame_header(self._receive_exactly(sock, FRAME_HEADER.size))
+            if compressed:
+                # Decompressed pieces; the caller checks that the message was complete
+                for chunk in self._receive_body_chunks(sock, remaining, compressed):
+                    if not decoder.done:
+                        yield chunk
+                return
+        try:
+            while not decoder.done:
+                if remaining == 0:
+                    raise Exception("Frame ended before the message was complete")
+                chunk = sock.recv(config.buffer_size if remaining is None else min(config.buffer_size, remaining))
+                if not chunk:
+                    raise Exception("Connection closed before receiving data")
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+            if remaining:
+                # Trailing whitespace inside the frame
+                self._receive_exactly(sock, remaining)
+        except socket.timeout:
+            logger.warning("Socket timeout during receive")
+            raise Exception("Timeout receiving Unity response")
+
+    def _frame(self, payload: bytes) -> bytes:
+        """Frame a message body, compressed if it is large enough."""
+        return encode_frame(*compress_body(payload, self.compression))
+
+    def _exchange(self, payload: bytes, timer=NULL_TIMER) -> Optional[bytes]:
+        """Write one message and read its reply using the negotiated wire mode."""
+        if self.framed:
+            self.sock.sendall(self._frame(payload))
+            timer.sent()
+            return self.receive_frame(self.sock, timer)
+        self.sock.sendall(payload)
+        timer.sent()
+        return self.receive_full_response(self.sock, timer=timer)
+
+    def receive_frame(self, sock, timer=NULL_TIMER) -> bytearray:
+        """Receive one length-prefixed message into a buffer sized from its header."""
+        sock.settimeout(config.connection_timeout)
+        try:
+            header = self._receive_exactly(sock, FRAME_HEADER.size)
+            timer.first_byte()
+            length, compressed = decode_frame_header(header)
+            if compressed:
+                payload = b"".join(self._receive_body_chunks(sock, length, compressed))
+            else:
+                payload = self._receive_exactly(sock, length)
+            timer.received(FRAME_HEADER.size + length)
+            logger.debug(f"Received complete response ({length} bytes)")
+            return payload
+        except socket.timeout:
+            logger.warning("Socket timeout during receive")
+            raise Exception("Timeout receiving Unity response")
+
+    def _receive_body_chunks(self, sock, length: int, compressed: bool) -> Iterator[bytes]:
+        """Yield the body of a frame as it is received, decompressed if needed."""
+        decompressor = Decompressor(self.compression) if compressed else None
+        remaining = length
+        while remaining > 0:
+            chunk = sock.recv(min(config.buffer_size, remaining))
+            if not chunk:
+                raise Exception("Connection closed before receiving data")
+            remaining -= len(chunk)
+            if decompressor is not None:
+                chunk = decompressor.feed(chunk)
+            if chunk:
+                yield chunk
+        if decompressor is not None:
+            decompressor.finish()
+
+    @staticmethod
+    def _receive_exactly(sock, size: int) -> bytearray:
+        """Fill a preallocated buffer with exactly `size` bytes from the socket."""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = sock.recv_into(view[received:], size - received)
+            if count == 0:
+                raise Exception("Connection closed before receiving data")
+            received += count
+        return buffer
+
+    def receive_full_response(self, sock, buffer_size=None, timer=NULL_TIMER) -> Optional[bytes]:
         """Receive a complete response from Unity, handling chunked data."""
         if buffer_size is None:
             buffer_size = config.buffer_size
             
-        chunks = []
+        decoder = JsonStreamDecoder()
         sock.settimeout(config.connection_timeout)
         try:
             while True:
                 chunk = sock.recv(buffer_size)
                 if not chunk:
-                    if not chunks:
+                    if not decoder.buffer:
                         raise Exception("Connection closed before receiving data")
                     break
-                chunks.append(chunk)
-                
-                # Process the data received so far
-                data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
+                if not decoder.buffer:
+                    timer.first_byte()
                 
-                # Check if we've received a complete response
-                try:
-                    # Special case for ping-pong
-                    if decoded_data.strip().startswith('{"status":"success","result":{"message":"pong"'):
-                        logger.debug("Received ping response")
-                        return data
-                    
-                    # Validate JSON format
-                    json.loads(decoded_data)
-                    
-                    # If we get here, we have valid JSON
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
-                except json.JSONDecodeError:
-                    # We haven't received a complete valid JSON response yet
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
-                    # Continue reading more chunks as this might not be the complete response
-                    continue
+                # Only the new bytes are scanned; the decoder knows when the message is complete
+                decoder.feed(chunk)
+                if decoder.done:
+                    timer.received(decoder.end)
+                    logger.debug(f"Received complete response ({decoder.end} bytes)")
+                    return decoder.message()
         except socket.timeout:
             logger.warning("Socket timeout during receive")
             raise Exception("Timeout receiving Unity response")
@@ -148,37 +942,682 @@ class UnityConnection:
             logger.error(f"Error during receive: {str(e)}")
             raise
 
+@dataclass
+class AsyncUnityConnection:
+    """Asyncio counterpart of UnityConnection, used by the MCP tools.
+
+    Waiting on Unity never blocks the event loop. When the bridge supports
+    pipelining, every command is tagged with an ID and many commands can be in
+    flight at once: a single reader task matches replies to requests by ID, so
+    concurrent tool calls share the socket and land in the same editor tick.
+    Otherwise exchanges are serialized on a lock, and a request that times out
+    or is cancelled closes the socket so that its late reply cannot be read as
+    the answer to the next command.
+    """
+    host: str = config.unity_host
+    port: int = config.unity_port
+    reader: Optional[asyncio.StreamReader] = None
+    writer: Optional[asyncio.StreamWriter] = None
+    framed: bool = False  # True once the bridge has agreed to length-prefixed framing
+    pipelined: bool = False  # True once the bridge has agreed to ID-tagged, out-of-order replies
+    encoding: str = ENCODING_JSON  # Message body encoding agreed with the bridge
+    compression: Optional[str] = None  # Compression of large bodies agreed with the bridge
+    notifications: bool = False  # True once the bridge has agreed to push asset change notifications
+    state_version: Optional[int] = None  # Editor state version carried by the latest reply (None: not reported)
+    state_version_at: float = 0.0  # time.monotonic() of that reply
+    queue_depth: Optional[int] = None  # Commands waiting in the bridge when the latest reply's command started
+    queue_wait_ms: Optional[float] = None  # How long that command waited in the bridge's queue
+    project: Optional[str] = None  # Name of the editor's project, from the handshake reply (None: not reported)
+    event_handler: Optional[Callable[[Dict[str, Any]], None]] = None  # Called with each pushed event
+    health: ConnectionHealth = field(default_factory=ConnectionHealth)
+
+    def __post_init__(self):
+        self._lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._pending_pings: Deque[asyncio.Future] = deque()
+        # Pipelined replies delivered piece by piece to stream_command, by request ID
+        self._streams: Dict[str, asyncio.Queue] = {}
+        # Metrics timers of pipelined requests, by request ID (empty while metrics are off)
+        self._timers: Dict[str, Any] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests waiting for a reply."""
+        return len(self._pending) + len(self._pending_pings)
+
+    async def connect(self) -> bool:
+        """Establish a connection to the Unity Editor."""
+        if self.connected:
+            return True
+        try:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            logger.info(f"Connected to Unity at {self.host}:{self.port}")
+        except Exception as e:
+            logger.error(f"Failed to connect to Unity: {str(e)}")
+            self._reset()
+            return False
+        self.framed = False
+        self.pipelined = False
+        self.encoding = ENCODING_JSON
+        self.compression = None
+        self.notifications = False
+        self.project = None
+        if config.framing:
+            await self.negotiate()
+        if self.pipelined:
+            self._reader_task = asyncio.get_running_loop().create_task(self._read_replies(self.reader))
+        return True
+
+    async def negotiate(self) -> None:
+        """Ask the bridge for framed (and pipelined) mode, falling back to legacy mode if it declines."""
+        options = handshake_options(framing=FRAMING_LENGTH, pipelining=config.pipelining)
+        if config.pipelining and config.asset_events:
+            options["events"] = [EVENTS_ASSETS]
+        encoding = options.get("encoding")
+        try:
+            self.writer.write(build_handshake(options))
+            await self.writer.drain()
+            response = json.loads(await self._receive_legacy())
+            # Any well-formed reply, even a legacy bridge's rejection, proves the socket works
+            self.health.mark_ok()
+            result = response.get("result") or {}
+            self.framed = response.get("status") == "success" and result.get("framing") == FRAMING_LENGTH
+            self.pipelined = self.framed and result.get("pipelining") is True
+            # Bridges that predate an encoding leave it out of the reply and keep JSON
+            self.encoding = encoding if self.framed and encoding and result.get("encoding") == encoding else ENCODING_JSON
+            self.compression = negotiated_compression(result, options) if self.framed else None
+            self.notifications = self.pipelined and EVENTS_ASSETS in (result.get("events") or [])
+            self.project = result.get("project") if isinstance(result.get("project"), str) else None
+        except Exception as e:
+            logger.warning(f"Framing handshake failed, using legacy mode: {str(e)}")
+            self.framed = False
+            self.pipelined = False
+            self.encoding = ENCODING_JSON
+            self.compression = None
+            self.notifications = False
+        logger.debug(f"Unity wire mode: {'framed' if self.framed else 'legacy'}"
+                     f"{', pipelined' if self.pipelined else ''}, {self.encoding}"
+                     f"{', ' + self.compression if self.compression else ''}"
+                     f"{', asset notifications' if self.notifications else ''}")
+
+    async def disconnect(self):
+        """Close the connection to the Unity Editor."""
+        writer = self.writer
+        self._reset()
+        if writer is not None:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception as e:
+                logger.error(f"Error disconnecting from Unity: {str(e)}")
+
+    def _reset(self, error: Optional[Exception] = None):
+        """Drop the streams without waiting, e.g. after a timeout or cancellation.
+
+        Requests still waiting for a pipelined reply fail with `error`.
+        """
+        if self.writer is not None:
+            self.writer.transport.abort()
+        if self._reader_task is not None and self._reader_task is not asyncio.current_task():
+            self._reader_task.cancel()
+        self._reader_task = None
+        self.reader = None
+        self.writer = None
+        self.framed = False
+        self.pipelined = False
+        self.encoding = ENCODING_JSON
+        self.compression = None
+        notified, self.notifications = self.notifications, False
+        error = error or ConnectionError("Connection to Unity was closed")
+        for future in list(self._pending.values()) + list(self._pending_pings):
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+        self._pending_pings.clear()
+        self._timers.clear()
+        for queue in self._streams.values():
+            queue.put_nowait(error)
+        self._streams.clear()
+        if notified:
+            # Notifications pushed from now on are lost
+            self._push_event({"event": "closed"})
+
+    def _note_reply(self, response: Dict[str, Any], timer: Any = NULL_TIMER) -> None:
+        """Remember the editor state version and the bridge's queue figures a reply carries.
+
+        Bridges that predate them leave them out; raw pings are answered without queueing.
+        """
+        version = response.get("stateVersion")
+        if version is not None:
+            self.state_version = version
+            self.state_version_at = time.monotonic()
+        wait_ms = response.get("queueWaitMs")
+        if wait_ms is not None:
+            self.queue_depth = response.get("queueDepth")
+            self.queue_wait_ms = wait_ms
+            timer.queued(wait_ms / 1000.0)
+
+    def _push_event(self, event: Dict[str, Any]) -> None:
+        """Pass a pushed event to the event handler."""
+        if self.event_handler is None:
+            return
+        try:
+            self.event_handler(event)
+        except Exception as e:
+            logger.warning(f"Event handler failed: {str(e)}")
+
+    async def send_command(
+        self,
+        command_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send a command to Unity and return its response.
+
+        Args:
+            command_type: The bridge command, or "ping".
+            params: Command parameters.
+            timeout: Seconds to wait for the reply. Defaults to config.connection_timeout.
+        """
+        if timeout is None:
+            timeout = config.connection_timeout
+
+        async with self._lock:
+            if not self.connected and not await self.connect():
+                raise UnityUnavailableError("Not connected to Unity")
+            if not self.pipelined:
+                return await self._send_serialized(command_type, params, timeout)
+        return await self._send_pipelined(command_type, params, timeout)
+
+    async def send_batch(
+        self,
+        commands: List[Dict[str, Any]],
+        stop_on_error: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Execute many commands with one round trip per chunk.
+
+        With stop_on_error the chunks run one after another; otherwise they are
+        sent together and, when pipelined, processed in the same editor tick.
+        """
+        chunks = plan_batch(commands)
+
+        async def run(chunk):
+            result = await self.send_command("batch", {
+                "commands": [command for _, command in chunk],
+                "stopOnError": stop_on_error,
+            }, timeout=timeout)
+            return batch_chunk_results(chunk, result)
+
+        entries: List[Dict[str, Any]] = []
+        if stop_on_error:
+            for chunk in chunks:
+                chunk_entries = await run(chunk)
+                entries.extend(chunk_entries)
+                if any(entry["status"] == "error" for entry in chunk_entries):
+                    break
+        else:
+            for chunk_entries in await asyncio.gather(*(run(chunk) for chunk in chunks)):
+                entries.extend(chunk_entries)
+        return merge_batch_results(len(commands), entries)
+
+    async def stream_command(
+        self,
+        command_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        path: Tuple[str, ...] = ("result", "data"),
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """Send a command and yield the elements of one array in its response as they arrive.
+
+        Only the element being received is held in memory. Unity errors are raised
+        once the whole response has arrived. Close the generator (e.g. with
+        contextlib.aclosing) if it is abandoned early: in serialized mode the
+        connection stays locked until then, and is reset when it happens.
+
+        Args:
+            command_type: The bridge command.
+            params: Command parameters.
+            path: Keys leading to the array to stream, e.g. ("result", "data").
+            timeout: Seconds to wait for each piece of the reply. Defaults to config.connection_timeout.
+        """
+        if timeout is None:
+            timeout = config.connection_timeout
+        queue: Optional[asyncio.Queue] = None
+        timer = get_command_metrics().start(command_type, params)
+        received = 0
+
+        await self._lock.acquire()
+        locked = True
+        complete = False
+        try:
+            if not self.connected and not await self.connect():
+                raise ConnectionError("Not connected to Unity")
+            command = {"type": command_type, "parameters": params or {}}
+            if self.pipelined:
+                request_id = str(next(self._ids))
+                command = {"id": request_id, **command}
+                queue = asyncio.Queue()
+                self._streams[request_id] = queue
+                self._lock.release()
+                locked = False
+            logger.debug(f"Streaming command: {command_type}")
+            decoder = stream_decoder(path, self.encoding)
+            payload = encode_message(command, self.encoding)
+            timer.serialized(len(payload))
+            try:
+                self.writer.write(self._frame(payload) if self.framed else payload)
+                async with asyncio.timeout(timeout):
+                    await self.writer.drain()
+                timer.sent()
+                if queue is not None:
+                    while True:
+                        async with asyncio.timeout(timeout):
+                            chunk = await queue.get()
+                        if chunk is None:
+                            break
+                        if isinstance(chunk, Exception):
+                            raise chunk
+                        if not received:
+                            timer.first_byte()
+                        received += len(chunk)
+                        for item in decoder.feed(chunk):
+                            yield item
+                else:
+                    chunks = self._receive_chunks(decoder)
+                    while True:
+                        async with asyncio.timeout(timeout):
+                            chunk = await anext(chunks, None)
+                        if chunk is None:
+                            break
+                        if not received:
+                            timer.first_byte()
+                        received += len(chunk)
+                        for item in decoder.feed(chunk):
+                            yield item
+                if not decoder.done:
+                    raise Exception("Reply ended before the message was complete")
+                complete = True
+                timer.received(received)
+            except TimeoutError:
+                logger.error(f"Timed out after {timeout}s waiting for Unity ({command_type})")
+                if queue is None:
+                    self.health.mark_failed(f"timed out after {timeout}s")
+                timer.finish(error=True)
+                raise Exception(f"Failed to communicate with Unity: timed out after {timeout}s")
+            except Exception as e:
+                logger.error(f"Communication error with Unity: {str(e)}")
+                self.health.mark_failed(str(e))
+                timer.finish(error=True)
+                raise Exception(f"Failed to communicate with Unity: {str(e)}")
+        finally:
+            if queue is not None:
+                for request_id, pending in list(self._streams.items()):
+                    if pending is queue:
+                        del self._streams[request_id]
+            elif not complete:
+                # Unread reply bytes would be taken for the answer to the next command
+                self._reset()
+            if locked:
+                self._lock.release()
+
+        self.health.mark_ok()
+        logger.debug(f"Received complete response ({decoder.items_decoded} streamed items)")
+        try:
+            response_result(decoder.envelope())
+        except UnityCommandError as e:
+            timer.finish(error=True)
+            raise UnityCommandError(f"Failed to communicate with Unity: {str(e)}")
+        timer.finish()
+
+    async def _send_pipelined(
+        self,
+        command_type: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> Dict[str, Any]:
+        """Send an ID-tagged command without waiting for earlier replies."""
+        future = asyncio.get_running_loop().create_future()
+        timer = NULL_TIMER
+        if command_type == "ping":
+            # The bridge answers raw pings in arrival order, without an ID
+            logger.debug("Sending ping to verify connection")
+            payload = b"ping"
+            self._pending_pings.append(future)
+        else:
+            timer = get_command_metrics().start(command_type, params)
+            request_id = str(next(self._ids))
+            # The ID goes first so the bridge can find it without parsing the whole command
+            command = {"id": request_id, "type": command_type, "parameters": params or {}}
+            logger.debug(f"Sending command: {command_type} (id {request_id})")
+            payload = encode_message(command, self.encoding)
+            timer.serialized(len(payload))
+            self._pending[request_id] = future
+            if timer is not NULL_TIMER:
+                # The reader task records when the reply arrives
+                self._timers[request_id] = timer
+        try:
+            self.writer.write(self._frame(payload))
+            async with asyncio.timeout(timeout):
+                await self.writer.drain()
+                timer.sent()
+                response = await future
+        except asyncio.CancelledError:
+            # A late reply is matched by ID and dropped; other requests are unaffected.
+            self._forget(future)
+            timer.finish(error=True)
+            raise
+        except TimeoutError:
+            self._forget(future)
+            timer.finish(error=True)
+            logger.error(f"Timed out after {timeout}s waiting for Unity ({command_type})")
+            if command_type == "ping":
+                self.health.record_probe(False, f"timed out after {timeout}s")
+                raise ConnectionError(f"Connection verification failed: timed out after {timeout}s")
+            raise Exception(f"Failed to communicate with Unity: timed out after {timeout}s")
+        except Exception as e:
+            self._forget(future)
+            timer.finish(error=True)
+            if command_type == "ping":
+                self.health.record_probe(False, str(e))
+                raise ConnectionError(f"Connection verification failed: {str(e)}")
+            logger.error(f"Communication error with Unity: {str(e)}")
+            raise ConnectionError(f"Failed to communicate with Unity: {str(e)}")
+
+        self._note_reply(response, timer)
+        if command_type == "ping":
+            if response.get("status") != "success":
+                self.health.record_probe(False, "unsuccessful ping response")
+                raise ConnectionError("Connection verification failed")
+            self.health.record_probe(True)
+            return {"message": "pong"}
+        self.health.mark_ok()
+        try:
+            result = response_result(response)
+        except UnityCommandError as e:
+            timer.finish(error=True)
+            raise UnityCommandError(f"Failed to communicate with Unity: {str(e)}")
+        timer.finish()
+        return result
+
+    def _forget(self, future: asyncio.Future) -> None:
+        """Stop waiting for a pipelined reply."""
+        for request_id, pending in list(self._pending.items()):
+            if pending is future:
+                del self._pending[request_id]
+                self._timers.pop(request_id, None)
+                return
+        # Pings are matched by position, so an abandoned ping stays queued to absorb its pong.
+
+    async def _read_replies(self, reader: asyncio.StreamReader) -> None:
+        """Reader task: demultiplex framed replies to their waiting requests."""
+        try:
+            while True:
+                length, compressed = await self._receive_header(reader)
+                first_byte = time.perf_counter() if self._timers else 0.0
+                if self._streams:
+                    # The bridge puts the ID first, so the first bytes tell whether the reply is streamed
+                    body = self._body_chunks(reader, length, compressed)
+                    head = b""
+                    async for chunk in body:
+                        head += chunk
+                        if len(head) >= _REPLY_ID_PEEK:
+                            break
+                    request_id = peek_reply_id(head[:_REPLY_ID_PEEK], self.encoding)
+                    queue = self._streams.get(request_id) if request_id is not None else None
+                    if queue is not None:
+                        # Pass the rest to the stream as it is received, then mark its end
+                        queue.put_nowait(head)
+                        async for chunk in body:
+                            queue.put_nowait(chunk)
+                        queue.put_nowait(None)
+                        continue
+                    payload = head + b"".join([chunk async for chunk in body])
+                elif compressed:
+                    payload = b"".join([chunk async for chunk in self._body_chunks(reader, length, compressed)])
+                else:
+                    payload = await self._read_exactly(reader, length)
+                received = time.perf_counter() if first_byte else 0.0
+                response = decode_message(payload, self.encoding)
+                request_id = response.pop("id", None)
+                if request_id is None and "event" in response:
+                    self._push_event(response)
+                    continue
+                if request_id is None:
+                    future = self._pending_pings.popleft() if self._pending_pings else None
+                else:
+                    future = self._pending.pop(str(request_id), None)
+                    timer = self._timers.pop(str(request_id), None) if first_byte else None
+                    if timer is not None:
+                        timer.first_byte(first_byte)
+                        timer.received(FRAME_HEADER.size + length, received)
+                if future is None:
+                    logger.debug(f"Dropping reply for abandoned request {request_id}")
+                elif not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if reader is self.reader:
+                logger.error(f"Communication error with Unity: {str(e)}")
+                self.health.mark_failed(str(e))
+                self._reset(ConnectionError(f"Connection to Unity lost: {str(e)}"))
+
+    async def _send_serialized(
+        self,
+        command_type: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> Dict[str, Any]:
+        """Send a command and wait for its reply while holding the connection lock."""
+        if command_type == "ping":
+            try:
+                logger.debug("Sending ping to verify connection")
+                async with asyncio.timeout(timeout):
+                    response = decode_message(await self._exchange(b"ping"), self.encoding)
+                self._note_reply(response)
+                if response.get("status") != "success":
+                    logger.warning("Ping response was not successful")
+                    raise ConnectionError("Connection verification failed")
+                self.health.record_probe(True)
+                return {"message": "pong"}
+            except asyncio.CancelledError:
+                self._reset()
+                raise
+            except Exception as e:
+                logger.error(f"Ping error: {str(e)}")
+                self.health.record_probe(False, str(e))
+                self._reset()
+                raise ConnectionError(f"Connection verification failed: {str(e)}")
+
+        timer = get_command_metrics().start(command_type, params)
+        command = {"type": command_type, "parameters": params or {}}
+        try:
+            payload = encode_message(command, self.encoding)
+            timer.serialized(len(payload))
+            logger.debug(f"Sending command: {command_type}")
+            async with asyncio.timeout(timeout):
+                response_data = await self._exchange(payload, timer)
+        except asyncio.CancelledError:
+            # The reply may still arrive; the socket can no longer be trusted.
+            self.health.mark_failed("cancelled")
+            self._reset()
+            timer.finish(error=True)
+            raise
+        except TimeoutError:
+            logger.error(f"Timed out after {timeout}s waiting for Unity ({command_type})")
+            self.health.mark_failed(f"timed out after {timeout}s")
+            self._reset()
+            timer.finish(error=True)
+            raise Exception(f"Failed to communicate with Unity: timed out after {timeout}s")
+        except Exception as e:
+            logger.error(f"Communication error with Unity: {str(e)}")
+            self.health.mark_failed(str(e))
+            self._reset()
+            timer.finish(error=True)
+            raise ConnectionError(f"Failed to communicate with Unity: {str(e)}")
+        self.health.mark_ok()
+        response = decode_envelope(response_data, self.encoding)
+        self._note_reply(response, timer)
+        try:
+            result = response_result(response)
+        except UnityCommandError as e:
+            timer.finish(error=True)
+            raise UnityCommandError(f"Failed to communicate with Unity: {str(e)}")
+        timer.finish()
+        return result
+
+    def _frame(self, payload: bytes) -> bytes:
+        """Frame a message body, compressed if it is large enough."""
+        return encode_frame(*compress_body(payload, self.compression))
+
+    async def _exchange(self, payload: bytes, timer=NULL_TIMER) -> bytes:
+        """Write one message and read its reply using the negotiated wire mode."""
+        if self.framed:
+            self.writer.write(self._frame(payload))
+            await self.writer.drain()
+            timer.sent()
+            return await self._receive_frame(self.reader, timer)
+        self.writer.write(payload)
+        await self.writer.drain()
+        timer.sent()
+        return await self._receive_legacy(timer)
+
+    async def _receive_frame(self, reader: asyncio.StreamReader, timer=NULL_TIMER) -> bytes:
+        """Receive one length-prefixed message."""
+        length, compressed = await self._receive_header(reader)
+        timer.first_byte()
+        if compressed:
+            payload = b"".join([chunk async for chunk in self._body_chunks(reader, length, compressed)])
+        else:
+            payload = await self._read_exactly(reader, length)
+        timer.received(FRAME_HEADER.size + length)
+        logger.debug(f"Received complete response ({length} bytes)")
+        return payload
+
+    async def _receive_header(self, reader: asyncio.StreamReader) -> Tuple[int, bool]:
+        """Receive a frame header and return the body length and whether it is compressed."""
+        return decode_frame_header(await self._read_exactly(reader, FRAME_HEADER.size))
+
+    @staticmethod
+    async def _read_exactly(reader: asyncio.StreamReader, size: int) -> bytes:
+        try:
+            return await reader.readexactly(size)
+        except asyncio.IncompleteReadError:
+            raise Exception("Connection closed before receiving data")
+
+    async def _body_chunks(self, reader: asyncio.StreamReader, length: int, compressed: bool) -> AsyncIterator[bytes]:
+        """Yield the body of a frame as it is received, decompressed if needed."""
+        decompressor = Decompressor(self.compression) if compressed else None
+        remaining = length
+        while remaining > 0:
+            chunk = await reader.read(min(config.buffer_size, remaining))
+            if not chunk:
+                raise Exception("Connection closed before receiving data")
+            remaining -= len(chunk)
+            if decompressor is not None:
+                chunk = decompressor.feed(chunk)
+            if chunk:
+                yield chunk
+        if decompressor is not None:
+            decompressor.finish()
+
+    async def _receive_chunks(self, decoder) -> AsyncIterator[bytes]:
+        """Yield the pieces of one reply as they are received (serialized mode)."""
+        remaining = None
+        if self.framed:
+            remaining, compressed = await self._receive_header(self.reader)
+            if compressed:
+                # Decompressed pieces; the caller checks that the message was complete
+                async for chunk in self._body_chunks(self.reader, remaining, compressed):
+                    if not decoder.done:
+                        yield chunk
+                return
+        while not decoder.done:
+            if remaining == 0:
+                raise Exception("Frame ended before the message was complete")
+            chunk = await self.reader.read(config.buffer_size if remaining is None else min(config.buffer_size, remaining))
+            if not chunk:
+                raise Exception("Connection closed before receiving data")
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+        if remaining:
+            # Trailing whitespace inside the frame
+            await self._read_exactly(self.reader, remaining)
+
+    async def _receive_legacy(self, timer=NULL_TIMER) -> bytes:
+        """Receive an unframed response, reading until it forms complete JSON."""
+        decoder = JsonStreamDecoder()
+        while not decoder.done:
+            chunk = await self.reader.read(config.buffer_size)
+            if not chunk:
+                raise Exception("Connection closed before receiving data")
+            if not decoder.buffer:
+                timer.first_byte()
+            decoder.feed(chunk)
+        timer.received(decoder.end)
+        logger.debug(f"Received complete response ({decoder.end} bytes)")
+        return decoder.message()
+
 # Global Unity connection
 _unity_connection = None
+_unity_health = ConnectionHealth()
+_unity_connection_lock = threading.Lock()
 
 def get_unity_connection() -> UnityConnection:
-    """Retrieve or establish a persistent Unity connection."""
+    """Retrieve or establish a persistent Unity connection.
+
+    An existing connection is only pinged once it has been idle for longer than
+    config.health_idle_threshold; dead sockets are detected from send/recv errors.
+    The returned connection serializes its exchanges, so worker threads can share it.
+    """
+    with _unity_connection_lock:
+        return _get_unity_connection()
+
+def _get_unity_connection() -> UnityConnection:
     global _unity_connection
-    if _unity_connection is not None:
+    if _unity_connection is not None and _unity_connection.sock is not None:
+        if not _unity_health.needs_probe():
+            _unity_health.record_skipped_probe()
+            return _unity_connection
         try:
-            # Try to ping with a short timeout to verify connection
+            # Try to ping to verify the idle connection
             result = _unity_connection.send_command("ping")
             # If we get here, the connection is still valid
             logger.debug("Reusing existing Unity connection")
             return _unity_connection
         except Exception as e:
             logger.warning(f"Existing connection failed: {str(e)}")
-            try:
-                _unity_connection.disconnect()
-            except:
-                pass
-            _unity_connection = None
+    if _unity_connection is not None:
+        try:
+            _unity_connection.disconnect()
+        except:
+            pass
+        _unity_connection = None
+        _unity_health.reconnects += 1
+        get_command_metrics().record_reconnect()
     
     # Create a new connection
     logger.info("Creating new Unity connection")
-    _unity_connection = UnityConnection()
+    _unity_connection = UnityConnection(health=_unity_health)
     if not _unity_connection.connect():
         _unity_connection = None
         raise ConnectionError("Could not connect to Unity. Ensure the Unity Editor and MCP Bridge are running.")
     
     try:
-        # Verify the new connection works
-        _unity_connection.send_command("ping")
+        # Verify the new connection works, unless the handshake already did
+        if _unity_health.needs_probe():
+            _unity_connection.send_command("ping")
         logger.info("Successfully established new Unity connection")
         return _unity_connection
     except Exception as e:
@@ -189,3 +1628,7 @@ def get_unity_connection() -> UnityConnection:
             pass
         _unity_connection = None
         raise ConnectionError(f"Could not establish valid Unity connection: {str(e)}")
+
+def get_unity_connection_health() -> Dict[str, Any]:
+    """Return health state and probe counters for the sync connection."""
+    return _unity_health.snapshot()
@@ -0,0 +1,94 @@
+"""
+Regression tests for QueryCache: lookups that race other cache updates, and writes
+that must not be memoized.
+"""
+import asyncio
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from query_cache import QueryCache, memoized  # noqa: E402
+
+GET_STATE = ("manage_editor", {"action": "get_state"})
+GET_ACTIVE = ("manage_scene", {"action": "get_active"})
+
+
+class StubBridge:
+    """Stands in for a connection pool whose revalidation ping waits until `release` is set."""
+
+    def __init__(self):
+        self.version = 1
+        self.reported_at = time.monotonic()
+        self.release = asyncio.Event()
+        self.pinging = asyncio.Event()
+
+    @property
+    def state_version(self):
+        return self.version, self.reported_at
+
+    async def send_command(self, command_type, params=None):
+        if command_type == "ping":
+            self.pinging.set()
+            await self.release.wait()
+            self.reported_at = time.monotonic()
+            return {"message": "pong"}
+        return {"message": command_type, "data": dict(params or {})}
+
+
+class QueryCacheRaceTest(unittest.TestCase):
+    def run_race(self, interfere) -> None:
+        async def scenario():
+            bridge = StubBridge()
+            cache = QueryCache(bridge, ttl=0.05, max_entries=1)
+            await cache.send_command(*GET_STATE)
+            # The reported version goes stale, so the next lookup revalidates with a ping
+            bridge.reported_at -= 1.0
+            lookup = asyncio.create_task(cache.send_command(*GET_STATE))
+            await bridge.pinging.wait()
+            interfere(cache)
+            bridge.release.set()
+            result = await lookup
+            self.assertEqual(result["message"], "manage_editor")
+            return cache
+
+        return asyncio.run(scenario())
+
+    def test_entry_evicted_during_revalidation_is_a_miss(self):
+        cache = self.run_race(lambda cache: cache._store(
+            "other", {"message": "other"}, cache.generation, cache.bridge.version))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 2))
+
+    def test_invalidation_during_revalidation_is_a_miss(self):
+        cache = self.run_race(lambda cache: cache.invalidate())
+        self.assertEqual(cache.stats()["hits"], 0)
+
+    def test_entry_replaced_during_revalidation_is_a_miss(self):
+        key = '["manage_editor", {"action": "get_state"}]'
+        cache = self.run_race(lambda cache: cache._store(
+            key, {"message": "newer"}, cache.generation, cache.bridge.version))
+        self.assertEqual(cache.stats()["hits"], 0)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+
+class QueryCacheWritesTest(unittest.TestCase):
+    def test_tags_and_layers_invalidate(self):
+        async def scenario():
+            cache = QueryCache(StubBridge())
+            await cache.send_command(*GET_STATE)
+            for action in ("add_tag", "add_layer"):
+                params = {"action": action, "tagName": "Enemy", "layerName": "Enemy"}
+                self.assertFalse(memoized("manage_editor", params))
+                cache.observe("manage_editor", params, {"message": "added"}, None)
+                await cache.send_command(*GET_STATE)
+            return cache.stats()
+
+        stats = asyncio.run(scenario())
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
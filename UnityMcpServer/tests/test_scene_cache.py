@@ -0,0 +1,97 @@
+"""
+Regression tests for SceneCache: writes and finds on names shared by several
+GameObjects, and scenes loaded alongside the active one.
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from scene_cache import SceneCache  # noqa: E402
+
+
+def node(instance_id, name, parent_id=None):
+    return {"instanceId": instance_id, "name": name, "parentId": parent_id, "active": True,
+            "tag": "Untagged", "layer": "Default", "componentTypes": ["Transform"]}
+
+
+# Two objects named "Enemy", under different parents
+SCENE = [node(1, "Left"), node(2, "Enemy", 1), node(3, "Right"), node(4, "Enemy", 3)]
+
+
+class StubBridge:
+    """Stands in for a connection pool that serves one hierarchy page."""
+
+    def __init__(self, items, scene_count=1):
+        self.page = {"items": items, "nextCursor": None, "sceneCount": scene_count}
+
+    async def send_command(self, command_type, params=None):
+        return {"message": "Scene hierarchy retrieved.", "data": self.page}
+
+
+def loaded_cache(items=SCENE, scene_count=1) -> SceneCache:
+    cache = SceneCache(StubBridge(items, scene_count), ttl=60, max_nodes=100)
+    asyncio.run(cache.refresh())
+    return cache
+
+
+def modify(cache, params, data=None):
+    cache.observe("manage_gameobject", {"action": "modify", **params},
+                  {"message": "GameObject modified.", "data": data}, None)
+
+
+class SceneCacheAmbiguityTest(unittest.TestCase):
+    def test_shared_name_is_asked_of_unity(self):
+        cache = loaded_cache()
+        self.assertIsNone(cache.find("by_name", "Enemy"))
+        self.assertEqual(cache.find("by_path", "Right/Enemy")["data"]["instanceId"], 4)
+
+    def test_write_to_shared_name_without_instance_id_invalidates(self):
+        cache = loaded_cache()
+        modify(cache, {"target": "Enemy", "name": "Boss"})
+        self.assertFalse(cache.fresh)
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+    def test_reply_instance_id_picks_the_written_object(self):
+        cache = loaded_cache()
+        modify(cache, {"target": "Enemy", "name": "Boss"}, {"name": "Boss", "instanceId": 4, "parentId": 3})
+        self.assertTrue(cache.fresh)
+        self.assertEqual(cache.find("by_name", "Boss")["data"]["instanceId"], 4)
+        self.assertEqual(cache.find("by_name", "Enemy")["data"]["instanceId"], 2)
+
+    def test_delete_reply_instance_id(self):
+        cache = loaded_cache()
+        cache.observe("manage_gameobject", {"action": "delete", "target": "Enemy"},
+                      {"message": "GameObject 'Enemy' deleted.", "data": {"instanceId": 2}}, None)
+        self.assertEqual(cache.find("by_name", "Enemy")["data"]["instanceId"], 4)
+
+    def test_parent_from_reply(self):
+        cache = loaded_cache()
+        cache.observe("manage_gameobject", {"action": "create", "name": "Gun", "parent": "Enemy"},
+                      {"message": "GameObject 'Gun' created.",
+                       "data": {"name": "Gun", "instanceId": 5, "parentId": 2}}, None)
+        self.assertEqual(cache.find("by_path", "Left/Enemy/Gun")["data"]["instanceId"], 5)
+
+    def test_ambiguous_parent_without_reply_invalidates(self):
+        cache = loaded_cache()
+        cache.observe("manage_gameobject", {"action": "create", "name": "Gun", "parent": "Enemy"},
+                      {"message": "GameObject 'Gun' created.", "data": {"name": "Gun", "instanceId": 5}}, None)
+        self.assertFalse(cache.fresh)
+
+
+class SceneCacheMultiSceneTest(unittest.TestCase):
+    def test_several_loaded_scenes_are_not_cached(self):
+        cache = loaded_cache(scene_count=2)
+        self.assertFalse(cache.fresh)
+        self.assertTrue(cache.stats()["multiScene"])
+
+    def test_single_scene_is_cached(self):
+        cache = loaded_cache(scene_count=1)
+        self.assertTrue(cache.fresh)
+        self.assertFalse(cache.stats()["multiScene"])
+
+
+if __name__ == "__main__":
+    unittest.main()